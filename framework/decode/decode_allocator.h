@@ -44,6 +44,15 @@ class DecodeAllocator
         return instance_->can_allocate_ ? instance_->allocator_.Allocate<T>(count, initialize) : nullptr;
     }
 
+    // Reserves memory for the objects decoded from the parameter buffer of an API call, using an estimate based on the
+    // size of the encoded parameter data, so that the decoded objects are allocated from a single memory block. When
+    // the estimate exceeds the allocator block size, the block that is created is reused by later calls.
+    static void ReserveForParameters(size_t parameter_buffer_size)
+    {
+        assert((instance_ != nullptr) && instance_->can_allocate_);
+        instance_->allocator_.Reserve(parameter_buffer_size * kParameterSizeScale);
+    }
+
     // End must be called to release any allocations made since last call to Begin. Currently allocated system memory
     // is re-used for future allocations.
     static void End();
@@ -63,6 +72,7 @@ class DecodeAllocator
 
   private:
     static const size_t     kAllocatorBlockSize{ 64 * 1024 };
+    static const size_t     kParameterSizeScale{ 2 }; // Estimated ratio of decoded size to encoded size.
     static DecodeAllocator* instance_;
 
     util::MonotonicAllocator allocator_;
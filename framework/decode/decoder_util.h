@@ -23,9 +23,12 @@
 #ifndef GFXRECON_DECODE_DECODER_UTIL_H
 #define GFXRECON_DECODE_DECODER_UTIL_H
 
+#include "format/api_call_id.h"
 #include "util/defines.h"
 
+#include <cstdint>
 #include <string>
+#include <vector>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
@@ -55,6 +58,38 @@ bool IsComplete(std::vector<T>& consumers, uint64_t block_index)
     return completed_consumers == consumers.size();
 }
 
+// Number of API call IDs in an API family, which is the range of the low 16 bits of an API call ID.
+const uint32_t kApiCallIndexCount = 0x10000;
+
+// Returns a table, indexed by the low 16 bits of the API call ID, of the API calls from an API family that are
+// processed by at least one of the consumers.
+template <typename T>
+std::vector<bool> GetProcessedApiCalls(const std::vector<T>& consumers, format::ApiFamilyId family)
+{
+    std::vector<bool> processed_api_calls(kApiCallIndexCount, false);
+
+    for (uint32_t i = 0; i < kApiCallIndexCount; ++i)
+    {
+        auto call_id = static_cast<format::ApiCallId>(format::MakeApiCallId(family, static_cast<uint16_t>(i)));
+
+        for (auto consumer : consumers)
+        {
+            if (consumer->IsApiCallProcessed(call_id))
+            {
+                processed_api_calls[i] = true;
+                break;
+            }
+        }
+    }
+
+    return processed_api_calls;
+}
+
+inline bool IsApiCallProcessed(const std::vector<bool>& processed_api_calls, format::ApiCallId call_id)
+{
+    return processed_api_calls[call_id & (kApiCallIndexCount - 1)];
+}
+
 GFXRECON_END_NAMESPACE(decode)
 GFXRECON_END_NAMESPACE(gfxrecon)
 
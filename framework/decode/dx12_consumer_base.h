@@ -33,6 +33,8 @@
 #include <d3d12.h>
 #include <dxgi1_5.h>
 
+#include <type_traits>
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
@@ -48,6 +50,10 @@ class Dx12ConsumerBase : public MetadataConsumerBase, public MarkerConsumerBase
 
     virtual bool IsComplete(uint64_t block_index) { return false; }
 
+    // Returns true if the consumer processes an API call.  Decoders skip the API calls that none of their consumers
+    // process.  Consumers that only process a few API calls can implement this with Dx12ConsumerOverridesApiCall().
+    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const { return true; }
+
     virtual void ProcessInitDx12AccelerationStructureCommand(
         const format::InitDx12AccelerationStructureCommandHeader&       command_header,
         std::vector<format::InitDx12AccelerationStructureGeometryDesc>& geometry_descs,
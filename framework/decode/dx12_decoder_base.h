@@ -44,23 +44,42 @@ class Dx12DecoderBase : public ApiDecoder
 
     virtual bool IsComplete(uint64_t block_index) override
     {
-        return decode::IsComplete<Dx12Consumer*>(consumers_, block_index);
+        size_t consumer_count = consumers_.size();
+        bool   complete       = decode::IsComplete<Dx12Consumer*>(consumers_, block_index);
+        if (consumers_.size() != consumer_count)
+        {
+            UpdateProcessedApiCalls();
+        }
+        return complete;
     }
 
-    void AddConsumer(Dx12Consumer* consumer) { consumers_.push_back(consumer); }
+    void AddConsumer(Dx12Consumer* consumer)
+    {
+        consumers_.push_back(consumer);
+        UpdateProcessedApiCalls();
+    }
 
     void RemoveConsumer(Dx12Consumer* consumer)
     {
         consumers_.erase(std::remove(consumers_.begin(), consumers_.end(), consumer));
+        UpdateProcessedApiCalls();
     }
 
     virtual void WaitIdle() override {}
 
+    // API calls that are not processed by any consumer are skipped without being decoded.
     virtual bool SupportsApiCall(format::ApiCallId call_id) override
     {
         auto family_id = format::GetApiCallFamily(call_id);
-        return ((family_id == format::ApiFamilyId::ApiFamily_Dxgi) ||
-                (family_id == format::ApiFamilyId::ApiFamily_D3D12));
+        if (family_id == format::ApiFamilyId::ApiFamily_Dxgi)
+        {
+            return decode::IsApiCallProcessed(processed_dxgi_calls_, call_id);
+        }
+        else if (family_id == format::ApiFamilyId::ApiFamily_D3D12)
+        {
+            return decode::IsApiCallProcessed(processed_d3d12_calls_, call_id);
+        }
+        return false;
     }
 
     virtual bool SupportsMetaDataId(format::MetaDataId meta_data_id) override
@@ -216,6 +235,12 @@ class Dx12DecoderBase : public ApiDecoder
     const std::vector<Dx12Consumer*>& GetConsumers() const { return consumers_; }
 
   private:
+    void UpdateProcessedApiCalls()
+    {
+        processed_dxgi_calls_  = GetProcessedApiCalls(consumers_, format::ApiFamilyId::ApiFamily_Dxgi);
+        processed_d3d12_calls_ = GetProcessedApiCalls(consumers_, format::ApiFamilyId::ApiFamily_D3D12);
+    }
+
     template <typename T>
     size_t DecodeCheckD3D12FeatureSupport(format::HandleId object_id,
                                           D3D12_FEATURE    feature,
@@ -263,6 +288,8 @@ class Dx12DecoderBase : public ApiDecoder
 
   private:
     std::vector<Dx12Consumer*> consumers_;
+    std::vector<bool>          processed_dxgi_calls_  = std::vector<bool>(kApiCallIndexCount, false);
+    std::vector<bool>          processed_d3d12_calls_ = std::vector<bool>(kApiCallIndexCount, false);
 };
 
 GFXRECON_END_NAMESPACE(decode)
@@ -34,6 +34,11 @@ class Dx12ObjectScanningConsumer : public Dx12ObjectScanningConsumerBase
     Dx12ObjectScanningConsumer() {}
     virtual ~Dx12ObjectScanningConsumer() override {}
 
+    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const override
+    {
+        return Dx12ConsumerOverridesApiCall<Dx12ObjectScanningConsumer>(call_id);
+    }
+
     virtual void Process_ID3D12PipelineState_GetCachedBlob(const ApiCallInfo&                 call_info,
                                                            format::HandleId                   object_id,
                                                            HRESULT                            return_value,
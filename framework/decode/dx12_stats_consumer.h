@@ -39,6 +39,11 @@ class Dx12StatsConsumer : public Dx12Consumer
         dummy_trim_frame_count_(0)
     {}
 
+    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const override
+    {
+        return Dx12ConsumerOverridesApiCall<Dx12StatsConsumer>(call_id);
+    }
+
     bool IsComplete(uint64_t current_block_index) override { return false; }
 
     format::Dx12RuntimeInfo GetDx12RuntimeInfo() { return runtime_info_; }
@@ -41,6 +41,7 @@
 #include "vulkan/vulkan.h"
 
 #include <numeric>
+#include <type_traits>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
@@ -56,6 +57,10 @@ class VulkanConsumerBase : public MetadataConsumerBase, public MarkerConsumerBas
 
     virtual bool IsComplete(uint64_t block_index) { return false; }
 
+    // Returns true if the consumer processes an API call.  Decoders skip the API calls that none of their consumers
+    // process.  Consumers that only process a few API calls can implement this with VulkanConsumerOverridesApiCall().
+    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const { return true; }
+
     virtual void Process_ExeFileInfo(util::filepath::FileInfo& info_record) {}
 
     virtual void Process_vkUpdateDescriptorSetWithTemplate(const ApiCallInfo&               call_info,
@@ -34,6 +34,8 @@
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+const size_t kFrameFileBufferSize = 1024 * 1024;
+
 struct GfxToCppPlatformMap
 {
     GfxToCppPlatform platform;
@@ -442,6 +444,11 @@ void VulkanCppConsumerBase::NewFrameFile(uint32_t frameNumber, uint32_t frameSpl
         exit(-1);
     }
 
+    // Frame files are written with many small writes, so they share one large buffer.  Only one frame file is open at
+    // a time.
+    frame_file_buffer_.resize(kFrameFileBufferSize);
+    setvbuf(frame_file_, frame_file_buffer_.data(), _IOFBF, frame_file_buffer_.size());
+
     fprintf(frame_file_, "%s\n", sCommonFrameSourceHeader);
 
     std::string frameFunctionName = "void " + new_frame_filename + "()";
@@ -498,6 +505,13 @@ void VulkanCppConsumerBase::Post_APICall(format::ApiCallId callId)
     {
         NextFrame(true);
     }
+    else if ((max_frame_file_size_ != 0) && (frame_api_call_number_ != 0) &&
+             (static_cast<size_t>(util::platform::FileTell(frame_file_)) >= max_frame_file_size_))
+    {
+        // The amount of generated code is used as an estimate of the compilation cost of the frame file, so splitting
+        // by size produces files with similar compilation costs.
+        NextFrame(true);
+    }
 
     if (callId != format::ApiCallId::ApiCall_vkAcquireNextImageKHR)
     {
@@ -523,6 +537,17 @@ FILE* VulkanCppConsumerBase::GetFrameFile()
     return frame_file_;
 }
 
+void VulkanCppConsumerBase::WriteFrameCode(const char* code)
+{
+    util::platform::FilePuts(code, frame_file_);
+}
+
+void VulkanCppConsumerBase::WriteFrameCode(const std::stringstream& code)
+{
+    const std::string code_string = code.str();
+    util::platform::FileWrite(code_string.data(), sizeof(char), code_string.size(), frame_file_);
+}
+
 std::string VulkanCppConsumerBase::GenFrameName(uint32_t frameNumber, uint32_t frameSplitNumber, uint32_t fillLength)
 {
     std::stringstream frame_name_stream;
@@ -133,6 +133,7 @@ class VulkanCppConsumerBase : public VulkanConsumer
         const std::map<format::HandleId, std::queue<std::pair<format::HandleId, VkDeviceSize>>> memoryImageMap);
     void SetWindowSize(uint32_t appWindowWidth, uint32_t appWindowHeight);
     void SetMaxCommandLimit(uint32_t max) { max_command_limit_ = max; }
+    void SetMaxFrameFileSize(size_t max) { max_frame_file_size_ = max; }
 
     void DisableVirtualSwapchain() { enable_virtual_swapchain_ = false; }
 
@@ -669,6 +670,10 @@ class VulkanCppConsumerBase : public VulkanConsumer
     FILE* GetFrameFile();
     FILE* GetGlobalFile() const { return global_file_; };
 
+    // Write code to the frame file without printf style formatting.
+    void WriteFrameCode(const char* code);
+    void WriteFrameCode(const std::stringstream& code);
+
     std::string GenFrameName(uint32_t frameNumber, uint32_t frameSplitNumber, uint32_t fillLength);
 
     void NewFrameFile(uint32_t frameNumber, uint32_t frameSplitNumber);
@@ -711,6 +716,7 @@ class VulkanCppConsumerBase : public VulkanConsumer
     uint32_t                                                              window_width_;
     uint32_t                                                              window_height_;
     uint32_t                                                              max_command_limit_{ 1000 };
+    size_t                                                                max_frame_file_size_{ 0 };
     std::vector<GfxToCppVariable>                                         variable_data_;
     std::vector<format::HandleId>                                         imported_semaphores_;
     std::unordered_map<format::HandleId, DescriptorUpdateTemplateEntries> descriptor_update_template_entry_map_;
@@ -741,6 +747,7 @@ class VulkanCppConsumerBase : public VulkanConsumer
     uint32_t                                           api_call_number_;
     std::vector<FrameTempMemory>                       frame_split_temp_memory_;
     FILE*                                              frame_file_;
+    std::vector<char>                                  frame_file_buffer_;
     FILE*                                              global_file_;
     FILE*                                              main_file_;
     std::string                                        filename_;
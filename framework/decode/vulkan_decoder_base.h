@@ -48,23 +48,36 @@ class VulkanDecoderBase : public ApiDecoder
 
     virtual ~VulkanDecoderBase() override {}
 
-    void AddConsumer(VulkanConsumer* consumer) { consumers_.push_back(consumer); }
+    void AddConsumer(VulkanConsumer* consumer)
+    {
+        consumers_.push_back(consumer);
+        UpdateProcessedApiCalls();
+    }
 
     void RemoveConsumer(VulkanConsumer* consumer)
     {
         consumers_.erase(std::remove(consumers_.begin(), consumers_.end(), consumer));
+        UpdateProcessedApiCalls();
     }
 
     virtual void WaitIdle() override;
 
     virtual bool IsComplete(uint64_t block_index) override
     {
-        return decode::IsComplete<VulkanConsumer*>(consumers_, block_index);
+        size_t consumer_count = consumers_.size();
+        bool   complete       = decode::IsComplete<VulkanConsumer*>(consumers_, block_index);
+        if (consumers_.size() != consumer_count)
+        {
+            UpdateProcessedApiCalls();
+        }
+        return complete;
     }
 
+    // API calls that are not processed by any consumer are skipped without being decoded.
     virtual bool SupportsApiCall(format::ApiCallId call_id) override
     {
-        return (format::GetApiCallFamily(call_id) == format::ApiFamilyId::ApiFamily_Vulkan);
+        return (format::GetApiCallFamily(call_id) == format::ApiFamilyId::ApiFamily_Vulkan) &&
+               decode::IsApiCallProcessed(processed_api_calls_, call_id);
     }
 
     virtual bool SupportsMetaDataId(format::MetaDataId meta_data_id) override
@@ -201,6 +214,15 @@ class VulkanDecoderBase : public ApiDecoder
     const std::vector<VulkanConsumer*>& GetConsumers() const { return consumers_; }
 
   private:
+    void UpdateProcessedApiCalls()
+    {
+        processed_api_calls_ = GetProcessedApiCalls(consumers_, format::ApiFamilyId::ApiFamily_Vulkan);
+
+        // Always decode vkDeferredOperationJoinKHR, which releases the data retained by the decoder for deferred
+        // vkCreateRayTracingPipelinesKHR calls.
+        processed_api_calls_[format::ApiCallId::ApiCall_vkDeferredOperationJoinKHR & (kApiCallIndexCount - 1)] = true;
+    }
+
     size_t Decode_vkUpdateDescriptorSetWithTemplate(const ApiCallInfo& call_info,
                                                     const uint8_t*     parameter_buffer,
                                                     size_t             buffer_size);
@@ -223,6 +245,7 @@ class VulkanDecoderBase : public ApiDecoder
 
   private:
     std::vector<VulkanConsumer*> consumers_;
+    std::vector<bool>            processed_api_calls_ = std::vector<bool>(kApiCallIndexCount, false);
 
     struct DeferredOperationFunctionCallData
     {
@@ -34,7 +34,18 @@ class VulkanObjectInfoTable : public VulkanObjectInfoTableBase2
   public:
     void ReplaceSemaphore(VkSemaphore target, VkSemaphore replacement)
     {
-        for (auto& entry : semaphore_map_)
+        ReplaceHandle(&semaphore_map_, target, replacement);
+    }
+
+    void ReplaceFence(VkFence target, VkFence replacement) { ReplaceHandle(&fence_map_, target, replacement); }
+
+  private:
+    template <typename T>
+    static void ReplaceHandle(std::unordered_map<format::HandleId, T>* map,
+                              typename T::HandleType                   target,
+                              typename T::HandleType                   replacement)
+    {
+        for (auto& entry : *map)
         {
             if (entry.second.handle == target)
             {
@@ -44,15 +55,14 @@ class VulkanObjectInfoTable : public VulkanObjectInfoTableBase2
         }
     }
 
-    void ReplaceFence(VkFence target, VkFence replacement)
+    template <typename T>
+    static void
+    ReplaceHandle(util::DenseHandleTable<T>* map, typename T::HandleType target, typename T::HandleType replacement)
     {
-        for (auto& entry : fence_map_)
+        T* info = map->FindIf([target](const T& entry) { return entry.handle == target; });
+        if (info != nullptr)
         {
-            if (entry.second.handle == target)
-            {
-                entry.second.handle = replacement;
-                break;
-            }
+            info->handle = replacement;
         }
     }
 };
@@ -27,6 +27,7 @@
 #include "decode/vulkan_object_info.h"
 #include "format/format.h"
 #include "util/defines.h"
+#include "util/dense_handle_table.h"
 
 #include "vulkan/vulkan.h"
 
@@ -149,6 +150,37 @@ class VulkanObjectInfoTableBase
 
         return object_info;
     }
+
+    template <typename T>
+    void AddObjectInfo(T&& info, util::DenseHandleTable<T>* map)
+    {
+        assert(map != nullptr);
+
+        if ((info.capture_id != 0) && (info.handle != VK_NULL_HANDLE))
+        {
+            auto result = map->Emplace(info.capture_id, std::forward<T>(info));
+
+            // See the std::unordered_map version above for when the ID is expected to already be in the map.
+            if (!result.second && (result.first->handle != info.handle))
+            {
+                *result.first = std::forward<T>(info);
+            }
+        }
+    }
+
+    template <typename T>
+    const T* GetObjectInfo(format::HandleId id, const util::DenseHandleTable<T>* map) const
+    {
+        assert(map != nullptr);
+        return (id != 0) ? map->Find(id) : nullptr;
+    }
+
+    template <typename T>
+    T* GetObjectInfo(format::HandleId id, util::DenseHandleTable<T>* map)
+    {
+        assert(map != nullptr);
+        return (id != 0) ? map->Find(id) : nullptr;
+    }
 };
 
 GFXRECON_END_NAMESPACE(decode)
@@ -48,6 +48,11 @@ class VulkanResourceTrackingConsumer : public VulkanConsumer
 
     virtual ~VulkanResourceTrackingConsumer() override;
 
+    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const override
+    {
+        return VulkanConsumerOverridesApiCall<VulkanResourceTrackingConsumer>(call_id);
+    }
+
     void InitializeLoader();
 
     void AddInstanceTable(VkInstance instance);
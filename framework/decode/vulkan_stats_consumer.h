@@ -68,6 +68,11 @@ class VulkanStatsConsumer : public gfxrecon::decode::VulkanConsumer
         return nullptr;
     }
 
+    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const override
+    {
+        return VulkanConsumerOverridesApiCall<VulkanStatsConsumer>(call_id);
+    }
+
     virtual void ProcessStateBeginMarker(uint64_t frame_number) override
     {
         // Theres should only be one of these in a capture file.
@@ -98,8 +98,9 @@ CaptureManager::CaptureManager(format::ApiFamilyId api_family) :
     queue_submit_count_(0), capture_mode_(kModeWrite), previous_hotkey_state_(false),
     previous_runtime_trigger_state_(CaptureSettings::RuntimeTriggerState::kNotUsed), debug_layer_(false),
     debug_device_lost_(false), screenshot_prefix_(""), screenshots_enabled_(false), disable_dxr_(false),
-    accel_struct_padding_(0), iunknown_wrapping_(false), force_command_serialization_(false), queue_zero_only_(false),
-    allow_pipeline_compile_required_(false), quit_after_frame_ranges_(false)
+    accel_struct_padding_(0), iunknown_wrapping_(false), force_command_serialization_(false),
+    lock_free_command_encoding_(false), queue_zero_only_(false), allow_pipeline_compile_required_(false),
+    quit_after_frame_ranges_(false)
 {}
 
 CaptureManager::~CaptureManager()
@@ -432,6 +433,10 @@ bool CaptureManager::Initialize(std::string base_filename, const CaptureSettings
         {
             CreateStateTracker();
         }
+
+        // Without trimming, the capture mode and capture file do not change after initialization and no state is
+        // tracked for command buffer commands, so those commands can be encoded without the API call lock.
+        lock_free_command_encoding_ = !trim_enabled_ && !force_command_serialization_;
     }
     else
     {
@@ -464,6 +469,49 @@ ParameterEncoder* CaptureManager::InitMethodCallCapture(format::ApiCallId call_i
     return thread_data->parameter_encoder_.get();
 }
 
+std::pair<const void*, size_t> CaptureManager::FinalizeApiCallBlock(ThreadData* thread_data)
+{
+    auto parameter_buffer = thread_data->parameter_buffer_.get();
+    assert((parameter_buffer != nullptr) && (thread_data->parameter_encoder_ != nullptr));
+
+    size_t uncompressed_size = parameter_buffer->GetDataSize();
+
+    if (compressor_ != nullptr)
+    {
+        size_t header_size     = sizeof(format::CompressedFunctionCallHeader);
+        size_t compressed_size = compressor_->Compress(
+            uncompressed_size, parameter_buffer->GetData(), &thread_data->compressed_buffer_, header_size);
+
+        if ((compressed_size > 0) && (compressed_size < uncompressed_size))
+        {
+            auto compressed_header =
+                reinterpret_cast<format::CompressedFunctionCallHeader*>(thread_data->compressed_buffer_.data());
+            compressed_header->block_header.type = format::BlockType::kCompressedFunctionCallBlock;
+            compressed_header->api_call_id       = thread_data->call_id_;
+            compressed_header->thread_id         = thread_data->thread_id_;
+            compressed_header->uncompressed_size = uncompressed_size;
+            compressed_header->block_header.size = sizeof(compressed_header->api_call_id) +
+                                                   sizeof(compressed_header->thread_id) +
+                                                   sizeof(compressed_header->uncompressed_size) + compressed_size;
+
+            return { thread_data->compressed_buffer_.data(), header_size + compressed_size };
+        }
+    }
+
+    uint8_t* header_data = parameter_buffer->GetHeaderData();
+    assert((header_data != nullptr) && (parameter_buffer->GetHeaderDataSize() == sizeof(format::FunctionCallHeader)));
+
+    auto uncompressed_header               = reinterpret_cast<format::FunctionCallHeader*>(header_data);
+    uncompressed_header->block_header.type = format::BlockType::kFunctionCallBlock;
+    uncompressed_header->api_call_id       = thread_data->call_id_;
+    uncompressed_header->thread_id         = thread_data->thread_id_;
+    uncompressed_header->block_header.size =
+        sizeof(uncompressed_header->api_call_id) + sizeof(uncompressed_header->thread_id) + uncompressed_size;
+
+    return { parameter_buffer->GetHeaderData(),
+             parameter_buffer->GetHeaderDataSize() + parameter_buffer->GetDataSize() };
+}
+
 void CaptureManager::EndApiCallCapture()
 {
     if ((capture_mode_ & kModeWrite) == kModeWrite)
@@ -471,53 +519,49 @@ void CaptureManager::EndApiCallCapture()
         auto thread_data = GetThreadData();
         assert(thread_data != nullptr);
 
-        auto parameter_buffer = thread_data->parameter_buffer_.get();
-        assert((parameter_buffer != nullptr) && (thread_data->parameter_encoder_ != nullptr));
-
-        bool   not_compressed    = true;
-        size_t uncompressed_size = parameter_buffer->GetDataSize();
+        auto block = FinalizeApiCallBlock(thread_data);
+        WriteToFile(block.first, block.second);
+    }
+}
 
-        if (compressor_ != nullptr)
-        {
-            size_t header_size     = sizeof(format::CompressedFunctionCallHeader);
-            size_t compressed_size = compressor_->Compress(
-                uncompressed_size, parameter_buffer->GetData(), &thread_data->compressed_buffer_, header_size);
+void CaptureManager::EndDeferredApiCallCapture(std::vector<uint8_t>* deferred_blocks, uint64_t* deferred_block_count)
+{
+    assert((deferred_blocks != nullptr) && (deferred_block_count != nullptr));
 
-            if ((compressed_size > 0) && (compressed_size < uncompressed_size))
-            {
-                auto compressed_header =
-                    reinterpret_cast<format::CompressedFunctionCallHeader*>(thread_data->compressed_buffer_.data());
-                compressed_header->block_header.type = format::BlockType::kCompressedFunctionCallBlock;
-                compressed_header->api_call_id       = thread_data->call_id_;
-                compressed_header->thread_id         = thread_data->thread_id_;
-                compressed_header->uncompressed_size = uncompressed_size;
-                compressed_header->block_header.size = sizeof(compressed_header->api_call_id) +
-                                                       sizeof(compressed_header->thread_id) +
-                                                       sizeof(compressed_header->uncompressed_size) + compressed_size;
+    if ((capture_mode_ & kModeWrite) == kModeWrite)
+    {
+        auto thread_data = GetThreadData();
+        assert(thread_data != nullptr);
 
-                WriteToFile(thread_data->compressed_buffer_.data(), header_size + compressed_size);
+        auto           block      = FinalizeApiCallBlock(thread_data);
+        const uint8_t* block_data = reinterpret_cast<const uint8_t*>(block.first);
+        deferred_blocks->insert(deferred_blocks->end(), block_data, block_data + block.second);
+        ++(*deferred_block_count);
+    }
+}
 
-                not_compressed = false;
-            }
-        }
+void CaptureManager::WriteDeferredApiCallBlocks(std::vector<uint8_t>* deferred_blocks, uint64_t* deferred_block_count)
+{
+    assert((deferred_blocks != nullptr) && (deferred_block_count != nullptr));
 
-        if (not_compressed)
+    if (!deferred_blocks->empty())
+    {
+        if ((capture_mode_ & kModeWrite) == kModeWrite)
         {
-            uint8_t* header_data = parameter_buffer->GetHeaderData();
-            assert((header_data != nullptr) &&
-                   (parameter_buffer->GetHeaderDataSize() == sizeof(format::FunctionCallHeader)));
+            assert(*deferred_block_count > 0);
+            WriteToFile(deferred_blocks->data(), deferred_blocks->size());
 
-            auto uncompressed_header               = reinterpret_cast<format::FunctionCallHeader*>(header_data);
-            uncompressed_header->block_header.type = format::BlockType::kFunctionCallBlock;
-            uncompressed_header->api_call_id       = thread_data->call_id_;
-            uncompressed_header->thread_id         = thread_data->thread_id_;
-            uncompressed_header->block_header.size =
-                sizeof(uncompressed_header->api_call_id) + sizeof(uncompressed_header->thread_id) + uncompressed_size;
+            // WriteToFile counted the write as one block.
+            block_index_ += *deferred_block_count - 1;
 
-            WriteToFile(parameter_buffer->GetHeaderData(),
-                        parameter_buffer->GetHeaderDataSize() + parameter_buffer->GetDataSize());
+            auto thread_data          = GetThreadData();
+            thread_data->block_index_ = block_index_.load();
         }
+
+        deferred_blocks->clear();
     }
+
+    *deferred_block_count = 0;
 }
 
 void CaptureManager::EndMethodCallCapture()
@@ -43,6 +43,7 @@
 #include <shared_mutex>
 #include <string>
 #include <unordered_map>
+#include <utility>
 #include <vector>
 #include "util/file_path.h"
 
@@ -153,6 +154,7 @@ class CaptureManager
 
     bool GetIUnknownWrappingSetting() const { return iunknown_wrapping_; }
     auto GetForceCommandSerialization() const { return force_command_serialization_; }
+    auto GetLockFreeCommandEncoding() const { return lock_free_command_encoding_; }
     auto GetQueueZeroOnly() const { return queue_zero_only_; }
     auto GetAllowPipelineCompileRequired() const { return allow_pipeline_compile_required_; }
 
@@ -270,6 +272,14 @@ class CaptureManager
 
     ParameterEncoder* InitApiCallCapture(format::ApiCallId call_id);
 
+    // Appends the function call block for the API call captured by the current thread to deferred_blocks, instead of
+    // writing it to the capture file, and increments deferred_block_count.
+    void EndDeferredApiCallCapture(std::vector<uint8_t>* deferred_blocks, uint64_t* deferred_block_count);
+
+    // Writes the function call blocks appended by EndDeferredApiCallCapture to the capture file with a single write,
+    // and advances the block index by the number of blocks written.
+    void WriteDeferredApiCallBlocks(std::vector<uint8_t>* deferred_blocks, uint64_t* deferred_block_count);
+
     ParameterEncoder* InitMethodCallCapture(format::ApiCallId call_id, format::HandleId object_id);
 
     void WriteResizeWindowCmd(format::HandleId surface_id, uint32_t width, uint32_t height);
@@ -307,6 +317,8 @@ class CaptureManager
     }
 
   private:
+    std::pair<const void*, size_t> FinalizeApiCallBlock(ThreadData* thread_data);
+
     static void AtExit()
     {
         if (delete_instance_func_)
@@ -360,6 +372,7 @@ class CaptureManager
     uint32_t                                accel_struct_padding_;
     bool                                    iunknown_wrapping_;
     bool                                    force_command_serialization_;
+    bool                                    lock_free_command_encoding_;
     bool                                    queue_zero_only_;
     bool                                    allow_pipeline_compile_required_;
     bool                                    quit_after_frame_ranges_;
@@ -263,6 +263,8 @@ VKAPI_ATTR void VKAPI_CALL CmdPushDescriptorSetWithTemplateKHR(VkCommandBuffer
 
         EncodeDescriptorUpdateTemplateInfo(manager, encoder, info, pData);
 
+        // Commands recorded before this one with deferred command encoding must be written first.
+        manager->WriteDeferredCommands(commandBuffer);
         manager->EndApiCallCapture();
     }
 
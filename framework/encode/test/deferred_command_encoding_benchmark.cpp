@@ -0,0 +1,159 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+// Compares the per-draw cost of writing each vkCmdDraw function call block to the capture file as it is recorded with
+// the cost of appending the blocks to a command buffer staging buffer that is written once per command buffer, as
+// is done by deferred command encoding. Run with: gfxrecon_encode_test [benchmark]
+
+#include "encode/parameter_buffer.h"
+#include "format/api_call_id.h"
+#include "format/format.h"
+#include "util/file_output_stream.h"
+
+#include <catch2/catch.hpp>
+
+#include <chrono>
+#include <cstdio>
+#include <mutex>
+#include <shared_mutex>
+#include <thread>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(encode)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+const uint32_t kDrawsPerCommandBuffer   = 1000;
+const uint32_t kCommandBuffersPerThread = 100;
+
+template <typename T>
+void EncodeValue(ParameterBuffer* parameter_buffer, T value)
+{
+    parameter_buffer->Write(&value, sizeof(value));
+}
+
+// Encode a vkCmdDraw call with the same layout as the generated encoder.
+void EncodeDraw(ParameterBuffer* parameter_buffer, format::ThreadId thread_id, uint32_t first_vertex)
+{
+    parameter_buffer->ClearWithHeader(sizeof(format::FunctionCallHeader));
+
+    EncodeValue<format::HandleEncodeType>(parameter_buffer, thread_id); // commandBuffer
+    EncodeValue<uint32_t>(parameter_buffer, 3);                         // vertexCount
+    EncodeValue<uint32_t>(parameter_buffer, 1);                         // instanceCount
+    EncodeValue<uint32_t>(parameter_buffer, first_vertex);              // firstVertex
+    EncodeValue<uint32_t>(parameter_buffer, 0);                         // firstInstance
+
+    auto header               = reinterpret_cast<format::FunctionCallHeader*>(parameter_buffer->GetHeaderData());
+    header->block_header.type = format::BlockType::kFunctionCallBlock;
+    header->api_call_id       = format::ApiCallId::ApiCall_vkCmdDraw;
+    header->thread_id         = thread_id;
+    header->block_header.size =
+        sizeof(header->api_call_id) + sizeof(header->thread_id) + parameter_buffer->GetDataSize();
+}
+
+// Record draws from each thread, returning the average time per draw in nanoseconds.
+template <typename RecordFunc>
+double MeasureDrawTime(uint32_t thread_count, RecordFunc record)
+{
+    std::vector<std::thread> threads;
+
+    auto start = std::chrono::steady_clock::now();
+    for (uint32_t i = 0; i < thread_count; ++i)
+    {
+        threads.emplace_back(record, static_cast<format::ThreadId>(i + 1));
+    }
+    for (auto& thread : threads)
+    {
+        thread.join();
+    }
+    auto end = std::chrono::steady_clock::now();
+
+    double draw_count = static_cast<double>(thread_count) * kCommandBuffersPerThread * kDrawsPerCommandBuffer;
+    return std::chrono::duration<double, std::nano>(end - start).count() / draw_count;
+}
+
+TEST_CASE("Deferred command encoding reduces the per-draw capture cost", "[.][benchmark]")
+{
+    const uint32_t thread_count = std::max(1u, std::min(8u, std::thread::hardware_concurrency()));
+
+    std::shared_mutex api_call_mutex;
+
+    // One block is written to the capture file, with the shared API call lock held, for each draw.
+    FILE*                  immediate_fp = std::tmpfile();
+    util::FileOutputStream immediate_file(immediate_fp, true);
+
+    double immediate_time = MeasureDrawTime(thread_count, [&](format::ThreadId thread_id) {
+        ParameterBuffer parameter_buffer;
+        for (uint32_t i = 0; i < kCommandBuffersPerThread; ++i)
+        {
+            for (uint32_t draw = 0; draw < kDrawsPerCommandBuffer; ++draw)
+            {
+                std::shared_lock<std::shared_mutex> api_call_lock(api_call_mutex);
+                EncodeDraw(&parameter_buffer, thread_id, draw);
+                immediate_file.Write(parameter_buffer.GetHeaderData(),
+                                     parameter_buffer.GetHeaderDataSize() + parameter_buffer.GetDataSize());
+            }
+        }
+    });
+
+    // Blocks are appended to the command buffer's staging buffer with the command buffer's own lock, and the staging
+    // buffer is written to the capture file when the command buffer is ended, which holds the shared API call lock.
+    FILE*                  deferred_fp = std::tmpfile();
+    util::FileOutputStream deferred_file(deferred_fp, true);
+
+    double deferred_time = MeasureDrawTime(thread_count, [&](format::ThreadId thread_id) {
+        ParameterBuffer      parameter_buffer;
+        std::mutex           deferred_command_lock;
+        std::vector<uint8_t> deferred_command_blocks;
+        for (uint32_t i = 0; i < kCommandBuffersPerThread; ++i)
+        {
+            for (uint32_t draw = 0; draw < kDrawsPerCommandBuffer; ++draw)
+            {
+                EncodeDraw(&parameter_buffer, thread_id, draw);
+                std::lock_guard<std::mutex> command_lock(deferred_command_lock);
+                const uint8_t*              block_data = parameter_buffer.GetHeaderData();
+                deferred_command_blocks.insert(deferred_command_blocks.end(),
+                                               block_data,
+                                               block_data + parameter_buffer.GetHeaderDataSize() +
+                                                   parameter_buffer.GetDataSize());
+            }
+
+            std::shared_lock<std::shared_mutex> api_call_lock(api_call_mutex);
+            std::lock_guard<std::mutex>         command_lock(deferred_command_lock);
+            deferred_file.Write(deferred_command_blocks.data(), deferred_command_blocks.size());
+            deferred_command_blocks.clear();
+        }
+    });
+
+    immediate_file.Flush();
+    deferred_file.Flush();
+
+    WARN("Threads: " << thread_count << ", immediate: " << immediate_time << " ns/draw, deferred: " << deferred_time
+                     << " ns/draw");
+
+    // Both methods write the same blocks.
+    REQUIRE(std::ftell(immediate_fp) == std::ftell(deferred_fp));
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(encode)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,221 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "generated/generated_vulkan_dispatch_table.h"
+
+#include <catch2/catch.hpp>
+
+#include <atomic>
+#include <cstring>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <utility>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(encode)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+const uint32_t kThreadCount = 8;
+const uint32_t kCallCount   = 1000;
+
+// Dispatchable handles start with the loader's dispatch pointer, which is shared by a device and its child objects.
+struct MockDispatchableObject
+{
+    const void* dispatch;
+    uint32_t    device_index;
+};
+
+struct MockDevice
+{
+    MockDevice(uint32_t index) :
+        device{ &dispatch, index }, queue{ &dispatch, index }, command_buffer{ &dispatch, index }
+    {}
+
+    VkDevice        GetDevice() { return reinterpret_cast<VkDevice>(&device); }
+    VkQueue         GetQueue() { return reinterpret_cast<VkQueue>(&queue); }
+    VkCommandBuffer GetCommandBuffer() { return reinterpret_cast<VkCommandBuffer>(&command_buffer); }
+
+    int                    dispatch{ 0 };
+    MockDispatchableObject device;
+    MockDispatchableObject queue;
+    MockDispatchableObject command_buffer;
+};
+
+const uint32_t kDeviceCount = 2;
+
+std::mutex                                      gpa_lock;
+std::map<std::pair<VkDevice, std::string>, int> gpa_calls;
+std::atomic<int>                                queue_wait_idle_calls[kDeviceCount];
+std::atomic<int>                                destroy_device_calls[kDeviceCount];
+std::atomic<float>                              blend_constant[kDeviceCount];
+
+uint32_t GetDeviceIndex(const void* handle)
+{
+    return reinterpret_cast<const MockDispatchableObject*>(handle)->device_index;
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL QueueWaitIdle(VkQueue queue)
+{
+    ++queue_wait_idle_calls[GetDeviceIndex(queue)];
+    return VK_ERROR_DEVICE_LOST;
+}
+
+VKAPI_ATTR void VKAPI_CALL CmdSetBlendConstants(VkCommandBuffer commandBuffer, const float blendConstants[4])
+{
+    blend_constant[GetDeviceIndex(commandBuffer)] = blendConstants[3];
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyDevice(VkDevice device, const VkAllocationCallbacks*)
+{
+    ++destroy_device_calls[GetDeviceIndex(device)];
+}
+
+// Provides the device functions above. Every other device function is not supported.
+VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, const char* pName)
+{
+    {
+        std::lock_guard<std::mutex> lock(gpa_lock);
+        ++gpa_calls[{ device, pName }];
+    }
+
+    if (strcmp(pName, "vkQueueWaitIdle") == 0)
+    {
+        return reinterpret_cast<PFN_vkVoidFunction>(QueueWaitIdle);
+    }
+    else if (strcmp(pName, "vkCmdSetBlendConstants") == 0)
+    {
+        return reinterpret_cast<PFN_vkVoidFunction>(CmdSetBlendConstants);
+    }
+    else if (strcmp(pName, "vkDestroyDevice") == 0)
+    {
+        return reinterpret_cast<PFN_vkVoidFunction>(DestroyDevice);
+    }
+    return nullptr;
+}
+
+int GetProcAddrCallCount(VkDevice device, const std::string& name)
+{
+    std::lock_guard<std::mutex> lock(gpa_lock);
+    auto                        entry = gpa_calls.find({ device, name });
+    return (entry != gpa_calls.end()) ? entry->second : 0;
+}
+
+TEST_CASE("LoadVulkanDeviceTable retrieves each device function once", "[dispatch_table]")
+{
+    MockDevice device(0);
+    auto       table = std::make_unique<VulkanDeviceTable>();
+    LoadVulkanDeviceTable(GetDeviceProcAddr, device.GetDevice(), table.get());
+
+    queue_wait_idle_calls[0] = 0;
+    REQUIRE(table->QueueWaitIdle(device.GetQueue()) == VK_ERROR_DEVICE_LOST);
+    REQUIRE(table->QueueWaitIdle(device.GetQueue()) == VK_ERROR_DEVICE_LOST);
+    REQUIRE(queue_wait_idle_calls[0] == 2);
+    REQUIRE(GetProcAddrCallCount(device.GetDevice(), "vkQueueWaitIdle") == 1);
+
+    PFN_vkQueueWaitIdle queue_wait_idle = table->QueueWaitIdle;
+    REQUIRE(queue_wait_idle == QueueWaitIdle);
+
+    PFN_vkGetDeviceProcAddr get_device_proc_addr = table->GetDeviceProcAddr;
+    REQUIRE(get_device_proc_addr == GetDeviceProcAddr);
+}
+
+TEST_CASE("LoadVulkanDeviceTable uses noop functions for unsupported device functions", "[dispatch_table]")
+{
+    MockDevice device(0);
+    auto       table = std::make_unique<VulkanDeviceTable>();
+    LoadVulkanDeviceTable(GetDeviceProcAddr, device.GetDevice(), table.get());
+
+    table->CmdDraw(device.GetCommandBuffer(), 3, 1, 0, 0);
+    table->CmdDraw(device.GetCommandBuffer(), 3, 1, 0, 0);
+    REQUIRE(GetProcAddrCallCount(device.GetDevice(), "vkCmdDraw") == 1);
+
+    PFN_vkCmdDraw cmd_draw = table->CmdDraw;
+    REQUIRE(cmd_draw == noop::CmdDraw);
+}
+
+TEST_CASE("Device tables call the functions of their own device from multiple threads", "[dispatch_table]")
+{
+    MockDevice devices[kDeviceCount] = { 0, 1 };
+    auto       tables                = std::make_unique<VulkanDeviceTable[]>(kDeviceCount);
+    for (uint32_t i = 0; i < kDeviceCount; ++i)
+    {
+        LoadVulkanDeviceTable(GetDeviceProcAddr, devices[i].GetDevice(), &tables[i]);
+    }
+
+    std::vector<std::thread> threads;
+    for (uint32_t i = 0; i < kThreadCount; ++i)
+    {
+        threads.emplace_back([&]() {
+            for (uint32_t call = 0; call < kCallCount; ++call)
+            {
+                for (uint32_t device = 0; device < kDeviceCount; ++device)
+                {
+                    float blend_constants[4] = { 0.0f, 0.0f, 0.0f, static_cast<float>(device + 1) };
+                    tables[device].CmdSetBlendConstants(devices[device].GetCommandBuffer(), blend_constants);
+                }
+            }
+        });
+    }
+    for (auto& thread : threads)
+    {
+        thread.join();
+    }
+
+    for (uint32_t i = 0; i < kDeviceCount; ++i)
+    {
+        REQUIRE(blend_constant[i] == static_cast<float>(i + 1));
+        REQUIRE(GetProcAddrCallCount(devices[i].GetDevice(), "vkCmdSetBlendConstants") == 1);
+
+        PFN_vkCmdSetBlendConstants cmd_set_blend_constants = tables[i].CmdSetBlendConstants;
+        REQUIRE(cmd_set_blend_constants == CmdSetBlendConstants);
+    }
+}
+
+TEST_CASE("Device tables can be loaded again after the device is destroyed", "[dispatch_table]")
+{
+    MockDevice device(1);
+    auto       table = std::make_unique<VulkanDeviceTable>();
+    LoadVulkanDeviceTable(GetDeviceProcAddr, device.GetDevice(), table.get());
+
+    destroy_device_calls[1] = 0;
+    table->DestroyDevice(device.GetDevice(), nullptr);
+    REQUIRE(destroy_device_calls[1] == 1);
+
+    // A new device may have the same dispatch key as the destroyed device.
+    auto new_table = std::make_unique<VulkanDeviceTable>();
+    LoadVulkanDeviceTable(GetDeviceProcAddr, device.GetDevice(), new_table.get());
+
+    queue_wait_idle_calls[1] = 0;
+    REQUIRE(new_table->QueueWaitIdle(device.GetQueue()) == VK_ERROR_DEVICE_LOST);
+    REQUIRE(queue_wait_idle_calls[1] == 1);
+
+    new_table->DestroyDevice(device.GetDevice(), nullptr);
+    REQUIRE(destroy_device_calls[1] == 2);
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(encode)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -2708,6 +2708,42 @@ bool VulkanCaptureManager::CheckPNextChainForFrameBoundary(const VkBaseInStructu
     return false;
 }
 
+void VulkanCaptureManager::DeferCommandApiCall(VkCommandBuffer command_buffer)
+{
+    auto cmd_buffer_wrapper = GetVulkanWrapper<vulkan_wrappers::CommandBufferWrapper>(command_buffer);
+    GFXRECON_ASSERT(cmd_buffer_wrapper != nullptr);
+
+    bool first_command = false;
+
+    {
+        // Commands are only written by other threads when an object is destroyed.
+        std::lock_guard<std::mutex> command_lock(cmd_buffer_wrapper->deferred_command_lock);
+        first_command = cmd_buffer_wrapper->deferred_command_blocks.empty();
+        EndDeferredApiCallCapture(&cmd_buffer_wrapper->deferred_command_blocks,
+                                  &cmd_buffer_wrapper->deferred_command_block_count);
+    }
+
+    if (first_command)
+    {
+        std::lock_guard<std::mutex> lock(deferred_command_buffers_lock_);
+        deferred_command_buffers_.insert(cmd_buffer_wrapper);
+    }
+}
+
+void VulkanCaptureManager::WriteDeferredCommands(vulkan_wrappers::CommandBufferWrapper* cmd_buffer_wrapper)
+{
+    assert(cmd_buffer_wrapper != nullptr);
+
+    {
+        std::lock_guard<std::mutex> lock(deferred_command_buffers_lock_);
+        deferred_command_buffers_.erase(cmd_buffer_wrapper);
+    }
+
+    std::lock_guard<std::mutex> command_lock(cmd_buffer_wrapper->deferred_command_lock);
+    WriteDeferredApiCallBlocks(&cmd_buffer_wrapper->deferred_command_blocks,
+                               &cmd_buffer_wrapper->deferred_command_block_count);
+}
+
 void VulkanCaptureManager::PreProcess_vkBindBufferMemory(VkDevice       device,
                                                          VkBuffer       buffer,
                                                          VkDeviceMemory memory,
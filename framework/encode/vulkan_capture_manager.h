@@ -195,6 +195,7 @@ class VulkanCaptureManager : public CaptureManager
             state_tracker_->RemoveEntry<Wrapper>(handle);
         }
 
+        WriteAllDeferredCommands();
         EndApiCallCapture();
     }
 
@@ -212,6 +213,7 @@ class VulkanCaptureManager : public CaptureManager
             }
         }
 
+        WriteAllDeferredCommands();
         EndApiCallCapture();
     }
 
@@ -260,6 +262,121 @@ class VulkanCaptureManager : public CaptureManager
         EndApiCallCapture();
     }
 
+    // Deferred command encoding appends the function call blocks for commands recorded to a command buffer to a buffer
+    // owned by the command buffer wrapper, which is written to the capture file with a single write when the command
+    // buffer is ended, reset, or freed. Commands that were recorded to a command buffer that entered the invalid state
+    // without being ended are written when recording begins again. The commands of all command buffers are written
+    // before the block for an object destruction, including vkDestroyDevice and vkDestroyInstance, so that commands are
+    // never written after the destruction of an object they reference. Commands that are still deferred when the
+    // application exits without destroying its devices and instances are not written. Commands are only deferred under
+    // the conditions that allow lock free command encoding, where the capture mode does not change and commands are not
+    // tracked for trimming. Otherwise the commands are written immediately, as they are with EndCommandApiCallCapture.
+    void EndDeferredCommandApiCallCapture(VkCommandBuffer command_buffer)
+    {
+        if (GetLockFreeCommandEncoding())
+        {
+            DeferCommandApiCall(command_buffer);
+        }
+        else
+        {
+            EndCommandApiCallCapture(command_buffer);
+        }
+    }
+
+    template <typename GetHandlesFunc, typename... GetHandlesArgs>
+    void EndDeferredCommandApiCallCapture(VkCommandBuffer command_buffer, GetHandlesFunc func, GetHandlesArgs... args)
+    {
+        if (GetLockFreeCommandEncoding())
+        {
+            // The command handles are only needed for state tracking.
+            DeferCommandApiCall(command_buffer);
+        }
+        else
+        {
+            EndCommandApiCallCapture(command_buffer, func, args...);
+        }
+    }
+
+    // Write the deferred commands for a command buffer to the capture file.
+    void WriteDeferredCommands(VkCommandBuffer command_buffer)
+    {
+        if (GetLockFreeCommandEncoding() && (command_buffer != VK_NULL_HANDLE))
+        {
+            auto cmd_buffer_wrapper = GetVulkanWrapper<vulkan_wrappers::CommandBufferWrapper>(command_buffer);
+            if (cmd_buffer_wrapper != nullptr)
+            {
+                WriteDeferredCommands(cmd_buffer_wrapper);
+            }
+        }
+    }
+
+    void WriteDeferredCommands(VkCommandPool command_pool)
+    {
+        if (GetLockFreeCommandEncoding() && (command_pool != VK_NULL_HANDLE))
+        {
+            auto pool_wrapper = GetVulkanWrapper<vulkan_wrappers::CommandPoolWrapper>(command_pool);
+            if (pool_wrapper != nullptr)
+            {
+                for (const auto& entry : pool_wrapper->child_buffers)
+                {
+                    WriteDeferredCommands(entry.second);
+                }
+            }
+        }
+    }
+
+    // Write the deferred commands for all command buffers to the capture file.
+    void WriteAllDeferredCommands()
+    {
+        if (GetLockFreeCommandEncoding())
+        {
+            std::lock_guard<std::mutex> lock(deferred_command_buffers_lock_);
+            for (auto cmd_buffer_wrapper : deferred_command_buffers_)
+            {
+                std::lock_guard<std::mutex> command_lock(cmd_buffer_wrapper->deferred_command_lock);
+                WriteDeferredApiCallBlocks(&cmd_buffer_wrapper->deferred_command_blocks,
+                                           &cmd_buffer_wrapper->deferred_command_block_count);
+            }
+            deferred_command_buffers_.clear();
+        }
+    }
+
+    void PreProcess_vkBeginCommandBuffer(VkCommandBuffer commandBuffer, const VkCommandBufferBeginInfo*)
+    {
+        WriteDeferredCommands(commandBuffer);
+    }
+
+    void PreProcess_vkEndCommandBuffer(VkCommandBuffer commandBuffer) { WriteDeferredCommands(commandBuffer); }
+
+    void PreProcess_vkResetCommandBuffer(VkCommandBuffer commandBuffer, VkCommandBufferResetFlags)
+    {
+        WriteDeferredCommands(commandBuffer);
+    }
+
+    void PreProcess_vkFreeCommandBuffers(VkDevice,
+                                         VkCommandPool,
+                                         uint32_t               commandBufferCount,
+                                         const VkCommandBuffer* pCommandBuffers)
+    {
+        if (pCommandBuffers != nullptr)
+        {
+            for (uint32_t i = 0; i < commandBufferCount; ++i)
+            {
+                WriteDeferredCommands(pCommandBuffers[i]);
+            }
+        }
+    }
+
+    void PreProcess_vkResetCommandPool(VkDevice, VkCommandPool commandPool, VkCommandPoolResetFlags)
+    {
+        WriteDeferredCommands(commandPool);
+    }
+
+    void PreProcess_vkDestroyCommandPool(VkDevice, VkCommandPool commandPool, const VkAllocationCallbacks*)
+    {
+        WriteDeferredCommands(commandPool);
+    }
+
     bool GetDescriptorUpdateTemplateInfo(VkDescriptorUpdateTemplate update_template,
                                          const UpdateTemplateInfo** info) const;
 
@@ -1332,6 +1449,9 @@ class VulkanCaptureManager : public CaptureManager
 
     bool CheckPNextChainForFrameBoundary(const VkBaseInStructure* current);
 
+    void DeferCommandApiCall(VkCommandBuffer command_buffer);
+    void WriteDeferredCommands(vulkan_wrappers::CommandBufferWrapper* cmd_buffer_wrapper);
+
   private:
     void QueueSubmitWriteFillMemoryCmd();
 
@@ -1341,6 +1461,10 @@ class VulkanCaptureManager : public CaptureManager
     std::unique_ptr<VulkanStateTracker>             state_tracker_;
     HardwareBufferMap                               hardware_buffers_;
     std::mutex                                      deferred_operation_mutex;
+
+    // Command buffers with deferred commands, for deferred command encoding.
+    std::set<vulkan_wrappers::CommandBufferWrapper*> deferred_command_buffers_;
+    std::mutex                                       deferred_command_buffers_lock_;
 };
 
 GFXRECON_END_NAMESPACE(encode)
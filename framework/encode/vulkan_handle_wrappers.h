@@ -38,6 +38,7 @@
 
 #include <limits>
 #include <memory>
+#include <mutex>
 #include <set>
 #include <unordered_map>
 #include <vector>
@@ -282,6 +283,12 @@ struct CommandBufferWrapper : public HandleWrapper<VkCommandBuffer>
     // when destroyed.
     CommandPoolWrapper* parent_pool{ nullptr };
 
+    // Function call blocks for deferred command encoding, which are written to the capture file when the command
+    // buffer is ended, reset, or freed, or when an object is destroyed.
+    std::mutex           deferred_command_lock;
+    std::vector<uint8_t> deferred_command_blocks;
+    uint64_t             deferred_command_block_count{ 0 };
+
     // Members for trimming state tracking.
     VkCommandBufferLevel       level{ VK_COMMAND_BUFFER_LEVEL_PRIMARY };
     util::MemoryOutputStream   command_data;
@@ -26,6 +26,8 @@
 #include "encode/vulkan_handle_wrappers.h"
 #include "format/format.h"
 #include "util/defines.h"
+#include "util/paged_handle_table.h"
+#include "util/sharded_handle_table.h"
 
 #include "vulkan/vulkan.h"
 
@@ -73,6 +75,59 @@ class VulkanStateTableBase
         return (entry != map.end()) ? entry->second : nullptr;
     }
 
+    template <typename T>
+    bool InsertEntry(format::HandleId id, T* wrapper, util::PagedHandleTable<T*>& table)
+    {
+        return table.Insert(id, wrapper);
+    }
+
+    template <typename Wrapper>
+    bool RemoveEntry(const Wrapper* wrapper, util::PagedHandleTable<Wrapper*>& table)
+    {
+        assert(wrapper != nullptr);
+        return table.Remove(wrapper->handle_id);
+    }
+
+    template <typename T>
+    T* GetWrapper(format::HandleId id, util::PagedHandleTable<T*>& table)
+    {
+        auto entry = table.Find(id);
+        return (entry != nullptr) ? *entry : nullptr;
+    }
+
+    template <typename T>
+    const T* GetWrapper(format::HandleId id, const util::PagedHandleTable<T*>& table) const
+    {
+        auto entry = table.Find(id);
+        return (entry != nullptr) ? *entry : nullptr;
+    }
+
+    // The sharded tables synchronize access to their entries, so they do not use the table mutex.
+    template <typename Key, typename T>
+    bool InsertEntry(Key key, T* wrapper, util::ShardedHandleTable<Key, T>& table)
+    {
+        return table.Insert(key, wrapper);
+    }
+
+    template <typename Wrapper>
+    bool RemoveEntry(const Wrapper* wrapper, util::ShardedHandleTable<format::HandleId, Wrapper>& table)
+    {
+        assert(wrapper != nullptr);
+        return table.Remove(wrapper->handle_id);
+    }
+
+    template <typename Key, typename Wrapper>
+    bool RemoveEntry(Key key, util::ShardedHandleTable<Key, Wrapper>& table)
+    {
+        return table.Remove(key);
+    }
+
+    template <typename T, typename Key>
+    T* GetWrapper(Key key, const util::ShardedHandleTable<Key, T>& table) const
+    {
+        return table.Find(key);
+    }
+
     template <typename Wrapper>
     bool InsertEntry(typename Wrapper::HandleType                                handle,
                      Wrapper*                                                    wrapper,
@@ -113,6 +168,11 @@ class VulkanStateTableBase
     mutable std::shared_mutex mutex_;
 };
 
+// Base class for state tables that store their entries in util::ShardedHandleTable objects, which allow entries to be
+// inserted, removed, and retrieved from multiple threads without an external lock.
+class VulkanShardedStateTableBase : public VulkanStateTableBase
+{};
+
 GFXRECON_END_NAMESPACE(encode)
 GFXRECON_END_NAMESPACE(gfxrecon)
 
@@ -1181,7 +1181,7 @@ void VulkanStateTracker::TrackResetDescriptorPool(VkDescriptorPool descriptor_po
     auto wrapper = GetVulkanWrapper<vulkan_wrappers::DescriptorPoolWrapper>(descriptor_pool);
 
     // Pool reset implicitly frees descriptor sets, so remove all wrappers from the state tracker.
-    std::unique_lock<std::mutex> lock(state_table_mutex_);
+    StateTableLock lock(state_table_mutex_);
     for (const auto& set_entry : wrapper->child_sets)
     {
         state_table_.RemoveWrapper(set_entry.second);
@@ -1429,7 +1429,7 @@ void VulkanStateTracker::DestroyState(vulkan_wrappers::InstanceWrapper* wrapper)
 
     // Physical devices are not explicitly destroyed, so need to be removed from the state tracker when their parent
     // instance is destroyed.
-    std::unique_lock<std::mutex> lock(state_table_mutex_);
+    StateTableLock lock(state_table_mutex_);
     for (const auto physical_device_entry : wrapper->child_physical_devices)
     {
         for (const auto display_entry : physical_device_entry->child_displays)
@@ -1453,7 +1453,7 @@ void VulkanStateTracker::DestroyState(vulkan_wrappers::DeviceWrapper* wrapper)
 
     // Queues are not explicitly destroyed, so need to be removed from the state tracker when their parent device is
     // destroyed.
-    std::unique_lock<std::mutex> lock(state_table_mutex_);
+    StateTableLock lock(state_table_mutex_);
     for (const auto& entry : wrapper->child_queues)
     {
         state_table_.RemoveWrapper(entry);
@@ -1467,7 +1467,7 @@ void VulkanStateTracker::DestroyState(vulkan_wrappers::CommandPoolWrapper* wrapp
 
     // Destroying the pool implicitly destroys objects allocated from the pool, which need to be removed from state
     // tracking.
-    std::unique_lock<std::mutex> lock(state_table_mutex_);
+    StateTableLock lock(state_table_mutex_);
     for (const auto& entry : wrapper->child_buffers)
     {
         state_table_.RemoveWrapper(entry.second);
@@ -1481,7 +1481,7 @@ void VulkanStateTracker::DestroyState(vulkan_wrappers::DescriptorPoolWrapper* wr
 
     // Destroying the pool implicitly destroys objects allocated from the pool, which need to be removed from state
     // tracking.
-    std::unique_lock<std::mutex> lock(state_table_mutex_);
+    StateTableLock lock(state_table_mutex_);
     for (const auto& entry : wrapper->child_sets)
     {
         state_table_.RemoveWrapper(entry.second);
@@ -1495,7 +1495,7 @@ void VulkanStateTracker::DestroyState(vulkan_wrappers::SwapchainKHRWrapper* wrap
 
     // Swapchain images are not explicitly destroyed, so need to be removed from state tracking when the parent
     // swapchain is destroyed.
-    std::unique_lock<std::mutex> lock(state_table_mutex_);
+    StateTableLock lock(state_table_mutex_);
     for (auto entry : wrapper->child_images)
     {
         state_table_.RemoveWrapper(entry);
@@ -41,6 +41,8 @@
 #include <cassert>
 #include <functional>
 #include <mutex>
+#include <shared_mutex>
+#include <type_traits>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(encode)
@@ -56,7 +58,7 @@ class VulkanStateTracker
     {
         if (writer != nullptr)
         {
-            std::unique_lock<std::mutex> lock(state_table_mutex_);
+            std::unique_lock<std::shared_mutex> lock(state_table_mutex_);
             return writer->WriteState(state_table_, frame_number);
         }
 
@@ -78,7 +80,7 @@ class VulkanStateTracker
             auto wrapper = GetVulkanWrapper<Wrapper>(*new_handle);
 
             // Adds the handle wrapper to the object state table, filtering for duplicate handle retrieval.
-            std::unique_lock<std::mutex> lock(state_table_mutex_);
+            StateTableLock lock(state_table_mutex_);
             if (state_table_.InsertWrapper(wrapper->handle_id, wrapper))
             {
                 vulkan_state_tracker::InitializeState<ParentHandle, Wrapper, CreateInfo>(
@@ -106,7 +108,7 @@ class VulkanStateTracker
         vulkan_state_info::CreateParameters create_parameters = std::make_shared<util::MemoryOutputStream>(
             create_parameter_buffer->GetData(), create_parameter_buffer->GetDataSize());
 
-        std::unique_lock<std::mutex> lock(state_table_mutex_);
+        StateTableLock lock(state_table_mutex_);
         for (uint32_t i = 0; i < count; ++i)
         {
             if (new_handles[i] != VK_NULL_HANDLE)
@@ -158,7 +160,7 @@ class VulkanStateTracker
         vulkan_state_info::CreateParameters create_parameters = std::make_shared<util::MemoryOutputStream>(
             create_parameter_buffer->GetData(), create_parameter_buffer->GetDataSize());
 
-        std::unique_lock<std::mutex> lock(state_table_mutex_);
+        StateTableLock lock(state_table_mutex_);
         for (uint32_t i = 0; i < count; ++i)
         {
             auto wrapper = unwrap_struct_handle(&handle_structs[i]);
@@ -211,7 +213,7 @@ class VulkanStateTracker
             // Scope the state table mutex lock because DestroyState also modifies the state table and will attempt to
             // lock the mutex.
             {
-                std::unique_lock<std::mutex> lock(state_table_mutex_);
+                StateTableLock lock(state_table_mutex_);
                 if (!state_table_.RemoveWrapper(wrapper))
                 {
                     GFXRECON_LOG_WARNING(
@@ -424,7 +426,7 @@ class VulkanStateTracker
         assert(new_handles != nullptr);
         assert(create_parameters != nullptr);
 
-        std::unique_lock<std::mutex> lock(state_table_mutex_);
+        StateTableLock lock(state_table_mutex_);
         for (uint32_t i = 0; i < count; ++i)
         {
             if (new_handles[i] != VK_NULL_HANDLE)
@@ -478,8 +480,15 @@ class VulkanStateTracker
 
     void TrackQuerySubmissions(vulkan_wrappers::CommandBufferWrapper* command_wrapper);
 
-    std::mutex       state_table_mutex_;
-    VulkanStateTable state_table_;
+    // When the generated state table synchronizes access to its own entries, entries are added and removed with a
+    // shared lock, so that threads do not wait for each other, and writing the state takes an exclusive lock so that it
+    // sees a consistent table. Otherwise, all state table access takes an exclusive lock.
+    using StateTableLock = std::conditional_t<std::is_base_of<VulkanShardedStateTableBase, VulkanStateTable>::value,
+                                              std::shared_lock<std::shared_mutex>,
+                                              std::unique_lock<std::shared_mutex>>;
+
+    std::shared_mutex state_table_mutex_;
+    VulkanStateTable  state_table_;
 
     // Keeps track of device memories' device addresses
     std::unordered_map<VkDeviceAddress, const vulkan_wrappers::DeviceMemoryWrapper*> device_memory_addresses_map;
@@ -27,6 +27,9 @@ from base_generator import ValueInfo, write
 class BaseDecoderBodyGenerator():
     """Base class for generating decoder body code."""
 
+    # Generate a DecodeAllocator::ReserveForParameters call at the start of the decoder methods that decode pointers.
+    reserve_decode_memory = False
+
     def generate_feature(self):
         """Performs C++ code generation for the feature."""
         platform_type = 'Vulkan'
@@ -48,6 +51,11 @@ class BaseDecoderBodyGenerator():
             cmddef += '{\n'
             cmddef += '    size_t bytes_read = 0;\n'
             cmddef += '\n'
+            if self.reserve_decode_memory and any(
+                value.is_pointer or value.is_array for value in values
+            ):
+                cmddef += '    DecodeAllocator::ReserveForParameters(buffer_size);\n'
+                cmddef += '\n'
             cmddef += self.make_cmd_body(return_type, cmd, values)
             cmddef += '\n'
             cmddef += '    return bytes_read;\n'
@@ -0,0 +1,152 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+## @file Per-phase profiling for the code generators.
+## A GeneratorProfiler wraps the phase methods of a generator instance to
+## record the number of calls, wall time, CPU time, and bytes written to the
+## output file for each phase, along with the totals and peak Python memory
+## use for the target. The results are written as one JSON file per target.
+
+import json
+import os
+import time
+import tracemalloc
+
+# Increment when the format of the profile files changes.
+PROFILE_VERSION = 1
+
+# Generator methods that are profiled by default.
+PROFILED_METHODS = [
+    'beginFile', 'genStruct', 'genCmd', 'generate_feature', 'endFile'
+]
+
+
+class GeneratorProfiler():
+    """Records per-phase timing and output size for a single generator target.
+    The generator methods are wrapped on the generator instance, so calls that
+    a subclass makes to a base class implementation are counted once, as part
+    of the subclass method.
+    """
+
+    def __init__(self, target, gen, methods=PROFILED_METHODS):
+        self.target = target
+        self.gen = gen
+        self.phases = dict()
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_memory = 0
+        self.bytes = 0
+        self.start_wall = None
+        self.start_cpu = None
+
+        for name in methods:
+            if hasattr(gen, name):
+                self.__wrap(name)
+
+    def __get_output_path(self):
+        gen_opts = getattr(self.gen, 'genOpts', None)
+        if gen_opts and gen_opts.filename:
+            return os.path.join(gen_opts.directory, gen_opts.filename)
+        return None
+
+    def __get_output_size(self, output_path):
+        """Return the number of bytes written to the output file so far."""
+        out_file = getattr(self.gen, 'outFile', None)
+        if out_file and not out_file.closed:
+            return out_file.tell()
+        if output_path and os.path.isfile(output_path):
+            return os.path.getsize(output_path)
+        return 0
+
+    def __wrap(self, name):
+        method = getattr(self.gen, name)
+        phase = {'calls': 0, 'wall': 0.0, 'cpu': 0.0, 'bytes': 0}
+        self.phases[name] = phase
+
+        def profiled_method(*args, **kwargs):
+            # The output path is captured before the call, because endFile()
+            # clears the generator options.
+            output_path = self.__get_output_path()
+            start_size = self.__get_output_size(None)
+            start_wall = time.perf_counter()
+            start_cpu = time.process_time()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                phase['calls'] += 1
+                phase['wall'] += time.perf_counter() - start_wall
+                phase['cpu'] += time.process_time() - start_cpu
+                phase['bytes'] += max(
+                    self.__get_output_size(output_path) - start_size, 0
+                )
+
+        setattr(self.gen, name, profiled_method)
+
+    def start(self):
+        """Start profiling the target.  Peak memory is measured with tracemalloc,
+        which slows down the generator while it is active.
+        """
+        tracemalloc.start()
+        self.start_wall = time.perf_counter()
+        self.start_cpu = time.process_time()
+
+    def stop(self, output_path):
+        """Stop profiling the target, recording the size of the generated file."""
+        self.wall = time.perf_counter() - self.start_wall
+        self.cpu = time.process_time() - self.start_cpu
+        self.peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        if os.path.isfile(output_path):
+            self.bytes = os.path.getsize(output_path)
+
+    def to_dict(self):
+        return {
+            'version': PROFILE_VERSION,
+            'target': self.target,
+            'wall': self.wall,
+            'cpu': self.cpu,
+            'peak_memory': self.peak_memory,
+            'bytes': self.bytes,
+            'phases': self.phases
+        }
+
+    def write(self, profile_dir):
+        """Write the results to <profile_dir>/<target>.json."""
+        os.makedirs(profile_dir, exist_ok=True)
+        path = os.path.join(profile_dir, self.target + '.json')
+        with open(path + '.tmp', 'w') as f:
+            json.dump(self.to_dict(), f, indent=4)
+        os.replace(path + '.tmp', path)
+
+
+def load_profiles(profile_dir):
+    """Load the profile files in a directory into a dictionary of target names
+    to profile dictionaries.
+    """
+    profiles = dict()
+    for filename in sorted(os.listdir(profile_dir)):
+        if filename.endswith('.json'):
+            with open(os.path.join(profile_dir, filename), 'r') as f:
+                profile = json.load(f)
+            if profile.get('version') == PROFILE_VERSION:
+                profiles[profile['target']] = profile
+    return profiles
@@ -0,0 +1,178 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+## @file Incremental regeneration support for the code generators.
+## A TargetCache records a hash of the inputs used to generate each target
+## (registry files, JSON configuration files, generator module sources) next
+## to a hash of the generated output, so that a target with unchanged inputs
+## can be skipped. replace_if_changed() only replaces a generated file when
+## its content has changed, so that the build system only recompiles sources
+## that really changed.
+
+import hashlib
+import json
+import os
+import sys
+import sysconfig
+import types
+
+# Increment when the format of the cache files or the set of hashed inputs changes.
+TARGET_CACHE_VERSION = 2
+
+
+def update_hash(hasher, path):
+    """Update hasher with the content of a file."""
+    with open(path, 'rb') as f:
+        hasher.update(f.read())
+
+
+def hash_file(path):
+    """Return the sha256 hex digest of a file's content."""
+    hasher = hashlib.sha256()
+    update_hash(hasher, path)
+    return hasher.hexdigest()
+
+
+def _is_library_file(path):
+    """Determine if a file belongs to the Python standard library or site packages."""
+    path = os.path.normcase(os.path.abspath(path))
+    for key in ['stdlib', 'platstdlib', 'purelib', 'platlib']:
+        lib_path = sysconfig.get_paths().get(key)
+        if lib_path and path.startswith(
+            os.path.normcase(os.path.abspath(lib_path)) + os.sep
+        ):
+            return True
+    return False
+
+
+def get_generator_sources(generator_class):
+    """Return a sorted list of the source files for the modules that define
+    generator_class and its base classes, the generator modules that those
+    modules import, and the other Python files in the directories of those
+    modules. The directories are included so that changes to shared generator
+    code, such as the registry type index, invalidate every target even when
+    it is not imported by the target's generator module. Standard library and
+    site package modules are excluded.
+    """
+    pending = [
+        sys.modules[cls.__module__]
+        for cls in generator_class.__mro__
+        if cls.__module__ in sys.modules
+    ]
+    visited = set()
+    sources = set()
+    while pending:
+        module = pending.pop()
+        if module.__name__ in visited:
+            continue
+        visited.add(module.__name__)
+
+        path = getattr(module, '__file__', None)
+        if (not path) or (not path.endswith('.py')) or _is_library_file(path):
+            continue
+        sources.add(os.path.abspath(path))
+
+        for value in vars(module).values():
+            if isinstance(value, types.ModuleType):
+                pending.append(value)
+            else:
+                module_name = getattr(value, '__module__', None)
+                if isinstance(module_name, str) and (module_name in sys.modules):
+                    pending.append(sys.modules[module_name])
+
+    for directory in set(os.path.dirname(path) for path in sources):
+        for filename in os.listdir(directory):
+            if filename.endswith('.py'):
+                sources.add(os.path.join(directory, filename))
+    return sorted(sources)
+
+
+def replace_if_changed(src_path, dest_path):
+    """Move the file at src_path to dest_path if dest_path does not exist or has
+    different content, otherwise delete src_path and leave dest_path untouched.
+    Returns True if dest_path was replaced.
+    """
+    if os.path.isfile(dest_path):
+        with open(src_path, 'rb') as src, open(dest_path, 'rb') as dest:
+            if src.read() == dest.read():
+                os.remove(src_path)
+                return False
+    os.replace(src_path, dest_path)
+    return True
+
+
+class TargetCache():
+    """Records the input hash and output hash for each generated target in a
+    small JSON file per target, so that concurrent generator processes never
+    write the same cache file.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+
+    def make_input_hash(self, target, input_files, generator_class, extra=None):
+        """Create a hash of the inputs for a target.
+         input_files - List of registry, header, and configuration file paths.
+         generator_class - Generator class; its module sources are hashed.
+         extra - Optional list of strings, such as option values, to include.
+        """
+        hasher = hashlib.sha256()
+        hasher.update('{}\0{}\0'.format(TARGET_CACHE_VERSION, target).encode())
+        for path in list(input_files) + get_generator_sources(generator_class):
+            hasher.update(os.path.basename(path).encode() + b'\0')
+            update_hash(hasher, path)
+        if extra:
+            for value in extra:
+                hasher.update(str(value).encode() + b'\0')
+        return hasher.hexdigest()
+
+    def get_cache_path(self, target):
+        return os.path.join(self.cache_dir, target + '.json')
+
+    def is_up_to_date(self, target, output_path, input_hash):
+        """Determine if the output for a target was generated from inputs with the
+        specified hash and has not been modified since it was generated.
+        """
+        cache_path = self.get_cache_path(target)
+        if not (os.path.isfile(cache_path) and os.path.isfile(output_path)):
+            return False
+        try:
+            with open(cache_path, 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return (entry.get('version') == TARGET_CACHE_VERSION) and (
+            entry.get('inputs') == input_hash
+        ) and (entry.get('output') == hash_file(output_path))
+
+    def update(self, target, output_path, input_hash):
+        """Record the input hash and output hash for a generated target."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {
+            'version': TARGET_CACHE_VERSION,
+            'inputs': input_hash,
+            'output': hash_file(output_path)
+        }
+        cache_path = self.get_cache_path(target)
+        with open(cache_path + '.tmp', 'w') as f:
+            json.dump(entry, f, indent=4)
+        os.replace(cache_path + '.tmp', cache_path)
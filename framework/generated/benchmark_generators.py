@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Profile the Vulkan code generators and check for performance regressions.
+
+Generates every Vulkan target into a temporary directory with per-phase
+profiling enabled. The results can be saved as a baseline with --save-baseline,
+and compared against a saved baseline with --baseline, in which case the script
+fails when the CPU time of a target or generator phase, or the peak memory of a
+target, grows past the threshold. The baseline records a hash of vk.xml, and
+only results for the same vk.xml are compared.
+
+The DX12 targets are also profiled when --dx12-sdk-include-dir is specified,
+with the DXGI and WinAPI headers from that directory. A hash of the DX12
+headers is recorded in the same way as vk.xml.
+'''
+
+import argparse
+import json
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
+KHRONOS_REGISTRY_DIR = os.path.normpath(
+    os.path.join(
+        SCRIPT_DIR, '..', '..', 'external', 'Vulkan-Headers', 'registry'
+    )
+)
+BASE_GENERATOR_DIR = os.path.join(SCRIPT_DIR, 'base_generators')
+GENERATOR_DIR = os.path.join(SCRIPT_DIR, 'vulkan_generators')
+VK_HEADERS_DIR = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', '..', 'external', 'Vulkan-Headers')
+)
+
+# Increment when the format of the benchmark results changes.
+BENCHMARK_VERSION = 1
+
+
+def run_benchmark(registry_dir):
+    """Generate all Vulkan targets with profiling enabled, returning the
+    benchmark results dictionary.
+    """
+    sys.path[0:0] = [
+        KHRONOS_REGISTRY_DIR, BASE_GENERATOR_DIR, GENERATOR_DIR,
+        VK_HEADERS_DIR
+    ]
+    import gencode
+    import generate_vulkan
+    from generator_profiler import load_profiles
+    from target_cache import hash_file
+
+    registry_path = os.path.join(registry_dir, 'vk.xml')
+    video_path = os.path.join(registry_dir, 'video.xml')
+
+    os.chdir(SCRIPT_DIR)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = os.path.join(temp_dir, 'output')
+        profile_dir = os.path.join(temp_dir, 'profile')
+        os.makedirs(output_dir)
+        gencode_args = gencode.make_arg_parser().parse_args(
+            [
+                '-quiet', '-o', output_dir, '-configs', GENERATOR_DIR,
+                '-registry', registry_path, '-video', video_path,
+                '-profile-dir', profile_dir
+            ]
+        )
+        # Generate one target at a time, so that targets do not compete for CPU.
+        gencode.generate_targets(
+            gencode_args, generate_vulkan.generate_targets, 1
+        )
+        profiles = load_profiles(profile_dir)
+
+    return {
+        'version': BENCHMARK_VERSION,
+        'registry': hash_file(registry_path),
+        'targets': profiles
+    }
+
+
+def run_dx12_benchmark(sdk_include_dir, sdk_version):
+    """Generate all DX12 targets with profiling enabled, returning the
+    profiles for each target and a hash of the headers they were generated
+    from.
+    """
+    import generate_dx12
+    from generator_profiler import load_profiles
+    from target_cache import update_hash
+
+    hasher = hashlib.sha256()
+    for source_files in generate_dx12.get_source_files(sdk_include_dir):
+        for source_file in source_files:
+            update_hash(hasher, source_file)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dir = os.path.join(temp_dir, 'output')
+        profile_dir = os.path.join(temp_dir, 'profile')
+        # Parse the headers and generate one target at a time, so that they
+        # do not compete for CPU.
+        subprocess.run(
+            [
+                sys.executable,
+                os.path.join(SCRIPT_DIR, 'generate_dx12.py'), '--no-cache',
+                '-j', '1', '--sdk-include-dir', sdk_include_dir,
+                '--sdk-version', sdk_version, '--output-dir', output_dir,
+                '--profile-dir', profile_dir
+            ],
+            stdout=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            check=True
+        )
+        profiles = load_profiles(profile_dir)
+
+    return profiles, hasher.hexdigest()
+
+
+def is_regression(baseline, current, threshold, min_delta):
+    return (current > baseline * (1.0 + threshold)) and (
+        current - baseline > min_delta
+    )
+
+
+def find_regressions(baseline, results, threshold, min_time, min_memory):
+    """Compare benchmark results with a baseline, returning a list of messages
+    that describe each regression.
+    """
+    regressions = []
+    for target, profile in sorted(results['targets'].items()):
+        base_profile = baseline['targets'].get(target)
+        if base_profile is None:
+            continue
+
+        if is_regression(
+            base_profile['cpu'], profile['cpu'], threshold, min_time
+        ):
+            regressions.append(
+                '{}: CPU time {:.3f} s -> {:.3f} s'.format(
+                    target, base_profile['cpu'], profile['cpu']
+                )
+            )
+        if is_regression(
+            base_profile['peak_memory'], profile['peak_memory'], threshold,
+            min_memory
+        ):
+            regressions.append(
+                '{}: peak memory {} -> {} bytes'.format(
+                    target, base_profile['peak_memory'],
+                    profile['peak_memory']
+                )
+            )
+        for name, phase in sorted(profile['phases'].items()):
+            base_phase = base_profile['phases'].get(name)
+            if base_phase and is_regression(
+                base_phase['cpu'], phase['cpu'], threshold, min_time
+            ):
+                regressions.append(
+                    '{} {}: CPU time {:.3f} s -> {:.3f} s'.format(
+                        target, name, base_phase['cpu'], phase['cpu']
+                    )
+                )
+    return regressions
+
+
+def print_results(results):
+    print(
+        '{:<56} {:>9} {:>9} {:>12} {:>10}'.format(
+            'Target', 'Wall (s)', 'CPU (s)', 'Peak memory', 'Bytes'
+        )
+    )
+    for target, profile in sorted(results['targets'].items()):
+        print(
+            '{:<56} {:>9.3f} {:>9.3f} {:>12} {:>10}'.format(
+                target, profile['wall'], profile['cpu'],
+                profile['peak_memory'], profile['bytes']
+            )
+        )
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        '--registry-dir',
+        dest='registry_dir',
+        default=KHRONOS_REGISTRY_DIR,
+        help='\n'.join(
+            [
+                'Path to a directory that holds the Vulkan registry files (vk.xml and video.xml).',
+                'Defaults to the registry from the external Khronos Vulkan headers sub module.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--baseline',
+        dest='baseline',
+        default=None,
+        help='Benchmark results to compare against.'
+    )
+    arg_parser.add_argument(
+        '--save-baseline',
+        dest='save_baseline',
+        default=None,
+        help='File to write the benchmark results to, for use with --baseline.'
+    )
+    arg_parser.add_argument(
+        '--threshold',
+        dest='threshold',
+        type=float,
+        default=0.25,
+        help='Fraction that a CPU time or peak memory value may grow before it is reported as a regression.'
+    )
+    arg_parser.add_argument(
+        '--min-time',
+        dest='min_time',
+        type=float,
+        default=0.05,
+        help='Smallest CPU time increase, in seconds, that is reported as a regression.'
+    )
+    arg_parser.add_argument(
+        '--min-memory',
+        dest='min_memory',
+        type=int,
+        default=4 * 1024 * 1024,
+        help='Smallest peak memory increase, in bytes, that is reported as a regression.'
+    )
+    arg_parser.add_argument(
+        '--dx12-sdk-include-dir',
+        dest='dx12_sdk_include_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Also profile the DX12 targets, with the Windows SDK headers from this directory.',
+                'See the --sdk-include-dir option of generate_dx12.py.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--dx12-sdk-version',
+        dest='dx12_sdk_version',
+        default='10.0.0.0',
+        help='Windows SDK version to record in the generated DX12 files.'
+    )
+    args = arg_parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != BENCHMARK_VERSION:
+            raise Exception(
+                'Error: {} has an unsupported version'.format(args.baseline)
+            )
+
+    results = run_benchmark(os.path.abspath(args.registry_dir))
+    if args.dx12_sdk_include_dir:
+        dx12_profiles, results['dx12_headers'] = run_dx12_benchmark(
+            os.path.abspath(args.dx12_sdk_include_dir), args.dx12_sdk_version
+        )
+        results['targets'].update(dx12_profiles)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(results, f, indent=4)
+
+    if baseline:
+        if baseline['registry'] != results['registry']:
+            raise Exception(
+                'Error: {} was created with a different vk.xml'.format(
+                    args.baseline
+                )
+            )
+        # The DX12 targets are only compared when both results include them.
+        if ('dx12_headers' in baseline) and ('dx12_headers' in results) and (
+            baseline['dx12_headers'] != results['dx12_headers']
+        ):
+            raise Exception(
+                'Error: {} was created with different DX12 headers'.format(
+                    args.baseline
+                )
+            )
+        regressions = find_regressions(
+            baseline, results, args.threshold, args.min_time, args.min_memory
+        )
+        for regression in regressions:
+            print('Regression:', regression)
+        if regressions:
+            sys.exit(1)
+        print('No regressions found')
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Compare the cost of the XPath based pNext handle search previously used by
+BaseGenerator.check_struct_pnext_handles with the RegistryTypeIndex lookups,
+and verify that both produce the same results for every struct in the registry.
+'''
+
+import argparse
+import os
+import sys
+import time
+
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
+KHRONOS_REGISTRY_DIR = os.path.normpath(
+    os.path.join(
+        SCRIPT_DIR, '..', '..', 'external', 'Vulkan-Headers', 'registry'
+    )
+)
+BASE_GENERATOR_DIR = os.path.join(SCRIPT_DIR, 'base_generators')
+GENERATOR_DIR = os.path.join(SCRIPT_DIR, 'vulkan_generators')
+VK_HEADERS_DIR = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', '..', 'external', 'Vulkan-Headers')
+)
+
+# The target used to create the generator that loads the registry.
+REGISTRY_TARGET = 'generated_vulkan_struct_handle_wrappers.cpp'
+
+
+def xpath_pnext_handles(registry, typename, ext_handles, ext_handle_ptrs):
+    """The XPath search from the original check_struct_pnext_handles, with the
+    per-generator result caches passed as arguments.
+    """
+    found_handles = False
+    found_handle_ptrs = False
+    for struct_name in registry.validextensionstructs.get(typename, []):
+        if struct_name in ext_handles:
+            found_handles = found_handles or ext_handles[struct_name]
+            found_handle_ptrs = found_handle_ptrs or ext_handle_ptrs[
+                struct_name]
+            continue
+
+        has_handles = False
+        has_handle_ptrs = False
+        type_info = registry.lookupElementInfo(struct_name, registry.typedict)
+        if type_info:
+            for member_info in type_info.elem.findall('.//member/type'):
+                found = registry.tree.find(
+                    "types/type/[name='" + member_info.text
+                    + "'][@category='handle']"
+                )
+                if found is not None:
+                    has_handles = True
+                    if member_info.tail and ('*' in member_info.tail):
+                        has_handle_ptrs = True
+        ext_handles[struct_name] = has_handles
+        ext_handle_ptrs[struct_name] = has_handle_ptrs
+        found_handles = found_handles or has_handles
+        found_handle_ptrs = found_handle_ptrs or has_handle_ptrs
+    return found_handles, found_handle_ptrs
+
+
+def time_xpath(registry, typenames, repeat):
+    results = {}
+    start = time.perf_counter()
+    for i in range(repeat):
+        # Each generator instance started with empty caches.
+        ext_handles = {}
+        ext_handle_ptrs = {}
+        for typename in typenames:
+            results[typename] = xpath_pnext_handles(
+                registry, typename, ext_handles, ext_handle_ptrs
+            )
+    return (time.perf_counter() - start) / repeat, results
+
+
+def time_index(registry, typenames, repeat):
+    from base_generator import RegistryTypeIndex
+
+    start = time.perf_counter()
+    index = RegistryTypeIndex(registry)
+    build_time = time.perf_counter() - start
+
+    results = {}
+    start = time.perf_counter()
+    for i in range(repeat):
+        for typename in typenames:
+            results[typename] = index.pnext_handles.get(
+                typename, (False, False)
+            )
+    return build_time, (time.perf_counter() - start) / repeat, results
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        '--registry-dir',
+        dest='registry_dir',
+        default=KHRONOS_REGISTRY_DIR,
+        help='Path to a directory that holds the Vulkan registry files (vk.xml and video.xml).'
+    )
+    arg_parser.add_argument(
+        '--repeat',
+        dest='repeat',
+        type=int,
+        default=5,
+        help='Number of times to repeat each search, which is the number of generators that run the search for one regeneration.'
+    )
+    args = arg_parser.parse_args()
+
+    sys.path[0:0] = [
+        KHRONOS_REGISTRY_DIR, BASE_GENERATOR_DIR, GENERATOR_DIR,
+        VK_HEADERS_DIR
+    ]
+    import gencode
+
+    registry_dir = os.path.abspath(args.registry_dir)
+    gencode_args = gencode.make_arg_parser().parse_args(
+        [
+            '-quiet', '-o', SCRIPT_DIR, '-configs', GENERATOR_DIR, '-registry',
+            os.path.join(registry_dir, 'vk.xml'), '-video',
+            os.path.join(registry_dir, 'video.xml'), REGISTRY_TARGET
+        ]
+    )
+    (tree, video_tree) = gencode.make_registry_tree(gencode_args)
+    (gen, options) = gencode.gen_target(gencode_args)
+    registry = gencode.load_registry(gencode_args, tree, gen, options)
+
+    # Every struct and union, including those without extension structs.
+    typenames = sorted(
+        set(
+            key if isinstance(key, str) else key[0]
+            for key, info in registry.typedict.items()
+            if info.elem.get('category') in ['struct', 'union']
+        )
+    )
+
+    xpath_time, xpath_results = time_xpath(registry, typenames, args.repeat)
+    build_time, index_time, index_results = time_index(
+        registry, typenames, args.repeat
+    )
+
+    mismatches = [
+        typename for typename in typenames
+        if xpath_results[typename] != index_results[typename]
+    ]
+    for typename in mismatches:
+        print(
+            'Mismatch for {}: xpath={} index={}'.format(
+                typename, xpath_results[typename], index_results[typename]
+            )
+        )
+
+    print('Structs checked:       {}'.format(len(typenames)))
+    print('XPath search:          {:.4f} s per generator'.format(xpath_time))
+    print('Index build:           {:.4f} s per registry'.format(build_time))
+    print('Index lookups:         {:.6f} s per generator'.format(index_time))
+    print(
+        'Speedup for {} generators: {:.1f}x'.format(
+            args.repeat, (xpath_time * args.repeat) /
+            max(build_time + index_time * args.repeat, 1e-9)
+        )
+    )
+
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Check that the DX12 headers parsed by generate_dx12.py can be stored in and
+loaded from its cache directory, and passed to spawned worker processes.
+
+generate_dx12.py parses the headers in worker processes, stores the parsed
+headers in its cache directory, and passes them to the worker processes that
+generate the targets, so the parsed headers must survive being pickled and
+unpickled. This script parses each header, stores it in a cache file in a
+temporary directory, and loads it back. It fails if a header can not be
+loaded, or if the loaded header differs from the parsed header.
+
+The script then generates every target into a temporary directory twice: one
+target at a time in this process, and with a pool of worker processes that are
+created with the spawn start method, as on Windows. It fails if any of the
+files differ.
+'''
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
+LIB_CPPHEADERPARSER_DIR = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', '..', 'external')
+)
+LIB_REGISTRY_DIR = os.path.join(
+    LIB_CPPHEADERPARSER_DIR, 'Vulkan-Headers', 'registry'
+)
+GENERATOR_DIR = os.path.join(SCRIPT_DIR, 'dx12_generators')
+GENERATOR_PATHS = [
+    SCRIPT_DIR, GENERATOR_DIR,
+    os.path.join(SCRIPT_DIR, 'base_generators'),
+    os.path.join(SCRIPT_DIR, 'vulkan_generators'), LIB_REGISTRY_DIR,
+    LIB_CPPHEADERPARSER_DIR
+]
+
+
+def is_same_data(expected, actual, visited):
+    """Compare two parsed headers.  The headers hold references between their
+    classes, methods and parameters, so visited holds the pairs of dicts and
+    lists that are being compared, to stop at the references.
+    """
+    if type(expected) is not type(actual):
+        return False
+    if isinstance(expected, (dict, list)):
+        if (id(expected), id(actual)) in visited:
+            return True
+        visited.add((id(expected), id(actual)))
+        if isinstance(expected, dict):
+            return (list(expected) == list(actual)) and all(
+                is_same_data(expected[k], actual[k], visited)
+                for k in expected
+            )
+        return (len(expected) == len(actual)) and all(
+            is_same_data(e, a, visited) for e, a in zip(expected, actual)
+        )
+    return expected == actual
+
+
+def check_header(cache_dir, name, source_file, required_data):
+    """Store a parsed header in a cache file and load it back, returning True
+    if the loaded header matches the parsed header.
+    """
+    from generate_dx12 import load_cache_file, parse_header, save_cache_file
+
+    header = parse_header(source_file, required_data)
+    path = os.path.join(cache_dir, name + '.pickle')
+    save_cache_file(path, name, header)
+    loaded_header = load_cache_file(path, name)
+    if loaded_header is None:
+        print('{}: failed to load the parsed header'.format(name))
+        return False
+
+    if not is_same_data(vars(header), vars(loaded_header), set()):
+        print('{}: the loaded header does not match'.format(name))
+        return False
+    return True
+
+
+def generate(header_sources, windows_sdk_version, output_dir, jobs):
+    """Parse the headers and generate every target with up to jobs worker
+    processes.
+    """
+    from generate_dx12 import (
+        GENERATE_TARGETS, generate_targets, make_source_dict, parse_headers
+    )
+
+    source_dict = make_source_dict(
+        parse_headers(
+            [source + (None, ) for source in header_sources], None, jobs
+        )
+    )
+    generate_targets(
+        GENERATE_TARGETS, (
+            source_dict, windows_sdk_version, output_dir, GENERATOR_DIR, None,
+            [], None, False
+        ), jobs
+    )
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        '--sdk-include-dir',
+        dest='sdk_include_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Directory with the Windows SDK headers, in the shared and um sub directories.',
+                'Defaults to the Windows SDK found with the Visual Studio Developer Command Prompt environment variables.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--sdk-version',
+        dest='sdk_version',
+        default=None,
+        help='\n'.join(
+            [
+                'Windows SDK version to record in the generated files.',
+                'Defaults to the WindowsSDKVersion environment variable.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '-j',
+        '--jobs',
+        dest='jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes for the pooled run. Defaults to the number of CPUs.'
+    )
+    args = arg_parser.parse_args()
+    jobs = max(args.jobs, 2)
+
+    sys.path[0:0] = GENERATOR_PATHS
+    from check_shared_registry import compare_outputs
+    from generate_dx12 import (
+        GENERATE_TARGETS, get_header_sources, get_windows_sdk
+    )
+
+    sdk_include_dir, sdk_version = get_windows_sdk(
+        args.sdk_include_dir, args.sdk_version
+    )
+    if (sdk_include_dir is None) or (sdk_version is None):
+        print(
+            'Please run in Visual Studio Developer Command Prompt to get environment variables, WindowsSDKVersion and WindowsSdkDir,'
+            ' or specify the Windows SDK headers with --sdk-include-dir and --sdk-version'
+        )
+        sys.exit(1)
+
+    header_sources = get_header_sources(sdk_include_dir)
+    failures = 0
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for name, source_file, required_data in header_sources:
+            print('Checking', source_file)
+            if not check_header(temp_dir, name, source_file, required_data):
+                failures += 1
+    if failures:
+        sys.exit(1)
+    print('All {} headers match'.format(len(header_sources)))
+
+    # Use the start method that is used on Windows, where the workers do not
+    # inherit the parsed headers.
+    multiprocessing.set_start_method('spawn')
+
+    os.chdir(SCRIPT_DIR)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dirs = {}
+        for mode in ['serial', 'spawned']:
+            output_dirs[mode] = os.path.join(temp_dir, mode)
+            os.makedirs(output_dirs[mode])
+
+        print('Generating one target at a time')
+        generate(header_sources, sdk_version, output_dirs['serial'], 1)
+        print('Generating with {} spawned worker processes'.format(jobs))
+        generate(header_sources, sdk_version, output_dirs['spawned'], jobs)
+
+        mismatches = compare_outputs(
+            output_dirs['serial'], output_dirs['spawned'], GENERATE_TARGETS,
+            'spawned'
+        )
+
+    if mismatches:
+        sys.exit(1)
+    print('All {} targets match'.format(len(GENERATE_TARGETS)))
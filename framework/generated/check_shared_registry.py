@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+#
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Check that generating the Vulkan targets with a shared registry produces the
+same files as generating each target in its own gencode.py process.
+
+The --in-process and -j options of generate_vulkan.py load the registry once,
+and reuse it for every target that a process generates. The Khronos Registry
+is not designed to be reused, so generate() resets the state that apiGen()
+leaves on it. This script generates every target into a temporary directory
+four times: with a gencode.py process per target, in this process, with a pool
+of worker processes, and with a pool of worker processes that use a cache
+directory, as generate_vulkan.py does by default. It fails if any of the files
+differ.
+'''
+
+import argparse
+import concurrent.futures
+import difflib
+import os
+import subprocess
+import sys
+import tempfile
+
+SCRIPT_DIR = os.path.abspath(os.path.dirname(__file__))
+KHRONOS_REGISTRY_DIR = os.path.normpath(
+    os.path.join(
+        SCRIPT_DIR, '..', '..', 'external', 'Vulkan-Headers', 'registry'
+    )
+)
+BASE_GENERATOR_DIR = os.path.join(SCRIPT_DIR, 'base_generators')
+GENERATOR_DIR = os.path.join(SCRIPT_DIR, 'vulkan_generators')
+VK_HEADERS_DIR = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', '..', 'external', 'Vulkan-Headers')
+)
+GENERATOR_PATHS = [
+    KHRONOS_REGISTRY_DIR, BASE_GENERATOR_DIR, GENERATOR_DIR, VK_HEADERS_DIR
+]
+
+
+def make_gencode_args(registry_dir, output_dir, cache_dir=None):
+    args = [
+        '-quiet', '-o', output_dir, '-configs', GENERATOR_DIR, '-registry',
+        os.path.join(registry_dir, 'vk.xml'), '-video',
+        os.path.join(registry_dir, 'video.xml')
+    ]
+    if cache_dir is not None:
+        args += ['-cache-dir', cache_dir]
+    return args
+
+
+def generate_serial(registry_dir, output_dir, targets, jobs):
+    """Generate each target with its own gencode.py process."""
+    env = os.environ.copy()
+    env['PYTHONPATH'] = os.pathsep.join(GENERATOR_PATHS)
+
+    def generate_target(target):
+        subprocess.run(
+            [sys.executable,
+             os.path.join(GENERATOR_DIR, 'gencode.py')] +
+            make_gencode_args(registry_dir, output_dir) + [target],
+            env=env,
+            cwd=SCRIPT_DIR,
+            stdout=subprocess.DEVNULL,
+            check=True
+        )
+
+    with concurrent.futures.ThreadPoolExecutor(jobs) as executor:
+        list(executor.map(generate_target, targets))
+
+
+def generate_shared(registry_dir, output_dir, targets, jobs, cache_dir=None):
+    """Generate the targets with gencode.generate_targets(), which shares the
+    registry between the targets generated by a process.
+    """
+    import gencode
+    args = gencode.make_arg_parser().parse_args(
+        make_gencode_args(registry_dir, output_dir, cache_dir)
+    )
+    gencode.generate_targets(args, targets, jobs)
+
+
+def compare_outputs(expected_dir, actual_dir, targets, mode):
+    """Print a diff for each target that does not match, returning the number
+    of targets that do not match.
+    """
+    mismatches = 0
+    for target in targets:
+        with open(os.path.join(expected_dir, target), 'r') as f:
+            expected = f.readlines()
+        with open(os.path.join(actual_dir, target), 'r') as f:
+            actual = f.readlines()
+        if expected != actual:
+            mismatches += 1
+            print('{}: {} does not match'.format(mode, target))
+            sys.stdout.writelines(
+                difflib.unified_diff(
+                    expected, actual, 'serial/' + target,
+                    mode + '/' + target, n=1
+                )
+            )
+    return mismatches
+
+
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(description=__doc__)
+    arg_parser.add_argument(
+        '--registry-dir',
+        dest='registry_dir',
+        default=KHRONOS_REGISTRY_DIR,
+        help='\n'.join(
+            [
+                'Path to a directory that holds the Vulkan registry files (vk.xml and video.xml).',
+                'Defaults to the registry from the external Khronos Vulkan headers sub module.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '-j',
+        '--jobs',
+        dest='jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of worker processes for the serial and pooled runs. Defaults to the number of CPUs.'
+    )
+    args = arg_parser.parse_args()
+    registry_dir = os.path.abspath(args.registry_dir)
+    jobs = max(args.jobs, 2)
+
+    sys.path[0:0] = GENERATOR_PATHS
+    from generate_vulkan import generate_targets
+    targets = list(dict.fromkeys(generate_targets))
+
+    os.chdir(SCRIPT_DIR)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output_dirs = {}
+        for mode in ['serial', 'in-process', 'pooled', 'cached']:
+            output_dirs[mode] = os.path.join(temp_dir, mode)
+            os.makedirs(output_dirs[mode])
+
+        print('Generating with a process per target')
+        generate_serial(registry_dir, output_dirs['serial'], targets, jobs)
+        print('Generating in-process')
+        generate_shared(registry_dir, output_dirs['in-process'], targets, 1)
+        print('Generating with {} worker processes'.format(jobs))
+        generate_shared(registry_dir, output_dirs['pooled'], targets, jobs)
+        print(
+            'Generating with {} worker processes and a cache directory'.
+            format(jobs)
+        )
+        generate_shared(
+            registry_dir, output_dirs['cached'], targets, jobs,
+            os.path.join(temp_dir, 'cache')
+        )
+
+        mismatches = 0
+        for mode in ['in-process', 'pooled', 'cached']:
+            mismatches += compare_outputs(
+                output_dirs['serial'], output_dirs[mode], targets, mode
+            )
+
+    if mismatches:
+        sys.exit(1)
+    print('All {} targets match'.format(len(targets)))
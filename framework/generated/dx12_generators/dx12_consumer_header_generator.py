@@ -79,6 +79,7 @@ class Dx12ConsumerHeaderGenerator(Dx12BaseGenerator):
         """Method override."""
         Dx12BaseGenerator.generate_feature(self)
         self.write_dx12_consumer_class('')
+        self.write_override_traits()
 
     def write_include(self):
         code = (
@@ -249,6 +250,47 @@ class Dx12ConsumerHeaderGenerator(Dx12BaseGenerator):
         code += class_end
         write(code, file=self.outFile)
 
+    def write_override_traits(self):
+        """Generate a function that checks which of the Process_ methods of the Dx12Consumer class are overridden
+        by a consumer class, which consumers can use to implement IsApiCallProcessed().
+        """
+        code = '// Returns true if T overrides the Dx12Consumer method that processes an API call.  API calls that do not\n'\
+               '// have a Dx12Consumer method are always treated as processed.\n'\
+               'template <typename T>\n'\
+               'bool Dx12ConsumerOverridesApiCall(format::ApiCallId call_id)\n'\
+               '{\n'\
+               '    switch (call_id)\n'\
+               '    {\n'
+
+        names = []
+        header_dict = self.source_dict['header_dict']
+        for k, v in header_dict.items():
+            for m in v.functions:
+                if self.is_required_function_data(m) and (
+                    not self.is_cmd_black_listed(m['name'])
+                ):
+                    names.append(m['name'])
+
+            for class_name, class_value in v.classes.items():
+                if self.is_required_class_data(class_value):
+                    for m in class_value['methods']['public']:
+                        if not self.is_method_black_listed(
+                            class_name, m['name']
+                        ):
+                            names.append(class_name + '_' + m['name'])
+
+        for name in names:
+            code += '        case format::ApiCallId::ApiCall_{}:\n'.format(name)
+            code += '            return !std::is_same<decltype(&T::Process_{0}), decltype(&Dx12Consumer::Process_{0})>::value;\n'.format(
+                name
+            )
+
+        code += '        default:\n'\
+                '            return true;\n'\
+                '    }\n'\
+                '}\n'
+        write(code, file=self.outFile)
+
     def endFile(self):
         """Method override."""
         self.newline()
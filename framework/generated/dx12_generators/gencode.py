@@ -22,9 +22,13 @@
 
 import os
 import sys
+import tempfile
+import time
 
 # API Call Encoders
 from base_generator import write
+from generator_profiler import GeneratorProfiler
+from target_cache import TargetCache, replace_if_changed
 from dx12_base_generator import Dx12GeneratorOptions
 from dx12_api_call_encoders_header_generator import Dx12ApiCallEncodersHeaderGenerator
 from dx12_api_call_encoders_body_generator import Dx12ApiCallEncodersBodyGenerator
@@ -672,22 +676,116 @@ def gen_target(args, source_dict):
         return None
 
 
-class GenCode():
+def make_target_input_hash(
+    target, create_generator, windows_sdk_version, configs, cache_dir,
+    input_files
+):
+    """Create a hash of the header files, configuration files, and generator
+    sources used to generate a target.
+    """
+    input_files = list(input_files) + [os.path.abspath(__file__)]
+    input_files += [
+        os.path.join(configs, filename)
+        for filename in sorted(os.listdir(configs))
+        if filename.endswith('.json')
+    ]
+    return TargetCache(cache_dir).make_input_hash(
+        target, input_files, create_generator, [windows_sdk_version]
+    )
 
-    def __init__(
-        self, target, source_dict, windows_sdk_version, directory, configs
-    ):
+
+def is_target_up_to_date(
+    target, windows_sdk_version, directory, configs, cache_dir, input_files
+):
+    """Determine if a target can be skipped because its output was generated
+    from the current inputs.  Always returns False when caching is disabled.
+    """
+    if not cache_dir:
+        return False
+
+    args = GenCodeArgs(target, windows_sdk_version, directory, configs)
+    make_gen_opts(args)
+    if target not in gen_opts:
+        return False
+
+    return TargetCache(cache_dir).is_up_to_date(
+        target, os.path.join(directory, target),
+        make_target_input_hash(
+            target, gen_opts[target][0], windows_sdk_version, configs,
+            cache_dir, input_files
+        )
+    )
+
+
+class GenCodeArgs():
+    """Arguments used by make_gen_opts() and gen_target()."""
+
+    def __init__(self, target, windows_sdk_version, directory, configs):
         self.target = target
-        self.source_dict = source_dict
         self.windows_sdk_version = windows_sdk_version
         self.directory = directory
         self.configs = configs
 
+
+class GenCode(GenCodeArgs):
+
+    def __init__(
+        self,
+        target,
+        source_dict,
+        windows_sdk_version,
+        directory,
+        configs,
+        cache_dir=None,
+        input_files=[],
+        profile_dir=None,
+        timeit=False
+    ):
+        GenCodeArgs.__init__(
+            self, target, windows_sdk_version, directory, configs
+        )
+        self.source_dict = source_dict
+
         (gen, options) = gen_target(self, self.source_dict)
 
-        gen.beginFile(options)
-        gen.beginFeature({}, False)
-        gen.genType(None, None, None)
-        gen.generate_feature()
-        gen.endFeature()
-        gen.endFile()
+        # Generate to a temporary directory and only replace the target file
+        # when its content changes, so that an unchanged file keeps its
+        # timestamp.
+        with tempfile.TemporaryDirectory(dir=directory) as temp_dir:
+            options.directory = temp_dir
+            profiler = None
+            if profile_dir:
+                profiler = GeneratorProfiler(options.filename, gen)
+                profiler.start()
+            start_time = time.process_time()
+            gen.beginFile(options)
+            gen.beginFeature({}, False)
+            gen.genType(None, None, None)
+            gen.generate_feature()
+            gen.endFeature()
+            gen.endFile()
+            if timeit:
+                write(
+                    '* Time to generate', options.filename, '=',
+                    time.process_time() - start_time,
+                    file=sys.stderr
+                )
+            if profiler:
+                profiler.stop(os.path.join(temp_dir, options.filename))
+
+            output_path = os.path.join(directory, options.filename)
+            replace_if_changed(
+                os.path.join(temp_dir, options.filename), output_path
+            )
+
+        if profiler:
+            profiler.write(profile_dir)
+
+        if cache_dir:
+            TargetCache(cache_dir).update(
+                target, output_path,
+                make_target_input_hash(
+                    target, type(gen), windows_sdk_version, configs,
+                    cache_dir, input_files
+                )
+            )
@@ -20,8 +20,17 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import argparse
+import contextlib
+import hashlib
+import io
+import multiprocessing
 import os
+import pickle
 import sys
+import tempfile
+import time
+import traceback
 
 # Relative path to dxgi code generators for trace encode/decode.
 GENERATOR_PATH = './dx12_generators'
@@ -93,81 +102,299 @@ WINAPI_SOURCE_LIST = [
     ['um\\minwinbase.h', ['_SECURITY_ATTRIBUTES']],
 ]
 
-if __name__ == '__main__':
+# The D3D12 headers are read from the Agility SDK, instead of the Windows SDK.
+DX12_INCLUDE_DIR = os.path.normpath(
+    os.path.join(SCRIPT_DIR, '..', '..', 'external', 'AgilitySDK', 'inc')
+)
+
+# Increment when the content of the parsed header cache changes.
+HEADER_CACHE_VERSION = 2
+
+# Arguments shared with generate_target() worker processes.
+worker_args = None
+
+
+def get_source_files(sdk_include_dir):
+    """Return the paths of the DXGI, D3D12, and WinAPI headers, for the
+    Windows SDK headers in sdk_include_dir.
+    """
+    # The source lists use Windows path separators.
+    dxgi_source_files = [
+        os.path.join(sdk_include_dir, *source.split('\\'))
+        for source in DXGI_SOURCE_LIST
+    ]
+    dx12_source_files = [
+        os.path.join(DX12_INCLUDE_DIR, *source.split('\\'))
+        for source in DX12_SOURCE_LIST
+    ]
+    winapi_source_files = [
+        os.path.join(sdk_include_dir, *source[0].split('\\'))
+        for source in WINAPI_SOURCE_LIST
+    ]
+    return dxgi_source_files, dx12_source_files, winapi_source_files
+
+
+def get_header_sources(sdk_include_dir):
+    """Return a (name, source file, required data) tuple for each header to
+    parse, for the Windows SDK headers in sdk_include_dir.
+    """
+    (dxgi_source_files, dx12_source_files,
+     winapi_source_files) = get_source_files(sdk_include_dir)
+    header_sources = []
+    for source, source_file in zip(DXGI_SOURCE_LIST, dxgi_source_files):
+        header_sources.append((source[source.find('\\') + 1:], source_file, None))
+    for source, source_file in zip(DX12_SOURCE_LIST, dx12_source_files):
+        header_sources.append((source[source.find('\\') + 1:], source_file, None))
+    for source, source_file in zip(WINAPI_SOURCE_LIST, winapi_source_files):
+        header_sources.append(
+            (source[0][source[0].find('\\') + 1:], source_file, source[1])
+        )
+    return header_sources
+
+
+def get_windows_sdk(sdk_include_dir, sdk_version):
+    """Return the Windows SDK include directory and version.  Values that are
+    None are read from the Visual Studio Developer Command Prompt environment
+    variables, and are still None when the variables are not set.
+    """
     env = os.environ
-    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+    if (sdk_version is None) and ('WindowsSDKVersion' in env):
+        # The environment variable ends with a path separator.
+        sdk_version = env['WindowsSDKVersion'][:-1]
 
-    if 'WindowsSDKVersion' in env:
-        WINDOWS_SDK_VERSION = env['WindowsSDKVersion']
-    else:
-        print(
-            'Please run in Visual Studio Developer Command Prompt to get environment variables, WindowsSDKVersion and WindowsSdkDir'
+    if (sdk_include_dir is None) and ('WindowsSdkDir' in env) and (
+        sdk_version is not None
+    ):
+        sdk_include_dir = os.path.join(
+            env['WindowsSdkDir'], 'Include', sdk_version
         )
-        input("Press Enter to continue...")
-        sys.exit()
+    return sdk_include_dir, sdk_version
 
-    if 'WindowsSdkDir' in env:
-        WINDOWS_SDK_DIR = env['WindowsSdkDir']
 
-    CURRENT_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
-    GENERATOR_DIR = os.path.normpath(os.path.join(CURRENT_DIR, GENERATOR_PATH))
-    BASE_GENERATOR_DIR = os.path.normpath(
-        os.path.join(CURRENT_DIR, BASE_GENERATOR_PATH)
-    )
-    VULKAN_GENERATOR_DIR = os.path.normpath(
-        os.path.join(CURRENT_DIR, VULKAN_GENERATOR_PATH)
-    )
-    LIB_REGISTRY_DIR = os.path.normpath(
-        os.path.join(CURRENT_DIR, LIB_REGISTRY_PATH)
-    )
-    LIB_CPPHEADERPARSER_DIR = os.path.normpath(
-        os.path.join(CURRENT_DIR, LIB_CPPHEADERPARSER_PATH)
+def init_worker(
+    source_dict, windows_sdk_version, directory, configs, cache_dir,
+    input_files, profile_dir, timeit
+):
+    """Initialize a generate_target() worker process. Forked workers inherit
+    source_dict from the parent process, while spawned workers receive a
+    pickled copy, which is why parse_header() converts the parsed headers to
+    plain data.
+    """
+    global worker_args
+    worker_args = (
+        source_dict, windows_sdk_version, directory, configs, cache_dir,
+        input_files, profile_dir, timeit
     )
 
-    sys.path.append(GENERATOR_DIR)
-    sys.path.append(BASE_GENERATOR_DIR)
-    sys.path.append(VULKAN_GENERATOR_DIR)
-    sys.path.append(LIB_REGISTRY_DIR)
-    sys.path.append(LIB_CPPHEADERPARSER_DIR)
 
+def generate_target(target):
+    """Generate a target in a worker process, returning the console output
+    from the generator so that the output for each target can be printed as a
+    group.
+    """
     from gencode import GenCode
-    from dx12_generators.dx12_CppHeaderParser import Dx12CppHeader, Dx12CppClass
 
-    header_dict = {}
-    for source in DXGI_SOURCE_LIST:
-        source_file = os.path.join(
-            WINDOWS_SDK_DIR + 'Include\\' + WINDOWS_SDK_VERSION, source
-        )
-        print('Parsing', source_file)
-        header_dict[source[source.find('\\') + 1:]
-                    ] = Dx12CppHeader(source_file)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        print('Generating', target)
+        try:
+            GenCode(target, *worker_args)
+            success = True
+        except Exception:
+            traceback.print_exc()
+            success = False
+    return (output.getvalue(), success)
 
-    for source in DX12_SOURCE_LIST:
-        source_file = os.path.join(SCRIPT_DIR, '..', '..', 'external', 'AgilitySDK', 'inc', source)
 
-        print('Parsing', source_file)
-        header_dict[source[source.find('\\') + 1:]] = Dx12CppHeader(source_file)
+def generate_targets(targets, gencode_args, jobs):
+    """Generate the targets with GenCode(target, *gencode_args).  When jobs is
+    greater than one, the targets are generated by a pool of worker
+    processes, with the console output for each target printed in target
+    order.
+    """
+    from gencode import GenCode
+
+    if jobs <= 1:
+        for target in targets:
+            print('Generating', target)
+            GenCode(target, *gencode_args)
+        return
 
-    for source in WINAPI_SOURCE_LIST:
-        source_file = os.path.join(
-            WINDOWS_SDK_DIR + 'Include\\' + WINDOWS_SDK_VERSION, source[0]
+    # Each target writes its own file, so the targets can be generated in
+    # any order.
+    failed_targets = []
+    with multiprocessing.Pool(
+        min(jobs, len(targets)), init_worker, gencode_args
+    ) as pool:
+        for target, (output, success) in zip(
+            targets, pool.imap(generate_target, targets)
+        ):
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            if not success:
+                failed_targets.append(target)
+
+    if failed_targets:
+        raise Exception(
+            'Error: failed to generate ' + ', '.join(failed_targets)
         )
-        print('Parsing', source_file)
-        header = Dx12CppHeader(source_file)
-        header1 = Dx12CppClass()
 
-        for k, v in header.classes.items():
-            if k in source[1]:
-                # print('    Find out', k)
-                header1.classes[k] = v
 
-        for enum in header.enums:
-            if enum['name'] in source[1]:
-                # print('    Find out', enum['name'])
-                header1.enums.append(enum)
+def make_cache_key(input_files, extra):
+    """Create a hash of the content of the input files and of the extra
+    values, which is used to check that a cache file is up to date.
+    """
+    from target_cache import update_hash
+
+    hasher = hashlib.sha256()
+    hasher.update(
+        '{}\0{}\0'.format(HEADER_CACHE_VERSION, sys.version).encode()
+    )
+    for path in input_files:
+        hasher.update(os.path.basename(path).encode() + b'\0')
+        update_hash(hasher, path)
+    for value in extra:
+        hasher.update(str(value).encode() + b'\0')
+    return hasher.hexdigest()
+
+
+def load_cache_file(path, key):
+    """Load the object stored in a cache file.  Returns None if there is no
+    cache file or it was stored with a different key.
+    """
+    if not os.path.isfile(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            # The key is pickled separately, so that the object is only
+            # unpickled when the key matches.
+            if pickle.load(f) != key:
+                return None
+            return pickle.load(f)
+    except Exception as e:
+        print('Warning: failed to load', path + ':', e, file=sys.stderr)
+        return None
+
+
+def save_cache_file(path, key, value):
+    """Store an object and the key used to check it in a cache file."""
+    directory = os.path.dirname(path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=directory, suffix='.tmp', delete=False
+        ) as f:
+            temp_path = f.name
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+    except Exception as e:
+        print('Warning: failed to save', path + ':', e, file=sys.stderr)
+
+
+def make_plain_data(value, memo):
+    """Copy a value from the header parser, replacing the parser's dict, list
+    and str sub classes with dicts, lists and strs.  The parser's TagStr class
+    can be pickled, but not unpickled, so the parsed headers are converted
+    before they are returned from a worker process or stored in the cache.
+    The memo maps the ids of the copied dicts and lists to their copies, to
+    keep the references between classes, methods and their parameters.
+    """
+    if id(value) in memo:
+        return memo[id(value)]
+    if isinstance(value, dict):
+        copy = dict()
+        memo[id(value)] = copy
+        for k, v in value.items():
+            copy[make_plain_data(k, memo)] = make_plain_data(v, memo)
+        return copy
+    if isinstance(value, list):
+        copy = list()
+        memo[id(value)] = copy
+        copy.extend(make_plain_data(v, memo) for v in value)
+        return copy
+    if isinstance(value, str):
+        return str(value)
+    return value
 
-        header_dict[source[0][source[0].find('\\') + 1:]] = header1
 
+def parse_header(source_file, required_data):
+    """Parse a header in a worker process.  When required_data is a list of
+    names, only the classes and enums with those names are kept.  Returns a
+    Dx12CppClass with the classes, functions, enums, and for complete headers
+    the variables, of the header as plain data.
+    """
+    from dx12_generators.dx12_CppHeaderParser import Dx12CppHeader, Dx12CppClass
+
+    header = Dx12CppHeader(source_file)
+    header1 = Dx12CppClass()
+    memo = dict()
+
+    if required_data is None:
+        header1.classes = make_plain_data(header.classes, memo)
+        header1.functions = make_plain_data(header.functions, memo)
+        header1.enums = make_plain_data(header.enums, memo)
+        header1.variables = make_plain_data(header.variables, memo)
+        return header1
+
+    for k, v in header.classes.items():
+        if k in required_data:
+            header1.classes[str(k)] = make_plain_data(v, memo)
+
+    for enum in header.enums:
+        if enum['name'] in required_data:
+            header1.enums.append(make_plain_data(enum, memo))
+
+    return header1
+
+
+def parse_headers(sources, cache_dir, jobs):
+    """Parse the headers listed as (name, source file, required data, cache
+    key) tuples, using up to jobs worker processes.  Parsed headers are stored
+    in the cache directory, and headers with matching cache keys are loaded
+    from it instead of being parsed.  Returns a dict of header names to parsed
+    headers, in source order.
+    """
+    header_dict = dict()
+    pending = []
+    for name, source_file, required_data, key in sources:
+        header = None
+        if cache_dir:
+            header = load_cache_file(
+                os.path.join(cache_dir, 'headers', name + '.pickle'), key
+            )
+        if header is None:
+            print('Parsing', source_file)
+            pending.append((name, source_file, required_data, key))
+        header_dict[name] = header
+
+    parse_args = [
+        (source_file, required_data)
+        for name, source_file, required_data, key in pending
+    ]
+    if (jobs <= 1) or (len(pending) <= 1):
+        headers = [parse_header(*parse_arg) for parse_arg in parse_args]
+    else:
+        with multiprocessing.Pool(min(jobs, len(pending))) as pool:
+            headers = pool.starmap(parse_header, parse_args)
+
+    for (name, source_file, required_data, key), header in zip(
+        pending, headers
+    ):
+        header_dict[name] = header
+        if cache_dir:
+            save_cache_file(
+                os.path.join(cache_dir, 'headers', name + '.pickle'), key,
+                header
+            )
+
+    return header_dict
+
+
+def make_source_dict(header_dict):
+    """Merge the unions, enums, classes and structs from the parsed headers.
+    Duplicate struct declarations are removed from the headers.
+    """
     union_dict = dict()
     enum_dict = dict()
     class_dict = dict()
@@ -202,10 +429,199 @@ if __name__ == '__main__':
     source_dict['enum_dict'] = enum_dict
     source_dict['class_dict'] = class_dict
     source_dict['struct_dict'] = struct_dict
+    return source_dict
+
 
+if __name__ == '__main__':
+    arg_parser = argparse.ArgumentParser(
+        description='Generate GFXR DX12 framework source code'
+    )
+    arg_parser.add_argument(
+        '-j',
+        '--jobs',
+        dest='jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='\n'.join(
+            [
+                'Number of headers to parse and targets to generate in parallel.',
+                'Defaults to the number of CPUs. Use 1 to parse headers and generate targets one at a time.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--cache-dir',
+        dest='cache_dir',
+        default=os.path.join(SCRIPT_DIR, '.codegen_cache', 'dx12'),
+        help='\n'.join(
+            [
+                'Directory for recording a hash of the inputs used to generate each target, and for storing',
+                'the parsed headers. Targets that were generated from the same inputs are skipped, and headers',
+                'that have not changed are not parsed again.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--no-cache',
+        dest='cache_dir',
+        action='store_const',
+        const=None,
+        help='Parse all headers and generate all targets, even if their inputs have not changed.'
+    )
+    arg_parser.add_argument(
+        '--sdk-include-dir',
+        dest='sdk_include_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Directory with the Windows SDK headers, in the shared and um sub directories, to use instead of',
+                'the Windows SDK found with the Visual Studio Developer Command Prompt environment variables.',
+                'The D3D12 headers are always read from external/AgilitySDK/inc.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--sdk-version',
+        dest='sdk_version',
+        default=None,
+        help='\n'.join(
+            [
+                'Windows SDK version to record in the generated files.',
+                'Defaults to the WindowsSDKVersion environment variable.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--output-dir',
+        dest='output_dir',
+        default=SCRIPT_DIR,
+        help='Directory to write the generated files to. Defaults to the directory of this script.'
+    )
+    arg_parser.add_argument(
+        '--profile-dir',
+        dest='profile_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Directory for writing a JSON file per target with the wall time, CPU time,',
+                'peak memory, and bytes written for each generator phase.',
+                'Combine with --no-cache to profile every target.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--time',
+        dest='time',
+        action='store_true',
+        default=False,
+        help='Print the time taken to parse the headers and to generate each target.'
+    )
+    args = arg_parser.parse_args()
+
+    env = os.environ
+    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+
+    SDK_INCLUDE_DIR, WINDOWS_SDK_VERSION = get_windows_sdk(
+        args.sdk_include_dir, args.sdk_version
+    )
+
+    if (SDK_INCLUDE_DIR is None) or (WINDOWS_SDK_VERSION is None):
+        print(
+            'Please run in Visual Studio Developer Command Prompt to get environment variables, WindowsSDKVersion and WindowsSdkDir,'
+            ' or specify the Windows SDK headers with --sdk-include-dir and --sdk-version'
+        )
+        # Only wait for the user when running interactively, so that automated
+        # runs fail instead of blocking.
+        if sys.stdin.isatty():
+            input("Press Enter to continue...")
+        sys.exit(1)
+
+    CURRENT_DIR = os.path.dirname(os.path.abspath(sys.argv[0]))
+    OUTPUT_DIR = os.path.abspath(args.output_dir)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    GENERATOR_DIR = os.path.normpath(os.path.join(CURRENT_DIR, GENERATOR_PATH))
+    BASE_GENERATOR_DIR = os.path.normpath(
+        os.path.join(CURRENT_DIR, BASE_GENERATOR_PATH)
+    )
+    VULKAN_GENERATOR_DIR = os.path.normpath(
+        os.path.join(CURRENT_DIR, VULKAN_GENERATOR_PATH)
+    )
+    LIB_REGISTRY_DIR = os.path.normpath(
+        os.path.join(CURRENT_DIR, LIB_REGISTRY_PATH)
+    )
+    LIB_CPPHEADERPARSER_DIR = os.path.normpath(
+        os.path.join(CURRENT_DIR, LIB_CPPHEADERPARSER_PATH)
+    )
+
+    sys.path.append(GENERATOR_DIR)
+    sys.path.append(BASE_GENERATOR_DIR)
+    sys.path.append(VULKAN_GENERATOR_DIR)
+    sys.path.append(LIB_REGISTRY_DIR)
+    sys.path.append(LIB_CPPHEADERPARSER_DIR)
+
+    from gencode import is_target_up_to_date
+    from dx12_generators.dx12_CppHeaderParser import Dx12CppHeader
+    from target_cache import get_generator_sources
+
+    (dxgi_source_files, dx12_source_files,
+     winapi_source_files) = get_source_files(SDK_INCLUDE_DIR)
+
+    # The headers and the header parser sources are inputs for every target.
+    parser_sources = get_generator_sources(Dx12CppHeader)
+    input_files = dxgi_source_files + dx12_source_files + winapi_source_files
+    input_files += parser_sources
+
+    pending_targets = []
     for target in GENERATE_TARGETS:
-        print('Generating', target)
-        GenCode(
-            target, source_dict, WINDOWS_SDK_VERSION[:-1], CURRENT_DIR,
-            GENERATOR_DIR
+        if is_target_up_to_date(
+            target, WINDOWS_SDK_VERSION, OUTPUT_DIR, GENERATOR_DIR,
+            args.cache_dir, input_files
+        ):
+            print('Skipping', target, '(up to date)')
+        else:
+            pending_targets.append(target)
+
+    if not pending_targets:
+        sys.exit()
+
+    # Each header is cached with a key made from its content and the parser
+    # sources.  The merged source_dict is cached with a key made from the keys
+    # for all of the headers.
+    header_sources = [
+        (
+            name, source_file, required_data,
+            make_cache_key([source_file] + parser_sources, required_data or [])
+        ) for name, source_file, required_data in
+        get_header_sources(SDK_INCLUDE_DIR)
+    ]
+
+    start_time = time.perf_counter()
+    source_dict = None
+    if args.cache_dir:
+        source_dict_key = make_cache_key(
+            [os.path.abspath(__file__)],
+            [key for name, source_file, required_data, key in header_sources]
         )
+        source_dict_path = os.path.join(args.cache_dir, 'source_dict.pickle')
+        source_dict = load_cache_file(source_dict_path, source_dict_key)
+
+    if source_dict is None:
+        source_dict = make_source_dict(
+            parse_headers(header_sources, args.cache_dir, args.jobs)
+        )
+        if args.cache_dir:
+            save_cache_file(source_dict_path, source_dict_key, source_dict)
+
+    if args.time:
+        print(
+            '* Time to load headers =',
+            time.perf_counter() - start_time,
+            file=sys.stderr
+        )
+
+    generate_targets(
+        pending_targets, (
+            source_dict, WINDOWS_SDK_VERSION, OUTPUT_DIR, GENERATOR_DIR,
+            args.cache_dir, input_files, args.profile_dir, args.time
+        ), args.jobs
+    )
@@ -24,6 +24,7 @@
 '''
 
 import argparse
+import concurrent.futures
 import os
 import sys
 import subprocess
@@ -72,7 +73,6 @@ generate_targets = [
     'generated_vulkan_feature_util.cpp',
     'generated_vulkan_enum_to_string.h',
     'generated_vulkan_enum_to_string.cpp',
-    'generated_vulkan_object_info_table_base2.h',
     'generated_vulkan_state_table.h',
     'generated_vulkan_json_consumer.h',
     'generated_vulkan_json_consumer.cpp',
@@ -91,6 +91,11 @@ generate_targets = [
 ]
 
 if __name__ == '__main__':
+    # The output mode options are shared with gencode.py.
+    if GENERATOR_DIR not in sys.path:
+        sys.path.append(GENERATOR_DIR)
+    from output_modes import output_mode_args, add_output_mode_args
+
     arg_parser = argparse.ArgumentParser(description=__doc__)
     arg_parser.add_argument(
         '--registry-dir',
@@ -115,6 +120,62 @@ if __name__ == '__main__':
             ]
         )
     )
+    arg_parser.add_argument(
+        '--in-process',
+        dest='in_process',
+        action='store_true',
+        default=False,
+        help='\n'.join(
+            [
+                'Generate all targets in this process instead of running a gencode.py subprocess per target.',
+                'The registry is parsed and loaded once and shared by all of the target generators.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '-j',
+        '--jobs',
+        dest='jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='\n'.join(
+            [
+                'Number of targets to generate in parallel.',
+                'Defaults to the number of CPUs. Use 1 to generate targets one at a time.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--cache-dir',
+        dest='cache_dir',
+        default=os.path.join(SCRIPT_DIR, '.codegen_cache', 'vulkan'),
+        help='\n'.join(
+            [
+                'Directory for recording a hash of the inputs used to generate each target.',
+                'Targets that were generated from the same inputs are skipped.'
+            ]
+        )
+    )
+    arg_parser.add_argument(
+        '--no-cache',
+        dest='cache_dir',
+        action='store_const',
+        const=None,
+        help='Generate all targets, even if their inputs have not changed.'
+    )
+    add_output_mode_args(arg_parser, '--')
+    arg_parser.add_argument(
+        '--profile-dir',
+        dest='profile_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Directory for writing a JSON file per target with the wall time, CPU time,',
+                'peak memory, and bytes emitted for each generator phase.',
+                'Combine with --no-cache to profile every target.'
+            ]
+        )
+    )
     args = arg_parser.parse_args()
     registry_dir = KHRONOS_REGISTRY_DIR
     if args.registry_dir is not None:
@@ -143,34 +204,83 @@ if __name__ == '__main__':
             VK_HEADERS_DIR,
         ]
     )
-    for target in generate_targets:
-        print('Generating', target)
-        gencode_args = [
-            sys.executable,
-            os.path.join(GENERATOR_DIR, 'gencode.py'),
-            '-o',
-            SCRIPT_DIR,
-            '-configs',
-            GENERATOR_DIR,
-            '-registry',
-            registry_path,
-            '-video',
-            video_path,
-        ]
-        if args.headers_dir is not None:
-            if not os.path.isdir(args.headers_dir):
-                raise Exception(
-                    'Error: extra headers dir', args.headers_dir,
-                    'is not a directory'
-                )
-            gencode_args.extend(
-                ['-headers-dir',
-                 os.path.abspath(args.headers_dir)]
+    gencode_args = [
+        '-o',
+        SCRIPT_DIR,
+        '-configs',
+        GENERATOR_DIR,
+        '-registry',
+        registry_path,
+        '-video',
+        video_path,
+    ]
+    if args.headers_dir is not None:
+        if not os.path.isdir(args.headers_dir):
+            raise Exception(
+                'Error: extra headers dir', args.headers_dir,
+                'is not a directory'
             )
-        gencode_args.append(target)
-        subprocess.call(
-            gencode_args,
-            shell=False,
-            env=env,
-            cwd=SCRIPT_DIR,
+        gencode_args.extend(
+            ['-headers-dir',
+             os.path.abspath(args.headers_dir)]
+        )
+
+    if args.cache_dir is not None:
+        gencode_args.extend(['-cache-dir', os.path.abspath(args.cache_dir)])
+
+    for name in output_mode_args:
+        if getattr(args, name):
+            gencode_args.append('-' + name.replace('_', '-'))
+
+    if args.profile_dir is not None:
+        gencode_args.extend(
+            ['-profile-dir', os.path.abspath(args.profile_dir)]
         )
+
+    if args.in_process:
+        for path in [
+            KHRONOS_REGISTRY_DIR,
+            BASE_GENERATOR_DIR,
+            GENERATOR_DIR,
+            VK_HEADERS_DIR,
+        ]:
+            if path not in sys.path:
+                sys.path.append(path)
+        import gencode
+
+        os.chdir(SCRIPT_DIR)
+        gencode_parsed_args = gencode.make_arg_parser().parse_args(
+            gencode_args
+        )
+        gencode.generate_targets(
+            gencode_parsed_args, generate_targets, args.jobs
+        )
+    else:
+
+        def generate_target(target):
+            """Run gencode.py for a target, returning its console output."""
+            result = subprocess.run(
+                [sys.executable,
+                 os.path.join(GENERATOR_DIR, 'gencode.py')] + gencode_args
+                + [target],
+                shell=False,
+                env=env,
+                cwd=SCRIPT_DIR,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                universal_newlines=True
+            )
+            return result.stdout
+
+        # Each target is generated by its own process, so threads are sufficient
+        # to run them in parallel. Output is printed in target order.
+        with concurrent.futures.ThreadPoolExecutor(
+            max(args.jobs, 1)
+        ) as executor:
+            for target, output in zip(
+                generate_targets,
+                executor.map(generate_target, generate_targets)
+            ):
+                print('Generating', target)
+                sys.stdout.write(output)
+                sys.stdout.flush()
@@ -3413,6 +3413,984 @@ class Dx12Consumer : public Dx12ConsumerBase
 
 };
 
+// Returns true if T overrides the Dx12Consumer method that processes an API call.  API calls that do not
+// have a Dx12Consumer method are always treated as processed.
+template <typename T>
+bool Dx12ConsumerOverridesApiCall(format::ApiCallId call_id)
+{
+    switch (call_id)
+    {
+        case format::ApiCallId::ApiCall_CreateDXGIFactory:
+            return !std::is_same<decltype(&T::Process_CreateDXGIFactory), decltype(&Dx12Consumer::Process_CreateDXGIFactory)>::value;
+        case format::ApiCallId::ApiCall_CreateDXGIFactory1:
+            return !std::is_same<decltype(&T::Process_CreateDXGIFactory1), decltype(&Dx12Consumer::Process_CreateDXGIFactory1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIObject_SetPrivateData:
+            return !std::is_same<decltype(&T::Process_IDXGIObject_SetPrivateData), decltype(&Dx12Consumer::Process_IDXGIObject_SetPrivateData)>::value;
+        case format::ApiCallId::ApiCall_IDXGIObject_SetPrivateDataInterface:
+            return !std::is_same<decltype(&T::Process_IDXGIObject_SetPrivateDataInterface), decltype(&Dx12Consumer::Process_IDXGIObject_SetPrivateDataInterface)>::value;
+        case format::ApiCallId::ApiCall_IDXGIObject_GetPrivateData:
+            return !std::is_same<decltype(&T::Process_IDXGIObject_GetPrivateData), decltype(&Dx12Consumer::Process_IDXGIObject_GetPrivateData)>::value;
+        case format::ApiCallId::ApiCall_IDXGIObject_GetParent:
+            return !std::is_same<decltype(&T::Process_IDXGIObject_GetParent), decltype(&Dx12Consumer::Process_IDXGIObject_GetParent)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDeviceSubObject_GetDevice:
+            return !std::is_same<decltype(&T::Process_IDXGIDeviceSubObject_GetDevice), decltype(&Dx12Consumer::Process_IDXGIDeviceSubObject_GetDevice)>::value;
+        case format::ApiCallId::ApiCall_IDXGIResource_GetSharedHandle:
+            return !std::is_same<decltype(&T::Process_IDXGIResource_GetSharedHandle), decltype(&Dx12Consumer::Process_IDXGIResource_GetSharedHandle)>::value;
+        case format::ApiCallId::ApiCall_IDXGIResource_GetUsage:
+            return !std::is_same<decltype(&T::Process_IDXGIResource_GetUsage), decltype(&Dx12Consumer::Process_IDXGIResource_GetUsage)>::value;
+        case format::ApiCallId::ApiCall_IDXGIResource_SetEvictionPriority:
+            return !std::is_same<decltype(&T::Process_IDXGIResource_SetEvictionPriority), decltype(&Dx12Consumer::Process_IDXGIResource_SetEvictionPriority)>::value;
+        case format::ApiCallId::ApiCall_IDXGIResource_GetEvictionPriority:
+            return !std::is_same<decltype(&T::Process_IDXGIResource_GetEvictionPriority), decltype(&Dx12Consumer::Process_IDXGIResource_GetEvictionPriority)>::value;
+        case format::ApiCallId::ApiCall_IDXGIKeyedMutex_AcquireSync:
+            return !std::is_same<decltype(&T::Process_IDXGIKeyedMutex_AcquireSync), decltype(&Dx12Consumer::Process_IDXGIKeyedMutex_AcquireSync)>::value;
+        case format::ApiCallId::ApiCall_IDXGIKeyedMutex_ReleaseSync:
+            return !std::is_same<decltype(&T::Process_IDXGIKeyedMutex_ReleaseSync), decltype(&Dx12Consumer::Process_IDXGIKeyedMutex_ReleaseSync)>::value;
+        case format::ApiCallId::ApiCall_IDXGISurface_GetDesc:
+            return !std::is_same<decltype(&T::Process_IDXGISurface_GetDesc), decltype(&Dx12Consumer::Process_IDXGISurface_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_IDXGISurface_Map:
+            return !std::is_same<decltype(&T::Process_IDXGISurface_Map), decltype(&Dx12Consumer::Process_IDXGISurface_Map)>::value;
+        case format::ApiCallId::ApiCall_IDXGISurface_Unmap:
+            return !std::is_same<decltype(&T::Process_IDXGISurface_Unmap), decltype(&Dx12Consumer::Process_IDXGISurface_Unmap)>::value;
+        case format::ApiCallId::ApiCall_IDXGISurface1_GetDC:
+            return !std::is_same<decltype(&T::Process_IDXGISurface1_GetDC), decltype(&Dx12Consumer::Process_IDXGISurface1_GetDC)>::value;
+        case format::ApiCallId::ApiCall_IDXGISurface1_ReleaseDC:
+            return !std::is_same<decltype(&T::Process_IDXGISurface1_ReleaseDC), decltype(&Dx12Consumer::Process_IDXGISurface1_ReleaseDC)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter_EnumOutputs:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter_EnumOutputs), decltype(&Dx12Consumer::Process_IDXGIAdapter_EnumOutputs)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter_GetDesc:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter_GetDesc), decltype(&Dx12Consumer::Process_IDXGIAdapter_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter_CheckInterfaceSupport:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter_CheckInterfaceSupport), decltype(&Dx12Consumer::Process_IDXGIAdapter_CheckInterfaceSupport)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_GetDesc:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_GetDesc), decltype(&Dx12Consumer::Process_IDXGIOutput_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_GetDisplayModeList:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_GetDisplayModeList), decltype(&Dx12Consumer::Process_IDXGIOutput_GetDisplayModeList)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_FindClosestMatchingMode:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_FindClosestMatchingMode), decltype(&Dx12Consumer::Process_IDXGIOutput_FindClosestMatchingMode)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_WaitForVBlank:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_WaitForVBlank), decltype(&Dx12Consumer::Process_IDXGIOutput_WaitForVBlank)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_TakeOwnership:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_TakeOwnership), decltype(&Dx12Consumer::Process_IDXGIOutput_TakeOwnership)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_ReleaseOwnership:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_ReleaseOwnership), decltype(&Dx12Consumer::Process_IDXGIOutput_ReleaseOwnership)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_GetGammaControlCapabilities:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_GetGammaControlCapabilities), decltype(&Dx12Consumer::Process_IDXGIOutput_GetGammaControlCapabilities)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_SetGammaControl:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_SetGammaControl), decltype(&Dx12Consumer::Process_IDXGIOutput_SetGammaControl)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_GetGammaControl:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_GetGammaControl), decltype(&Dx12Consumer::Process_IDXGIOutput_GetGammaControl)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_SetDisplaySurface:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_SetDisplaySurface), decltype(&Dx12Consumer::Process_IDXGIOutput_SetDisplaySurface)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_GetDisplaySurfaceData:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_GetDisplaySurfaceData), decltype(&Dx12Consumer::Process_IDXGIOutput_GetDisplaySurfaceData)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput_GetFrameStatistics:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput_GetFrameStatistics), decltype(&Dx12Consumer::Process_IDXGIOutput_GetFrameStatistics)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_Present:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_Present), decltype(&Dx12Consumer::Process_IDXGISwapChain_Present)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_GetBuffer:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_GetBuffer), decltype(&Dx12Consumer::Process_IDXGISwapChain_GetBuffer)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_SetFullscreenState:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_SetFullscreenState), decltype(&Dx12Consumer::Process_IDXGISwapChain_SetFullscreenState)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_GetFullscreenState:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_GetFullscreenState), decltype(&Dx12Consumer::Process_IDXGISwapChain_GetFullscreenState)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_GetDesc:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_GetDesc), decltype(&Dx12Consumer::Process_IDXGISwapChain_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_ResizeBuffers:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_ResizeBuffers), decltype(&Dx12Consumer::Process_IDXGISwapChain_ResizeBuffers)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_ResizeTarget:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_ResizeTarget), decltype(&Dx12Consumer::Process_IDXGISwapChain_ResizeTarget)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_GetContainingOutput:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_GetContainingOutput), decltype(&Dx12Consumer::Process_IDXGISwapChain_GetContainingOutput)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_GetFrameStatistics:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_GetFrameStatistics), decltype(&Dx12Consumer::Process_IDXGISwapChain_GetFrameStatistics)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain_GetLastPresentCount:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain_GetLastPresentCount), decltype(&Dx12Consumer::Process_IDXGISwapChain_GetLastPresentCount)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory_EnumAdapters:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory_EnumAdapters), decltype(&Dx12Consumer::Process_IDXGIFactory_EnumAdapters)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory_MakeWindowAssociation:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory_MakeWindowAssociation), decltype(&Dx12Consumer::Process_IDXGIFactory_MakeWindowAssociation)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory_GetWindowAssociation:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory_GetWindowAssociation), decltype(&Dx12Consumer::Process_IDXGIFactory_GetWindowAssociation)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory_CreateSwapChain:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory_CreateSwapChain), decltype(&Dx12Consumer::Process_IDXGIFactory_CreateSwapChain)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory_CreateSoftwareAdapter:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory_CreateSoftwareAdapter), decltype(&Dx12Consumer::Process_IDXGIFactory_CreateSoftwareAdapter)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice_GetAdapter:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice_GetAdapter), decltype(&Dx12Consumer::Process_IDXGIDevice_GetAdapter)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice_CreateSurface:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice_CreateSurface), decltype(&Dx12Consumer::Process_IDXGIDevice_CreateSurface)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice_QueryResourceResidency:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice_QueryResourceResidency), decltype(&Dx12Consumer::Process_IDXGIDevice_QueryResourceResidency)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice_SetGPUThreadPriority:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice_SetGPUThreadPriority), decltype(&Dx12Consumer::Process_IDXGIDevice_SetGPUThreadPriority)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice_GetGPUThreadPriority:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice_GetGPUThreadPriority), decltype(&Dx12Consumer::Process_IDXGIDevice_GetGPUThreadPriority)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory1_EnumAdapters1:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory1_EnumAdapters1), decltype(&Dx12Consumer::Process_IDXGIFactory1_EnumAdapters1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory1_IsCurrent:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory1_IsCurrent), decltype(&Dx12Consumer::Process_IDXGIFactory1_IsCurrent)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter1_GetDesc1:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter1_GetDesc1), decltype(&Dx12Consumer::Process_IDXGIAdapter1_GetDesc1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice1_SetMaximumFrameLatency:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice1_SetMaximumFrameLatency), decltype(&Dx12Consumer::Process_IDXGIDevice1_SetMaximumFrameLatency)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice1_GetMaximumFrameLatency:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice1_GetMaximumFrameLatency), decltype(&Dx12Consumer::Process_IDXGIDevice1_GetMaximumFrameLatency)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDisplayControl_IsStereoEnabled:
+            return !std::is_same<decltype(&T::Process_IDXGIDisplayControl_IsStereoEnabled), decltype(&Dx12Consumer::Process_IDXGIDisplayControl_IsStereoEnabled)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDisplayControl_SetStereoEnabled:
+            return !std::is_same<decltype(&T::Process_IDXGIDisplayControl_SetStereoEnabled), decltype(&Dx12Consumer::Process_IDXGIDisplayControl_SetStereoEnabled)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_GetDesc:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_GetDesc), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_AcquireNextFrame:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_AcquireNextFrame), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_AcquireNextFrame)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_GetFrameDirtyRects:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_GetFrameDirtyRects), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_GetFrameDirtyRects)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_GetFrameMoveRects:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_GetFrameMoveRects), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_GetFrameMoveRects)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_GetFramePointerShape:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_GetFramePointerShape), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_GetFramePointerShape)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_MapDesktopSurface:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_MapDesktopSurface), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_MapDesktopSurface)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_UnMapDesktopSurface:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_UnMapDesktopSurface), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_UnMapDesktopSurface)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutputDuplication_ReleaseFrame:
+            return !std::is_same<decltype(&T::Process_IDXGIOutputDuplication_ReleaseFrame), decltype(&Dx12Consumer::Process_IDXGIOutputDuplication_ReleaseFrame)>::value;
+        case format::ApiCallId::ApiCall_IDXGISurface2_GetResource:
+            return !std::is_same<decltype(&T::Process_IDXGISurface2_GetResource), decltype(&Dx12Consumer::Process_IDXGISurface2_GetResource)>::value;
+        case format::ApiCallId::ApiCall_IDXGIResource1_CreateSubresourceSurface:
+            return !std::is_same<decltype(&T::Process_IDXGIResource1_CreateSubresourceSurface), decltype(&Dx12Consumer::Process_IDXGIResource1_CreateSubresourceSurface)>::value;
+        case format::ApiCallId::ApiCall_IDXGIResource1_CreateSharedHandle:
+            return !std::is_same<decltype(&T::Process_IDXGIResource1_CreateSharedHandle), decltype(&Dx12Consumer::Process_IDXGIResource1_CreateSharedHandle)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice2_OfferResources:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice2_OfferResources), decltype(&Dx12Consumer::Process_IDXGIDevice2_OfferResources)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice2_ReclaimResources:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice2_ReclaimResources), decltype(&Dx12Consumer::Process_IDXGIDevice2_ReclaimResources)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice2_EnqueueSetEvent:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice2_EnqueueSetEvent), decltype(&Dx12Consumer::Process_IDXGIDevice2_EnqueueSetEvent)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_GetDesc1:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_GetDesc1), decltype(&Dx12Consumer::Process_IDXGISwapChain1_GetDesc1)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_GetFullscreenDesc:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_GetFullscreenDesc), decltype(&Dx12Consumer::Process_IDXGISwapChain1_GetFullscreenDesc)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_GetHwnd:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_GetHwnd), decltype(&Dx12Consumer::Process_IDXGISwapChain1_GetHwnd)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_GetCoreWindow:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_GetCoreWindow), decltype(&Dx12Consumer::Process_IDXGISwapChain1_GetCoreWindow)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_Present1:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_Present1), decltype(&Dx12Consumer::Process_IDXGISwapChain1_Present1)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_IsTemporaryMonoSupported:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_IsTemporaryMonoSupported), decltype(&Dx12Consumer::Process_IDXGISwapChain1_IsTemporaryMonoSupported)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_GetRestrictToOutput:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_GetRestrictToOutput), decltype(&Dx12Consumer::Process_IDXGISwapChain1_GetRestrictToOutput)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_SetBackgroundColor:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_SetBackgroundColor), decltype(&Dx12Consumer::Process_IDXGISwapChain1_SetBackgroundColor)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_GetBackgroundColor:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_GetBackgroundColor), decltype(&Dx12Consumer::Process_IDXGISwapChain1_GetBackgroundColor)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_SetRotation:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_SetRotation), decltype(&Dx12Consumer::Process_IDXGISwapChain1_SetRotation)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain1_GetRotation:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain1_GetRotation), decltype(&Dx12Consumer::Process_IDXGISwapChain1_GetRotation)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_IsWindowedStereoEnabled:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_IsWindowedStereoEnabled), decltype(&Dx12Consumer::Process_IDXGIFactory2_IsWindowedStereoEnabled)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_CreateSwapChainForHwnd:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_CreateSwapChainForHwnd), decltype(&Dx12Consumer::Process_IDXGIFactory2_CreateSwapChainForHwnd)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_CreateSwapChainForCoreWindow:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_CreateSwapChainForCoreWindow), decltype(&Dx12Consumer::Process_IDXGIFactory2_CreateSwapChainForCoreWindow)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_GetSharedResourceAdapterLuid:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_GetSharedResourceAdapterLuid), decltype(&Dx12Consumer::Process_IDXGIFactory2_GetSharedResourceAdapterLuid)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_RegisterStereoStatusWindow:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_RegisterStereoStatusWindow), decltype(&Dx12Consumer::Process_IDXGIFactory2_RegisterStereoStatusWindow)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_RegisterStereoStatusEvent:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_RegisterStereoStatusEvent), decltype(&Dx12Consumer::Process_IDXGIFactory2_RegisterStereoStatusEvent)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_UnregisterStereoStatus:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_UnregisterStereoStatus), decltype(&Dx12Consumer::Process_IDXGIFactory2_UnregisterStereoStatus)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_RegisterOcclusionStatusWindow:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_RegisterOcclusionStatusWindow), decltype(&Dx12Consumer::Process_IDXGIFactory2_RegisterOcclusionStatusWindow)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_RegisterOcclusionStatusEvent:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_RegisterOcclusionStatusEvent), decltype(&Dx12Consumer::Process_IDXGIFactory2_RegisterOcclusionStatusEvent)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_UnregisterOcclusionStatus:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_UnregisterOcclusionStatus), decltype(&Dx12Consumer::Process_IDXGIFactory2_UnregisterOcclusionStatus)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory2_CreateSwapChainForComposition:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory2_CreateSwapChainForComposition), decltype(&Dx12Consumer::Process_IDXGIFactory2_CreateSwapChainForComposition)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter2_GetDesc2:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter2_GetDesc2), decltype(&Dx12Consumer::Process_IDXGIAdapter2_GetDesc2)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput1_GetDisplayModeList1:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput1_GetDisplayModeList1), decltype(&Dx12Consumer::Process_IDXGIOutput1_GetDisplayModeList1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput1_FindClosestMatchingMode1:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput1_FindClosestMatchingMode1), decltype(&Dx12Consumer::Process_IDXGIOutput1_FindClosestMatchingMode1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput1_GetDisplaySurfaceData1:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput1_GetDisplaySurfaceData1), decltype(&Dx12Consumer::Process_IDXGIOutput1_GetDisplaySurfaceData1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput1_DuplicateOutput:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput1_DuplicateOutput), decltype(&Dx12Consumer::Process_IDXGIOutput1_DuplicateOutput)>::value;
+        case format::ApiCallId::ApiCall_CreateDXGIFactory2:
+            return !std::is_same<decltype(&T::Process_CreateDXGIFactory2), decltype(&Dx12Consumer::Process_CreateDXGIFactory2)>::value;
+        case format::ApiCallId::ApiCall_DXGIGetDebugInterface1:
+            return !std::is_same<decltype(&T::Process_DXGIGetDebugInterface1), decltype(&Dx12Consumer::Process_DXGIGetDebugInterface1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice3_Trim:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice3_Trim), decltype(&Dx12Consumer::Process_IDXGIDevice3_Trim)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain2_SetSourceSize:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain2_SetSourceSize), decltype(&Dx12Consumer::Process_IDXGISwapChain2_SetSourceSize)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain2_GetSourceSize:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain2_GetSourceSize), decltype(&Dx12Consumer::Process_IDXGISwapChain2_GetSourceSize)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain2_SetMaximumFrameLatency:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain2_SetMaximumFrameLatency), decltype(&Dx12Consumer::Process_IDXGISwapChain2_SetMaximumFrameLatency)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain2_GetMaximumFrameLatency:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain2_GetMaximumFrameLatency), decltype(&Dx12Consumer::Process_IDXGISwapChain2_GetMaximumFrameLatency)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain2_GetFrameLatencyWaitableObject:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain2_GetFrameLatencyWaitableObject), decltype(&Dx12Consumer::Process_IDXGISwapChain2_GetFrameLatencyWaitableObject)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain2_SetMatrixTransform:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain2_SetMatrixTransform), decltype(&Dx12Consumer::Process_IDXGISwapChain2_SetMatrixTransform)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain2_GetMatrixTransform:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain2_GetMatrixTransform), decltype(&Dx12Consumer::Process_IDXGISwapChain2_GetMatrixTransform)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput2_SupportsOverlays:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput2_SupportsOverlays), decltype(&Dx12Consumer::Process_IDXGIOutput2_SupportsOverlays)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory3_GetCreationFlags:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory3_GetCreationFlags), decltype(&Dx12Consumer::Process_IDXGIFactory3_GetCreationFlags)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_PresentBuffer:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_PresentBuffer), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_PresentBuffer)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_SetSourceRect:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_SetSourceRect), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_SetSourceRect)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_SetTargetRect:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_SetTargetRect), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_SetTargetRect)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_SetDestSize:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_SetDestSize), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_SetDestSize)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_GetSourceRect:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_GetSourceRect), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_GetSourceRect)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_GetTargetRect:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_GetTargetRect), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_GetTargetRect)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_GetDestSize:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_GetDestSize), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_GetDestSize)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_SetColorSpace:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_SetColorSpace), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_SetColorSpace)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDecodeSwapChain_GetColorSpace:
+            return !std::is_same<decltype(&T::Process_IDXGIDecodeSwapChain_GetColorSpace), decltype(&Dx12Consumer::Process_IDXGIDecodeSwapChain_GetColorSpace)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactoryMedia_CreateSwapChainForCompositionSurfaceHandle:
+            return !std::is_same<decltype(&T::Process_IDXGIFactoryMedia_CreateSwapChainForCompositionSurfaceHandle), decltype(&Dx12Consumer::Process_IDXGIFactoryMedia_CreateSwapChainForCompositionSurfaceHandle)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactoryMedia_CreateDecodeSwapChainForCompositionSurfaceHandle:
+            return !std::is_same<decltype(&T::Process_IDXGIFactoryMedia_CreateDecodeSwapChainForCompositionSurfaceHandle), decltype(&Dx12Consumer::Process_IDXGIFactoryMedia_CreateDecodeSwapChainForCompositionSurfaceHandle)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChainMedia_GetFrameStatisticsMedia:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChainMedia_GetFrameStatisticsMedia), decltype(&Dx12Consumer::Process_IDXGISwapChainMedia_GetFrameStatisticsMedia)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChainMedia_SetPresentDuration:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChainMedia_SetPresentDuration), decltype(&Dx12Consumer::Process_IDXGISwapChainMedia_SetPresentDuration)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChainMedia_CheckPresentDurationSupport:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChainMedia_CheckPresentDurationSupport), decltype(&Dx12Consumer::Process_IDXGISwapChainMedia_CheckPresentDurationSupport)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput3_CheckOverlaySupport:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput3_CheckOverlaySupport), decltype(&Dx12Consumer::Process_IDXGIOutput3_CheckOverlaySupport)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain3_GetCurrentBackBufferIndex:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain3_GetCurrentBackBufferIndex), decltype(&Dx12Consumer::Process_IDXGISwapChain3_GetCurrentBackBufferIndex)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain3_CheckColorSpaceSupport:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain3_CheckColorSpaceSupport), decltype(&Dx12Consumer::Process_IDXGISwapChain3_CheckColorSpaceSupport)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain3_SetColorSpace1:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain3_SetColorSpace1), decltype(&Dx12Consumer::Process_IDXGISwapChain3_SetColorSpace1)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain3_ResizeBuffers1:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain3_ResizeBuffers1), decltype(&Dx12Consumer::Process_IDXGISwapChain3_ResizeBuffers1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput4_CheckOverlayColorSpaceSupport:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput4_CheckOverlayColorSpaceSupport), decltype(&Dx12Consumer::Process_IDXGIOutput4_CheckOverlayColorSpaceSupport)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory4_EnumAdapterByLuid:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory4_EnumAdapterByLuid), decltype(&Dx12Consumer::Process_IDXGIFactory4_EnumAdapterByLuid)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory4_EnumWarpAdapter:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory4_EnumWarpAdapter), decltype(&Dx12Consumer::Process_IDXGIFactory4_EnumWarpAdapter)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter3_RegisterHardwareContentProtectionTeardownStatusEvent:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter3_RegisterHardwareContentProtectionTeardownStatusEvent), decltype(&Dx12Consumer::Process_IDXGIAdapter3_RegisterHardwareContentProtectionTeardownStatusEvent)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter3_UnregisterHardwareContentProtectionTeardownStatus:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter3_UnregisterHardwareContentProtectionTeardownStatus), decltype(&Dx12Consumer::Process_IDXGIAdapter3_UnregisterHardwareContentProtectionTeardownStatus)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter3_QueryVideoMemoryInfo:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter3_QueryVideoMemoryInfo), decltype(&Dx12Consumer::Process_IDXGIAdapter3_QueryVideoMemoryInfo)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter3_SetVideoMemoryReservation:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter3_SetVideoMemoryReservation), decltype(&Dx12Consumer::Process_IDXGIAdapter3_SetVideoMemoryReservation)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter3_RegisterVideoMemoryBudgetChangeNotificationEvent:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter3_RegisterVideoMemoryBudgetChangeNotificationEvent), decltype(&Dx12Consumer::Process_IDXGIAdapter3_RegisterVideoMemoryBudgetChangeNotificationEvent)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter3_UnregisterVideoMemoryBudgetChangeNotification:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter3_UnregisterVideoMemoryBudgetChangeNotification), decltype(&Dx12Consumer::Process_IDXGIAdapter3_UnregisterVideoMemoryBudgetChangeNotification)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput5_DuplicateOutput1:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput5_DuplicateOutput1), decltype(&Dx12Consumer::Process_IDXGIOutput5_DuplicateOutput1)>::value;
+        case format::ApiCallId::ApiCall_IDXGISwapChain4_SetHDRMetaData:
+            return !std::is_same<decltype(&T::Process_IDXGISwapChain4_SetHDRMetaData), decltype(&Dx12Consumer::Process_IDXGISwapChain4_SetHDRMetaData)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice4_OfferResources1:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice4_OfferResources1), decltype(&Dx12Consumer::Process_IDXGIDevice4_OfferResources1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIDevice4_ReclaimResources1:
+            return !std::is_same<decltype(&T::Process_IDXGIDevice4_ReclaimResources1), decltype(&Dx12Consumer::Process_IDXGIDevice4_ReclaimResources1)>::value;
+        case format::ApiCallId::ApiCall_DXGIDeclareAdapterRemovalSupport:
+            return !std::is_same<decltype(&T::Process_DXGIDeclareAdapterRemovalSupport), decltype(&Dx12Consumer::Process_DXGIDeclareAdapterRemovalSupport)>::value;
+        case format::ApiCallId::ApiCall_IDXGIAdapter4_GetDesc3:
+            return !std::is_same<decltype(&T::Process_IDXGIAdapter4_GetDesc3), decltype(&Dx12Consumer::Process_IDXGIAdapter4_GetDesc3)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput6_GetDesc1:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput6_GetDesc1), decltype(&Dx12Consumer::Process_IDXGIOutput6_GetDesc1)>::value;
+        case format::ApiCallId::ApiCall_IDXGIOutput6_CheckHardwareCompositionSupport:
+            return !std::is_same<decltype(&T::Process_IDXGIOutput6_CheckHardwareCompositionSupport), decltype(&Dx12Consumer::Process_IDXGIOutput6_CheckHardwareCompositionSupport)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory6_EnumAdapterByGpuPreference:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory6_EnumAdapterByGpuPreference), decltype(&Dx12Consumer::Process_IDXGIFactory6_EnumAdapterByGpuPreference)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory7_RegisterAdaptersChangedEvent:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory7_RegisterAdaptersChangedEvent), decltype(&Dx12Consumer::Process_IDXGIFactory7_RegisterAdaptersChangedEvent)>::value;
+        case format::ApiCallId::ApiCall_IDXGIFactory7_UnregisterAdaptersChangedEvent:
+            return !std::is_same<decltype(&T::Process_IDXGIFactory7_UnregisterAdaptersChangedEvent), decltype(&Dx12Consumer::Process_IDXGIFactory7_UnregisterAdaptersChangedEvent)>::value;
+        case format::ApiCallId::ApiCall_D3D12SerializeRootSignature:
+            return !std::is_same<decltype(&T::Process_D3D12SerializeRootSignature), decltype(&Dx12Consumer::Process_D3D12SerializeRootSignature)>::value;
+        case format::ApiCallId::ApiCall_D3D12CreateRootSignatureDeserializer:
+            return !std::is_same<decltype(&T::Process_D3D12CreateRootSignatureDeserializer), decltype(&Dx12Consumer::Process_D3D12CreateRootSignatureDeserializer)>::value;
+        case format::ApiCallId::ApiCall_D3D12SerializeVersionedRootSignature:
+            return !std::is_same<decltype(&T::Process_D3D12SerializeVersionedRootSignature), decltype(&Dx12Consumer::Process_D3D12SerializeVersionedRootSignature)>::value;
+        case format::ApiCallId::ApiCall_D3D12CreateVersionedRootSignatureDeserializer:
+            return !std::is_same<decltype(&T::Process_D3D12CreateVersionedRootSignatureDeserializer), decltype(&Dx12Consumer::Process_D3D12CreateVersionedRootSignatureDeserializer)>::value;
+        case format::ApiCallId::ApiCall_D3D12CreateDevice:
+            return !std::is_same<decltype(&T::Process_D3D12CreateDevice), decltype(&Dx12Consumer::Process_D3D12CreateDevice)>::value;
+        case format::ApiCallId::ApiCall_D3D12GetDebugInterface:
+            return !std::is_same<decltype(&T::Process_D3D12GetDebugInterface), decltype(&Dx12Consumer::Process_D3D12GetDebugInterface)>::value;
+        case format::ApiCallId::ApiCall_D3D12EnableExperimentalFeatures:
+            return !std::is_same<decltype(&T::Process_D3D12EnableExperimentalFeatures), decltype(&Dx12Consumer::Process_D3D12EnableExperimentalFeatures)>::value;
+        case format::ApiCallId::ApiCall_D3D12GetInterface:
+            return !std::is_same<decltype(&T::Process_D3D12GetInterface), decltype(&Dx12Consumer::Process_D3D12GetInterface)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Object_GetPrivateData:
+            return !std::is_same<decltype(&T::Process_ID3D12Object_GetPrivateData), decltype(&Dx12Consumer::Process_ID3D12Object_GetPrivateData)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Object_SetPrivateData:
+            return !std::is_same<decltype(&T::Process_ID3D12Object_SetPrivateData), decltype(&Dx12Consumer::Process_ID3D12Object_SetPrivateData)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Object_SetPrivateDataInterface:
+            return !std::is_same<decltype(&T::Process_ID3D12Object_SetPrivateDataInterface), decltype(&Dx12Consumer::Process_ID3D12Object_SetPrivateDataInterface)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Object_SetName:
+            return !std::is_same<decltype(&T::Process_ID3D12Object_SetName), decltype(&Dx12Consumer::Process_ID3D12Object_SetName)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceChild_GetDevice:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceChild_GetDevice), decltype(&Dx12Consumer::Process_ID3D12DeviceChild_GetDevice)>::value;
+        case format::ApiCallId::ApiCall_ID3D12RootSignatureDeserializer_GetRootSignatureDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12RootSignatureDeserializer_GetRootSignatureDesc), decltype(&Dx12Consumer::Process_ID3D12RootSignatureDeserializer_GetRootSignatureDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12VersionedRootSignatureDeserializer_GetRootSignatureDescAtVersion:
+            return !std::is_same<decltype(&T::Process_ID3D12VersionedRootSignatureDeserializer_GetRootSignatureDescAtVersion), decltype(&Dx12Consumer::Process_ID3D12VersionedRootSignatureDeserializer_GetRootSignatureDescAtVersion)>::value;
+        case format::ApiCallId::ApiCall_ID3D12VersionedRootSignatureDeserializer_GetUnconvertedRootSignatureDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12VersionedRootSignatureDeserializer_GetUnconvertedRootSignatureDesc), decltype(&Dx12Consumer::Process_ID3D12VersionedRootSignatureDeserializer_GetUnconvertedRootSignatureDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Heap_GetDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12Heap_GetDesc), decltype(&Dx12Consumer::Process_ID3D12Heap_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource_Map:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource_Map), decltype(&Dx12Consumer::Process_ID3D12Resource_Map)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource_Unmap:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource_Unmap), decltype(&Dx12Consumer::Process_ID3D12Resource_Unmap)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource_GetDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource_GetDesc), decltype(&Dx12Consumer::Process_ID3D12Resource_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource_GetGPUVirtualAddress:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource_GetGPUVirtualAddress), decltype(&Dx12Consumer::Process_ID3D12Resource_GetGPUVirtualAddress)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource_ReadFromSubresource:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource_ReadFromSubresource), decltype(&Dx12Consumer::Process_ID3D12Resource_ReadFromSubresource)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource_GetHeapProperties:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource_GetHeapProperties), decltype(&Dx12Consumer::Process_ID3D12Resource_GetHeapProperties)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandAllocator_Reset:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandAllocator_Reset), decltype(&Dx12Consumer::Process_ID3D12CommandAllocator_Reset)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Fence_GetCompletedValue:
+            return !std::is_same<decltype(&T::Process_ID3D12Fence_GetCompletedValue), decltype(&Dx12Consumer::Process_ID3D12Fence_GetCompletedValue)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Fence_SetEventOnCompletion:
+            return !std::is_same<decltype(&T::Process_ID3D12Fence_SetEventOnCompletion), decltype(&Dx12Consumer::Process_ID3D12Fence_SetEventOnCompletion)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Fence_Signal:
+            return !std::is_same<decltype(&T::Process_ID3D12Fence_Signal), decltype(&Dx12Consumer::Process_ID3D12Fence_Signal)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Fence1_GetCreationFlags:
+            return !std::is_same<decltype(&T::Process_ID3D12Fence1_GetCreationFlags), decltype(&Dx12Consumer::Process_ID3D12Fence1_GetCreationFlags)>::value;
+        case format::ApiCallId::ApiCall_ID3D12PipelineState_GetCachedBlob:
+            return !std::is_same<decltype(&T::Process_ID3D12PipelineState_GetCachedBlob), decltype(&Dx12Consumer::Process_ID3D12PipelineState_GetCachedBlob)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DescriptorHeap_GetDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12DescriptorHeap_GetDesc), decltype(&Dx12Consumer::Process_ID3D12DescriptorHeap_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DescriptorHeap_GetCPUDescriptorHandleForHeapStart:
+            return !std::is_same<decltype(&T::Process_ID3D12DescriptorHeap_GetCPUDescriptorHandleForHeapStart), decltype(&Dx12Consumer::Process_ID3D12DescriptorHeap_GetCPUDescriptorHandleForHeapStart)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DescriptorHeap_GetGPUDescriptorHandleForHeapStart:
+            return !std::is_same<decltype(&T::Process_ID3D12DescriptorHeap_GetGPUDescriptorHandleForHeapStart), decltype(&Dx12Consumer::Process_ID3D12DescriptorHeap_GetGPUDescriptorHandleForHeapStart)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandList_GetType:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandList_GetType), decltype(&Dx12Consumer::Process_ID3D12CommandList_GetType)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_Close:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_Close), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_Close)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_Reset:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_Reset), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_Reset)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ClearState:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ClearState), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ClearState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_DrawInstanced:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_DrawInstanced), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_DrawInstanced)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_DrawIndexedInstanced:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_DrawIndexedInstanced), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_DrawIndexedInstanced)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_Dispatch:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_Dispatch), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_Dispatch)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_CopyBufferRegion:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_CopyBufferRegion), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_CopyBufferRegion)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_CopyTextureRegion:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_CopyTextureRegion), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_CopyTextureRegion)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_CopyResource:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_CopyResource), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_CopyResource)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_CopyTiles:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_CopyTiles), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_CopyTiles)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ResolveSubresource:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ResolveSubresource), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ResolveSubresource)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_IASetPrimitiveTopology:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_IASetPrimitiveTopology), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_IASetPrimitiveTopology)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_RSSetViewports:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_RSSetViewports), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_RSSetViewports)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_RSSetScissorRects:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_RSSetScissorRects), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_RSSetScissorRects)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_OMSetBlendFactor:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_OMSetBlendFactor), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_OMSetBlendFactor)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_OMSetStencilRef:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_OMSetStencilRef), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_OMSetStencilRef)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetPipelineState:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetPipelineState), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetPipelineState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ResourceBarrier:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ResourceBarrier), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ResourceBarrier)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ExecuteBundle:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ExecuteBundle), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ExecuteBundle)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetDescriptorHeaps:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetDescriptorHeaps), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetDescriptorHeaps)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetComputeRootSignature:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetComputeRootSignature), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetComputeRootSignature)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetGraphicsRootSignature:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetGraphicsRootSignature), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetGraphicsRootSignature)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetComputeRootDescriptorTable:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetComputeRootDescriptorTable), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetComputeRootDescriptorTable)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetGraphicsRootDescriptorTable:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetGraphicsRootDescriptorTable), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetGraphicsRootDescriptorTable)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetComputeRoot32BitConstant:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetComputeRoot32BitConstant), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetComputeRoot32BitConstant)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetGraphicsRoot32BitConstant:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetGraphicsRoot32BitConstant), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetGraphicsRoot32BitConstant)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetComputeRoot32BitConstants:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetComputeRoot32BitConstants), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetComputeRoot32BitConstants)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetGraphicsRoot32BitConstants:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetGraphicsRoot32BitConstants), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetGraphicsRoot32BitConstants)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetComputeRootConstantBufferView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetComputeRootConstantBufferView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetComputeRootConstantBufferView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetGraphicsRootConstantBufferView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetGraphicsRootConstantBufferView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetGraphicsRootConstantBufferView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetComputeRootShaderResourceView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetComputeRootShaderResourceView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetComputeRootShaderResourceView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetGraphicsRootShaderResourceView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetGraphicsRootShaderResourceView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetGraphicsRootShaderResourceView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetComputeRootUnorderedAccessView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetComputeRootUnorderedAccessView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetComputeRootUnorderedAccessView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetGraphicsRootUnorderedAccessView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetGraphicsRootUnorderedAccessView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetGraphicsRootUnorderedAccessView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_IASetIndexBuffer:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_IASetIndexBuffer), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_IASetIndexBuffer)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_IASetVertexBuffers:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_IASetVertexBuffers), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_IASetVertexBuffers)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SOSetTargets:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SOSetTargets), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SOSetTargets)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_OMSetRenderTargets:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_OMSetRenderTargets), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_OMSetRenderTargets)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ClearDepthStencilView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ClearDepthStencilView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ClearDepthStencilView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ClearRenderTargetView:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ClearRenderTargetView), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ClearRenderTargetView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ClearUnorderedAccessViewUint:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ClearUnorderedAccessViewUint), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ClearUnorderedAccessViewUint)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ClearUnorderedAccessViewFloat:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ClearUnorderedAccessViewFloat), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ClearUnorderedAccessViewFloat)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_DiscardResource:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_DiscardResource), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_DiscardResource)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_BeginQuery:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_BeginQuery), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_BeginQuery)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_EndQuery:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_EndQuery), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_EndQuery)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ResolveQueryData:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ResolveQueryData), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ResolveQueryData)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetPredication:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetPredication), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetPredication)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_SetMarker:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_SetMarker), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_SetMarker)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_BeginEvent:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_BeginEvent), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_BeginEvent)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_EndEvent:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_EndEvent), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_EndEvent)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList_ExecuteIndirect:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList_ExecuteIndirect), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList_ExecuteIndirect)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList1_AtomicCopyBufferUINT:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList1_AtomicCopyBufferUINT), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList1_AtomicCopyBufferUINT)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList1_AtomicCopyBufferUINT64:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList1_AtomicCopyBufferUINT64), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList1_AtomicCopyBufferUINT64)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList1_OMSetDepthBounds:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList1_OMSetDepthBounds), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList1_OMSetDepthBounds)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList1_SetSamplePositions:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList1_SetSamplePositions), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList1_SetSamplePositions)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList1_ResolveSubresourceRegion:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList1_ResolveSubresourceRegion), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList1_ResolveSubresourceRegion)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList1_SetViewInstanceMask:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList1_SetViewInstanceMask), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList1_SetViewInstanceMask)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList2_WriteBufferImmediate:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList2_WriteBufferImmediate), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList2_WriteBufferImmediate)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_UpdateTileMappings:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_UpdateTileMappings), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_UpdateTileMappings)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_CopyTileMappings:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_CopyTileMappings), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_CopyTileMappings)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_ExecuteCommandLists:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_ExecuteCommandLists), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_ExecuteCommandLists)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_SetMarker:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_SetMarker), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_SetMarker)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_BeginEvent:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_BeginEvent), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_BeginEvent)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_EndEvent:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_EndEvent), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_EndEvent)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_Signal:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_Signal), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_Signal)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_Wait:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_Wait), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_Wait)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_GetTimestampFrequency:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_GetTimestampFrequency), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_GetTimestampFrequency)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_GetClockCalibration:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_GetClockCalibration), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_GetClockCalibration)>::value;
+        case format::ApiCallId::ApiCall_ID3D12CommandQueue_GetDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12CommandQueue_GetDesc), decltype(&Dx12Consumer::Process_ID3D12CommandQueue_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetNodeCount:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetNodeCount), decltype(&Dx12Consumer::Process_ID3D12Device_GetNodeCount)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateCommandQueue:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateCommandQueue), decltype(&Dx12Consumer::Process_ID3D12Device_CreateCommandQueue)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateCommandAllocator:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateCommandAllocator), decltype(&Dx12Consumer::Process_ID3D12Device_CreateCommandAllocator)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateGraphicsPipelineState:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateGraphicsPipelineState), decltype(&Dx12Consumer::Process_ID3D12Device_CreateGraphicsPipelineState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateComputePipelineState:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateComputePipelineState), decltype(&Dx12Consumer::Process_ID3D12Device_CreateComputePipelineState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateCommandList:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateCommandList), decltype(&Dx12Consumer::Process_ID3D12Device_CreateCommandList)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateDescriptorHeap:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateDescriptorHeap), decltype(&Dx12Consumer::Process_ID3D12Device_CreateDescriptorHeap)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetDescriptorHandleIncrementSize:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetDescriptorHandleIncrementSize), decltype(&Dx12Consumer::Process_ID3D12Device_GetDescriptorHandleIncrementSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateRootSignature:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateRootSignature), decltype(&Dx12Consumer::Process_ID3D12Device_CreateRootSignature)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateConstantBufferView:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateConstantBufferView), decltype(&Dx12Consumer::Process_ID3D12Device_CreateConstantBufferView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateShaderResourceView:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateShaderResourceView), decltype(&Dx12Consumer::Process_ID3D12Device_CreateShaderResourceView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateUnorderedAccessView:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateUnorderedAccessView), decltype(&Dx12Consumer::Process_ID3D12Device_CreateUnorderedAccessView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateRenderTargetView:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateRenderTargetView), decltype(&Dx12Consumer::Process_ID3D12Device_CreateRenderTargetView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateDepthStencilView:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateDepthStencilView), decltype(&Dx12Consumer::Process_ID3D12Device_CreateDepthStencilView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateSampler:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateSampler), decltype(&Dx12Consumer::Process_ID3D12Device_CreateSampler)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CopyDescriptors:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CopyDescriptors), decltype(&Dx12Consumer::Process_ID3D12Device_CopyDescriptors)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CopyDescriptorsSimple:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CopyDescriptorsSimple), decltype(&Dx12Consumer::Process_ID3D12Device_CopyDescriptorsSimple)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetResourceAllocationInfo:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetResourceAllocationInfo), decltype(&Dx12Consumer::Process_ID3D12Device_GetResourceAllocationInfo)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetCustomHeapProperties:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetCustomHeapProperties), decltype(&Dx12Consumer::Process_ID3D12Device_GetCustomHeapProperties)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateCommittedResource:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateCommittedResource), decltype(&Dx12Consumer::Process_ID3D12Device_CreateCommittedResource)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateHeap:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateHeap), decltype(&Dx12Consumer::Process_ID3D12Device_CreateHeap)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreatePlacedResource:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreatePlacedResource), decltype(&Dx12Consumer::Process_ID3D12Device_CreatePlacedResource)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateReservedResource:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateReservedResource), decltype(&Dx12Consumer::Process_ID3D12Device_CreateReservedResource)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateSharedHandle:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateSharedHandle), decltype(&Dx12Consumer::Process_ID3D12Device_CreateSharedHandle)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_OpenSharedHandle:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_OpenSharedHandle), decltype(&Dx12Consumer::Process_ID3D12Device_OpenSharedHandle)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_OpenSharedHandleByName:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_OpenSharedHandleByName), decltype(&Dx12Consumer::Process_ID3D12Device_OpenSharedHandleByName)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_MakeResident:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_MakeResident), decltype(&Dx12Consumer::Process_ID3D12Device_MakeResident)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_Evict:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_Evict), decltype(&Dx12Consumer::Process_ID3D12Device_Evict)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateFence:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateFence), decltype(&Dx12Consumer::Process_ID3D12Device_CreateFence)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetDeviceRemovedReason:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetDeviceRemovedReason), decltype(&Dx12Consumer::Process_ID3D12Device_GetDeviceRemovedReason)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetCopyableFootprints:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetCopyableFootprints), decltype(&Dx12Consumer::Process_ID3D12Device_GetCopyableFootprints)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateQueryHeap:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateQueryHeap), decltype(&Dx12Consumer::Process_ID3D12Device_CreateQueryHeap)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_SetStablePowerState:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_SetStablePowerState), decltype(&Dx12Consumer::Process_ID3D12Device_SetStablePowerState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_CreateCommandSignature:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_CreateCommandSignature), decltype(&Dx12Consumer::Process_ID3D12Device_CreateCommandSignature)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetResourceTiling:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetResourceTiling), decltype(&Dx12Consumer::Process_ID3D12Device_GetResourceTiling)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device_GetAdapterLuid:
+            return !std::is_same<decltype(&T::Process_ID3D12Device_GetAdapterLuid), decltype(&Dx12Consumer::Process_ID3D12Device_GetAdapterLuid)>::value;
+        case format::ApiCallId::ApiCall_ID3D12PipelineLibrary_StorePipeline:
+            return !std::is_same<decltype(&T::Process_ID3D12PipelineLibrary_StorePipeline), decltype(&Dx12Consumer::Process_ID3D12PipelineLibrary_StorePipeline)>::value;
+        case format::ApiCallId::ApiCall_ID3D12PipelineLibrary_LoadGraphicsPipeline:
+            return !std::is_same<decltype(&T::Process_ID3D12PipelineLibrary_LoadGraphicsPipeline), decltype(&Dx12Consumer::Process_ID3D12PipelineLibrary_LoadGraphicsPipeline)>::value;
+        case format::ApiCallId::ApiCall_ID3D12PipelineLibrary_LoadComputePipeline:
+            return !std::is_same<decltype(&T::Process_ID3D12PipelineLibrary_LoadComputePipeline), decltype(&Dx12Consumer::Process_ID3D12PipelineLibrary_LoadComputePipeline)>::value;
+        case format::ApiCallId::ApiCall_ID3D12PipelineLibrary_GetSerializedSize:
+            return !std::is_same<decltype(&T::Process_ID3D12PipelineLibrary_GetSerializedSize), decltype(&Dx12Consumer::Process_ID3D12PipelineLibrary_GetSerializedSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12PipelineLibrary_Serialize:
+            return !std::is_same<decltype(&T::Process_ID3D12PipelineLibrary_Serialize), decltype(&Dx12Consumer::Process_ID3D12PipelineLibrary_Serialize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12PipelineLibrary1_LoadPipeline:
+            return !std::is_same<decltype(&T::Process_ID3D12PipelineLibrary1_LoadPipeline), decltype(&Dx12Consumer::Process_ID3D12PipelineLibrary1_LoadPipeline)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device1_CreatePipelineLibrary:
+            return !std::is_same<decltype(&T::Process_ID3D12Device1_CreatePipelineLibrary), decltype(&Dx12Consumer::Process_ID3D12Device1_CreatePipelineLibrary)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device1_SetEventOnMultipleFenceCompletion:
+            return !std::is_same<decltype(&T::Process_ID3D12Device1_SetEventOnMultipleFenceCompletion), decltype(&Dx12Consumer::Process_ID3D12Device1_SetEventOnMultipleFenceCompletion)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device1_SetResidencyPriority:
+            return !std::is_same<decltype(&T::Process_ID3D12Device1_SetResidencyPriority), decltype(&Dx12Consumer::Process_ID3D12Device1_SetResidencyPriority)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device2_CreatePipelineState:
+            return !std::is_same<decltype(&T::Process_ID3D12Device2_CreatePipelineState), decltype(&Dx12Consumer::Process_ID3D12Device2_CreatePipelineState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device3_OpenExistingHeapFromAddress:
+            return !std::is_same<decltype(&T::Process_ID3D12Device3_OpenExistingHeapFromAddress), decltype(&Dx12Consumer::Process_ID3D12Device3_OpenExistingHeapFromAddress)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device3_OpenExistingHeapFromFileMapping:
+            return !std::is_same<decltype(&T::Process_ID3D12Device3_OpenExistingHeapFromFileMapping), decltype(&Dx12Consumer::Process_ID3D12Device3_OpenExistingHeapFromFileMapping)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device3_EnqueueMakeResident:
+            return !std::is_same<decltype(&T::Process_ID3D12Device3_EnqueueMakeResident), decltype(&Dx12Consumer::Process_ID3D12Device3_EnqueueMakeResident)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ProtectedSession_GetStatusFence:
+            return !std::is_same<decltype(&T::Process_ID3D12ProtectedSession_GetStatusFence), decltype(&Dx12Consumer::Process_ID3D12ProtectedSession_GetStatusFence)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ProtectedSession_GetSessionStatus:
+            return !std::is_same<decltype(&T::Process_ID3D12ProtectedSession_GetSessionStatus), decltype(&Dx12Consumer::Process_ID3D12ProtectedSession_GetSessionStatus)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ProtectedResourceSession_GetDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12ProtectedResourceSession_GetDesc), decltype(&Dx12Consumer::Process_ID3D12ProtectedResourceSession_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device4_CreateCommandList1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device4_CreateCommandList1), decltype(&Dx12Consumer::Process_ID3D12Device4_CreateCommandList1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device4_CreateProtectedResourceSession:
+            return !std::is_same<decltype(&T::Process_ID3D12Device4_CreateProtectedResourceSession), decltype(&Dx12Consumer::Process_ID3D12Device4_CreateProtectedResourceSession)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device4_CreateCommittedResource1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device4_CreateCommittedResource1), decltype(&Dx12Consumer::Process_ID3D12Device4_CreateCommittedResource1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device4_CreateHeap1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device4_CreateHeap1), decltype(&Dx12Consumer::Process_ID3D12Device4_CreateHeap1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device4_CreateReservedResource1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device4_CreateReservedResource1), decltype(&Dx12Consumer::Process_ID3D12Device4_CreateReservedResource1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device4_GetResourceAllocationInfo1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device4_GetResourceAllocationInfo1), decltype(&Dx12Consumer::Process_ID3D12Device4_GetResourceAllocationInfo1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12LifetimeOwner_LifetimeStateUpdated:
+            return !std::is_same<decltype(&T::Process_ID3D12LifetimeOwner_LifetimeStateUpdated), decltype(&Dx12Consumer::Process_ID3D12LifetimeOwner_LifetimeStateUpdated)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SwapChainAssistant_GetLUID:
+            return !std::is_same<decltype(&T::Process_ID3D12SwapChainAssistant_GetLUID), decltype(&Dx12Consumer::Process_ID3D12SwapChainAssistant_GetLUID)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SwapChainAssistant_GetSwapChainObject:
+            return !std::is_same<decltype(&T::Process_ID3D12SwapChainAssistant_GetSwapChainObject), decltype(&Dx12Consumer::Process_ID3D12SwapChainAssistant_GetSwapChainObject)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SwapChainAssistant_GetCurrentResourceAndCommandQueue:
+            return !std::is_same<decltype(&T::Process_ID3D12SwapChainAssistant_GetCurrentResourceAndCommandQueue), decltype(&Dx12Consumer::Process_ID3D12SwapChainAssistant_GetCurrentResourceAndCommandQueue)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SwapChainAssistant_InsertImplicitSync:
+            return !std::is_same<decltype(&T::Process_ID3D12SwapChainAssistant_InsertImplicitSync), decltype(&Dx12Consumer::Process_ID3D12SwapChainAssistant_InsertImplicitSync)>::value;
+        case format::ApiCallId::ApiCall_ID3D12LifetimeTracker_DestroyOwnedObject:
+            return !std::is_same<decltype(&T::Process_ID3D12LifetimeTracker_DestroyOwnedObject), decltype(&Dx12Consumer::Process_ID3D12LifetimeTracker_DestroyOwnedObject)>::value;
+        case format::ApiCallId::ApiCall_ID3D12StateObjectProperties_GetShaderIdentifier:
+            return !std::is_same<decltype(&T::Process_ID3D12StateObjectProperties_GetShaderIdentifier), decltype(&Dx12Consumer::Process_ID3D12StateObjectProperties_GetShaderIdentifier)>::value;
+        case format::ApiCallId::ApiCall_ID3D12StateObjectProperties_GetShaderStackSize:
+            return !std::is_same<decltype(&T::Process_ID3D12StateObjectProperties_GetShaderStackSize), decltype(&Dx12Consumer::Process_ID3D12StateObjectProperties_GetShaderStackSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12StateObjectProperties_GetPipelineStackSize:
+            return !std::is_same<decltype(&T::Process_ID3D12StateObjectProperties_GetPipelineStackSize), decltype(&Dx12Consumer::Process_ID3D12StateObjectProperties_GetPipelineStackSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12StateObjectProperties_SetPipelineStackSize:
+            return !std::is_same<decltype(&T::Process_ID3D12StateObjectProperties_SetPipelineStackSize), decltype(&Dx12Consumer::Process_ID3D12StateObjectProperties_SetPipelineStackSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_CreateLifetimeTracker:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_CreateLifetimeTracker), decltype(&Dx12Consumer::Process_ID3D12Device5_CreateLifetimeTracker)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_RemoveDevice:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_RemoveDevice), decltype(&Dx12Consumer::Process_ID3D12Device5_RemoveDevice)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_EnumerateMetaCommands:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_EnumerateMetaCommands), decltype(&Dx12Consumer::Process_ID3D12Device5_EnumerateMetaCommands)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_EnumerateMetaCommandParameters:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_EnumerateMetaCommandParameters), decltype(&Dx12Consumer::Process_ID3D12Device5_EnumerateMetaCommandParameters)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_CreateMetaCommand:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_CreateMetaCommand), decltype(&Dx12Consumer::Process_ID3D12Device5_CreateMetaCommand)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_CreateStateObject:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_CreateStateObject), decltype(&Dx12Consumer::Process_ID3D12Device5_CreateStateObject)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_GetRaytracingAccelerationStructurePrebuildInfo:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_GetRaytracingAccelerationStructurePrebuildInfo), decltype(&Dx12Consumer::Process_ID3D12Device5_GetRaytracingAccelerationStructurePrebuildInfo)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device5_CheckDriverMatchingIdentifier:
+            return !std::is_same<decltype(&T::Process_ID3D12Device5_CheckDriverMatchingIdentifier), decltype(&Dx12Consumer::Process_ID3D12Device5_CheckDriverMatchingIdentifier)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedDataSettings_SetAutoBreadcrumbsEnablement:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedDataSettings_SetAutoBreadcrumbsEnablement), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedDataSettings_SetAutoBreadcrumbsEnablement)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedDataSettings_SetPageFaultEnablement:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedDataSettings_SetPageFaultEnablement), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedDataSettings_SetPageFaultEnablement)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedDataSettings_SetWatsonDumpEnablement:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedDataSettings_SetWatsonDumpEnablement), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedDataSettings_SetWatsonDumpEnablement)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedDataSettings1_SetBreadcrumbContextEnablement:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedDataSettings1_SetBreadcrumbContextEnablement), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedDataSettings1_SetBreadcrumbContextEnablement)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedDataSettings2_UseMarkersOnlyAutoBreadcrumbs:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedDataSettings2_UseMarkersOnlyAutoBreadcrumbs), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedDataSettings2_UseMarkersOnlyAutoBreadcrumbs)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedData_GetAutoBreadcrumbsOutput:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedData_GetAutoBreadcrumbsOutput), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedData_GetAutoBreadcrumbsOutput)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedData_GetPageFaultAllocationOutput:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedData_GetPageFaultAllocationOutput), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedData_GetPageFaultAllocationOutput)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedData1_GetAutoBreadcrumbsOutput1:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedData1_GetAutoBreadcrumbsOutput1), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedData1_GetAutoBreadcrumbsOutput1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedData1_GetPageFaultAllocationOutput1:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedData1_GetPageFaultAllocationOutput1), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedData1_GetPageFaultAllocationOutput1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedData2_GetPageFaultAllocationOutput2:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedData2_GetPageFaultAllocationOutput2), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedData2_GetPageFaultAllocationOutput2)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceRemovedExtendedData2_GetDeviceState:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceRemovedExtendedData2_GetDeviceState), decltype(&Dx12Consumer::Process_ID3D12DeviceRemovedExtendedData2_GetDeviceState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device6_SetBackgroundProcessingMode:
+            return !std::is_same<decltype(&T::Process_ID3D12Device6_SetBackgroundProcessingMode), decltype(&Dx12Consumer::Process_ID3D12Device6_SetBackgroundProcessingMode)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ProtectedResourceSession1_GetDesc1:
+            return !std::is_same<decltype(&T::Process_ID3D12ProtectedResourceSession1_GetDesc1), decltype(&Dx12Consumer::Process_ID3D12ProtectedResourceSession1_GetDesc1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device7_AddToStateObject:
+            return !std::is_same<decltype(&T::Process_ID3D12Device7_AddToStateObject), decltype(&Dx12Consumer::Process_ID3D12Device7_AddToStateObject)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device7_CreateProtectedResourceSession1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device7_CreateProtectedResourceSession1), decltype(&Dx12Consumer::Process_ID3D12Device7_CreateProtectedResourceSession1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device8_GetResourceAllocationInfo2:
+            return !std::is_same<decltype(&T::Process_ID3D12Device8_GetResourceAllocationInfo2), decltype(&Dx12Consumer::Process_ID3D12Device8_GetResourceAllocationInfo2)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device8_CreateCommittedResource2:
+            return !std::is_same<decltype(&T::Process_ID3D12Device8_CreateCommittedResource2), decltype(&Dx12Consumer::Process_ID3D12Device8_CreateCommittedResource2)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device8_CreatePlacedResource1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device8_CreatePlacedResource1), decltype(&Dx12Consumer::Process_ID3D12Device8_CreatePlacedResource1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device8_CreateSamplerFeedbackUnorderedAccessView:
+            return !std::is_same<decltype(&T::Process_ID3D12Device8_CreateSamplerFeedbackUnorderedAccessView), decltype(&Dx12Consumer::Process_ID3D12Device8_CreateSamplerFeedbackUnorderedAccessView)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device8_GetCopyableFootprints1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device8_GetCopyableFootprints1), decltype(&Dx12Consumer::Process_ID3D12Device8_GetCopyableFootprints1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource1_GetProtectedResourceSession:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource1_GetProtectedResourceSession), decltype(&Dx12Consumer::Process_ID3D12Resource1_GetProtectedResourceSession)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Resource2_GetDesc1:
+            return !std::is_same<decltype(&T::Process_ID3D12Resource2_GetDesc1), decltype(&Dx12Consumer::Process_ID3D12Resource2_GetDesc1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Heap1_GetProtectedResourceSession:
+            return !std::is_same<decltype(&T::Process_ID3D12Heap1_GetProtectedResourceSession), decltype(&Dx12Consumer::Process_ID3D12Heap1_GetProtectedResourceSession)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList3_SetProtectedResourceSession:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList3_SetProtectedResourceSession), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList3_SetProtectedResourceSession)>::value;
+        case format::ApiCallId::ApiCall_ID3D12MetaCommand_GetRequiredParameterResourceSize:
+            return !std::is_same<decltype(&T::Process_ID3D12MetaCommand_GetRequiredParameterResourceSize), decltype(&Dx12Consumer::Process_ID3D12MetaCommand_GetRequiredParameterResourceSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_BeginRenderPass:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_BeginRenderPass), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_BeginRenderPass)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_EndRenderPass:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_EndRenderPass), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_EndRenderPass)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_InitializeMetaCommand:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_InitializeMetaCommand), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_InitializeMetaCommand)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_ExecuteMetaCommand:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_ExecuteMetaCommand), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_ExecuteMetaCommand)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_BuildRaytracingAccelerationStructure:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_BuildRaytracingAccelerationStructure), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_BuildRaytracingAccelerationStructure)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_EmitRaytracingAccelerationStructurePostbuildInfo:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_EmitRaytracingAccelerationStructurePostbuildInfo), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_EmitRaytracingAccelerationStructurePostbuildInfo)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_CopyRaytracingAccelerationStructure:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_CopyRaytracingAccelerationStructure), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_CopyRaytracingAccelerationStructure)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_SetPipelineState1:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_SetPipelineState1), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_SetPipelineState1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList4_DispatchRays:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList4_DispatchRays), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList4_DispatchRays)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ShaderCacheSession_FindValue:
+            return !std::is_same<decltype(&T::Process_ID3D12ShaderCacheSession_FindValue), decltype(&Dx12Consumer::Process_ID3D12ShaderCacheSession_FindValue)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ShaderCacheSession_StoreValue:
+            return !std::is_same<decltype(&T::Process_ID3D12ShaderCacheSession_StoreValue), decltype(&Dx12Consumer::Process_ID3D12ShaderCacheSession_StoreValue)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ShaderCacheSession_SetDeleteOnDestroy:
+            return !std::is_same<decltype(&T::Process_ID3D12ShaderCacheSession_SetDeleteOnDestroy), decltype(&Dx12Consumer::Process_ID3D12ShaderCacheSession_SetDeleteOnDestroy)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ShaderCacheSession_GetDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12ShaderCacheSession_GetDesc), decltype(&Dx12Consumer::Process_ID3D12ShaderCacheSession_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device9_CreateShaderCacheSession:
+            return !std::is_same<decltype(&T::Process_ID3D12Device9_CreateShaderCacheSession), decltype(&Dx12Consumer::Process_ID3D12Device9_CreateShaderCacheSession)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device9_ShaderCacheControl:
+            return !std::is_same<decltype(&T::Process_ID3D12Device9_ShaderCacheControl), decltype(&Dx12Consumer::Process_ID3D12Device9_ShaderCacheControl)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device9_CreateCommandQueue1:
+            return !std::is_same<decltype(&T::Process_ID3D12Device9_CreateCommandQueue1), decltype(&Dx12Consumer::Process_ID3D12Device9_CreateCommandQueue1)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device10_CreateCommittedResource3:
+            return !std::is_same<decltype(&T::Process_ID3D12Device10_CreateCommittedResource3), decltype(&Dx12Consumer::Process_ID3D12Device10_CreateCommittedResource3)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device10_CreatePlacedResource2:
+            return !std::is_same<decltype(&T::Process_ID3D12Device10_CreatePlacedResource2), decltype(&Dx12Consumer::Process_ID3D12Device10_CreatePlacedResource2)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device10_CreateReservedResource2:
+            return !std::is_same<decltype(&T::Process_ID3D12Device10_CreateReservedResource2), decltype(&Dx12Consumer::Process_ID3D12Device10_CreateReservedResource2)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device11_CreateSampler2:
+            return !std::is_same<decltype(&T::Process_ID3D12Device11_CreateSampler2), decltype(&Dx12Consumer::Process_ID3D12Device11_CreateSampler2)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Device12_GetResourceAllocationInfo3:
+            return !std::is_same<decltype(&T::Process_ID3D12Device12_GetResourceAllocationInfo3), decltype(&Dx12Consumer::Process_ID3D12Device12_GetResourceAllocationInfo3)>::value;
+        case format::ApiCallId::ApiCall_ID3D12VirtualizationGuestDevice_ShareWithHost:
+            return !std::is_same<decltype(&T::Process_ID3D12VirtualizationGuestDevice_ShareWithHost), decltype(&Dx12Consumer::Process_ID3D12VirtualizationGuestDevice_ShareWithHost)>::value;
+        case format::ApiCallId::ApiCall_ID3D12VirtualizationGuestDevice_CreateFenceFd:
+            return !std::is_same<decltype(&T::Process_ID3D12VirtualizationGuestDevice_CreateFenceFd), decltype(&Dx12Consumer::Process_ID3D12VirtualizationGuestDevice_CreateFenceFd)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Tools_EnableShaderInstrumentation:
+            return !std::is_same<decltype(&T::Process_ID3D12Tools_EnableShaderInstrumentation), decltype(&Dx12Consumer::Process_ID3D12Tools_EnableShaderInstrumentation)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Tools_ShaderInstrumentationEnabled:
+            return !std::is_same<decltype(&T::Process_ID3D12Tools_ShaderInstrumentationEnabled), decltype(&Dx12Consumer::Process_ID3D12Tools_ShaderInstrumentationEnabled)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SDKConfiguration_SetSDKVersion:
+            return !std::is_same<decltype(&T::Process_ID3D12SDKConfiguration_SetSDKVersion), decltype(&Dx12Consumer::Process_ID3D12SDKConfiguration_SetSDKVersion)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SDKConfiguration1_CreateDeviceFactory:
+            return !std::is_same<decltype(&T::Process_ID3D12SDKConfiguration1_CreateDeviceFactory), decltype(&Dx12Consumer::Process_ID3D12SDKConfiguration1_CreateDeviceFactory)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SDKConfiguration1_FreeUnusedSDKs:
+            return !std::is_same<decltype(&T::Process_ID3D12SDKConfiguration1_FreeUnusedSDKs), decltype(&Dx12Consumer::Process_ID3D12SDKConfiguration1_FreeUnusedSDKs)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceFactory_InitializeFromGlobalState:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceFactory_InitializeFromGlobalState), decltype(&Dx12Consumer::Process_ID3D12DeviceFactory_InitializeFromGlobalState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceFactory_ApplyToGlobalState:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceFactory_ApplyToGlobalState), decltype(&Dx12Consumer::Process_ID3D12DeviceFactory_ApplyToGlobalState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceFactory_SetFlags:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceFactory_SetFlags), decltype(&Dx12Consumer::Process_ID3D12DeviceFactory_SetFlags)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceFactory_GetFlags:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceFactory_GetFlags), decltype(&Dx12Consumer::Process_ID3D12DeviceFactory_GetFlags)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceFactory_GetConfigurationInterface:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceFactory_GetConfigurationInterface), decltype(&Dx12Consumer::Process_ID3D12DeviceFactory_GetConfigurationInterface)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceFactory_EnableExperimentalFeatures:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceFactory_EnableExperimentalFeatures), decltype(&Dx12Consumer::Process_ID3D12DeviceFactory_EnableExperimentalFeatures)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceFactory_CreateDevice:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceFactory_CreateDevice), decltype(&Dx12Consumer::Process_ID3D12DeviceFactory_CreateDevice)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceConfiguration_GetDesc:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceConfiguration_GetDesc), decltype(&Dx12Consumer::Process_ID3D12DeviceConfiguration_GetDesc)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceConfiguration_GetEnabledExperimentalFeatures:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceConfiguration_GetEnabledExperimentalFeatures), decltype(&Dx12Consumer::Process_ID3D12DeviceConfiguration_GetEnabledExperimentalFeatures)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceConfiguration_SerializeVersionedRootSignature:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceConfiguration_SerializeVersionedRootSignature), decltype(&Dx12Consumer::Process_ID3D12DeviceConfiguration_SerializeVersionedRootSignature)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DeviceConfiguration_CreateVersionedRootSignatureDeserializer:
+            return !std::is_same<decltype(&T::Process_ID3D12DeviceConfiguration_CreateVersionedRootSignatureDeserializer), decltype(&Dx12Consumer::Process_ID3D12DeviceConfiguration_CreateVersionedRootSignatureDeserializer)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList5_RSSetShadingRate:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList5_RSSetShadingRate), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList5_RSSetShadingRate)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList5_RSSetShadingRateImage:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList5_RSSetShadingRateImage), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList5_RSSetShadingRateImage)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList6_DispatchMesh:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList6_DispatchMesh), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList6_DispatchMesh)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList7_Barrier:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList7_Barrier), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList7_Barrier)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList8_OMSetFrontAndBackStencilRef:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList8_OMSetFrontAndBackStencilRef), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList8_OMSetFrontAndBackStencilRef)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList9_RSSetDepthBias:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList9_RSSetDepthBias), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList9_RSSetDepthBias)>::value;
+        case format::ApiCallId::ApiCall_ID3D12GraphicsCommandList9_IASetIndexBufferStripCutValue:
+            return !std::is_same<decltype(&T::Process_ID3D12GraphicsCommandList9_IASetIndexBufferStripCutValue), decltype(&Dx12Consumer::Process_ID3D12GraphicsCommandList9_IASetIndexBufferStripCutValue)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DSRDeviceFactory_CreateDSRDevice:
+            return !std::is_same<decltype(&T::Process_ID3D12DSRDeviceFactory_CreateDSRDevice), decltype(&Dx12Consumer::Process_ID3D12DSRDeviceFactory_CreateDSRDevice)>::value;
+        case format::ApiCallId::ApiCall_ID3D10Blob_GetBufferPointer:
+            return !std::is_same<decltype(&T::Process_ID3D10Blob_GetBufferPointer), decltype(&Dx12Consumer::Process_ID3D10Blob_GetBufferPointer)>::value;
+        case format::ApiCallId::ApiCall_ID3D10Blob_GetBufferSize:
+            return !std::is_same<decltype(&T::Process_ID3D10Blob_GetBufferSize), decltype(&Dx12Consumer::Process_ID3D10Blob_GetBufferSize)>::value;
+        case format::ApiCallId::ApiCall_ID3DDestructionNotifier_RegisterDestructionCallback:
+            return !std::is_same<decltype(&T::Process_ID3DDestructionNotifier_RegisterDestructionCallback), decltype(&Dx12Consumer::Process_ID3DDestructionNotifier_RegisterDestructionCallback)>::value;
+        case format::ApiCallId::ApiCall_ID3DDestructionNotifier_UnregisterDestructionCallback:
+            return !std::is_same<decltype(&T::Process_ID3DDestructionNotifier_UnregisterDestructionCallback), decltype(&Dx12Consumer::Process_ID3DDestructionNotifier_UnregisterDestructionCallback)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug_EnableDebugLayer:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug_EnableDebugLayer), decltype(&Dx12Consumer::Process_ID3D12Debug_EnableDebugLayer)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug1_EnableDebugLayer:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug1_EnableDebugLayer), decltype(&Dx12Consumer::Process_ID3D12Debug1_EnableDebugLayer)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug1_SetEnableGPUBasedValidation:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug1_SetEnableGPUBasedValidation), decltype(&Dx12Consumer::Process_ID3D12Debug1_SetEnableGPUBasedValidation)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug1_SetEnableSynchronizedCommandQueueValidation:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug1_SetEnableSynchronizedCommandQueueValidation), decltype(&Dx12Consumer::Process_ID3D12Debug1_SetEnableSynchronizedCommandQueueValidation)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug2_SetGPUBasedValidationFlags:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug2_SetGPUBasedValidationFlags), decltype(&Dx12Consumer::Process_ID3D12Debug2_SetGPUBasedValidationFlags)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug3_SetEnableGPUBasedValidation:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug3_SetEnableGPUBasedValidation), decltype(&Dx12Consumer::Process_ID3D12Debug3_SetEnableGPUBasedValidation)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug3_SetEnableSynchronizedCommandQueueValidation:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug3_SetEnableSynchronizedCommandQueueValidation), decltype(&Dx12Consumer::Process_ID3D12Debug3_SetEnableSynchronizedCommandQueueValidation)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug3_SetGPUBasedValidationFlags:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug3_SetGPUBasedValidationFlags), decltype(&Dx12Consumer::Process_ID3D12Debug3_SetGPUBasedValidationFlags)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug4_DisableDebugLayer:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug4_DisableDebugLayer), decltype(&Dx12Consumer::Process_ID3D12Debug4_DisableDebugLayer)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug5_SetEnableAutoName:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug5_SetEnableAutoName), decltype(&Dx12Consumer::Process_ID3D12Debug5_SetEnableAutoName)>::value;
+        case format::ApiCallId::ApiCall_ID3D12Debug6_SetForceLegacyBarrierValidation:
+            return !std::is_same<decltype(&T::Process_ID3D12Debug6_SetForceLegacyBarrierValidation), decltype(&Dx12Consumer::Process_ID3D12Debug6_SetForceLegacyBarrierValidation)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice1_SetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice1_SetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugDevice1_SetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice1_GetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice1_GetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugDevice1_GetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice1_ReportLiveDeviceObjects:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice1_ReportLiveDeviceObjects), decltype(&Dx12Consumer::Process_ID3D12DebugDevice1_ReportLiveDeviceObjects)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice_SetFeatureMask:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice_SetFeatureMask), decltype(&Dx12Consumer::Process_ID3D12DebugDevice_SetFeatureMask)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice_GetFeatureMask:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice_GetFeatureMask), decltype(&Dx12Consumer::Process_ID3D12DebugDevice_GetFeatureMask)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice_ReportLiveDeviceObjects:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice_ReportLiveDeviceObjects), decltype(&Dx12Consumer::Process_ID3D12DebugDevice_ReportLiveDeviceObjects)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice2_SetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice2_SetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugDevice2_SetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugDevice2_GetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugDevice2_GetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugDevice2_GetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandQueue_AssertResourceState:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandQueue_AssertResourceState), decltype(&Dx12Consumer::Process_ID3D12DebugCommandQueue_AssertResourceState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandQueue1_AssertResourceAccess:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandQueue1_AssertResourceAccess), decltype(&Dx12Consumer::Process_ID3D12DebugCommandQueue1_AssertResourceAccess)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandQueue1_AssertTextureLayout:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandQueue1_AssertTextureLayout), decltype(&Dx12Consumer::Process_ID3D12DebugCommandQueue1_AssertTextureLayout)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList1_AssertResourceState:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList1_AssertResourceState), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList1_AssertResourceState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList1_SetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList1_SetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList1_SetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList1_GetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList1_GetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList1_GetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList_AssertResourceState:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList_AssertResourceState), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList_AssertResourceState)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList_SetFeatureMask:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList_SetFeatureMask), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList_SetFeatureMask)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList_GetFeatureMask:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList_GetFeatureMask), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList_GetFeatureMask)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList2_SetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList2_SetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList2_SetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList2_GetDebugParameter:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList2_GetDebugParameter), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList2_GetDebugParameter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList3_AssertResourceAccess:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList3_AssertResourceAccess), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList3_AssertResourceAccess)>::value;
+        case format::ApiCallId::ApiCall_ID3D12DebugCommandList3_AssertTextureLayout:
+            return !std::is_same<decltype(&T::Process_ID3D12DebugCommandList3_AssertTextureLayout), decltype(&Dx12Consumer::Process_ID3D12DebugCommandList3_AssertTextureLayout)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SharingContract_Present:
+            return !std::is_same<decltype(&T::Process_ID3D12SharingContract_Present), decltype(&Dx12Consumer::Process_ID3D12SharingContract_Present)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SharingContract_SharedFenceSignal:
+            return !std::is_same<decltype(&T::Process_ID3D12SharingContract_SharedFenceSignal), decltype(&Dx12Consumer::Process_ID3D12SharingContract_SharedFenceSignal)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SharingContract_BeginCapturableWork:
+            return !std::is_same<decltype(&T::Process_ID3D12SharingContract_BeginCapturableWork), decltype(&Dx12Consumer::Process_ID3D12SharingContract_BeginCapturableWork)>::value;
+        case format::ApiCallId::ApiCall_ID3D12SharingContract_EndCapturableWork:
+            return !std::is_same<decltype(&T::Process_ID3D12SharingContract_EndCapturableWork), decltype(&Dx12Consumer::Process_ID3D12SharingContract_EndCapturableWork)>::value;
+        case format::ApiCallId::ApiCall_ID3D12ManualWriteTrackingResource_TrackWrite:
+            return !std::is_same<decltype(&T::Process_ID3D12ManualWriteTrackingResource_TrackWrite), decltype(&Dx12Consumer::Process_ID3D12ManualWriteTrackingResource_TrackWrite)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_SetMessageCountLimit:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_SetMessageCountLimit), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_SetMessageCountLimit)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_ClearStoredMessages:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_ClearStoredMessages), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_ClearStoredMessages)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetMessage:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetMessage), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetMessage)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetNumMessagesAllowedByStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetNumMessagesAllowedByStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetNumMessagesAllowedByStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetNumMessagesDeniedByStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetNumMessagesDeniedByStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetNumMessagesDeniedByStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetNumStoredMessages:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetNumStoredMessages), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetNumStoredMessages)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetNumStoredMessagesAllowedByRetrievalFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetNumStoredMessagesAllowedByRetrievalFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetNumStoredMessagesAllowedByRetrievalFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetNumMessagesDiscardedByMessageCountLimit:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetNumMessagesDiscardedByMessageCountLimit), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetNumMessagesDiscardedByMessageCountLimit)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetMessageCountLimit:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetMessageCountLimit), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetMessageCountLimit)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_AddStorageFilterEntries:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_AddStorageFilterEntries), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_AddStorageFilterEntries)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_ClearStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_ClearStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_ClearStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PushEmptyStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PushEmptyStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PushEmptyStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PushCopyOfStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PushCopyOfStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PushCopyOfStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PushStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PushStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PushStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PopStorageFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PopStorageFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PopStorageFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetStorageFilterStackSize:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetStorageFilterStackSize), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetStorageFilterStackSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_AddRetrievalFilterEntries:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_AddRetrievalFilterEntries), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_AddRetrievalFilterEntries)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetRetrievalFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetRetrievalFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetRetrievalFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_ClearRetrievalFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_ClearRetrievalFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_ClearRetrievalFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PushEmptyRetrievalFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PushEmptyRetrievalFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PushEmptyRetrievalFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PushCopyOfRetrievalFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PushCopyOfRetrievalFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PushCopyOfRetrievalFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PushRetrievalFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PushRetrievalFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PushRetrievalFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_PopRetrievalFilter:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_PopRetrievalFilter), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_PopRetrievalFilter)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetRetrievalFilterStackSize:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetRetrievalFilterStackSize), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetRetrievalFilterStackSize)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_AddMessage:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_AddMessage), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_AddMessage)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_AddApplicationMessage:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_AddApplicationMessage), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_AddApplicationMessage)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_SetBreakOnCategory:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_SetBreakOnCategory), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_SetBreakOnCategory)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_SetBreakOnSeverity:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_SetBreakOnSeverity), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_SetBreakOnSeverity)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_SetBreakOnID:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_SetBreakOnID), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_SetBreakOnID)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetBreakOnCategory:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetBreakOnCategory), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetBreakOnCategory)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetBreakOnSeverity:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetBreakOnSeverity), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetBreakOnSeverity)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetBreakOnID:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetBreakOnID), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetBreakOnID)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_SetMuteDebugOutput:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_SetMuteDebugOutput), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_SetMuteDebugOutput)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue_GetMuteDebugOutput:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue_GetMuteDebugOutput), decltype(&Dx12Consumer::Process_ID3D12InfoQueue_GetMuteDebugOutput)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue1_RegisterMessageCallback:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue1_RegisterMessageCallback), decltype(&Dx12Consumer::Process_ID3D12InfoQueue1_RegisterMessageCallback)>::value;
+        case format::ApiCallId::ApiCall_ID3D12InfoQueue1_UnregisterMessageCallback:
+            return !std::is_same<decltype(&T::Process_ID3D12InfoQueue1_UnregisterMessageCallback), decltype(&Dx12Consumer::Process_ID3D12InfoQueue1_UnregisterMessageCallback)>::value;
+        case format::ApiCallId::ApiCall_IUnknown_QueryInterface:
+            return !std::is_same<decltype(&T::Process_IUnknown_QueryInterface), decltype(&Dx12Consumer::Process_IUnknown_QueryInterface)>::value;
+        case format::ApiCallId::ApiCall_IUnknown_AddRef:
+            return !std::is_same<decltype(&T::Process_IUnknown_AddRef), decltype(&Dx12Consumer::Process_IUnknown_AddRef)>::value;
+        case format::ApiCallId::ApiCall_IUnknown_Release:
+            return !std::is_same<decltype(&T::Process_IUnknown_Release), decltype(&Dx12Consumer::Process_IUnknown_Release)>::value;
+        default:
+            return true;
+    }
+}
+
 
 GFXRECON_END_NAMESPACE(decode)
 GFXRECON_END_NAMESPACE(gfxrecon)
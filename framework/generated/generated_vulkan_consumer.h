@@ -4310,6 +4310,1268 @@ class VulkanConsumer : public VulkanConsumerBase
         uint32_t                                    stride) {}
 };
 
+// Returns true if T overrides the VulkanConsumer method that processes an API call.  API calls that do not
+// have a VulkanConsumer method are always treated as processed.
+template <typename T>
+bool VulkanConsumerOverridesApiCall(format::ApiCallId call_id)
+{
+    switch (call_id)
+    {
+        case format::ApiCallId::ApiCall_vkCreateInstance:
+            return !std::is_same<decltype(&T::Process_vkCreateInstance), decltype(&VulkanConsumer::Process_vkCreateInstance)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyInstance:
+            return !std::is_same<decltype(&T::Process_vkDestroyInstance), decltype(&VulkanConsumer::Process_vkDestroyInstance)>::value;
+        case format::ApiCallId::ApiCall_vkEnumeratePhysicalDevices:
+            return !std::is_same<decltype(&T::Process_vkEnumeratePhysicalDevices), decltype(&VulkanConsumer::Process_vkEnumeratePhysicalDevices)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceFeatures), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceFeatures)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceFormatProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceFormatProperties)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceImageFormatProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceImageFormatProperties)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceProperties)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceQueueFamilyProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceMemoryProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceMemoryProperties)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDevice:
+            return !std::is_same<decltype(&T::Process_vkCreateDevice), decltype(&VulkanConsumer::Process_vkCreateDevice)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDevice:
+            return !std::is_same<decltype(&T::Process_vkDestroyDevice), decltype(&VulkanConsumer::Process_vkDestroyDevice)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceQueue:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceQueue), decltype(&VulkanConsumer::Process_vkGetDeviceQueue)>::value;
+        case format::ApiCallId::ApiCall_vkQueueSubmit:
+            return !std::is_same<decltype(&T::Process_vkQueueSubmit), decltype(&VulkanConsumer::Process_vkQueueSubmit)>::value;
+        case format::ApiCallId::ApiCall_vkQueueWaitIdle:
+            return !std::is_same<decltype(&T::Process_vkQueueWaitIdle), decltype(&VulkanConsumer::Process_vkQueueWaitIdle)>::value;
+        case format::ApiCallId::ApiCall_vkDeviceWaitIdle:
+            return !std::is_same<decltype(&T::Process_vkDeviceWaitIdle), decltype(&VulkanConsumer::Process_vkDeviceWaitIdle)>::value;
+        case format::ApiCallId::ApiCall_vkAllocateMemory:
+            return !std::is_same<decltype(&T::Process_vkAllocateMemory), decltype(&VulkanConsumer::Process_vkAllocateMemory)>::value;
+        case format::ApiCallId::ApiCall_vkFreeMemory:
+            return !std::is_same<decltype(&T::Process_vkFreeMemory), decltype(&VulkanConsumer::Process_vkFreeMemory)>::value;
+        case format::ApiCallId::ApiCall_vkMapMemory:
+            return !std::is_same<decltype(&T::Process_vkMapMemory), decltype(&VulkanConsumer::Process_vkMapMemory)>::value;
+        case format::ApiCallId::ApiCall_vkUnmapMemory:
+            return !std::is_same<decltype(&T::Process_vkUnmapMemory), decltype(&VulkanConsumer::Process_vkUnmapMemory)>::value;
+        case format::ApiCallId::ApiCall_vkFlushMappedMemoryRanges:
+            return !std::is_same<decltype(&T::Process_vkFlushMappedMemoryRanges), decltype(&VulkanConsumer::Process_vkFlushMappedMemoryRanges)>::value;
+        case format::ApiCallId::ApiCall_vkInvalidateMappedMemoryRanges:
+            return !std::is_same<decltype(&T::Process_vkInvalidateMappedMemoryRanges), decltype(&VulkanConsumer::Process_vkInvalidateMappedMemoryRanges)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceMemoryCommitment:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceMemoryCommitment), decltype(&VulkanConsumer::Process_vkGetDeviceMemoryCommitment)>::value;
+        case format::ApiCallId::ApiCall_vkBindBufferMemory:
+            return !std::is_same<decltype(&T::Process_vkBindBufferMemory), decltype(&VulkanConsumer::Process_vkBindBufferMemory)>::value;
+        case format::ApiCallId::ApiCall_vkBindImageMemory:
+            return !std::is_same<decltype(&T::Process_vkBindImageMemory), decltype(&VulkanConsumer::Process_vkBindImageMemory)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements:
+            return !std::is_same<decltype(&T::Process_vkGetBufferMemoryRequirements), decltype(&VulkanConsumer::Process_vkGetBufferMemoryRequirements)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageMemoryRequirements:
+            return !std::is_same<decltype(&T::Process_vkGetImageMemoryRequirements), decltype(&VulkanConsumer::Process_vkGetImageMemoryRequirements)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements:
+            return !std::is_same<decltype(&T::Process_vkGetImageSparseMemoryRequirements), decltype(&VulkanConsumer::Process_vkGetImageSparseMemoryRequirements)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSparseImageFormatProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties)>::value;
+        case format::ApiCallId::ApiCall_vkQueueBindSparse:
+            return !std::is_same<decltype(&T::Process_vkQueueBindSparse), decltype(&VulkanConsumer::Process_vkQueueBindSparse)>::value;
+        case format::ApiCallId::ApiCall_vkCreateFence:
+            return !std::is_same<decltype(&T::Process_vkCreateFence), decltype(&VulkanConsumer::Process_vkCreateFence)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyFence:
+            return !std::is_same<decltype(&T::Process_vkDestroyFence), decltype(&VulkanConsumer::Process_vkDestroyFence)>::value;
+        case format::ApiCallId::ApiCall_vkResetFences:
+            return !std::is_same<decltype(&T::Process_vkResetFences), decltype(&VulkanConsumer::Process_vkResetFences)>::value;
+        case format::ApiCallId::ApiCall_vkGetFenceStatus:
+            return !std::is_same<decltype(&T::Process_vkGetFenceStatus), decltype(&VulkanConsumer::Process_vkGetFenceStatus)>::value;
+        case format::ApiCallId::ApiCall_vkWaitForFences:
+            return !std::is_same<decltype(&T::Process_vkWaitForFences), decltype(&VulkanConsumer::Process_vkWaitForFences)>::value;
+        case format::ApiCallId::ApiCall_vkCreateSemaphore:
+            return !std::is_same<decltype(&T::Process_vkCreateSemaphore), decltype(&VulkanConsumer::Process_vkCreateSemaphore)>::value;
+        case format::ApiCallId::ApiCall_vkDestroySemaphore:
+            return !std::is_same<decltype(&T::Process_vkDestroySemaphore), decltype(&VulkanConsumer::Process_vkDestroySemaphore)>::value;
+        case format::ApiCallId::ApiCall_vkCreateEvent:
+            return !std::is_same<decltype(&T::Process_vkCreateEvent), decltype(&VulkanConsumer::Process_vkCreateEvent)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyEvent:
+            return !std::is_same<decltype(&T::Process_vkDestroyEvent), decltype(&VulkanConsumer::Process_vkDestroyEvent)>::value;
+        case format::ApiCallId::ApiCall_vkGetEventStatus:
+            return !std::is_same<decltype(&T::Process_vkGetEventStatus), decltype(&VulkanConsumer::Process_vkGetEventStatus)>::value;
+        case format::ApiCallId::ApiCall_vkSetEvent:
+            return !std::is_same<decltype(&T::Process_vkSetEvent), decltype(&VulkanConsumer::Process_vkSetEvent)>::value;
+        case format::ApiCallId::ApiCall_vkResetEvent:
+            return !std::is_same<decltype(&T::Process_vkResetEvent), decltype(&VulkanConsumer::Process_vkResetEvent)>::value;
+        case format::ApiCallId::ApiCall_vkCreateQueryPool:
+            return !std::is_same<decltype(&T::Process_vkCreateQueryPool), decltype(&VulkanConsumer::Process_vkCreateQueryPool)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyQueryPool:
+            return !std::is_same<decltype(&T::Process_vkDestroyQueryPool), decltype(&VulkanConsumer::Process_vkDestroyQueryPool)>::value;
+        case format::ApiCallId::ApiCall_vkGetQueryPoolResults:
+            return !std::is_same<decltype(&T::Process_vkGetQueryPoolResults), decltype(&VulkanConsumer::Process_vkGetQueryPoolResults)>::value;
+        case format::ApiCallId::ApiCall_vkCreateBuffer:
+            return !std::is_same<decltype(&T::Process_vkCreateBuffer), decltype(&VulkanConsumer::Process_vkCreateBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyBuffer:
+            return !std::is_same<decltype(&T::Process_vkDestroyBuffer), decltype(&VulkanConsumer::Process_vkDestroyBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCreateBufferView:
+            return !std::is_same<decltype(&T::Process_vkCreateBufferView), decltype(&VulkanConsumer::Process_vkCreateBufferView)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyBufferView:
+            return !std::is_same<decltype(&T::Process_vkDestroyBufferView), decltype(&VulkanConsumer::Process_vkDestroyBufferView)>::value;
+        case format::ApiCallId::ApiCall_vkCreateImage:
+            return !std::is_same<decltype(&T::Process_vkCreateImage), decltype(&VulkanConsumer::Process_vkCreateImage)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyImage:
+            return !std::is_same<decltype(&T::Process_vkDestroyImage), decltype(&VulkanConsumer::Process_vkDestroyImage)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageSubresourceLayout:
+            return !std::is_same<decltype(&T::Process_vkGetImageSubresourceLayout), decltype(&VulkanConsumer::Process_vkGetImageSubresourceLayout)>::value;
+        case format::ApiCallId::ApiCall_vkCreateImageView:
+            return !std::is_same<decltype(&T::Process_vkCreateImageView), decltype(&VulkanConsumer::Process_vkCreateImageView)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyImageView:
+            return !std::is_same<decltype(&T::Process_vkDestroyImageView), decltype(&VulkanConsumer::Process_vkDestroyImageView)>::value;
+        case format::ApiCallId::ApiCall_vkCreateShaderModule:
+            return !std::is_same<decltype(&T::Process_vkCreateShaderModule), decltype(&VulkanConsumer::Process_vkCreateShaderModule)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyShaderModule:
+            return !std::is_same<decltype(&T::Process_vkDestroyShaderModule), decltype(&VulkanConsumer::Process_vkDestroyShaderModule)>::value;
+        case format::ApiCallId::ApiCall_vkCreatePipelineCache:
+            return !std::is_same<decltype(&T::Process_vkCreatePipelineCache), decltype(&VulkanConsumer::Process_vkCreatePipelineCache)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyPipelineCache:
+            return !std::is_same<decltype(&T::Process_vkDestroyPipelineCache), decltype(&VulkanConsumer::Process_vkDestroyPipelineCache)>::value;
+        case format::ApiCallId::ApiCall_vkGetPipelineCacheData:
+            return !std::is_same<decltype(&T::Process_vkGetPipelineCacheData), decltype(&VulkanConsumer::Process_vkGetPipelineCacheData)>::value;
+        case format::ApiCallId::ApiCall_vkMergePipelineCaches:
+            return !std::is_same<decltype(&T::Process_vkMergePipelineCaches), decltype(&VulkanConsumer::Process_vkMergePipelineCaches)>::value;
+        case format::ApiCallId::ApiCall_vkCreateGraphicsPipelines:
+            return !std::is_same<decltype(&T::Process_vkCreateGraphicsPipelines), decltype(&VulkanConsumer::Process_vkCreateGraphicsPipelines)>::value;
+        case format::ApiCallId::ApiCall_vkCreateComputePipelines:
+            return !std::is_same<decltype(&T::Process_vkCreateComputePipelines), decltype(&VulkanConsumer::Process_vkCreateComputePipelines)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyPipeline:
+            return !std::is_same<decltype(&T::Process_vkDestroyPipeline), decltype(&VulkanConsumer::Process_vkDestroyPipeline)>::value;
+        case format::ApiCallId::ApiCall_vkCreatePipelineLayout:
+            return !std::is_same<decltype(&T::Process_vkCreatePipelineLayout), decltype(&VulkanConsumer::Process_vkCreatePipelineLayout)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyPipelineLayout:
+            return !std::is_same<decltype(&T::Process_vkDestroyPipelineLayout), decltype(&VulkanConsumer::Process_vkDestroyPipelineLayout)>::value;
+        case format::ApiCallId::ApiCall_vkCreateSampler:
+            return !std::is_same<decltype(&T::Process_vkCreateSampler), decltype(&VulkanConsumer::Process_vkCreateSampler)>::value;
+        case format::ApiCallId::ApiCall_vkDestroySampler:
+            return !std::is_same<decltype(&T::Process_vkDestroySampler), decltype(&VulkanConsumer::Process_vkDestroySampler)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDescriptorSetLayout:
+            return !std::is_same<decltype(&T::Process_vkCreateDescriptorSetLayout), decltype(&VulkanConsumer::Process_vkCreateDescriptorSetLayout)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDescriptorSetLayout:
+            return !std::is_same<decltype(&T::Process_vkDestroyDescriptorSetLayout), decltype(&VulkanConsumer::Process_vkDestroyDescriptorSetLayout)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDescriptorPool:
+            return !std::is_same<decltype(&T::Process_vkCreateDescriptorPool), decltype(&VulkanConsumer::Process_vkCreateDescriptorPool)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDescriptorPool:
+            return !std::is_same<decltype(&T::Process_vkDestroyDescriptorPool), decltype(&VulkanConsumer::Process_vkDestroyDescriptorPool)>::value;
+        case format::ApiCallId::ApiCall_vkResetDescriptorPool:
+            return !std::is_same<decltype(&T::Process_vkResetDescriptorPool), decltype(&VulkanConsumer::Process_vkResetDescriptorPool)>::value;
+        case format::ApiCallId::ApiCall_vkAllocateDescriptorSets:
+            return !std::is_same<decltype(&T::Process_vkAllocateDescriptorSets), decltype(&VulkanConsumer::Process_vkAllocateDescriptorSets)>::value;
+        case format::ApiCallId::ApiCall_vkFreeDescriptorSets:
+            return !std::is_same<decltype(&T::Process_vkFreeDescriptorSets), decltype(&VulkanConsumer::Process_vkFreeDescriptorSets)>::value;
+        case format::ApiCallId::ApiCall_vkUpdateDescriptorSets:
+            return !std::is_same<decltype(&T::Process_vkUpdateDescriptorSets), decltype(&VulkanConsumer::Process_vkUpdateDescriptorSets)>::value;
+        case format::ApiCallId::ApiCall_vkCreateFramebuffer:
+            return !std::is_same<decltype(&T::Process_vkCreateFramebuffer), decltype(&VulkanConsumer::Process_vkCreateFramebuffer)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyFramebuffer:
+            return !std::is_same<decltype(&T::Process_vkDestroyFramebuffer), decltype(&VulkanConsumer::Process_vkDestroyFramebuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCreateRenderPass:
+            return !std::is_same<decltype(&T::Process_vkCreateRenderPass), decltype(&VulkanConsumer::Process_vkCreateRenderPass)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyRenderPass:
+            return !std::is_same<decltype(&T::Process_vkDestroyRenderPass), decltype(&VulkanConsumer::Process_vkDestroyRenderPass)>::value;
+        case format::ApiCallId::ApiCall_vkGetRenderAreaGranularity:
+            return !std::is_same<decltype(&T::Process_vkGetRenderAreaGranularity), decltype(&VulkanConsumer::Process_vkGetRenderAreaGranularity)>::value;
+        case format::ApiCallId::ApiCall_vkCreateCommandPool:
+            return !std::is_same<decltype(&T::Process_vkCreateCommandPool), decltype(&VulkanConsumer::Process_vkCreateCommandPool)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyCommandPool:
+            return !std::is_same<decltype(&T::Process_vkDestroyCommandPool), decltype(&VulkanConsumer::Process_vkDestroyCommandPool)>::value;
+        case format::ApiCallId::ApiCall_vkResetCommandPool:
+            return !std::is_same<decltype(&T::Process_vkResetCommandPool), decltype(&VulkanConsumer::Process_vkResetCommandPool)>::value;
+        case format::ApiCallId::ApiCall_vkAllocateCommandBuffers:
+            return !std::is_same<decltype(&T::Process_vkAllocateCommandBuffers), decltype(&VulkanConsumer::Process_vkAllocateCommandBuffers)>::value;
+        case format::ApiCallId::ApiCall_vkFreeCommandBuffers:
+            return !std::is_same<decltype(&T::Process_vkFreeCommandBuffers), decltype(&VulkanConsumer::Process_vkFreeCommandBuffers)>::value;
+        case format::ApiCallId::ApiCall_vkBeginCommandBuffer:
+            return !std::is_same<decltype(&T::Process_vkBeginCommandBuffer), decltype(&VulkanConsumer::Process_vkBeginCommandBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkEndCommandBuffer:
+            return !std::is_same<decltype(&T::Process_vkEndCommandBuffer), decltype(&VulkanConsumer::Process_vkEndCommandBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkResetCommandBuffer:
+            return !std::is_same<decltype(&T::Process_vkResetCommandBuffer), decltype(&VulkanConsumer::Process_vkResetCommandBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindPipeline:
+            return !std::is_same<decltype(&T::Process_vkCmdBindPipeline), decltype(&VulkanConsumer::Process_vkCmdBindPipeline)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetViewport:
+            return !std::is_same<decltype(&T::Process_vkCmdSetViewport), decltype(&VulkanConsumer::Process_vkCmdSetViewport)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetScissor:
+            return !std::is_same<decltype(&T::Process_vkCmdSetScissor), decltype(&VulkanConsumer::Process_vkCmdSetScissor)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetLineWidth:
+            return !std::is_same<decltype(&T::Process_vkCmdSetLineWidth), decltype(&VulkanConsumer::Process_vkCmdSetLineWidth)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthBias:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthBias), decltype(&VulkanConsumer::Process_vkCmdSetDepthBias)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetBlendConstants:
+            return !std::is_same<decltype(&T::Process_vkCmdSetBlendConstants), decltype(&VulkanConsumer::Process_vkCmdSetBlendConstants)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthBounds:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthBounds), decltype(&VulkanConsumer::Process_vkCmdSetDepthBounds)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetStencilCompareMask:
+            return !std::is_same<decltype(&T::Process_vkCmdSetStencilCompareMask), decltype(&VulkanConsumer::Process_vkCmdSetStencilCompareMask)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetStencilWriteMask:
+            return !std::is_same<decltype(&T::Process_vkCmdSetStencilWriteMask), decltype(&VulkanConsumer::Process_vkCmdSetStencilWriteMask)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetStencilReference:
+            return !std::is_same<decltype(&T::Process_vkCmdSetStencilReference), decltype(&VulkanConsumer::Process_vkCmdSetStencilReference)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindDescriptorSets:
+            return !std::is_same<decltype(&T::Process_vkCmdBindDescriptorSets), decltype(&VulkanConsumer::Process_vkCmdBindDescriptorSets)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindIndexBuffer:
+            return !std::is_same<decltype(&T::Process_vkCmdBindIndexBuffer), decltype(&VulkanConsumer::Process_vkCmdBindIndexBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers:
+            return !std::is_same<decltype(&T::Process_vkCmdBindVertexBuffers), decltype(&VulkanConsumer::Process_vkCmdBindVertexBuffers)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDraw:
+            return !std::is_same<decltype(&T::Process_vkCmdDraw), decltype(&VulkanConsumer::Process_vkCmdDraw)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexed:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndexed), decltype(&VulkanConsumer::Process_vkCmdDrawIndexed)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirect:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndirect), decltype(&VulkanConsumer::Process_vkCmdDrawIndirect)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirect:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndexedIndirect), decltype(&VulkanConsumer::Process_vkCmdDrawIndexedIndirect)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDispatch:
+            return !std::is_same<decltype(&T::Process_vkCmdDispatch), decltype(&VulkanConsumer::Process_vkCmdDispatch)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDispatchIndirect:
+            return !std::is_same<decltype(&T::Process_vkCmdDispatchIndirect), decltype(&VulkanConsumer::Process_vkCmdDispatchIndirect)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyBuffer:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyBuffer), decltype(&VulkanConsumer::Process_vkCmdCopyBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyImage:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyImage), decltype(&VulkanConsumer::Process_vkCmdCopyImage)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBlitImage:
+            return !std::is_same<decltype(&T::Process_vkCmdBlitImage), decltype(&VulkanConsumer::Process_vkCmdBlitImage)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyBufferToImage), decltype(&VulkanConsumer::Process_vkCmdCopyBufferToImage)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyImageToBuffer), decltype(&VulkanConsumer::Process_vkCmdCopyImageToBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCmdUpdateBuffer:
+            return !std::is_same<decltype(&T::Process_vkCmdUpdateBuffer), decltype(&VulkanConsumer::Process_vkCmdUpdateBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCmdFillBuffer:
+            return !std::is_same<decltype(&T::Process_vkCmdFillBuffer), decltype(&VulkanConsumer::Process_vkCmdFillBuffer)>::value;
+        case format::ApiCallId::ApiCall_vkCmdClearColorImage:
+            return !std::is_same<decltype(&T::Process_vkCmdClearColorImage), decltype(&VulkanConsumer::Process_vkCmdClearColorImage)>::value;
+        case format::ApiCallId::ApiCall_vkCmdClearDepthStencilImage:
+            return !std::is_same<decltype(&T::Process_vkCmdClearDepthStencilImage), decltype(&VulkanConsumer::Process_vkCmdClearDepthStencilImage)>::value;
+        case format::ApiCallId::ApiCall_vkCmdClearAttachments:
+            return !std::is_same<decltype(&T::Process_vkCmdClearAttachments), decltype(&VulkanConsumer::Process_vkCmdClearAttachments)>::value;
+        case format::ApiCallId::ApiCall_vkCmdResolveImage:
+            return !std::is_same<decltype(&T::Process_vkCmdResolveImage), decltype(&VulkanConsumer::Process_vkCmdResolveImage)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetEvent:
+            return !std::is_same<decltype(&T::Process_vkCmdSetEvent), decltype(&VulkanConsumer::Process_vkCmdSetEvent)>::value;
+        case format::ApiCallId::ApiCall_vkCmdResetEvent:
+            return !std::is_same<decltype(&T::Process_vkCmdResetEvent), decltype(&VulkanConsumer::Process_vkCmdResetEvent)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWaitEvents:
+            return !std::is_same<decltype(&T::Process_vkCmdWaitEvents), decltype(&VulkanConsumer::Process_vkCmdWaitEvents)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPipelineBarrier:
+            return !std::is_same<decltype(&T::Process_vkCmdPipelineBarrier), decltype(&VulkanConsumer::Process_vkCmdPipelineBarrier)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginQuery:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginQuery), decltype(&VulkanConsumer::Process_vkCmdBeginQuery)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndQuery:
+            return !std::is_same<decltype(&T::Process_vkCmdEndQuery), decltype(&VulkanConsumer::Process_vkCmdEndQuery)>::value;
+        case format::ApiCallId::ApiCall_vkCmdResetQueryPool:
+            return !std::is_same<decltype(&T::Process_vkCmdResetQueryPool), decltype(&VulkanConsumer::Process_vkCmdResetQueryPool)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteTimestamp:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteTimestamp), decltype(&VulkanConsumer::Process_vkCmdWriteTimestamp)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyQueryPoolResults:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyQueryPoolResults), decltype(&VulkanConsumer::Process_vkCmdCopyQueryPoolResults)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPushConstants:
+            return !std::is_same<decltype(&T::Process_vkCmdPushConstants), decltype(&VulkanConsumer::Process_vkCmdPushConstants)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderPass:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginRenderPass), decltype(&VulkanConsumer::Process_vkCmdBeginRenderPass)>::value;
+        case format::ApiCallId::ApiCall_vkCmdNextSubpass:
+            return !std::is_same<decltype(&T::Process_vkCmdNextSubpass), decltype(&VulkanConsumer::Process_vkCmdNextSubpass)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndRenderPass:
+            return !std::is_same<decltype(&T::Process_vkCmdEndRenderPass), decltype(&VulkanConsumer::Process_vkCmdEndRenderPass)>::value;
+        case format::ApiCallId::ApiCall_vkCmdExecuteCommands:
+            return !std::is_same<decltype(&T::Process_vkCmdExecuteCommands), decltype(&VulkanConsumer::Process_vkCmdExecuteCommands)>::value;
+        case format::ApiCallId::ApiCall_vkBindBufferMemory2:
+            return !std::is_same<decltype(&T::Process_vkBindBufferMemory2), decltype(&VulkanConsumer::Process_vkBindBufferMemory2)>::value;
+        case format::ApiCallId::ApiCall_vkBindImageMemory2:
+            return !std::is_same<decltype(&T::Process_vkBindImageMemory2), decltype(&VulkanConsumer::Process_vkBindImageMemory2)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeatures:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceGroupPeerMemoryFeatures), decltype(&VulkanConsumer::Process_vkGetDeviceGroupPeerMemoryFeatures)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDeviceMask:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDeviceMask), decltype(&VulkanConsumer::Process_vkCmdSetDeviceMask)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDispatchBase:
+            return !std::is_same<decltype(&T::Process_vkCmdDispatchBase), decltype(&VulkanConsumer::Process_vkCmdDispatchBase)>::value;
+        case format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroups:
+            return !std::is_same<decltype(&T::Process_vkEnumeratePhysicalDeviceGroups), decltype(&VulkanConsumer::Process_vkEnumeratePhysicalDeviceGroups)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2:
+            return !std::is_same<decltype(&T::Process_vkGetImageMemoryRequirements2), decltype(&VulkanConsumer::Process_vkGetImageMemoryRequirements2)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2:
+            return !std::is_same<decltype(&T::Process_vkGetBufferMemoryRequirements2), decltype(&VulkanConsumer::Process_vkGetBufferMemoryRequirements2)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2:
+            return !std::is_same<decltype(&T::Process_vkGetImageSparseMemoryRequirements2), decltype(&VulkanConsumer::Process_vkGetImageSparseMemoryRequirements2)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceFeatures2), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceFeatures2)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceProperties2), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceProperties2)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceFormatProperties2), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceFormatProperties2)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceImageFormatProperties2), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceImageFormatProperties2)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceQueueFamilyProperties2), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties2)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceMemoryProperties2), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceMemoryProperties2)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSparseImageFormatProperties2), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties2)>::value;
+        case format::ApiCallId::ApiCall_vkTrimCommandPool:
+            return !std::is_same<decltype(&T::Process_vkTrimCommandPool), decltype(&VulkanConsumer::Process_vkTrimCommandPool)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceQueue2:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceQueue2), decltype(&VulkanConsumer::Process_vkGetDeviceQueue2)>::value;
+        case format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversion:
+            return !std::is_same<decltype(&T::Process_vkCreateSamplerYcbcrConversion), decltype(&VulkanConsumer::Process_vkCreateSamplerYcbcrConversion)>::value;
+        case format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversion:
+            return !std::is_same<decltype(&T::Process_vkDestroySamplerYcbcrConversion), decltype(&VulkanConsumer::Process_vkDestroySamplerYcbcrConversion)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplate:
+            return !std::is_same<decltype(&T::Process_vkCreateDescriptorUpdateTemplate), decltype(&VulkanConsumer::Process_vkCreateDescriptorUpdateTemplate)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplate:
+            return !std::is_same<decltype(&T::Process_vkDestroyDescriptorUpdateTemplate), decltype(&VulkanConsumer::Process_vkDestroyDescriptorUpdateTemplate)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceExternalBufferProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceExternalBufferProperties)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFenceProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceExternalFenceProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceExternalFenceProperties)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphoreProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceExternalSemaphoreProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceExternalSemaphoreProperties)>::value;
+        case format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupport:
+            return !std::is_same<decltype(&T::Process_vkGetDescriptorSetLayoutSupport), decltype(&VulkanConsumer::Process_vkGetDescriptorSetLayoutSupport)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectCount:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndirectCount), decltype(&VulkanConsumer::Process_vkCmdDrawIndirectCount)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCount:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndexedIndirectCount), decltype(&VulkanConsumer::Process_vkCmdDrawIndexedIndirectCount)>::value;
+        case format::ApiCallId::ApiCall_vkCreateRenderPass2:
+            return !std::is_same<decltype(&T::Process_vkCreateRenderPass2), decltype(&VulkanConsumer::Process_vkCreateRenderPass2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderPass2:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginRenderPass2), decltype(&VulkanConsumer::Process_vkCmdBeginRenderPass2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdNextSubpass2:
+            return !std::is_same<decltype(&T::Process_vkCmdNextSubpass2), decltype(&VulkanConsumer::Process_vkCmdNextSubpass2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndRenderPass2:
+            return !std::is_same<decltype(&T::Process_vkCmdEndRenderPass2), decltype(&VulkanConsumer::Process_vkCmdEndRenderPass2)>::value;
+        case format::ApiCallId::ApiCall_vkResetQueryPool:
+            return !std::is_same<decltype(&T::Process_vkResetQueryPool), decltype(&VulkanConsumer::Process_vkResetQueryPool)>::value;
+        case format::ApiCallId::ApiCall_vkGetSemaphoreCounterValue:
+            return !std::is_same<decltype(&T::Process_vkGetSemaphoreCounterValue), decltype(&VulkanConsumer::Process_vkGetSemaphoreCounterValue)>::value;
+        case format::ApiCallId::ApiCall_vkWaitSemaphores:
+            return !std::is_same<decltype(&T::Process_vkWaitSemaphores), decltype(&VulkanConsumer::Process_vkWaitSemaphores)>::value;
+        case format::ApiCallId::ApiCall_vkSignalSemaphore:
+            return !std::is_same<decltype(&T::Process_vkSignalSemaphore), decltype(&VulkanConsumer::Process_vkSignalSemaphore)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferDeviceAddress:
+            return !std::is_same<decltype(&T::Process_vkGetBufferDeviceAddress), decltype(&VulkanConsumer::Process_vkGetBufferDeviceAddress)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddress:
+            return !std::is_same<decltype(&T::Process_vkGetBufferOpaqueCaptureAddress), decltype(&VulkanConsumer::Process_vkGetBufferOpaqueCaptureAddress)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddress:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceMemoryOpaqueCaptureAddress), decltype(&VulkanConsumer::Process_vkGetDeviceMemoryOpaqueCaptureAddress)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceToolProperties:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceToolProperties), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceToolProperties)>::value;
+        case format::ApiCallId::ApiCall_vkCreatePrivateDataSlot:
+            return !std::is_same<decltype(&T::Process_vkCreatePrivateDataSlot), decltype(&VulkanConsumer::Process_vkCreatePrivateDataSlot)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyPrivateDataSlot:
+            return !std::is_same<decltype(&T::Process_vkDestroyPrivateDataSlot), decltype(&VulkanConsumer::Process_vkDestroyPrivateDataSlot)>::value;
+        case format::ApiCallId::ApiCall_vkSetPrivateData:
+            return !std::is_same<decltype(&T::Process_vkSetPrivateData), decltype(&VulkanConsumer::Process_vkSetPrivateData)>::value;
+        case format::ApiCallId::ApiCall_vkGetPrivateData:
+            return !std::is_same<decltype(&T::Process_vkGetPrivateData), decltype(&VulkanConsumer::Process_vkGetPrivateData)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetEvent2:
+            return !std::is_same<decltype(&T::Process_vkCmdSetEvent2), decltype(&VulkanConsumer::Process_vkCmdSetEvent2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdResetEvent2:
+            return !std::is_same<decltype(&T::Process_vkCmdResetEvent2), decltype(&VulkanConsumer::Process_vkCmdResetEvent2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWaitEvents2:
+            return !std::is_same<decltype(&T::Process_vkCmdWaitEvents2), decltype(&VulkanConsumer::Process_vkCmdWaitEvents2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPipelineBarrier2:
+            return !std::is_same<decltype(&T::Process_vkCmdPipelineBarrier2), decltype(&VulkanConsumer::Process_vkCmdPipelineBarrier2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteTimestamp2:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteTimestamp2), decltype(&VulkanConsumer::Process_vkCmdWriteTimestamp2)>::value;
+        case format::ApiCallId::ApiCall_vkQueueSubmit2:
+            return !std::is_same<decltype(&T::Process_vkQueueSubmit2), decltype(&VulkanConsumer::Process_vkQueueSubmit2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyBuffer2:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyBuffer2), decltype(&VulkanConsumer::Process_vkCmdCopyBuffer2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyImage2:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyImage2), decltype(&VulkanConsumer::Process_vkCmdCopyImage2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyBufferToImage2), decltype(&VulkanConsumer::Process_vkCmdCopyBufferToImage2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyImageToBuffer2), decltype(&VulkanConsumer::Process_vkCmdCopyImageToBuffer2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBlitImage2:
+            return !std::is_same<decltype(&T::Process_vkCmdBlitImage2), decltype(&VulkanConsumer::Process_vkCmdBlitImage2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdResolveImage2:
+            return !std::is_same<decltype(&T::Process_vkCmdResolveImage2), decltype(&VulkanConsumer::Process_vkCmdResolveImage2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginRendering:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginRendering), decltype(&VulkanConsumer::Process_vkCmdBeginRendering)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndRendering:
+            return !std::is_same<decltype(&T::Process_vkCmdEndRendering), decltype(&VulkanConsumer::Process_vkCmdEndRendering)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCullMode:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCullMode), decltype(&VulkanConsumer::Process_vkCmdSetCullMode)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetFrontFace:
+            return !std::is_same<decltype(&T::Process_vkCmdSetFrontFace), decltype(&VulkanConsumer::Process_vkCmdSetFrontFace)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPrimitiveTopology:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPrimitiveTopology), decltype(&VulkanConsumer::Process_vkCmdSetPrimitiveTopology)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetViewportWithCount:
+            return !std::is_same<decltype(&T::Process_vkCmdSetViewportWithCount), decltype(&VulkanConsumer::Process_vkCmdSetViewportWithCount)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetScissorWithCount:
+            return !std::is_same<decltype(&T::Process_vkCmdSetScissorWithCount), decltype(&VulkanConsumer::Process_vkCmdSetScissorWithCount)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2:
+            return !std::is_same<decltype(&T::Process_vkCmdBindVertexBuffers2), decltype(&VulkanConsumer::Process_vkCmdBindVertexBuffers2)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthTestEnable:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthTestEnable), decltype(&VulkanConsumer::Process_vkCmdSetDepthTestEnable)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthWriteEnable:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthWriteEnable), decltype(&VulkanConsumer::Process_vkCmdSetDepthWriteEnable)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthCompareOp:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthCompareOp), decltype(&VulkanConsumer::Process_vkCmdSetDepthCompareOp)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthBoundsTestEnable:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthBoundsTestEnable), decltype(&VulkanConsumer::Process_vkCmdSetDepthBoundsTestEnable)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetStencilTestEnable:
+            return !std::is_same<decltype(&T::Process_vkCmdSetStencilTestEnable), decltype(&VulkanConsumer::Process_vkCmdSetStencilTestEnable)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetStencilOp:
+            return !std::is_same<decltype(&T::Process_vkCmdSetStencilOp), decltype(&VulkanConsumer::Process_vkCmdSetStencilOp)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRasterizerDiscardEnable:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRasterizerDiscardEnable), decltype(&VulkanConsumer::Process_vkCmdSetRasterizerDiscardEnable)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthBiasEnable:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthBiasEnable), decltype(&VulkanConsumer::Process_vkCmdSetDepthBiasEnable)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPrimitiveRestartEnable:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPrimitiveRestartEnable), decltype(&VulkanConsumer::Process_vkCmdSetPrimitiveRestartEnable)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceBufferMemoryRequirements:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceBufferMemoryRequirements), decltype(&VulkanConsumer::Process_vkGetDeviceBufferMemoryRequirements)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceImageMemoryRequirements:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceImageMemoryRequirements), decltype(&VulkanConsumer::Process_vkGetDeviceImageMemoryRequirements)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceImageSparseMemoryRequirements:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceImageSparseMemoryRequirements), decltype(&VulkanConsumer::Process_vkGetDeviceImageSparseMemoryRequirements)>::value;
+        case format::ApiCallId::ApiCall_vkDestroySurfaceKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroySurfaceKHR), decltype(&VulkanConsumer::Process_vkDestroySurfaceKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceSupportKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfaceSupportKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfaceSupportKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilitiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfaceCapabilitiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilitiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormatsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfaceFormatsKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfaceFormatsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfacePresentModesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfacePresentModesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateSwapchainKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateSwapchainKHR), decltype(&VulkanConsumer::Process_vkCreateSwapchainKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDestroySwapchainKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroySwapchainKHR), decltype(&VulkanConsumer::Process_vkDestroySwapchainKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetSwapchainImagesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetSwapchainImagesKHR), decltype(&VulkanConsumer::Process_vkGetSwapchainImagesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkAcquireNextImageKHR:
+            return !std::is_same<decltype(&T::Process_vkAcquireNextImageKHR), decltype(&VulkanConsumer::Process_vkAcquireNextImageKHR)>::value;
+        case format::ApiCallId::ApiCall_vkQueuePresentKHR:
+            return !std::is_same<decltype(&T::Process_vkQueuePresentKHR), decltype(&VulkanConsumer::Process_vkQueuePresentKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceGroupPresentCapabilitiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceGroupPresentCapabilitiesKHR), decltype(&VulkanConsumer::Process_vkGetDeviceGroupPresentCapabilitiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceGroupSurfacePresentModesKHR), decltype(&VulkanConsumer::Process_vkGetDeviceGroupSurfacePresentModesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDevicePresentRectanglesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDevicePresentRectanglesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDevicePresentRectanglesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkAcquireNextImage2KHR:
+            return !std::is_same<decltype(&T::Process_vkAcquireNextImage2KHR), decltype(&VulkanConsumer::Process_vkAcquireNextImage2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceDisplayPropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceDisplayPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlanePropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceDisplayPlanePropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceDisplayPlanePropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDisplayPlaneSupportedDisplaysKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDisplayPlaneSupportedDisplaysKHR), decltype(&VulkanConsumer::Process_vkGetDisplayPlaneSupportedDisplaysKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDisplayModePropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDisplayModePropertiesKHR), decltype(&VulkanConsumer::Process_vkGetDisplayModePropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDisplayModeKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateDisplayModeKHR), decltype(&VulkanConsumer::Process_vkCreateDisplayModeKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilitiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDisplayPlaneCapabilitiesKHR), decltype(&VulkanConsumer::Process_vkGetDisplayPlaneCapabilitiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDisplayPlaneSurfaceKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateDisplayPlaneSurfaceKHR), decltype(&VulkanConsumer::Process_vkCreateDisplayPlaneSurfaceKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateSharedSwapchainsKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateSharedSwapchainsKHR), decltype(&VulkanConsumer::Process_vkCreateSharedSwapchainsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateXlibSurfaceKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateXlibSurfaceKHR), decltype(&VulkanConsumer::Process_vkCreateXlibSurfaceKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceXlibPresentationSupportKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceXlibPresentationSupportKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceXlibPresentationSupportKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateXcbSurfaceKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateXcbSurfaceKHR), decltype(&VulkanConsumer::Process_vkCreateXcbSurfaceKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceXcbPresentationSupportKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceXcbPresentationSupportKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceXcbPresentationSupportKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateWaylandSurfaceKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateWaylandSurfaceKHR), decltype(&VulkanConsumer::Process_vkCreateWaylandSurfaceKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceWaylandPresentationSupportKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceWaylandPresentationSupportKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceWaylandPresentationSupportKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateAndroidSurfaceKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateAndroidSurfaceKHR), decltype(&VulkanConsumer::Process_vkCreateAndroidSurfaceKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateWin32SurfaceKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateWin32SurfaceKHR), decltype(&VulkanConsumer::Process_vkCreateWin32SurfaceKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceWin32PresentationSupportKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceWin32PresentationSupportKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceWin32PresentationSupportKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceVideoCapabilitiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceVideoCapabilitiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceVideoCapabilitiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceVideoFormatPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceVideoFormatPropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceVideoFormatPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateVideoSessionKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateVideoSessionKHR), decltype(&VulkanConsumer::Process_vkCreateVideoSessionKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyVideoSessionKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroyVideoSessionKHR), decltype(&VulkanConsumer::Process_vkDestroyVideoSessionKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetVideoSessionMemoryRequirementsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetVideoSessionMemoryRequirementsKHR), decltype(&VulkanConsumer::Process_vkGetVideoSessionMemoryRequirementsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkBindVideoSessionMemoryKHR:
+            return !std::is_same<decltype(&T::Process_vkBindVideoSessionMemoryKHR), decltype(&VulkanConsumer::Process_vkBindVideoSessionMemoryKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateVideoSessionParametersKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateVideoSessionParametersKHR), decltype(&VulkanConsumer::Process_vkCreateVideoSessionParametersKHR)>::value;
+        case format::ApiCallId::ApiCall_vkUpdateVideoSessionParametersKHR:
+            return !std::is_same<decltype(&T::Process_vkUpdateVideoSessionParametersKHR), decltype(&VulkanConsumer::Process_vkUpdateVideoSessionParametersKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyVideoSessionParametersKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroyVideoSessionParametersKHR), decltype(&VulkanConsumer::Process_vkDestroyVideoSessionParametersKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginVideoCodingKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginVideoCodingKHR), decltype(&VulkanConsumer::Process_vkCmdBeginVideoCodingKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndVideoCodingKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdEndVideoCodingKHR), decltype(&VulkanConsumer::Process_vkCmdEndVideoCodingKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdControlVideoCodingKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdControlVideoCodingKHR), decltype(&VulkanConsumer::Process_vkCmdControlVideoCodingKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDecodeVideoKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdDecodeVideoKHR), decltype(&VulkanConsumer::Process_vkCmdDecodeVideoKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderingKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginRenderingKHR), decltype(&VulkanConsumer::Process_vkCmdBeginRenderingKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndRenderingKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdEndRenderingKHR), decltype(&VulkanConsumer::Process_vkCmdEndRenderingKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceFeatures2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceFeatures2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceFormatProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceFormatProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceImageFormatProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceImageFormatProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceQueueFamilyProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceMemoryProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceMemoryProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSparseImageFormatProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeaturesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceGroupPeerMemoryFeaturesKHR), decltype(&VulkanConsumer::Process_vkGetDeviceGroupPeerMemoryFeaturesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDeviceMaskKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDeviceMaskKHR), decltype(&VulkanConsumer::Process_vkCmdSetDeviceMaskKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDispatchBaseKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdDispatchBaseKHR), decltype(&VulkanConsumer::Process_vkCmdDispatchBaseKHR)>::value;
+        case format::ApiCallId::ApiCall_vkTrimCommandPoolKHR:
+            return !std::is_same<decltype(&T::Process_vkTrimCommandPoolKHR), decltype(&VulkanConsumer::Process_vkTrimCommandPoolKHR)>::value;
+        case format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroupsKHR:
+            return !std::is_same<decltype(&T::Process_vkEnumeratePhysicalDeviceGroupsKHR), decltype(&VulkanConsumer::Process_vkEnumeratePhysicalDeviceGroupsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceExternalBufferPropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceExternalBufferPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryWin32HandleKHR:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryWin32HandleKHR), decltype(&VulkanConsumer::Process_vkGetMemoryWin32HandleKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryWin32HandlePropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryWin32HandlePropertiesKHR), decltype(&VulkanConsumer::Process_vkGetMemoryWin32HandlePropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryFdKHR:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryFdKHR), decltype(&VulkanConsumer::Process_vkGetMemoryFdKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryFdPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryFdPropertiesKHR), decltype(&VulkanConsumer::Process_vkGetMemoryFdPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkImportSemaphoreWin32HandleKHR:
+            return !std::is_same<decltype(&T::Process_vkImportSemaphoreWin32HandleKHR), decltype(&VulkanConsumer::Process_vkImportSemaphoreWin32HandleKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetSemaphoreWin32HandleKHR:
+            return !std::is_same<decltype(&T::Process_vkGetSemaphoreWin32HandleKHR), decltype(&VulkanConsumer::Process_vkGetSemaphoreWin32HandleKHR)>::value;
+        case format::ApiCallId::ApiCall_vkImportSemaphoreFdKHR:
+            return !std::is_same<decltype(&T::Process_vkImportSemaphoreFdKHR), decltype(&VulkanConsumer::Process_vkImportSemaphoreFdKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetSemaphoreFdKHR:
+            return !std::is_same<decltype(&T::Process_vkGetSemaphoreFdKHR), decltype(&VulkanConsumer::Process_vkGetSemaphoreFdKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPushDescriptorSetKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdPushDescriptorSetKHR), decltype(&VulkanConsumer::Process_vkCmdPushDescriptorSetKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplateKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateDescriptorUpdateTemplateKHR), decltype(&VulkanConsumer::Process_vkCreateDescriptorUpdateTemplateKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplateKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroyDescriptorUpdateTemplateKHR), decltype(&VulkanConsumer::Process_vkDestroyDescriptorUpdateTemplateKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateRenderPass2KHR:
+            return !std::is_same<decltype(&T::Process_vkCreateRenderPass2KHR), decltype(&VulkanConsumer::Process_vkCreateRenderPass2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginRenderPass2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginRenderPass2KHR), decltype(&VulkanConsumer::Process_vkCmdBeginRenderPass2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdNextSubpass2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdNextSubpass2KHR), decltype(&VulkanConsumer::Process_vkCmdNextSubpass2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndRenderPass2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdEndRenderPass2KHR), decltype(&VulkanConsumer::Process_vkCmdEndRenderPass2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetSwapchainStatusKHR:
+            return !std::is_same<decltype(&T::Process_vkGetSwapchainStatusKHR), decltype(&VulkanConsumer::Process_vkGetSwapchainStatusKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFencePropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceExternalFencePropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceExternalFencePropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkImportFenceWin32HandleKHR:
+            return !std::is_same<decltype(&T::Process_vkImportFenceWin32HandleKHR), decltype(&VulkanConsumer::Process_vkImportFenceWin32HandleKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetFenceWin32HandleKHR:
+            return !std::is_same<decltype(&T::Process_vkGetFenceWin32HandleKHR), decltype(&VulkanConsumer::Process_vkGetFenceWin32HandleKHR)>::value;
+        case format::ApiCallId::ApiCall_vkImportFenceFdKHR:
+            return !std::is_same<decltype(&T::Process_vkImportFenceFdKHR), decltype(&VulkanConsumer::Process_vkImportFenceFdKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetFenceFdKHR:
+            return !std::is_same<decltype(&T::Process_vkGetFenceFdKHR), decltype(&VulkanConsumer::Process_vkGetFenceFdKHR)>::value;
+        case format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR:
+            return !std::is_same<decltype(&T::Process_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR), decltype(&VulkanConsumer::Process_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkAcquireProfilingLockKHR:
+            return !std::is_same<decltype(&T::Process_vkAcquireProfilingLockKHR), decltype(&VulkanConsumer::Process_vkAcquireProfilingLockKHR)>::value;
+        case format::ApiCallId::ApiCall_vkReleaseProfilingLockKHR:
+            return !std::is_same<decltype(&T::Process_vkReleaseProfilingLockKHR), decltype(&VulkanConsumer::Process_vkReleaseProfilingLockKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfaceCapabilities2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilities2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormats2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfaceFormats2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfaceFormats2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceDisplayProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceDisplayProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlaneProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceDisplayPlaneProperties2KHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceDisplayPlaneProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDisplayModeProperties2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetDisplayModeProperties2KHR), decltype(&VulkanConsumer::Process_vkGetDisplayModeProperties2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilities2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetDisplayPlaneCapabilities2KHR), decltype(&VulkanConsumer::Process_vkGetDisplayPlaneCapabilities2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetImageMemoryRequirements2KHR), decltype(&VulkanConsumer::Process_vkGetImageMemoryRequirements2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetBufferMemoryRequirements2KHR), decltype(&VulkanConsumer::Process_vkGetBufferMemoryRequirements2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetImageSparseMemoryRequirements2KHR), decltype(&VulkanConsumer::Process_vkGetImageSparseMemoryRequirements2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversionKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateSamplerYcbcrConversionKHR), decltype(&VulkanConsumer::Process_vkCreateSamplerYcbcrConversionKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversionKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroySamplerYcbcrConversionKHR), decltype(&VulkanConsumer::Process_vkDestroySamplerYcbcrConversionKHR)>::value;
+        case format::ApiCallId::ApiCall_vkBindBufferMemory2KHR:
+            return !std::is_same<decltype(&T::Process_vkBindBufferMemory2KHR), decltype(&VulkanConsumer::Process_vkBindBufferMemory2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkBindImageMemory2KHR:
+            return !std::is_same<decltype(&T::Process_vkBindImageMemory2KHR), decltype(&VulkanConsumer::Process_vkBindImageMemory2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupportKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDescriptorSetLayoutSupportKHR), decltype(&VulkanConsumer::Process_vkGetDescriptorSetLayoutSupportKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectCountKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndirectCountKHR), decltype(&VulkanConsumer::Process_vkCmdDrawIndirectCountKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndexedIndirectCountKHR), decltype(&VulkanConsumer::Process_vkCmdDrawIndexedIndirectCountKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetSemaphoreCounterValueKHR:
+            return !std::is_same<decltype(&T::Process_vkGetSemaphoreCounterValueKHR), decltype(&VulkanConsumer::Process_vkGetSemaphoreCounterValueKHR)>::value;
+        case format::ApiCallId::ApiCall_vkWaitSemaphoresKHR:
+            return !std::is_same<decltype(&T::Process_vkWaitSemaphoresKHR), decltype(&VulkanConsumer::Process_vkWaitSemaphoresKHR)>::value;
+        case format::ApiCallId::ApiCall_vkSignalSemaphoreKHR:
+            return !std::is_same<decltype(&T::Process_vkSignalSemaphoreKHR), decltype(&VulkanConsumer::Process_vkSignalSemaphoreKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFragmentShadingRatesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceFragmentShadingRatesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceFragmentShadingRatesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdSetFragmentShadingRateKHR), decltype(&VulkanConsumer::Process_vkCmdSetFragmentShadingRateKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRenderingAttachmentLocationsKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRenderingAttachmentLocationsKHR), decltype(&VulkanConsumer::Process_vkCmdSetRenderingAttachmentLocationsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRenderingInputAttachmentIndicesKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRenderingInputAttachmentIndicesKHR), decltype(&VulkanConsumer::Process_vkCmdSetRenderingInputAttachmentIndicesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkWaitForPresentKHR:
+            return !std::is_same<decltype(&T::Process_vkWaitForPresentKHR), decltype(&VulkanConsumer::Process_vkWaitForPresentKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferDeviceAddressKHR:
+            return !std::is_same<decltype(&T::Process_vkGetBufferDeviceAddressKHR), decltype(&VulkanConsumer::Process_vkGetBufferDeviceAddressKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddressKHR:
+            return !std::is_same<decltype(&T::Process_vkGetBufferOpaqueCaptureAddressKHR), decltype(&VulkanConsumer::Process_vkGetBufferOpaqueCaptureAddressKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddressKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceMemoryOpaqueCaptureAddressKHR), decltype(&VulkanConsumer::Process_vkGetDeviceMemoryOpaqueCaptureAddressKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDeferredOperationKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateDeferredOperationKHR), decltype(&VulkanConsumer::Process_vkCreateDeferredOperationKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDeferredOperationKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroyDeferredOperationKHR), decltype(&VulkanConsumer::Process_vkDestroyDeferredOperationKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeferredOperationMaxConcurrencyKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeferredOperationMaxConcurrencyKHR), decltype(&VulkanConsumer::Process_vkGetDeferredOperationMaxConcurrencyKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeferredOperationResultKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeferredOperationResultKHR), decltype(&VulkanConsumer::Process_vkGetDeferredOperationResultKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDeferredOperationJoinKHR:
+            return !std::is_same<decltype(&T::Process_vkDeferredOperationJoinKHR), decltype(&VulkanConsumer::Process_vkDeferredOperationJoinKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPipelineExecutablePropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPipelineExecutablePropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPipelineExecutablePropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPipelineExecutableStatisticsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPipelineExecutableStatisticsKHR), decltype(&VulkanConsumer::Process_vkGetPipelineExecutableStatisticsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPipelineExecutableInternalRepresentationsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPipelineExecutableInternalRepresentationsKHR), decltype(&VulkanConsumer::Process_vkGetPipelineExecutableInternalRepresentationsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkMapMemory2KHR:
+            return !std::is_same<decltype(&T::Process_vkMapMemory2KHR), decltype(&VulkanConsumer::Process_vkMapMemory2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkUnmapMemory2KHR:
+            return !std::is_same<decltype(&T::Process_vkUnmapMemory2KHR), decltype(&VulkanConsumer::Process_vkUnmapMemory2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceVideoEncodeQualityLevelPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetEncodedVideoSessionParametersKHR:
+            return !std::is_same<decltype(&T::Process_vkGetEncodedVideoSessionParametersKHR), decltype(&VulkanConsumer::Process_vkGetEncodedVideoSessionParametersKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEncodeVideoKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdEncodeVideoKHR), decltype(&VulkanConsumer::Process_vkCmdEncodeVideoKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetEvent2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdSetEvent2KHR), decltype(&VulkanConsumer::Process_vkCmdSetEvent2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdResetEvent2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdResetEvent2KHR), decltype(&VulkanConsumer::Process_vkCmdResetEvent2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWaitEvents2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdWaitEvents2KHR), decltype(&VulkanConsumer::Process_vkCmdWaitEvents2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPipelineBarrier2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdPipelineBarrier2KHR), decltype(&VulkanConsumer::Process_vkCmdPipelineBarrier2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteTimestamp2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteTimestamp2KHR), decltype(&VulkanConsumer::Process_vkCmdWriteTimestamp2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkQueueSubmit2KHR:
+            return !std::is_same<decltype(&T::Process_vkQueueSubmit2KHR), decltype(&VulkanConsumer::Process_vkQueueSubmit2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteBufferMarker2AMD:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteBufferMarker2AMD), decltype(&VulkanConsumer::Process_vkCmdWriteBufferMarker2AMD)>::value;
+        case format::ApiCallId::ApiCall_vkGetQueueCheckpointData2NV:
+            return !std::is_same<decltype(&T::Process_vkGetQueueCheckpointData2NV), decltype(&VulkanConsumer::Process_vkGetQueueCheckpointData2NV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyBuffer2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyBuffer2KHR), decltype(&VulkanConsumer::Process_vkCmdCopyBuffer2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyImage2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyImage2KHR), decltype(&VulkanConsumer::Process_vkCmdCopyImage2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyBufferToImage2KHR), decltype(&VulkanConsumer::Process_vkCmdCopyBufferToImage2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyImageToBuffer2KHR), decltype(&VulkanConsumer::Process_vkCmdCopyImageToBuffer2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBlitImage2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBlitImage2KHR), decltype(&VulkanConsumer::Process_vkCmdBlitImage2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdResolveImage2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdResolveImage2KHR), decltype(&VulkanConsumer::Process_vkCmdResolveImage2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdTraceRaysIndirect2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdTraceRaysIndirect2KHR), decltype(&VulkanConsumer::Process_vkCmdTraceRaysIndirect2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceBufferMemoryRequirementsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceBufferMemoryRequirementsKHR), decltype(&VulkanConsumer::Process_vkGetDeviceBufferMemoryRequirementsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceImageMemoryRequirementsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceImageMemoryRequirementsKHR), decltype(&VulkanConsumer::Process_vkGetDeviceImageMemoryRequirementsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceImageSparseMemoryRequirementsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceImageSparseMemoryRequirementsKHR), decltype(&VulkanConsumer::Process_vkGetDeviceImageSparseMemoryRequirementsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindIndexBuffer2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBindIndexBuffer2KHR), decltype(&VulkanConsumer::Process_vkCmdBindIndexBuffer2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetRenderingAreaGranularityKHR:
+            return !std::is_same<decltype(&T::Process_vkGetRenderingAreaGranularityKHR), decltype(&VulkanConsumer::Process_vkGetRenderingAreaGranularityKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceImageSubresourceLayoutKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceImageSubresourceLayoutKHR), decltype(&VulkanConsumer::Process_vkGetDeviceImageSubresourceLayoutKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageSubresourceLayout2KHR:
+            return !std::is_same<decltype(&T::Process_vkGetImageSubresourceLayout2KHR), decltype(&VulkanConsumer::Process_vkGetImageSubresourceLayout2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetLineStippleKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdSetLineStippleKHR), decltype(&VulkanConsumer::Process_vkCmdSetLineStippleKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceCalibrateableTimeDomainsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetCalibratedTimestampsKHR:
+            return !std::is_same<decltype(&T::Process_vkGetCalibratedTimestampsKHR), decltype(&VulkanConsumer::Process_vkGetCalibratedTimestampsKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindDescriptorSets2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBindDescriptorSets2KHR), decltype(&VulkanConsumer::Process_vkCmdBindDescriptorSets2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPushConstants2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdPushConstants2KHR), decltype(&VulkanConsumer::Process_vkCmdPushConstants2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPushDescriptorSet2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdPushDescriptorSet2KHR), decltype(&VulkanConsumer::Process_vkCmdPushDescriptorSet2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPushDescriptorSetWithTemplate2KHR:
+            return !std::is_same<decltype(&T::Process_vkCmdPushDescriptorSetWithTemplate2KHR), decltype(&VulkanConsumer::Process_vkCmdPushDescriptorSetWithTemplate2KHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDescriptorBufferOffsets2EXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDescriptorBufferOffsets2EXT), decltype(&VulkanConsumer::Process_vkCmdSetDescriptorBufferOffsets2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT), decltype(&VulkanConsumer::Process_vkCmdBindDescriptorBufferEmbeddedSamplers2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkFrameBoundaryANDROID:
+            return !std::is_same<decltype(&T::Process_vkFrameBoundaryANDROID), decltype(&VulkanConsumer::Process_vkFrameBoundaryANDROID)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDebugReportCallbackEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateDebugReportCallbackEXT), decltype(&VulkanConsumer::Process_vkCreateDebugReportCallbackEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDebugReportCallbackEXT:
+            return !std::is_same<decltype(&T::Process_vkDestroyDebugReportCallbackEXT), decltype(&VulkanConsumer::Process_vkDestroyDebugReportCallbackEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDebugReportMessageEXT:
+            return !std::is_same<decltype(&T::Process_vkDebugReportMessageEXT), decltype(&VulkanConsumer::Process_vkDebugReportMessageEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDebugMarkerSetObjectTagEXT:
+            return !std::is_same<decltype(&T::Process_vkDebugMarkerSetObjectTagEXT), decltype(&VulkanConsumer::Process_vkDebugMarkerSetObjectTagEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDebugMarkerSetObjectNameEXT:
+            return !std::is_same<decltype(&T::Process_vkDebugMarkerSetObjectNameEXT), decltype(&VulkanConsumer::Process_vkDebugMarkerSetObjectNameEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDebugMarkerBeginEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDebugMarkerBeginEXT), decltype(&VulkanConsumer::Process_vkCmdDebugMarkerBeginEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDebugMarkerEndEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDebugMarkerEndEXT), decltype(&VulkanConsumer::Process_vkCmdDebugMarkerEndEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDebugMarkerInsertEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDebugMarkerInsertEXT), decltype(&VulkanConsumer::Process_vkCmdDebugMarkerInsertEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindTransformFeedbackBuffersEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBindTransformFeedbackBuffersEXT), decltype(&VulkanConsumer::Process_vkCmdBindTransformFeedbackBuffersEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginTransformFeedbackEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginTransformFeedbackEXT), decltype(&VulkanConsumer::Process_vkCmdBeginTransformFeedbackEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndTransformFeedbackEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdEndTransformFeedbackEXT), decltype(&VulkanConsumer::Process_vkCmdEndTransformFeedbackEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginQueryIndexedEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginQueryIndexedEXT), decltype(&VulkanConsumer::Process_vkCmdBeginQueryIndexedEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndQueryIndexedEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdEndQueryIndexedEXT), decltype(&VulkanConsumer::Process_vkCmdEndQueryIndexedEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectByteCountEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndirectByteCountEXT), decltype(&VulkanConsumer::Process_vkCmdDrawIndirectByteCountEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageViewHandleNVX:
+            return !std::is_same<decltype(&T::Process_vkGetImageViewHandleNVX), decltype(&VulkanConsumer::Process_vkGetImageViewHandleNVX)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageViewAddressNVX:
+            return !std::is_same<decltype(&T::Process_vkGetImageViewAddressNVX), decltype(&VulkanConsumer::Process_vkGetImageViewAddressNVX)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndirectCountAMD:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndirectCountAMD), decltype(&VulkanConsumer::Process_vkCmdDrawIndirectCountAMD)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountAMD:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawIndexedIndirectCountAMD), decltype(&VulkanConsumer::Process_vkCmdDrawIndexedIndirectCountAMD)>::value;
+        case format::ApiCallId::ApiCall_vkGetShaderInfoAMD:
+            return !std::is_same<decltype(&T::Process_vkGetShaderInfoAMD), decltype(&VulkanConsumer::Process_vkGetShaderInfoAMD)>::value;
+        case format::ApiCallId::ApiCall_vkCreateStreamDescriptorSurfaceGGP:
+            return !std::is_same<decltype(&T::Process_vkCreateStreamDescriptorSurfaceGGP), decltype(&VulkanConsumer::Process_vkCreateStreamDescriptorSurfaceGGP)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalImageFormatPropertiesNV:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceExternalImageFormatPropertiesNV), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceExternalImageFormatPropertiesNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryWin32HandleNV:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryWin32HandleNV), decltype(&VulkanConsumer::Process_vkGetMemoryWin32HandleNV)>::value;
+        case format::ApiCallId::ApiCall_vkCreateViSurfaceNN:
+            return !std::is_same<decltype(&T::Process_vkCreateViSurfaceNN), decltype(&VulkanConsumer::Process_vkCreateViSurfaceNN)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginConditionalRenderingEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginConditionalRenderingEXT), decltype(&VulkanConsumer::Process_vkCmdBeginConditionalRenderingEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndConditionalRenderingEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdEndConditionalRenderingEXT), decltype(&VulkanConsumer::Process_vkCmdEndConditionalRenderingEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetViewportWScalingNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetViewportWScalingNV), decltype(&VulkanConsumer::Process_vkCmdSetViewportWScalingNV)>::value;
+        case format::ApiCallId::ApiCall_vkReleaseDisplayEXT:
+            return !std::is_same<decltype(&T::Process_vkReleaseDisplayEXT), decltype(&VulkanConsumer::Process_vkReleaseDisplayEXT)>::value;
+        case format::ApiCallId::ApiCall_vkAcquireXlibDisplayEXT:
+            return !std::is_same<decltype(&T::Process_vkAcquireXlibDisplayEXT), decltype(&VulkanConsumer::Process_vkAcquireXlibDisplayEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetRandROutputDisplayEXT:
+            return !std::is_same<decltype(&T::Process_vkGetRandROutputDisplayEXT), decltype(&VulkanConsumer::Process_vkGetRandROutputDisplayEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2EXT:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfaceCapabilities2EXT), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilities2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkDisplayPowerControlEXT:
+            return !std::is_same<decltype(&T::Process_vkDisplayPowerControlEXT), decltype(&VulkanConsumer::Process_vkDisplayPowerControlEXT)>::value;
+        case format::ApiCallId::ApiCall_vkRegisterDeviceEventEXT:
+            return !std::is_same<decltype(&T::Process_vkRegisterDeviceEventEXT), decltype(&VulkanConsumer::Process_vkRegisterDeviceEventEXT)>::value;
+        case format::ApiCallId::ApiCall_vkRegisterDisplayEventEXT:
+            return !std::is_same<decltype(&T::Process_vkRegisterDisplayEventEXT), decltype(&VulkanConsumer::Process_vkRegisterDisplayEventEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetSwapchainCounterEXT:
+            return !std::is_same<decltype(&T::Process_vkGetSwapchainCounterEXT), decltype(&VulkanConsumer::Process_vkGetSwapchainCounterEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetRefreshCycleDurationGOOGLE:
+            return !std::is_same<decltype(&T::Process_vkGetRefreshCycleDurationGOOGLE), decltype(&VulkanConsumer::Process_vkGetRefreshCycleDurationGOOGLE)>::value;
+        case format::ApiCallId::ApiCall_vkGetPastPresentationTimingGOOGLE:
+            return !std::is_same<decltype(&T::Process_vkGetPastPresentationTimingGOOGLE), decltype(&VulkanConsumer::Process_vkGetPastPresentationTimingGOOGLE)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDiscardRectangleEXT), decltype(&VulkanConsumer::Process_vkCmdSetDiscardRectangleEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDiscardRectangleEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetDiscardRectangleEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleModeEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDiscardRectangleModeEXT), decltype(&VulkanConsumer::Process_vkCmdSetDiscardRectangleModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkSetHdrMetadataEXT:
+            return !std::is_same<decltype(&T::Process_vkSetHdrMetadataEXT), decltype(&VulkanConsumer::Process_vkSetHdrMetadataEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreateIOSSurfaceMVK:
+            return !std::is_same<decltype(&T::Process_vkCreateIOSSurfaceMVK), decltype(&VulkanConsumer::Process_vkCreateIOSSurfaceMVK)>::value;
+        case format::ApiCallId::ApiCall_vkCreateMacOSSurfaceMVK:
+            return !std::is_same<decltype(&T::Process_vkCreateMacOSSurfaceMVK), decltype(&VulkanConsumer::Process_vkCreateMacOSSurfaceMVK)>::value;
+        case format::ApiCallId::ApiCall_vkSetDebugUtilsObjectNameEXT:
+            return !std::is_same<decltype(&T::Process_vkSetDebugUtilsObjectNameEXT), decltype(&VulkanConsumer::Process_vkSetDebugUtilsObjectNameEXT)>::value;
+        case format::ApiCallId::ApiCall_vkSetDebugUtilsObjectTagEXT:
+            return !std::is_same<decltype(&T::Process_vkSetDebugUtilsObjectTagEXT), decltype(&VulkanConsumer::Process_vkSetDebugUtilsObjectTagEXT)>::value;
+        case format::ApiCallId::ApiCall_vkQueueBeginDebugUtilsLabelEXT:
+            return !std::is_same<decltype(&T::Process_vkQueueBeginDebugUtilsLabelEXT), decltype(&VulkanConsumer::Process_vkQueueBeginDebugUtilsLabelEXT)>::value;
+        case format::ApiCallId::ApiCall_vkQueueEndDebugUtilsLabelEXT:
+            return !std::is_same<decltype(&T::Process_vkQueueEndDebugUtilsLabelEXT), decltype(&VulkanConsumer::Process_vkQueueEndDebugUtilsLabelEXT)>::value;
+        case format::ApiCallId::ApiCall_vkQueueInsertDebugUtilsLabelEXT:
+            return !std::is_same<decltype(&T::Process_vkQueueInsertDebugUtilsLabelEXT), decltype(&VulkanConsumer::Process_vkQueueInsertDebugUtilsLabelEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBeginDebugUtilsLabelEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBeginDebugUtilsLabelEXT), decltype(&VulkanConsumer::Process_vkCmdBeginDebugUtilsLabelEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdEndDebugUtilsLabelEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdEndDebugUtilsLabelEXT), decltype(&VulkanConsumer::Process_vkCmdEndDebugUtilsLabelEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdInsertDebugUtilsLabelEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdInsertDebugUtilsLabelEXT), decltype(&VulkanConsumer::Process_vkCmdInsertDebugUtilsLabelEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDebugUtilsMessengerEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateDebugUtilsMessengerEXT), decltype(&VulkanConsumer::Process_vkCreateDebugUtilsMessengerEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyDebugUtilsMessengerEXT:
+            return !std::is_same<decltype(&T::Process_vkDestroyDebugUtilsMessengerEXT), decltype(&VulkanConsumer::Process_vkDestroyDebugUtilsMessengerEXT)>::value;
+        case format::ApiCallId::ApiCall_vkSubmitDebugUtilsMessageEXT:
+            return !std::is_same<decltype(&T::Process_vkSubmitDebugUtilsMessageEXT), decltype(&VulkanConsumer::Process_vkSubmitDebugUtilsMessageEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetAndroidHardwareBufferPropertiesANDROID:
+            return !std::is_same<decltype(&T::Process_vkGetAndroidHardwareBufferPropertiesANDROID), decltype(&VulkanConsumer::Process_vkGetAndroidHardwareBufferPropertiesANDROID)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryAndroidHardwareBufferANDROID:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryAndroidHardwareBufferANDROID), decltype(&VulkanConsumer::Process_vkGetMemoryAndroidHardwareBufferANDROID)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetSampleLocationsEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetSampleLocationsEXT), decltype(&VulkanConsumer::Process_vkCmdSetSampleLocationsEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMultisamplePropertiesEXT:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceMultisamplePropertiesEXT), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceMultisamplePropertiesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageDrmFormatModifierPropertiesEXT:
+            return !std::is_same<decltype(&T::Process_vkGetImageDrmFormatModifierPropertiesEXT), decltype(&VulkanConsumer::Process_vkGetImageDrmFormatModifierPropertiesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreateValidationCacheEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateValidationCacheEXT), decltype(&VulkanConsumer::Process_vkCreateValidationCacheEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyValidationCacheEXT:
+            return !std::is_same<decltype(&T::Process_vkDestroyValidationCacheEXT), decltype(&VulkanConsumer::Process_vkDestroyValidationCacheEXT)>::value;
+        case format::ApiCallId::ApiCall_vkMergeValidationCachesEXT:
+            return !std::is_same<decltype(&T::Process_vkMergeValidationCachesEXT), decltype(&VulkanConsumer::Process_vkMergeValidationCachesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetValidationCacheDataEXT:
+            return !std::is_same<decltype(&T::Process_vkGetValidationCacheDataEXT), decltype(&VulkanConsumer::Process_vkGetValidationCacheDataEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindShadingRateImageNV:
+            return !std::is_same<decltype(&T::Process_vkCmdBindShadingRateImageNV), decltype(&VulkanConsumer::Process_vkCmdBindShadingRateImageNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetViewportShadingRatePaletteNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetViewportShadingRatePaletteNV), decltype(&VulkanConsumer::Process_vkCmdSetViewportShadingRatePaletteNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCoarseSampleOrderNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCoarseSampleOrderNV), decltype(&VulkanConsumer::Process_vkCmdSetCoarseSampleOrderNV)>::value;
+        case format::ApiCallId::ApiCall_vkCreateAccelerationStructureNV:
+            return !std::is_same<decltype(&T::Process_vkCreateAccelerationStructureNV), decltype(&VulkanConsumer::Process_vkCreateAccelerationStructureNV)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyAccelerationStructureNV:
+            return !std::is_same<decltype(&T::Process_vkDestroyAccelerationStructureNV), decltype(&VulkanConsumer::Process_vkDestroyAccelerationStructureNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetAccelerationStructureMemoryRequirementsNV:
+            return !std::is_same<decltype(&T::Process_vkGetAccelerationStructureMemoryRequirementsNV), decltype(&VulkanConsumer::Process_vkGetAccelerationStructureMemoryRequirementsNV)>::value;
+        case format::ApiCallId::ApiCall_vkBindAccelerationStructureMemoryNV:
+            return !std::is_same<decltype(&T::Process_vkBindAccelerationStructureMemoryNV), decltype(&VulkanConsumer::Process_vkBindAccelerationStructureMemoryNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructureNV:
+            return !std::is_same<decltype(&T::Process_vkCmdBuildAccelerationStructureNV), decltype(&VulkanConsumer::Process_vkCmdBuildAccelerationStructureNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureNV:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyAccelerationStructureNV), decltype(&VulkanConsumer::Process_vkCmdCopyAccelerationStructureNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdTraceRaysNV:
+            return !std::is_same<decltype(&T::Process_vkCmdTraceRaysNV), decltype(&VulkanConsumer::Process_vkCmdTraceRaysNV)>::value;
+        case format::ApiCallId::ApiCall_vkCreateRayTracingPipelinesNV:
+            return !std::is_same<decltype(&T::Process_vkCreateRayTracingPipelinesNV), decltype(&VulkanConsumer::Process_vkCreateRayTracingPipelinesNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetRayTracingShaderGroupHandlesKHR), decltype(&VulkanConsumer::Process_vkGetRayTracingShaderGroupHandlesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesNV:
+            return !std::is_same<decltype(&T::Process_vkGetRayTracingShaderGroupHandlesNV), decltype(&VulkanConsumer::Process_vkGetRayTracingShaderGroupHandlesNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetAccelerationStructureHandleNV:
+            return !std::is_same<decltype(&T::Process_vkGetAccelerationStructureHandleNV), decltype(&VulkanConsumer::Process_vkGetAccelerationStructureHandleNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesNV:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteAccelerationStructuresPropertiesNV), decltype(&VulkanConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesNV)>::value;
+        case format::ApiCallId::ApiCall_vkCompileDeferredNV:
+            return !std::is_same<decltype(&T::Process_vkCompileDeferredNV), decltype(&VulkanConsumer::Process_vkCompileDeferredNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryHostPointerPropertiesEXT:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryHostPointerPropertiesEXT), decltype(&VulkanConsumer::Process_vkGetMemoryHostPointerPropertiesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteBufferMarkerAMD:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteBufferMarkerAMD), decltype(&VulkanConsumer::Process_vkCmdWriteBufferMarkerAMD)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetCalibratedTimestampsEXT:
+            return !std::is_same<decltype(&T::Process_vkGetCalibratedTimestampsEXT), decltype(&VulkanConsumer::Process_vkGetCalibratedTimestampsEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksNV:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMeshTasksNV), decltype(&VulkanConsumer::Process_vkCmdDrawMeshTasksNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectNV:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMeshTasksIndirectNV), decltype(&VulkanConsumer::Process_vkCmdDrawMeshTasksIndirectNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountNV:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMeshTasksIndirectCountNV), decltype(&VulkanConsumer::Process_vkCmdDrawMeshTasksIndirectCountNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetExclusiveScissorEnableNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetExclusiveScissorEnableNV), decltype(&VulkanConsumer::Process_vkCmdSetExclusiveScissorEnableNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetExclusiveScissorNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetExclusiveScissorNV), decltype(&VulkanConsumer::Process_vkCmdSetExclusiveScissorNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCheckpointNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCheckpointNV), decltype(&VulkanConsumer::Process_vkCmdSetCheckpointNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetQueueCheckpointDataNV:
+            return !std::is_same<decltype(&T::Process_vkGetQueueCheckpointDataNV), decltype(&VulkanConsumer::Process_vkGetQueueCheckpointDataNV)>::value;
+        case format::ApiCallId::ApiCall_vkInitializePerformanceApiINTEL:
+            return !std::is_same<decltype(&T::Process_vkInitializePerformanceApiINTEL), decltype(&VulkanConsumer::Process_vkInitializePerformanceApiINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkUninitializePerformanceApiINTEL:
+            return !std::is_same<decltype(&T::Process_vkUninitializePerformanceApiINTEL), decltype(&VulkanConsumer::Process_vkUninitializePerformanceApiINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPerformanceMarkerINTEL:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPerformanceMarkerINTEL), decltype(&VulkanConsumer::Process_vkCmdSetPerformanceMarkerINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPerformanceStreamMarkerINTEL:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPerformanceStreamMarkerINTEL), decltype(&VulkanConsumer::Process_vkCmdSetPerformanceStreamMarkerINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPerformanceOverrideINTEL:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPerformanceOverrideINTEL), decltype(&VulkanConsumer::Process_vkCmdSetPerformanceOverrideINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkAcquirePerformanceConfigurationINTEL:
+            return !std::is_same<decltype(&T::Process_vkAcquirePerformanceConfigurationINTEL), decltype(&VulkanConsumer::Process_vkAcquirePerformanceConfigurationINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkReleasePerformanceConfigurationINTEL:
+            return !std::is_same<decltype(&T::Process_vkReleasePerformanceConfigurationINTEL), decltype(&VulkanConsumer::Process_vkReleasePerformanceConfigurationINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkQueueSetPerformanceConfigurationINTEL:
+            return !std::is_same<decltype(&T::Process_vkQueueSetPerformanceConfigurationINTEL), decltype(&VulkanConsumer::Process_vkQueueSetPerformanceConfigurationINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkGetPerformanceParameterINTEL:
+            return !std::is_same<decltype(&T::Process_vkGetPerformanceParameterINTEL), decltype(&VulkanConsumer::Process_vkGetPerformanceParameterINTEL)>::value;
+        case format::ApiCallId::ApiCall_vkSetLocalDimmingAMD:
+            return !std::is_same<decltype(&T::Process_vkSetLocalDimmingAMD), decltype(&VulkanConsumer::Process_vkSetLocalDimmingAMD)>::value;
+        case format::ApiCallId::ApiCall_vkCreateImagePipeSurfaceFUCHSIA:
+            return !std::is_same<decltype(&T::Process_vkCreateImagePipeSurfaceFUCHSIA), decltype(&VulkanConsumer::Process_vkCreateImagePipeSurfaceFUCHSIA)>::value;
+        case format::ApiCallId::ApiCall_vkCreateMetalSurfaceEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateMetalSurfaceEXT), decltype(&VulkanConsumer::Process_vkCreateMetalSurfaceEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetBufferDeviceAddressEXT:
+            return !std::is_same<decltype(&T::Process_vkGetBufferDeviceAddressEXT), decltype(&VulkanConsumer::Process_vkGetBufferDeviceAddressEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceToolPropertiesEXT:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceToolPropertiesEXT), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceToolPropertiesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModes2EXT:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceSurfacePresentModes2EXT), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceSurfacePresentModes2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkAcquireFullScreenExclusiveModeEXT:
+            return !std::is_same<decltype(&T::Process_vkAcquireFullScreenExclusiveModeEXT), decltype(&VulkanConsumer::Process_vkAcquireFullScreenExclusiveModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkReleaseFullScreenExclusiveModeEXT:
+            return !std::is_same<decltype(&T::Process_vkReleaseFullScreenExclusiveModeEXT), decltype(&VulkanConsumer::Process_vkReleaseFullScreenExclusiveModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModes2EXT:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceGroupSurfacePresentModes2EXT), decltype(&VulkanConsumer::Process_vkGetDeviceGroupSurfacePresentModes2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreateHeadlessSurfaceEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateHeadlessSurfaceEXT), decltype(&VulkanConsumer::Process_vkCreateHeadlessSurfaceEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetLineStippleEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetLineStippleEXT), decltype(&VulkanConsumer::Process_vkCmdSetLineStippleEXT)>::value;
+        case format::ApiCallId::ApiCall_vkResetQueryPoolEXT:
+            return !std::is_same<decltype(&T::Process_vkResetQueryPoolEXT), decltype(&VulkanConsumer::Process_vkResetQueryPoolEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCullModeEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCullModeEXT), decltype(&VulkanConsumer::Process_vkCmdSetCullModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetFrontFaceEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetFrontFaceEXT), decltype(&VulkanConsumer::Process_vkCmdSetFrontFaceEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPrimitiveTopologyEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPrimitiveTopologyEXT), decltype(&VulkanConsumer::Process_vkCmdSetPrimitiveTopologyEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetViewportWithCountEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetViewportWithCountEXT), decltype(&VulkanConsumer::Process_vkCmdSetViewportWithCountEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetScissorWithCountEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetScissorWithCountEXT), decltype(&VulkanConsumer::Process_vkCmdSetScissorWithCountEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2EXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBindVertexBuffers2EXT), decltype(&VulkanConsumer::Process_vkCmdBindVertexBuffers2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthTestEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthTestEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthTestEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthWriteEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthWriteEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthWriteEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthCompareOpEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthCompareOpEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthCompareOpEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthBoundsTestEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthBoundsTestEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthBoundsTestEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetStencilTestEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetStencilTestEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetStencilTestEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetStencilOpEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetStencilOpEXT), decltype(&VulkanConsumer::Process_vkCmdSetStencilOpEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCopyMemoryToImageEXT:
+            return !std::is_same<decltype(&T::Process_vkCopyMemoryToImageEXT), decltype(&VulkanConsumer::Process_vkCopyMemoryToImageEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCopyImageToMemoryEXT:
+            return !std::is_same<decltype(&T::Process_vkCopyImageToMemoryEXT), decltype(&VulkanConsumer::Process_vkCopyImageToMemoryEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCopyImageToImageEXT:
+            return !std::is_same<decltype(&T::Process_vkCopyImageToImageEXT), decltype(&VulkanConsumer::Process_vkCopyImageToImageEXT)>::value;
+        case format::ApiCallId::ApiCall_vkTransitionImageLayoutEXT:
+            return !std::is_same<decltype(&T::Process_vkTransitionImageLayoutEXT), decltype(&VulkanConsumer::Process_vkTransitionImageLayoutEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetImageSubresourceLayout2EXT:
+            return !std::is_same<decltype(&T::Process_vkGetImageSubresourceLayout2EXT), decltype(&VulkanConsumer::Process_vkGetImageSubresourceLayout2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkReleaseSwapchainImagesEXT:
+            return !std::is_same<decltype(&T::Process_vkReleaseSwapchainImagesEXT), decltype(&VulkanConsumer::Process_vkReleaseSwapchainImagesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetGeneratedCommandsMemoryRequirementsNV:
+            return !std::is_same<decltype(&T::Process_vkGetGeneratedCommandsMemoryRequirementsNV), decltype(&VulkanConsumer::Process_vkGetGeneratedCommandsMemoryRequirementsNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdPreprocessGeneratedCommandsNV:
+            return !std::is_same<decltype(&T::Process_vkCmdPreprocessGeneratedCommandsNV), decltype(&VulkanConsumer::Process_vkCmdPreprocessGeneratedCommandsNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdExecuteGeneratedCommandsNV:
+            return !std::is_same<decltype(&T::Process_vkCmdExecuteGeneratedCommandsNV), decltype(&VulkanConsumer::Process_vkCmdExecuteGeneratedCommandsNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindPipelineShaderGroupNV:
+            return !std::is_same<decltype(&T::Process_vkCmdBindPipelineShaderGroupNV), decltype(&VulkanConsumer::Process_vkCmdBindPipelineShaderGroupNV)>::value;
+        case format::ApiCallId::ApiCall_vkCreateIndirectCommandsLayoutNV:
+            return !std::is_same<decltype(&T::Process_vkCreateIndirectCommandsLayoutNV), decltype(&VulkanConsumer::Process_vkCreateIndirectCommandsLayoutNV)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyIndirectCommandsLayoutNV:
+            return !std::is_same<decltype(&T::Process_vkDestroyIndirectCommandsLayoutNV), decltype(&VulkanConsumer::Process_vkDestroyIndirectCommandsLayoutNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthBias2EXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthBias2EXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthBias2EXT)>::value;
+        case format::ApiCallId::ApiCall_vkAcquireDrmDisplayEXT:
+            return !std::is_same<decltype(&T::Process_vkAcquireDrmDisplayEXT), decltype(&VulkanConsumer::Process_vkAcquireDrmDisplayEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetDrmDisplayEXT:
+            return !std::is_same<decltype(&T::Process_vkGetDrmDisplayEXT), decltype(&VulkanConsumer::Process_vkGetDrmDisplayEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreatePrivateDataSlotEXT:
+            return !std::is_same<decltype(&T::Process_vkCreatePrivateDataSlotEXT), decltype(&VulkanConsumer::Process_vkCreatePrivateDataSlotEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyPrivateDataSlotEXT:
+            return !std::is_same<decltype(&T::Process_vkDestroyPrivateDataSlotEXT), decltype(&VulkanConsumer::Process_vkDestroyPrivateDataSlotEXT)>::value;
+        case format::ApiCallId::ApiCall_vkSetPrivateDataEXT:
+            return !std::is_same<decltype(&T::Process_vkSetPrivateDataEXT), decltype(&VulkanConsumer::Process_vkSetPrivateDataEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetPrivateDataEXT:
+            return !std::is_same<decltype(&T::Process_vkGetPrivateDataEXT), decltype(&VulkanConsumer::Process_vkGetPrivateDataEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateEnumNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetFragmentShadingRateEnumNV), decltype(&VulkanConsumer::Process_vkCmdSetFragmentShadingRateEnumNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceFaultInfoEXT:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceFaultInfoEXT), decltype(&VulkanConsumer::Process_vkGetDeviceFaultInfoEXT)>::value;
+        case format::ApiCallId::ApiCall_vkAcquireWinrtDisplayNV:
+            return !std::is_same<decltype(&T::Process_vkAcquireWinrtDisplayNV), decltype(&VulkanConsumer::Process_vkAcquireWinrtDisplayNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetWinrtDisplayNV:
+            return !std::is_same<decltype(&T::Process_vkGetWinrtDisplayNV), decltype(&VulkanConsumer::Process_vkGetWinrtDisplayNV)>::value;
+        case format::ApiCallId::ApiCall_vkCreateDirectFBSurfaceEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateDirectFBSurfaceEXT), decltype(&VulkanConsumer::Process_vkCreateDirectFBSurfaceEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDirectFBPresentationSupportEXT:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceDirectFBPresentationSupportEXT), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceDirectFBPresentationSupportEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetVertexInputEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetVertexInputEXT), decltype(&VulkanConsumer::Process_vkCmdSetVertexInputEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryZirconHandleFUCHSIA:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryZirconHandleFUCHSIA), decltype(&VulkanConsumer::Process_vkGetMemoryZirconHandleFUCHSIA)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryZirconHandlePropertiesFUCHSIA:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryZirconHandlePropertiesFUCHSIA), decltype(&VulkanConsumer::Process_vkGetMemoryZirconHandlePropertiesFUCHSIA)>::value;
+        case format::ApiCallId::ApiCall_vkImportSemaphoreZirconHandleFUCHSIA:
+            return !std::is_same<decltype(&T::Process_vkImportSemaphoreZirconHandleFUCHSIA), decltype(&VulkanConsumer::Process_vkImportSemaphoreZirconHandleFUCHSIA)>::value;
+        case format::ApiCallId::ApiCall_vkGetSemaphoreZirconHandleFUCHSIA:
+            return !std::is_same<decltype(&T::Process_vkGetSemaphoreZirconHandleFUCHSIA), decltype(&VulkanConsumer::Process_vkGetSemaphoreZirconHandleFUCHSIA)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindInvocationMaskHUAWEI:
+            return !std::is_same<decltype(&T::Process_vkCmdBindInvocationMaskHUAWEI), decltype(&VulkanConsumer::Process_vkCmdBindInvocationMaskHUAWEI)>::value;
+        case format::ApiCallId::ApiCall_vkGetMemoryRemoteAddressNV:
+            return !std::is_same<decltype(&T::Process_vkGetMemoryRemoteAddressNV), decltype(&VulkanConsumer::Process_vkGetMemoryRemoteAddressNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPatchControlPointsEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPatchControlPointsEXT), decltype(&VulkanConsumer::Process_vkCmdSetPatchControlPointsEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRasterizerDiscardEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRasterizerDiscardEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetRasterizerDiscardEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthBiasEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthBiasEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthBiasEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetLogicOpEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetLogicOpEXT), decltype(&VulkanConsumer::Process_vkCmdSetLogicOpEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPrimitiveRestartEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPrimitiveRestartEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetPrimitiveRestartEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreateScreenSurfaceQNX:
+            return !std::is_same<decltype(&T::Process_vkCreateScreenSurfaceQNX), decltype(&VulkanConsumer::Process_vkCreateScreenSurfaceQNX)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceScreenPresentationSupportQNX:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceScreenPresentationSupportQNX), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceScreenPresentationSupportQNX)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetColorWriteEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetColorWriteEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetColorWriteEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMultiEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMultiEXT), decltype(&VulkanConsumer::Process_vkCmdDrawMultiEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMultiIndexedEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMultiIndexedEXT), decltype(&VulkanConsumer::Process_vkCmdDrawMultiIndexedEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreateMicromapEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateMicromapEXT), decltype(&VulkanConsumer::Process_vkCreateMicromapEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyMicromapEXT:
+            return !std::is_same<decltype(&T::Process_vkDestroyMicromapEXT), decltype(&VulkanConsumer::Process_vkDestroyMicromapEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBuildMicromapsEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBuildMicromapsEXT), decltype(&VulkanConsumer::Process_vkCmdBuildMicromapsEXT)>::value;
+        case format::ApiCallId::ApiCall_vkBuildMicromapsEXT:
+            return !std::is_same<decltype(&T::Process_vkBuildMicromapsEXT), decltype(&VulkanConsumer::Process_vkBuildMicromapsEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCopyMicromapEXT:
+            return !std::is_same<decltype(&T::Process_vkCopyMicromapEXT), decltype(&VulkanConsumer::Process_vkCopyMicromapEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCopyMicromapToMemoryEXT:
+            return !std::is_same<decltype(&T::Process_vkCopyMicromapToMemoryEXT), decltype(&VulkanConsumer::Process_vkCopyMicromapToMemoryEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCopyMemoryToMicromapEXT:
+            return !std::is_same<decltype(&T::Process_vkCopyMemoryToMicromapEXT), decltype(&VulkanConsumer::Process_vkCopyMemoryToMicromapEXT)>::value;
+        case format::ApiCallId::ApiCall_vkWriteMicromapsPropertiesEXT:
+            return !std::is_same<decltype(&T::Process_vkWriteMicromapsPropertiesEXT), decltype(&VulkanConsumer::Process_vkWriteMicromapsPropertiesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyMicromapEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyMicromapEXT), decltype(&VulkanConsumer::Process_vkCmdCopyMicromapEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyMicromapToMemoryEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyMicromapToMemoryEXT), decltype(&VulkanConsumer::Process_vkCmdCopyMicromapToMemoryEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyMemoryToMicromapEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyMemoryToMicromapEXT), decltype(&VulkanConsumer::Process_vkCmdCopyMemoryToMicromapEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteMicromapsPropertiesEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteMicromapsPropertiesEXT), decltype(&VulkanConsumer::Process_vkCmdWriteMicromapsPropertiesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceMicromapCompatibilityEXT:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceMicromapCompatibilityEXT), decltype(&VulkanConsumer::Process_vkGetDeviceMicromapCompatibilityEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetMicromapBuildSizesEXT:
+            return !std::is_same<decltype(&T::Process_vkGetMicromapBuildSizesEXT), decltype(&VulkanConsumer::Process_vkGetMicromapBuildSizesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawClusterHUAWEI:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawClusterHUAWEI), decltype(&VulkanConsumer::Process_vkCmdDrawClusterHUAWEI)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawClusterIndirectHUAWEI:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawClusterIndirectHUAWEI), decltype(&VulkanConsumer::Process_vkCmdDrawClusterIndirectHUAWEI)>::value;
+        case format::ApiCallId::ApiCall_vkSetDeviceMemoryPriorityEXT:
+            return !std::is_same<decltype(&T::Process_vkSetDeviceMemoryPriorityEXT), decltype(&VulkanConsumer::Process_vkSetDeviceMemoryPriorityEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutHostMappingInfoVALVE:
+            return !std::is_same<decltype(&T::Process_vkGetDescriptorSetLayoutHostMappingInfoVALVE), decltype(&VulkanConsumer::Process_vkGetDescriptorSetLayoutHostMappingInfoVALVE)>::value;
+        case format::ApiCallId::ApiCall_vkGetDescriptorSetHostMappingVALVE:
+            return !std::is_same<decltype(&T::Process_vkGetDescriptorSetHostMappingVALVE), decltype(&VulkanConsumer::Process_vkGetDescriptorSetHostMappingVALVE)>::value;
+        case format::ApiCallId::ApiCall_vkGetPipelineIndirectMemoryRequirementsNV:
+            return !std::is_same<decltype(&T::Process_vkGetPipelineIndirectMemoryRequirementsNV), decltype(&VulkanConsumer::Process_vkGetPipelineIndirectMemoryRequirementsNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdUpdatePipelineIndirectBufferNV:
+            return !std::is_same<decltype(&T::Process_vkCmdUpdatePipelineIndirectBufferNV), decltype(&VulkanConsumer::Process_vkCmdUpdatePipelineIndirectBufferNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetPipelineIndirectDeviceAddressNV:
+            return !std::is_same<decltype(&T::Process_vkGetPipelineIndirectDeviceAddressNV), decltype(&VulkanConsumer::Process_vkGetPipelineIndirectDeviceAddressNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthClampEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthClampEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthClampEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetPolygonModeEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetPolygonModeEXT), decltype(&VulkanConsumer::Process_vkCmdSetPolygonModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRasterizationSamplesEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRasterizationSamplesEXT), decltype(&VulkanConsumer::Process_vkCmdSetRasterizationSamplesEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetSampleMaskEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetSampleMaskEXT), decltype(&VulkanConsumer::Process_vkCmdSetSampleMaskEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetAlphaToCoverageEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetAlphaToCoverageEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetAlphaToCoverageEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetAlphaToOneEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetAlphaToOneEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetAlphaToOneEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetLogicOpEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetLogicOpEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetLogicOpEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetColorBlendEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetColorBlendEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetColorBlendEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetColorBlendEquationEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetColorBlendEquationEXT), decltype(&VulkanConsumer::Process_vkCmdSetColorBlendEquationEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetColorWriteMaskEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetColorWriteMaskEXT), decltype(&VulkanConsumer::Process_vkCmdSetColorWriteMaskEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetTessellationDomainOriginEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetTessellationDomainOriginEXT), decltype(&VulkanConsumer::Process_vkCmdSetTessellationDomainOriginEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRasterizationStreamEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRasterizationStreamEXT), decltype(&VulkanConsumer::Process_vkCmdSetRasterizationStreamEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetConservativeRasterizationModeEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetConservativeRasterizationModeEXT), decltype(&VulkanConsumer::Process_vkCmdSetConservativeRasterizationModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetExtraPrimitiveOverestimationSizeEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetExtraPrimitiveOverestimationSizeEXT), decltype(&VulkanConsumer::Process_vkCmdSetExtraPrimitiveOverestimationSizeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthClipEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthClipEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthClipEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetSampleLocationsEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetSampleLocationsEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetSampleLocationsEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetColorBlendAdvancedEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetColorBlendAdvancedEXT), decltype(&VulkanConsumer::Process_vkCmdSetColorBlendAdvancedEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetProvokingVertexModeEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetProvokingVertexModeEXT), decltype(&VulkanConsumer::Process_vkCmdSetProvokingVertexModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetLineRasterizationModeEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetLineRasterizationModeEXT), decltype(&VulkanConsumer::Process_vkCmdSetLineRasterizationModeEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetLineStippleEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetLineStippleEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetLineStippleEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetDepthClipNegativeOneToOneEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetDepthClipNegativeOneToOneEXT), decltype(&VulkanConsumer::Process_vkCmdSetDepthClipNegativeOneToOneEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetViewportWScalingEnableNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetViewportWScalingEnableNV), decltype(&VulkanConsumer::Process_vkCmdSetViewportWScalingEnableNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetViewportSwizzleNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetViewportSwizzleNV), decltype(&VulkanConsumer::Process_vkCmdSetViewportSwizzleNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCoverageToColorEnableNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCoverageToColorEnableNV), decltype(&VulkanConsumer::Process_vkCmdSetCoverageToColorEnableNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCoverageToColorLocationNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCoverageToColorLocationNV), decltype(&VulkanConsumer::Process_vkCmdSetCoverageToColorLocationNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCoverageModulationModeNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCoverageModulationModeNV), decltype(&VulkanConsumer::Process_vkCmdSetCoverageModulationModeNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCoverageModulationTableEnableNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCoverageModulationTableEnableNV), decltype(&VulkanConsumer::Process_vkCmdSetCoverageModulationTableEnableNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCoverageModulationTableNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCoverageModulationTableNV), decltype(&VulkanConsumer::Process_vkCmdSetCoverageModulationTableNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetShadingRateImageEnableNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetShadingRateImageEnableNV), decltype(&VulkanConsumer::Process_vkCmdSetShadingRateImageEnableNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRepresentativeFragmentTestEnableNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRepresentativeFragmentTestEnableNV), decltype(&VulkanConsumer::Process_vkCmdSetRepresentativeFragmentTestEnableNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetCoverageReductionModeNV:
+            return !std::is_same<decltype(&T::Process_vkCmdSetCoverageReductionModeNV), decltype(&VulkanConsumer::Process_vkCmdSetCoverageReductionModeNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetShaderModuleIdentifierEXT:
+            return !std::is_same<decltype(&T::Process_vkGetShaderModuleIdentifierEXT), decltype(&VulkanConsumer::Process_vkGetShaderModuleIdentifierEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetShaderModuleCreateInfoIdentifierEXT:
+            return !std::is_same<decltype(&T::Process_vkGetShaderModuleCreateInfoIdentifierEXT), decltype(&VulkanConsumer::Process_vkGetShaderModuleCreateInfoIdentifierEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetPhysicalDeviceOpticalFlowImageFormatsNV:
+            return !std::is_same<decltype(&T::Process_vkGetPhysicalDeviceOpticalFlowImageFormatsNV), decltype(&VulkanConsumer::Process_vkGetPhysicalDeviceOpticalFlowImageFormatsNV)>::value;
+        case format::ApiCallId::ApiCall_vkCreateOpticalFlowSessionNV:
+            return !std::is_same<decltype(&T::Process_vkCreateOpticalFlowSessionNV), decltype(&VulkanConsumer::Process_vkCreateOpticalFlowSessionNV)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyOpticalFlowSessionNV:
+            return !std::is_same<decltype(&T::Process_vkDestroyOpticalFlowSessionNV), decltype(&VulkanConsumer::Process_vkDestroyOpticalFlowSessionNV)>::value;
+        case format::ApiCallId::ApiCall_vkBindOpticalFlowSessionImageNV:
+            return !std::is_same<decltype(&T::Process_vkBindOpticalFlowSessionImageNV), decltype(&VulkanConsumer::Process_vkBindOpticalFlowSessionImageNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdOpticalFlowExecuteNV:
+            return !std::is_same<decltype(&T::Process_vkCmdOpticalFlowExecuteNV), decltype(&VulkanConsumer::Process_vkCmdOpticalFlowExecuteNV)>::value;
+        case format::ApiCallId::ApiCall_vkCreateShadersEXT:
+            return !std::is_same<decltype(&T::Process_vkCreateShadersEXT), decltype(&VulkanConsumer::Process_vkCreateShadersEXT)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyShaderEXT:
+            return !std::is_same<decltype(&T::Process_vkDestroyShaderEXT), decltype(&VulkanConsumer::Process_vkDestroyShaderEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetShaderBinaryDataEXT:
+            return !std::is_same<decltype(&T::Process_vkGetShaderBinaryDataEXT), decltype(&VulkanConsumer::Process_vkGetShaderBinaryDataEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBindShadersEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdBindShadersEXT), decltype(&VulkanConsumer::Process_vkCmdBindShadersEXT)>::value;
+        case format::ApiCallId::ApiCall_vkGetFramebufferTilePropertiesQCOM:
+            return !std::is_same<decltype(&T::Process_vkGetFramebufferTilePropertiesQCOM), decltype(&VulkanConsumer::Process_vkGetFramebufferTilePropertiesQCOM)>::value;
+        case format::ApiCallId::ApiCall_vkGetDynamicRenderingTilePropertiesQCOM:
+            return !std::is_same<decltype(&T::Process_vkGetDynamicRenderingTilePropertiesQCOM), decltype(&VulkanConsumer::Process_vkGetDynamicRenderingTilePropertiesQCOM)>::value;
+        case format::ApiCallId::ApiCall_vkSetLatencySleepModeNV:
+            return !std::is_same<decltype(&T::Process_vkSetLatencySleepModeNV), decltype(&VulkanConsumer::Process_vkSetLatencySleepModeNV)>::value;
+        case format::ApiCallId::ApiCall_vkLatencySleepNV:
+            return !std::is_same<decltype(&T::Process_vkLatencySleepNV), decltype(&VulkanConsumer::Process_vkLatencySleepNV)>::value;
+        case format::ApiCallId::ApiCall_vkSetLatencyMarkerNV:
+            return !std::is_same<decltype(&T::Process_vkSetLatencyMarkerNV), decltype(&VulkanConsumer::Process_vkSetLatencyMarkerNV)>::value;
+        case format::ApiCallId::ApiCall_vkGetLatencyTimingsNV:
+            return !std::is_same<decltype(&T::Process_vkGetLatencyTimingsNV), decltype(&VulkanConsumer::Process_vkGetLatencyTimingsNV)>::value;
+        case format::ApiCallId::ApiCall_vkQueueNotifyOutOfBandNV:
+            return !std::is_same<decltype(&T::Process_vkQueueNotifyOutOfBandNV), decltype(&VulkanConsumer::Process_vkQueueNotifyOutOfBandNV)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetAttachmentFeedbackLoopEnableEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdSetAttachmentFeedbackLoopEnableEXT), decltype(&VulkanConsumer::Process_vkCmdSetAttachmentFeedbackLoopEnableEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCreateAccelerationStructureKHR:
+            return !std::is_same<decltype(&T::Process_vkCreateAccelerationStructureKHR), decltype(&VulkanConsumer::Process_vkCreateAccelerationStructureKHR)>::value;
+        case format::ApiCallId::ApiCall_vkDestroyAccelerationStructureKHR:
+            return !std::is_same<decltype(&T::Process_vkDestroyAccelerationStructureKHR), decltype(&VulkanConsumer::Process_vkDestroyAccelerationStructureKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBuildAccelerationStructuresKHR), decltype(&VulkanConsumer::Process_vkCmdBuildAccelerationStructuresKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresIndirectKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdBuildAccelerationStructuresIndirectKHR), decltype(&VulkanConsumer::Process_vkCmdBuildAccelerationStructuresIndirectKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCopyAccelerationStructureToMemoryKHR:
+            return !std::is_same<decltype(&T::Process_vkCopyAccelerationStructureToMemoryKHR), decltype(&VulkanConsumer::Process_vkCopyAccelerationStructureToMemoryKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCopyMemoryToAccelerationStructureKHR:
+            return !std::is_same<decltype(&T::Process_vkCopyMemoryToAccelerationStructureKHR), decltype(&VulkanConsumer::Process_vkCopyMemoryToAccelerationStructureKHR)>::value;
+        case format::ApiCallId::ApiCall_vkWriteAccelerationStructuresPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkWriteAccelerationStructuresPropertiesKHR), decltype(&VulkanConsumer::Process_vkWriteAccelerationStructuresPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyAccelerationStructureKHR), decltype(&VulkanConsumer::Process_vkCmdCopyAccelerationStructureKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureToMemoryKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyAccelerationStructureToMemoryKHR), decltype(&VulkanConsumer::Process_vkCmdCopyAccelerationStructureToMemoryKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdCopyMemoryToAccelerationStructureKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdCopyMemoryToAccelerationStructureKHR), decltype(&VulkanConsumer::Process_vkCmdCopyMemoryToAccelerationStructureKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetAccelerationStructureDeviceAddressKHR:
+            return !std::is_same<decltype(&T::Process_vkGetAccelerationStructureDeviceAddressKHR), decltype(&VulkanConsumer::Process_vkGetAccelerationStructureDeviceAddressKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdWriteAccelerationStructuresPropertiesKHR), decltype(&VulkanConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetDeviceAccelerationStructureCompatibilityKHR:
+            return !std::is_same<decltype(&T::Process_vkGetDeviceAccelerationStructureCompatibilityKHR), decltype(&VulkanConsumer::Process_vkGetDeviceAccelerationStructureCompatibilityKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetAccelerationStructureBuildSizesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetAccelerationStructureBuildSizesKHR), decltype(&VulkanConsumer::Process_vkGetAccelerationStructureBuildSizesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdTraceRaysKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdTraceRaysKHR), decltype(&VulkanConsumer::Process_vkCmdTraceRaysKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR:
+            return !std::is_same<decltype(&T::Process_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR), decltype(&VulkanConsumer::Process_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdTraceRaysIndirectKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdTraceRaysIndirectKHR), decltype(&VulkanConsumer::Process_vkCmdTraceRaysIndirectKHR)>::value;
+        case format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupStackSizeKHR:
+            return !std::is_same<decltype(&T::Process_vkGetRayTracingShaderGroupStackSizeKHR), decltype(&VulkanConsumer::Process_vkGetRayTracingShaderGroupStackSizeKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdSetRayTracingPipelineStackSizeKHR:
+            return !std::is_same<decltype(&T::Process_vkCmdSetRayTracingPipelineStackSizeKHR), decltype(&VulkanConsumer::Process_vkCmdSetRayTracingPipelineStackSizeKHR)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMeshTasksEXT), decltype(&VulkanConsumer::Process_vkCmdDrawMeshTasksEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMeshTasksIndirectEXT), decltype(&VulkanConsumer::Process_vkCmdDrawMeshTasksIndirectEXT)>::value;
+        case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountEXT:
+            return !std::is_same<decltype(&T::Process_vkCmdDrawMeshTasksIndirectCountEXT), decltype(&VulkanConsumer::Process_vkCmdDrawMeshTasksIndirectCountEXT)>::value;
+        default:
+            return true;
+    }
+}
+
 GFXRECON_END_NAMESPACE(decode)
 GFXRECON_END_NAMESPACE(gfxrecon)
 
@@ -52,6 +52,11 @@ class VulkanReferencedResourceConsumer : public VulkanReferencedResourceConsumer
 
     virtual ~VulkanReferencedResourceConsumer() override { }
 
+    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const override
+    {
+        return VulkanConsumerOverridesApiCall<VulkanReferencedResourceConsumer>(call_id);
+    }
+
     virtual void Process_vkBeginCommandBuffer(
         const ApiCallInfo&                          call_info,
         VkResult                                    returnValue,
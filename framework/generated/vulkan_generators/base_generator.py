@@ -47,6 +47,10 @@ from generator import (GeneratorOptions, OutputGenerator, noneStr, regSortFeatur
 from vkconventions import VulkanConventions
 
 
+# Matches the identifiers in array length expressions.
+_identifier_re = re.compile(r'\w+')
+
+
 def _make_re_string(list, default=None):
     """Turn a list of strings into a regexp string matching exactly those strings.
     From Khronos genvk.py
@@ -150,6 +154,16 @@ class ValueInfo():
       is_const - True if the member is a const.
     """
 
+    # Tens of thousands of values are created for each generated file, so the members are stored in slots instead of
+    # a per-instance dictionary.
+    __slots__ = (
+        'name', 'base_type', 'full_type', 'pointer_count', 'array_length',
+        'array_length_value', 'array_capacity', 'array_dimension',
+        'platform_base_type', 'platform_full_type', 'bitfield_width',
+        'is_pointer', 'is_optional', 'is_array', 'is_dynamic', 'is_const',
+        'is_com_outptr'
+    )
+
     def __init__(
         self,
         name,
@@ -187,6 +201,287 @@ class ValueInfo():
         self.is_com_outptr = is_com_outptr
 
 
+class RegistryTypeIndex():
+    """RegistryTypeIndex - Lookup tables for Vulkan registry type information.
+    Built once per registry load and shared by every generator that uses the
+    registry, replacing XPath scans of the registry tree with dictionary lookups.
+
+    Members:
+      tree - The registry ElementTree the index was built from.
+      handle_names - Set of handle typenames declared with a <name> element.
+      union_names - Set of union typenames.
+      struct_member_types - Map of struct and union names to lists of
+        (member name, member typename, is_pointer, is_array) tuples.
+      extension_structs - The registry's validextensionstructs, as a tuple of
+        (struct name, tuple of extension struct names) tuples, that the pNext
+        tables were built from.
+      extension_struct_handles - Map of pNext extension struct names to
+        (has_handles, has_handle_ptrs) tuples.
+      pnext_handles - Map of struct names to (found_handles, found_handle_ptrs)
+        tuples for the extension structs that may appear in their pNext chains.
+      structs_with_handles - Set of struct names for structs that have handle
+        members, members that are structs that transitively contain handles, or
+        pNext chains that can reference extension structs with handles.
+      value_infos - Map of (platform types file, tuple of <param> or <member>
+        elements) to the lists of ValueInfo created for the elements, which is
+        filled as generators process commands and structs.
+    """
+
+    def __init__(self, registry):
+        self.tree = registry.tree
+        self.handle_names = set()
+        self.union_names = set()
+        self.struct_member_types = dict()
+        self.extension_structs = None
+        self.extension_struct_handles = dict()
+        self.pnext_handles = dict()
+        self.structs_with_handles = set()
+        self.value_infos = dict()
+
+        for elem in registry.tree.findall('types/type'):
+            category = elem.get('category')
+            if category == 'handle':
+                name_elem = elem.find('name')
+                if name_elem is not None:
+                    self.handle_names.add(name_elem.text)
+
+        # Typedict keys are either typenames or (typename, api) tuples for API
+        # specific definitions, which the registry lookup selects when present.
+        for key in registry.typedict:
+            name = key if isinstance(key, str) else key[0]
+            if name not in self.struct_member_types:
+                type_info = registry.lookupElementInfo(name, registry.typedict)
+                if type_info:
+                    category = type_info.elem.get('category')
+                    if category in ['struct', 'union']:
+                        self.struct_member_types[name] = [
+                            self.__get_member_type(member)
+                            for member in type_info.elem.findall('.//member')
+                        ]
+                        if category == 'union':
+                            self.union_names.add(name)
+
+        self.__update_extension_structs(registry)
+
+    def __update_extension_structs(self, registry):
+        """Build the pNext tables from the registry's valid extension structs,
+        which Registry.apiGen() fills for each generated target.  The tables
+        are only rebuilt when the valid extension structs have changed.
+        """
+        extension_structs = tuple(
+            (typename, tuple(struct_names)) for typename, struct_names in
+            sorted(registry.validextensionstructs.items())
+        )
+        if extension_structs == self.extension_structs:
+            return
+
+        self.extension_structs = extension_structs
+        self.extension_struct_handles = dict()
+        self.pnext_handles = dict()
+        self.structs_with_handles = set()
+
+        for typename, struct_names in extension_structs:
+            found_handles = False
+            found_handle_ptrs = False
+            for struct_name in struct_names:
+                if struct_name not in self.extension_struct_handles:
+                    self.extension_struct_handles[
+                        struct_name] = self.__check_struct_handles(struct_name)
+                has_handles, has_handle_ptrs = self.extension_struct_handles[
+                    struct_name]
+                found_handles = found_handles or has_handles
+                found_handle_ptrs = found_handle_ptrs or has_handle_ptrs
+            self.pnext_handles[typename] = (found_handles, found_handle_ptrs)
+
+        for component in self.__get_struct_components():
+            self.__add_struct_component_handles(component)
+
+    def __get_member_type(self, member):
+        type_elem = member.find('type')
+        name_elem = member.find('name')
+        member_type = type_elem.text if type_elem is not None else None
+        is_pointer = bool(
+            (type_elem is not None) and type_elem.tail
+            and ('*' in type_elem.tail)
+        )
+        is_array = bool(
+            member.get('len') or (
+                (name_elem is not None) and name_elem.tail
+                and ('[' in name_elem.tail)
+            )
+        )
+        return (name_elem.text, member_type, is_pointer, is_array)
+
+    def __check_struct_handles(self, struct_name):
+        has_handles = False
+        has_handle_ptrs = False
+        for member_name, member_type, is_pointer, is_array in self.struct_member_types.get(
+            struct_name, []
+        ):
+            if member_type in self.handle_names:
+                has_handles = True
+                if is_pointer:
+                    has_handle_ptrs = True
+        return (has_handles, has_handle_ptrs)
+
+    def __get_struct_dependencies(self, struct_name):
+        return [
+            member_type for member_name, member_type, is_pointer, is_array in
+            self.struct_member_types[struct_name]
+            if (member_type in self.struct_member_types) and (
+                member_type not in self.union_names
+            )
+        ]
+
+    def __get_struct_components(self):
+        """Return the strongly connected components of the graph of structs and
+        the struct types of their members, with the components for member types
+        ordered before the components for the structs that contain them.  Uses
+        an iterative version of Tarjan's algorithm.
+        """
+        indices = dict()
+        lowlinks = dict()
+        stack = []
+        on_stack = set()
+        components = []
+
+        for root in sorted(self.struct_member_types):
+            if (root in self.union_names) or (root in indices):
+                continue
+
+            indices[root] = lowlinks[root] = len(indices)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self.__get_struct_dependencies(root)))]
+            while work:
+                struct_name, dependencies = work[-1]
+                dependency = next(dependencies, None)
+                if dependency is not None:
+                    if dependency not in indices:
+                        indices[dependency] = lowlinks[dependency] = len(
+                            indices
+                        )
+                        stack.append(dependency)
+                        on_stack.add(dependency)
+                        work.append(
+                            (
+                                dependency,
+                                iter(
+                                    self.__get_struct_dependencies(dependency)
+                                )
+                            )
+                        )
+                    elif dependency in on_stack:
+                        lowlinks[struct_name] = min(
+                            lowlinks[struct_name], indices[dependency]
+                        )
+                    continue
+
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlinks[parent] = min(
+                        lowlinks[parent], lowlinks[struct_name]
+                    )
+
+                if lowlinks[struct_name] == indices[struct_name]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == struct_name:
+                            break
+                    components.append(component)
+
+        return components
+
+    def __add_struct_component_handles(self, component):
+        """Determine if the structs in a strongly connected component contain
+        handles, after the components for all of their member struct types
+        have been processed.  Structs in the same component reference each
+        other, so either all of them contain handles or none of them do.
+        """
+        if any(
+            (member_type in self.handle_names)
+            or (member_type in self.structs_with_handles) or (
+                ('pNext' in member_name)
+                and self.pnext_handles.get(struct_name, (False, False))[0]
+            ) for struct_name in component
+            for member_name, member_type, _, _ in
+            self.struct_member_types[struct_name]
+        ):
+            self.structs_with_handles.update(component)
+
+    @staticmethod
+    def get(registry):
+        """Return the index for a registry, building it on first use.  The index
+        is stored with the registry, so that generators sharing a registry share
+        the index.  It is rebuilt if a different tree is loaded into the registry.
+        """
+        index = getattr(registry, 'gfxr_type_index', None)
+        if (index is None) or (index.tree is not registry.tree):
+            index = RegistryTypeIndex(registry)
+            registry.gfxr_type_index = index
+        return index
+
+    @staticmethod
+    def update(registry):
+        """Rebuild the pNext tables of the index stored with a registry if the
+        registry's valid extension structs have changed since the index was
+        built, as they do when a shared registry generates another target.
+        """
+        index = getattr(registry, 'gfxr_type_index', None)
+        if (index is not None) and (index.tree is registry.tree):
+            index.__update_extension_structs(registry)
+
+
+class OutputBuffer():
+    """OutputBuffer - Collects the text written to a generated file in memory.
+    Generators write many small fragments to their output file.  The fragments
+    are appended to a list and joined once, so the file receives a single bulk
+    write when the buffer is committed.
+
+    Members:
+      file - The output file that receives the buffered text.
+      fragments - List of text fragments written since the buffer was created.
+      size - Number of characters written to the buffer.
+    """
+
+    def __init__(self, file):
+        self.file = file
+        self.fragments = []
+        self.size = 0
+
+    @property
+    def closed(self):
+        return self.file.closed
+
+    @property
+    def name(self):
+        return self.file.name
+
+    def write(self, text):
+        self.fragments.append(text)
+        self.size += len(text)
+        return len(text)
+
+    def tell(self):
+        return self.size
+
+    def flush(self):
+        """Fragments are only written to the file by commit()."""
+
+    def getvalue(self):
+        return ''.join(self.fragments)
+
+    def commit(self):
+        """Write the buffered text to the output file, returning the file."""
+        self.file.write(self.getvalue())
+        self.fragments = []
+        return self.file
+
+
 class BaseGeneratorOptions(GeneratorOptions):
     """BaseGeneratorOptions - subclass of GeneratorOptions.
     Options for Vulkan API parameter encoding and decoding C++ code generation.
@@ -282,6 +577,10 @@ class BaseGenerator(OutputGenerator):
     Base class for Vulkan API parameter encoding and decoding generators.
     """
 
+    # Share the ValueInfo lists created for registry commands and structs with the other generators that use the
+    # registry.  Generators that modify ValueInfo objects must create their own.
+    share_value_info = True
+
     def __init__(
         self,
         process_cmds,
@@ -389,6 +688,7 @@ class BaseGenerator(OutputGenerator):
         self.enum_names = set()  # Set of Vulkan enumeration typenames
         self.enumAliases = dict()  # Map of enum names to aliases
         self.enumEnumerants = dict()  # Map of enum names to enumerants
+        self.enumerant_elems = dict()  # Map of enumerant names to <enum> elements
 
         # Type processing options
         self.process_cmds = process_cmds  # Populate the feature_cmd_params map
@@ -401,11 +701,14 @@ class BaseGenerator(OutputGenerator):
             self.feature_struct_aliases = OrderedDict()            # Map of struct names to aliases
             self.feature_union_members = OrderedDict()             # Map of union names to lists of per-member ValueInfo
             self.feature_union_aliases = OrderedDict()             # Map of union names to aliases
-            self.extension_structs_with_handles = OrderedDict()     # Map of extension struct names to a Boolean value indicating that a struct member has a handle type
-            self.extension_structs_with_handle_ptrs = OrderedDict()  # Map of extension struct names to a Boolean value indicating that a struct member with a handle type is a pointer
         if self.process_cmds:
             self.feature_cmd_params = OrderedDict()                # Map of cmd names to lists of per-parameter ValueInfo
 
+        # Memoized type introspection results, reset when the current feature or the set of known types changes
+        self.invocation_type_names = dict()  # Map of base types to encoder/decoder invocation type names
+        self.decoded_param_types = dict()    # Map of ValueInfo type properties to decoded parameter types
+        self.key_word_in_types = dict()      # Map of (base type, key word) to key word search results
+
     #
     # Indicates that the current feature has C++ code to generate.
     # The subclass should override this method.
@@ -420,6 +723,14 @@ class BaseGenerator(OutputGenerator):
         """Method override."""
         OutputGenerator.beginFile(self, gen_opts)
 
+        # Registry.apiGen() has filled the valid extension structs for this
+        # target, which may differ from those of the target that built the
+        # shared registry type index.
+        RegistryTypeIndex.update(self.registry)
+
+        # Buffer the generated code and write it to the file with endFile().
+        self.outFile = OutputBuffer(self.outFile)
+
         if gen_opts.blacklists:
             self.__load_blacklists(gen_opts.blacklists)
         if gen_opts.platform_types:
@@ -463,6 +774,9 @@ class BaseGenerator(OutputGenerator):
             self.newline()
             write('#endif', file=self.outFile)
 
+        if isinstance(self.outFile, OutputBuffer):
+            self.outFile = self.outFile.commit()
+
         # Finish processing in superclass
         OutputGenerator.endFile(self)
 
@@ -476,6 +790,7 @@ class BaseGenerator(OutputGenerator):
             self.feature_struct_aliases = OrderedDict()
         if self.process_cmds:
             self.feature_cmd_params = OrderedDict()
+        self.reset_type_caches()
 
         # Some generation cases require that extra feature protection be suppressed
         if self.genOpts.protect_feature:
@@ -539,6 +854,8 @@ class BaseGenerator(OutputGenerator):
         # If the type is a struct type, traverse the imbedded <member> tags
         # generating a structure. Otherwise, emit the tag text.
         category = type_elem.get('category')
+        if category in ['struct', 'union', 'handle', 'bitmask']:
+            self.reset_type_caches()
         if (category == 'struct' or category == 'union'):
             self.struct_names.add(name)
             # Skip code generation for union encode/decode functions.
@@ -621,6 +938,7 @@ class BaseGenerator(OutputGenerator):
                     name = elem.get('name')
                     if name and not elem.get('alias'):
                         enumerants[name] = elem.get('value')
+                        self.enumerant_elems[name] = elem
             self.enumEnumerants[group_name] = enumerants
         else:
             self.enumAliases[group_name] = alias
@@ -664,6 +982,19 @@ class BaseGenerator(OutputGenerator):
         """Generate a list of ValueInfo objects from a list of <param> or <member> tags
          params - list of <param> or <member> tags to process
         """
+        if not self.share_value_info:
+            return self.__make_value_info(params)
+
+        # The lists are shared by the generators that use the registry, and must not be modified.
+        key = (self.genOpts.platform_types, tuple(params))
+        value_infos = RegistryTypeIndex.get(self.registry).value_infos
+        values = value_infos.get(key)
+        if values is None:
+            values = self.__make_value_info(params)
+            value_infos[key] = values
+        return values
+
+    def __make_value_info(self, params):
         values = []
         for param in params:
             # Get name
@@ -733,17 +1064,30 @@ class BaseGenerator(OutputGenerator):
                 )
             )
 
-        # Link array values to their corresponding length values
-        for array_value in [v for v in values if v.array_length]:
-            for v in values:
-                if re.search(
-                    r'\b{}\b'.format(v.name), array_value.array_length
-                ):
-                    array_value.array_length_value = v
-                    break
+        # Link array values to their corresponding length values, which are the first values with names that appear
+        # in the array length expressions
+        value_indices = dict()
+        for index, value in enumerate(values):
+            value_indices.setdefault(value.name, index)
+
+        for array_value in values:
+            if array_value.array_length:
+                indices = [
+                    value_indices[token] for token in
+                    _identifier_re.findall(array_value.array_length)
+                    if token in value_indices
+                ]
+                if indices:
+                    array_value.array_length_value = values[min(indices)]
 
         return values
 
+    def reset_type_caches(self):
+        """Discard memoized type introspection results."""
+        self.invocation_type_names.clear()
+        self.decoded_param_types.clear()
+        self.key_word_in_types.clear()
+
     def is_struct(self, base_type):
         """Check for struct type."""
         if (
@@ -939,63 +1283,14 @@ class BaseGenerator(OutputGenerator):
 
     def check_struct_pnext_handles(self, typename):
         """Determines if the specified struct type can reference pNext extension structs that contain handles."""
-        found_handles = False
-        found_handle_ptrs = False
-        valid_extension_structs = self.registry.validextensionstructs.get(
-            typename
+        return RegistryTypeIndex.get(self.registry).pnext_handles.get(
+            typename, (False, False)
         )
-        if valid_extension_structs:
-            # Need to search the XML tree for pNext structures that have not been processed yet.
-            for struct_name in valid_extension_structs:
-                # Check for cached results from a previous check for this struct
-                if struct_name in self.extension_structs_with_handles:
-                    if self.extension_structs_with_handles[struct_name]:
-                        found_handles = True
-                    if self.extension_structs_with_handle_ptrs[struct_name]:
-                        found_handle_ptrs = True
-                else:
-                    # If a pre-existing result was not found, check the XML registry for the struct
-                    has_handles = False
-                    hasHandlePtrs = False
-                    type_info = self.registry.lookupElementInfo(
-                        struct_name, self.registry.typedict
-                    )
-                    if type_info:
-                        member_infos = [
-                            member for member in
-                            type_info.elem.findall('.//member/type')
-                        ]
-                        if member_infos:
-                            for member_info in member_infos:
-                                found = self.registry.tree.find(
-                                    "types/type/[name='" + member_info.text
-                                    + "'][@category='handle']"
-                                )
-                                if found:
-                                    has_handles = True
-                                    self.extension_structs_with_handles[
-                                        struct_name] = True
-                                    if member_info.tail and (
-                                        '*' in member_info.tail
-                                    ):
-                                        self.extension_structs_with_handle_ptrs[
-                                            struct_name] = True
-                                        hasHandlePtrs = True
-                                    else:
-                                        self.extension_structs_with_handle_ptrs[
-                                            struct_name] = False
-
-                    if has_handles:
-                        found_handles = True
-                        if hasHandlePtrs:
-                            found_handle_ptrs = True
-                    else:
-                        self.extension_structs_with_handles[struct_name
-                                                            ] = False
-                        self.extension_structs_with_handle_ptrs[struct_name
-                                                                ] = False
-
-        return found_handles, found_handle_ptrs
+
+    def struct_has_handles(self, typename):
+        """Determines if the specified struct type transitively contains handles."""
+        return typename in RegistryTypeIndex.get(self.registry
+                                                 ).structs_with_handles
 
     def check_struct_member_handles(
         self,
@@ -1025,7 +1320,9 @@ class BaseGenerator(OutputGenerator):
                 ):
                     has_handle_pointer = True
             elif self.is_struct(value.base_type) and (
-                (value.base_type in structs_with_handles) and
+                self.__is_struct_with_handles(
+                    value.base_type, structs_with_handles
+                ) and
                 ((not ignore_output) or (not '_Out_' in value.full_type))
             ):
                 # The member is a struct that contains a handle.
@@ -1073,19 +1370,21 @@ class BaseGenerator(OutputGenerator):
             structs_with_map_data[typename] = map_data
 
         if handles:
-            # Process the list of struct members a second time to check for
-            # members with the same type as the struct.  The current struct
-            # type has not been added to the table of structs with handles
-            # yet, so we must check the struct members a second time, looking
-            # for members with the struct type, now that we know the current
-            # struct type contains members that are handles/objects.  Any
-            # struct members that have the same type as the struct must be
-            # added to the handle member list.
-            for value in self.feature_struct_members[typename]:
-                if (value.base_type == typename) and (
-                    (not ignore_output) or (not '_Out_' in value.full_type)
-                ):
-                    handles.append(value)
+            if self.is_dx12_class():
+                # Process the list of struct members a second time to check for
+                # members with the same type as the struct.  The current struct
+                # type has not been added to the table of structs with handles
+                # yet, so we must check the struct members a second time, looking
+                # for members with the struct type, now that we know the current
+                # struct type contains members that are handles/objects.  Any
+                # struct members that have the same type as the struct must be
+                # added to the handle member list.  Vulkan structs use the
+                # registry struct graph, which already includes these members.
+                for value in self.feature_struct_members[typename]:
+                    if (value.base_type == typename) and (
+                        (not ignore_output) or (not '_Out_' in value.full_type)
+                    ):
+                        handles.append(value)
 
             structs_with_handles[typename] = handles
             if (structs_with_handle_ptrs is not None) and has_handle_pointer:
@@ -1093,6 +1392,14 @@ class BaseGenerator(OutputGenerator):
             return True
         return False
 
+    def __is_struct_with_handles(self, typename, structs_with_handles):
+        """Determines if a struct member type contains handles.  DX12 structs are checked against the structs
+        processed so far, while Vulkan structs are checked with the registry struct graph.
+        """
+        if self.is_dx12_class():
+            return typename in structs_with_handles
+        return self.struct_has_handles(typename)
+
     def get_generic_struct_handle_type_value(self, struct_name, member_name):
         """For a struct member that contains a generic handle value, retrieve the struct member
         containing an enum value defining the specific handle type.  Generic handles have an
@@ -1176,6 +1483,13 @@ class BaseGenerator(OutputGenerator):
 
     def make_invocation_type_name(self, base_type):
         """Convert a type name to a string to be used as part of an encoder/decoder function/method name."""
+        type_name = self.invocation_type_names.get(base_type)
+        if type_name is None:
+            type_name = self.__make_invocation_type_name(base_type)
+            self.invocation_type_names[base_type] = type_name
+        return type_name
+
+    def __make_invocation_type_name(self, base_type):
         if self.is_struct(base_type):
             return base_type
         elif self.is_handle(base_type):
@@ -1210,6 +1524,17 @@ class BaseGenerator(OutputGenerator):
 
     def make_decoded_param_type(self, value):
         """Create a type to use for a decoded parameter, using the decoder wrapper types for pointers."""
+        key = (
+            value.base_type, value.is_pointer, value.is_array,
+            value.pointer_count, value.array_dimension, value.is_com_outptr
+        )
+        type_name = self.decoded_param_types.get(key)
+        if type_name is None:
+            type_name = self.__make_decoded_param_type(value)
+            self.decoded_param_types[key] = type_name
+        return type_name
+
+    def __make_decoded_param_type(self, value):
         type_name = value.base_type
 
         # is_pointer will be False for static arrays.
@@ -1560,13 +1885,38 @@ class BaseGenerator(OutputGenerator):
     def is_flags_enum_64bit(self, enum):
         flag_type = BitsEnumToFlagsTypedef(enum)
         return self.is_64bit_flags(flag_type)
+
+    def get_enumerant_values(self, enum):
+        """Returns a list of (value, name) tuples for the enumerants of an enum, sorted by value, or None if the
+        value of an enumerant cannot be determined or does not fit in an int64_t.
+        """
+        values = []
+        for name, value in self.enumEnumerants[enum].items():
+            number = None
+            if value is not None:
+                try:
+                    number = int(value, 0)
+                except ValueError:
+                    pass
+            elif name in self.enumerant_elems:
+                number = self.enumToValue(self.enumerant_elems[name], True)[0]
+            if (number is None) or not (-2**63 <= number < 2**63):
+                return None
+            values.append((number, name))
+        return sorted(values)
     
     def is_has_specific_key_word_in_type(self, value, key_word):
-        if key_word in value.base_type:
-            return True
-        
-        values = self.feature_struct_members.get(value.base_type)
-        if values:
-            for value in values:
-                return self.is_has_specific_key_word_in_type(value, key_word)
-        return False  
+        """Determine if the key word is part of the value's type name, or of the type name of the first member of the
+        value's struct type, following first members to any depth."""
+        key = (value.base_type, key_word)
+        result = self.key_word_in_types.get(key)
+        if result is None:
+            result = False
+            if key_word in value.base_type:
+                result = True
+            else:
+                values = self.feature_struct_members.get(value.base_type)
+                if values:
+                    result = self.is_has_specific_key_word_in_type(values[0], key_word)
+            self.key_word_in_types[key] = result
+        return result
@@ -40,12 +40,21 @@
 # limitations under the License.
 
 import argparse
+import contextlib
+import io
+import multiprocessing
 import os
 import pdb
 import sys
+import tempfile
 import time
+import traceback
+from collections import OrderedDict, defaultdict
 from registry.reg import Registry, etree
 from generator import write
+from generator_profiler import GeneratorProfiler
+from target_cache import TargetCache, replace_if_changed
+from output_modes import output_mode_args, add_output_mode_args
 
 # API Call Decoders
 from vulkan_decoder_body_generator import VulkanDecoderBodyGenerator, VulkanDecoderBodyGeneratorOptions
@@ -125,6 +134,12 @@ def end_timer(timeit, msg):
         start_time = None
 
 
+# Error/warning and diagnostic output files, replaced by the command line
+# -errfile and -diagfile options.
+err_warn = sys.stderr
+diag = None
+
+
 # JSON files for customizing code generation
 default_blacklists = 'blacklists.json'
 default_platform_types = 'platform_types.json'
@@ -241,7 +256,8 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=False,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            reserve_decode_memory=args.decoder_reserve
         )
     ]
 
@@ -407,7 +423,8 @@ def make_gen_opts(args):
             prefix_text        = prefix_strings + vk_prefix_strings,
             protect_file       = False,
             protect_feature    = False,
-            extraVulkanHeaders=extraVulkanHeaders)
+            extraVulkanHeaders=extraVulkanHeaders,
+            buffered_output    = args.cpp_buffered_output)
     ]
 
     gen_opts['generated_vulkan_cpp_structs.h'] = [
@@ -553,7 +570,9 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=False,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            lock_free_cmd_encoding=args.lock_free_cmd_encoding,
+            deferred_cmd_encoding=args.deferred_cmd_encoding
         )
     ]
 
@@ -593,7 +612,8 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=True,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            lazy_device_table=args.lazy_device_table
         )
     ]
 
@@ -605,7 +625,8 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=True,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            perfect_hash_func_table=args.perfect_hash_func_table
         )
     ]
 
@@ -715,7 +736,8 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=True,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            use_lookup_tables=args.enum_string_tables
         )
     ]
 
@@ -729,7 +751,8 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=False,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            use_lookup_tables=args.enum_string_tables
         )
     ]
 
@@ -743,7 +766,8 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=True,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            paged_object_info_tables=args.paged_object_info_tables
         )
     ]
 
@@ -757,7 +781,9 @@ def make_gen_opts(args):
             prefix_text=prefix_strings + vk_prefix_strings,
             protect_file=True,
             protect_feature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            paged_state_tables=args.paged_state_tables,
+            sharded_state_tables=args.sharded_state_tables
         )
     ]
 
@@ -844,7 +870,8 @@ def make_gen_opts(args):
             prefixText=prefix_strings + vk_prefix_strings,
             protectFile=False,
             protectFeature=False,
-            extraVulkanHeaders=extraVulkanHeaders
+            extraVulkanHeaders=extraVulkanHeaders,
+            use_name_tables=args.enum_json_tables
         )
     ]
 
@@ -941,11 +968,296 @@ def gen_target(args):
         return None
 
 
+def make_registry_tree(args):
+    """Parse the registry and video XML files into element trees, then apply any
+    XML patches and merge the XML files from the configs directory into the
+    registry tree.  Returns a (tree, video_tree) tuple.
+    """
+    start_timer(args.time)
+    tree = etree.parse(args.registry)
+    video_tree = etree.parse(args.video)
+    end_timer(args.time, '* Time to make ElementTree =')
+
+    # Apply any temporary patches to the xml to allow correct code generation
+    # from it. These should be reviewed and removed when the xml is fixed upstream.
+    start_timer(args.time)
+    # There are no current patches needed, but here is an example of how to patch the XML
+    # after parsing to add a missing single attribute:
+    # Workaround 1.3.264 VkFrameBoundaryEXT.pTag lacking len field:
+    # <https://github.com/KhronosGroup/Vulkan-Docs/pull/2240>
+    # if ptag_member := tree.find('types/type[@name="VkFrameBoundaryEXT"]/member[name="pTag"]'):
+    #    ptag_member.set('len', 'tagSize')
+    end_timer(args.time, '* Time to patch ElementTree =')
+
+    # Extend the vk.xml tree with XML files from the config dir
+    for filename in os.listdir(args.configs):
+        if filename.endswith('.xml'):
+            extend_xml(tree, os.path.join(args.configs, filename))
+
+    return (tree, video_tree)
+
+
+def load_registry(args, tree, gen, options):
+    """Create a Registry for the specified generator and load the parsed
+    registry tree into it.
+    """
+    reg = Registry(gen, options)
+
+    start_timer(args.time)
+    reg.loadElementTree(tree)
+    end_timer(args.time, '* Time to parse ElementTree =')
+
+    if (args.validate):
+        reg.validateGroups()
+
+    if (args.dump):
+        write('* Dumping registry to regdump.txt', file=sys.stderr)
+        reg.dumpReg(filehandle=open('regdump.txt', 'w', encoding='utf-8'))
+
+    return reg
+
+
+def make_registry(args, gen, options):
+    """Parse and load the registry.  Returns a (reg, video_tree) tuple."""
+    (tree, video_tree) = make_registry_tree(args)
+    return (load_registry(args, tree, gen, options), video_tree)
+
+
+def reset_registry(reg):
+    """Clear the state left on a Registry by apiGen(), so that it can generate
+    another target.  Registry.apiReset() only clears the required/declared
+    state of the type, enum, and command entries.  The lists that apiGen()
+    appends to are recreated here, as they are when a Registry is created.
+    """
+    reg.apiReset()
+    for ext in reg.extdict.values():
+        ext.resetState()
+    reg.requiredextensions = []
+    reg.validextensionstructs = defaultdict(list)
+    reg.commandextensionsuccesses = []
+    reg.commandextensionerrors = []
+
+
+def generate(args, reg, gen, options, video_tree):
+    """Generate a single target with a loaded Registry.  The Registry may have
+    been loaded for a different target, in which case it is rebound to the
+    specified generator and options.
+    """
+    if reg.gen is not gen:
+        reset_registry(reg)
+        reg.setGenerator(gen)
+        reg.genOpts = options
+        options.registry = reg
+    gen.VIDEO_TREE = video_tree
+
+    # Generate to a temporary directory and only replace the target file when
+    # its content changes, so that an unchanged file keeps its timestamp.
+    output_dir = options.directory
+    with tempfile.TemporaryDirectory(dir=output_dir) as temp_dir:
+        options.directory = temp_dir
+        profiler = None
+        if (args.debug):
+            pdb.runctx('reg.apiGen()', globals(), locals())
+        else:
+            if args.profile_dir:
+                profiler = GeneratorProfiler(options.filename, gen)
+                profiler.start()
+            start_timer(args.time)
+            reg.apiGen()
+            end_timer(
+                args.time, '* Time to generate ' + options.filename + ' ='
+            )
+            if profiler:
+                profiler.stop(os.path.join(temp_dir, options.filename))
+        options.directory = output_dir
+
+        output_path = os.path.join(output_dir, options.filename)
+        replaced = replace_if_changed(
+            os.path.join(temp_dir, options.filename), output_path
+        )
+
+    if profiler:
+        profiler.write(args.profile_dir)
+
+    if args.cache_dir:
+        TargetCache(args.cache_dir).update(
+            options.filename, output_path,
+            make_target_input_hash(args, gen, options)
+        )
+
+    if not args.quiet:
+        write(
+            '* Generated' if replaced else '* Unchanged',
+            options.filename,
+            file=sys.stderr
+        )
+
+
+def make_target_input_hash(args, gen, options):
+    """Create a hash of the registry files, configuration files, and generator
+    and Registry sources used to generate a target.
+    """
+    input_files = [
+        args.registry, args.video,
+        os.path.abspath(__file__), sys.modules[Registry.__module__].__file__
+    ]
+    input_files += [
+        os.path.join(args.configs, filename)
+        for filename in sorted(os.listdir(args.configs))
+        if filename.endswith('.json') or filename.endswith('.xml')
+    ]
+    extra = [options.protect_file, options.protect_feature]
+    extra += options.extraVulkanHeaders
+    extra += [
+        '{}={}'.format(name, getattr(args, name)) for name in output_mode_args
+    ]
+    return TargetCache(args.cache_dir).make_input_hash(
+        options.filename, input_files, type(gen), extra
+    )
+
+
+def is_target_up_to_date(args, gen, options):
+    """Determine if a target can be skipped because its output was generated
+    from the current inputs.  Always returns False when caching is disabled.
+    """
+    if not args.cache_dir:
+        return False
+    return TargetCache(args.cache_dir).is_up_to_date(
+        options.filename, os.path.join(options.directory, options.filename),
+        make_target_input_hash(args, gen, options)
+    )
+
+
+def get_out_of_date_targets(args, targets):
+    """Return the list of targets that need to be generated, skipping targets
+    that are up to date with their inputs.
+    """
+    out_of_date = []
+    for target in targets:
+        args.target = target
+        result = gen_target(args)
+        if (result is not None) and is_target_up_to_date(args, *result):
+            print('Skipping', target, '(up to date)')
+        else:
+            out_of_date.append(target)
+    return out_of_date
+
+
+def load_shared_registry(args, target):
+    """Parse and load the registry for generate_targets(), using the generator
+    for the specified target to create the Registry.  Returns a
+    (reg, video_tree) tuple.
+    """
+    args.target = target
+    result = gen_target(args)
+    if result is None:
+        raise Exception('Error: unknown target ' + target)
+    (gen, options) = result
+    return make_registry(args, gen, options)
+
+
+def generate_target(args, reg, video_tree, target):
+    """Generate the specified target with a shared Registry."""
+    args.target = target
+    result = gen_target(args)
+    if result is not None:
+        (gen, options) = result
+        generate(args, reg, gen, options, video_tree)
+
+
+# Arguments and (reg, video_tree) tuple used by generate_targets() worker processes.
+worker_args = None
+worker_registry = None
+
+
+def init_worker(args, shared_registry):
+    """Initialize a generate_targets() worker process.  Forked workers receive
+    the registry loaded by the parent process.  Otherwise shared_registry is
+    None and the worker parses and loads its own copy of the registry, once
+    for all of the targets that it generates.
+    """
+    global worker_args, worker_registry
+    worker_args = args
+    worker_registry = shared_registry
+
+
+def generate_worker_target(target):
+    """Generate a target in a worker process, returning the console output
+    from the generator so that the output for each target can be printed as a
+    group.
+    """
+    global err_warn, worker_registry
+    output = io.StringIO()
+    err_warn = output
+    with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        print('Generating', target)
+        try:
+            if worker_registry is None:
+                worker_registry = load_shared_registry(worker_args, target)
+            (reg, video_tree) = worker_registry
+            generate_target(worker_args, reg, video_tree, target)
+            success = True
+        except Exception:
+            traceback.print_exc()
+            success = False
+    return (output.getvalue(), success)
+
+
+def generate_targets(args, targets, jobs=1):
+    """Generate multiple targets with a single parsed and loaded registry that
+    is shared between all of the target generators.  When jobs is greater
+    than one, the targets are generated by a pool of worker processes, with
+    the console output for each target printed in target order.  The
+    args.target field is updated with the name of the target that is being
+    generated.
+    """
+    # Remove duplicates so that two workers do not write the same file.
+    targets = get_out_of_date_targets(
+        args, list(OrderedDict.fromkeys(targets))
+    )
+    if not targets:
+        return
+
+    if (jobs <= 1) or (len(targets) == 1):
+        (reg, video_tree) = load_shared_registry(args, targets[0])
+        for target in targets:
+            print('Generating', target)
+            generate_target(args, reg, video_tree, target)
+        return
+
+    # Workers created with fork inherit the registry from this process, which
+    # is parsed once. Workers created with spawn load their own registry.
+    if 'fork' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('fork')
+        shared_registry = load_shared_registry(args, targets[0])
+    else:
+        context = multiprocessing.get_context()
+        shared_registry = None
+
+    failed_targets = []
+    with context.Pool(
+        min(jobs, len(targets)), init_worker, (args, shared_registry)
+    ) as pool:
+        for target, (output, success) in zip(
+            targets, pool.imap(generate_worker_target, targets)
+        ):
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            if not success:
+                failed_targets.append(target)
+
+    if failed_targets:
+        raise Exception(
+            'Error: failed to generate ' + ', '.join(failed_targets)
+        )
+
+
 # -feature name
 # -extension name
 # For both, "name" may be a single name, or a space-separated list
 # of names, or a regular expression.
-if __name__ == '__main__':
+def make_arg_parser():
+    """Create the command line argument parser for gencode.py."""
     parser = argparse.ArgumentParser()
 
     parser.add_argument('-debug', action='store_true', help='Enable debugging')
@@ -973,6 +1285,18 @@ if __name__ == '__main__':
     parser.add_argument(
         '-profile', action='store_true', help='Enable profiling'
     )
+    parser.add_argument(
+        '-profile-dir',
+        action='store',
+        dest='profile_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Directory for writing a JSON file per target with the wall time, CPU time,',
+                'peak memory, and bytes emitted for each generator phase.'
+            ]
+        )
+    )
     parser.add_argument(
         '-registry',
         action='store',
@@ -1032,7 +1356,25 @@ if __name__ == '__main__':
         help=
         'Specify directory containing JSON configuration files for generators'
     )
+    add_output_mode_args(parser, '-')
+    parser.add_argument(
+        '-cache-dir',
+        action='store',
+        dest='cache_dir',
+        default=None,
+        help='\n'.join(
+            [
+                'Directory for recording a hash of the inputs used to generate each target.',
+                'Targets that were generated from the same inputs are skipped.'
+            ]
+        )
+    )
 
+    return parser
+
+
+if __name__ == '__main__':
+    parser = make_arg_parser()
     args = parser.parse_args()
 
     # create error/warning & diagnostic files
@@ -1048,49 +1390,14 @@ if __name__ == '__main__':
 
     (gen, options) = gen_target(args)
 
-    reg = Registry(gen, options)
+    if is_target_up_to_date(args, gen, options):
+        if not args.quiet:
+            write('* Skipped', options.filename, '(up to date)', file=sys.stderr)
+        sys.exit(0)
 
     ## @note We parse vk.xml to an in-memory element tree and then extract the info we need
     ## from that into the Registry object once per output file we generate rather than once
-    ## per run of the top-level generation script.
-    start_timer(args.time)
-    tree = etree.parse(args.registry)
-    gen.VIDEO_TREE = etree.parse(args.video)
-    end_timer(args.time, '* Time to make ElementTree =')
-
-    # Apply any temporary patches to the xml to allow correct code generation
-    # from it. These should be reviewed and removed when the xml is fixed upstream.
-    start_timer(args.time)
-    # There are no current patches needed, but here is an example of how to patch the XML
-    # after parsing to add a missing single attribute:
-    # Workaround 1.3.264 VkFrameBoundaryEXT.pTag lacking len field:
-    # <https://github.com/KhronosGroup/Vulkan-Docs/pull/2240>
-    # if ptag_member := tree.find('types/type[@name="VkFrameBoundaryEXT"]/member[name="pTag"]'):
-    #    ptag_member.set('len', 'tagSize')
-    end_timer(args.time, '* Time to patch ElementTree =')
-
-    # Extend the vk.xml tree with XML files from the config dir
-    for filename in os.listdir(args.configs):
-        if filename.endswith('.xml'):
-            extend_xml(tree, os.path.join(args.configs, filename))
-
-    start_timer(args.time)
-    reg.loadElementTree(tree)
-    end_timer(args.time, '* Time to parse ElementTree =')
-
-    if (args.validate):
-        reg.validateGroups()
-
-    if (args.dump):
-        write('* Dumping registry to regdump.txt', file=sys.stderr)
-        reg.dumpReg(filehandle=open('regdump.txt', 'w', encoding='utf-8'))
-
-    if (args.debug):
-        pdb.run('reg.api_gen()')
-    else:
-        start_timer(args.time)
-        reg.apiGen()
-        end_timer(args.time, '* Time to generate ' + options.filename + ' =')
-
-    if not args.quiet:
-        write('* Generated', options.filename, file=sys.stderr)
+    ## per run of the top-level generation script.  Use generate_targets() to parse the
+    ## registry once and generate multiple targets from it in a single process.
+    (reg, video_tree) = make_registry(args, gen, options)
+    generate(args, reg, gen, options, video_tree)
@@ -24,6 +24,73 @@
 import sys
 from base_generator import BaseGenerator, BaseGeneratorOptions, write
 
+# Hash functions for the perfect hash function table, which must match util::PerfectHashTable.
+FNV1A_64_OFFSET = 14695981039346656037
+FNV1A_64_PRIME = 1099511628211
+UINT32_MASK = 0xffffffff
+UINT64_MASK = 0xffffffffffffffff
+
+# Average number of function names in each bucket of the perfect hash function table.
+PERFECT_HASH_BUCKET_SIZE = 4
+
+# Maximum number of seeds to try for each bucket when building the perfect hash function table.
+PERFECT_HASH_MAX_SEED = 1 << 20
+
+
+def perfect_hash(key):
+    """Returns the 64-bit FNV-1a hash of key, matching util::PerfectHashTable::Hash."""
+    value = FNV1A_64_OFFSET
+    for byte in key.encode():
+        value = ((value ^ byte) * FNV1A_64_PRIME) & UINT64_MASK
+    return value
+
+
+def perfect_hash_slot(value, seed, entry_count):
+    """Returns the table slot for a key hash and bucket seed, matching util::PerfectHashTable::GetSlot."""
+    value = (value & UINT32_MASK) ^ seed
+    value ^= value >> 16
+    value = (value * 0x7feb352d) & UINT32_MASK
+    value ^= value >> 15
+    value = (value * 0x846ca68b) & UINT32_MASK
+    value ^= value >> 16
+    return value % entry_count
+
+
+def build_perfect_hash_table(keys):
+    """Builds a minimal perfect hash table for keys, returning the seed for each bucket and the keys in table order.
+    Buckets are assigned seeds from the largest to the smallest, searching for the first seed that places all of the
+    keys in the bucket in unused slots.
+    """
+    entry_count = len(keys)
+    bucket_count = max(1, (entry_count + PERFECT_HASH_BUCKET_SIZE - 1) // PERFECT_HASH_BUCKET_SIZE)
+
+    buckets = [[] for _ in range(bucket_count)]
+    for key in keys:
+        value = perfect_hash(key)
+        buckets[(value >> 32) % bucket_count].append((key, value))
+
+    seeds = [0] * bucket_count
+    slots = [None] * entry_count
+    for bucket_index in sorted(range(bucket_count), key=lambda index: (-len(buckets[index]), index)):
+        bucket = buckets[bucket_index]
+        if not bucket:
+            continue
+
+        for seed in range(PERFECT_HASH_MAX_SEED):
+            bucket_slots = [perfect_hash_slot(value, seed, entry_count) for _, value in bucket]
+            if (len(set(bucket_slots)) == len(bucket_slots)) and all(slots[slot] is None for slot in bucket_slots):
+                break
+        else:
+            raise RuntimeError(
+                'Failed to find a perfect hash seed for {}'.format(', '.join(key for key, _ in bucket))
+            )
+
+        seeds[bucket_index] = seed
+        for (key, _), slot in zip(bucket, bucket_slots):
+            slots[slot] = key
+
+    return seeds, slots
+
 
 class LayerFuncTableGeneratorOptions(BaseGeneratorOptions):
     """Eliminates JSON black_lists and platform_types files, which are not necessary for
@@ -38,7 +105,9 @@ class LayerFuncTableGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Generate a util::PerfectHashTable that is initialized at compile time instead of a std::unordered_map.
+        perfect_hash_func_table=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -51,6 +120,7 @@ class LayerFuncTableGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.perfect_hash_func_table = perfect_hash_func_table
 
 
 class LayerFuncTableGenerator(BaseGenerator):
@@ -84,6 +154,9 @@ class LayerFuncTableGenerator(BaseGenerator):
             'vkEnumerateDeviceExtensionProperties'
         ]
 
+        # Name and function pointer expression for each table entry, when generating a perfect hash table
+        self.func_table_entries = []
+
     def beginFile(self, gen_opts):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
@@ -98,26 +171,32 @@ class LayerFuncTableGenerator(BaseGenerator):
         )
         write('#include "layer/trace_layer.h"', file=self.outFile)
         write('#include "util/defines.h"', file=self.outFile)
+        if gen_opts.perfect_hash_func_table:
+            write('#include "util/perfect_hash_table.h"', file=self.outFile)
         self.newline()
         self.includeVulkanHeaders(gen_opts)
         self.newline()
-        write('#include <unordered_map>', file=self.outFile)
-        self.newline()
+        if not gen_opts.perfect_hash_func_table:
+            write('#include <unordered_map>', file=self.outFile)
+            self.newline()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         self.newline()
-        write(
-            'const std::unordered_map<std::string, PFN_vkVoidFunction> vulkan_func_table = {',
-            file=self.outFile
-        )
+        if not gen_opts.perfect_hash_func_table:
+            write(
+                'const std::unordered_map<std::string, PFN_vkVoidFunction> vulkan_func_table = {',
+                file=self.outFile
+            )
 
     def endFile(self):
         """Method override."""
         # Manually output the physical device proc address function as its name doesn't
         # match the scheme used by self.LAYER_FUNCTIONS:
-        align = 100 - len('vk_layerGetPhysicalDeviceProcAddr')
-        write('    { "vk_layerGetPhysicalDeviceProcAddr",%sreinterpret_cast<PFN_vkVoidFunction>(GetPhysicalDeviceProcAddr) },' % (' ' * align), file=self.outFile)
+        self.write_func_table_entry('vk_layerGetPhysicalDeviceProcAddr', 'GetPhysicalDeviceProcAddr')
 
-        write('};', file=self.outFile)
+        if self.genOpts.perfect_hash_func_table:
+            self.write_perfect_hash_func_table()
+        else:
+            write('};', file=self.outFile)
         self.newline()
         write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
 
@@ -133,13 +212,53 @@ class LayerFuncTableGenerator(BaseGenerator):
     def generate_feature(self):
         """Performs C++ code generation for the feature."""
         for cmd in self.get_filtered_cmd_names():
-            align = 100 - len(cmd)
             if (cmd in self.LAYER_FUNCTIONS):
-                body = '    {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>({}) }},'.format(
-                    cmd, (' ' * align), cmd[2:]
-                )
+                self.write_func_table_entry(cmd, cmd[2:])
             else:
-                body = '    {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>(encode::{}) }},'.format(
-                    cmd, (' ' * align), cmd[2:]
-                )
+                self.write_func_table_entry(cmd, 'encode::' + cmd[2:])
+
+    def write_func_table_entry(self, name, func):
+        """Writes a table entry, or saves it to be written in perfect hash order by endFile."""
+        if self.genOpts.perfect_hash_func_table:
+            self.func_table_entries.append((name, func))
+        else:
+            align = 100 - len(name)
+            body = '    {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>({}) }},'.format(
+                name, (' ' * align), func
+            )
             write(body, file=self.outFile)
+
+    def write_perfect_hash_func_table(self):
+        """Writes the function table as a util::PerfectHashTable, with the entries in the order determined by the
+        perfect hash of the function names.
+        """
+        # Keep the first entry for a name, as the std::unordered_map initializer list does.
+        funcs = {}
+        for name, func in self.func_table_entries:
+            funcs.setdefault(name, func)
+        seeds, names = build_perfect_hash_table(list(funcs))
+
+        write(
+            'const util::PerfectHashTable<PFN_vkVoidFunction, {}, {}> vulkan_func_table = {{'.format(
+                len(names), len(seeds)
+            ),
+            file=self.outFile
+        )
+        write('    {', file=self.outFile)
+        for index in range(0, len(seeds), 8):
+            write(
+                '        {},'.format(
+                    ', '.join('0x{:08x}'.format(seed) for seed in seeds[index:index + 8])
+                ),
+                file=self.outFile
+            )
+        write('    },', file=self.outFile)
+        write('    {', file=self.outFile)
+        for name in names:
+            align = 100 - len(name)
+            body = '        {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>({}) }},'.format(
+                name, (' ' * align), funcs[name]
+            )
+            write(body, file=self.outFile)
+        write('    }', file=self.outFile)
+        write('};', file=self.outFile)
@@ -0,0 +1,94 @@
+# Copyright (c) 2023 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+'''Output mode options for gencode.py and generate_vulkan.py.
+
+This module does not import the Khronos registry scripts, so that
+generate_vulkan.py can parse its arguments before it adds the registry
+directory to the module search path.
+'''
+
+
+# Command line options that select alternative versions of the generated
+# code, with their help text. gencode.py and generate_vulkan.py add them with
+# add_output_mode_args(). gencode.py includes their values in the input hash
+# for each target.
+output_mode_args = {
+    'enum_string_tables': [
+        'Generate the enum ToString functions with sorted lookup tables and std::string_view',
+        'ToStringView functions instead of switch statements.'
+    ],
+    'enum_json_tables': [
+        'Generate the enum and flags FieldToJson functions with a shared pool of interned enumerant',
+        'names and sorted index tables instead of switch statements.'
+    ],
+    'decoder_reserve': [
+        'Generate VulkanDecoder methods that reserve memory for the decoded parameters of an API call, so that',
+        'the decoded objects are allocated from a single DecodeAllocator memory block.'
+    ],
+    'lock_free_cmd_encoding': [
+        'Generate vkCmd API call encoders that do not acquire the API call lock when the capture manager',
+        'reports that lock free command encoding is supported. The encoded commands are appended to a buffer',
+        'owned by the command buffer, which is written to the capture file when the command buffer is ended.'
+    ],
+    'deferred_cmd_encoding': [
+        'Generate vkCmd API call encoders that append the encoded commands to a buffer owned by the command',
+        'buffer, which is written to the capture file when the command buffer is ended.'
+    ],
+    'cpp_buffered_output': [
+        'Generate gfxrecon-tocpp consumer functions that write their generated code to the frame file',
+        'without printf style formatting.'
+    ],
+    'paged_state_tables': [
+        'Generate a VulkanStateTable that stores the handle wrappers in HandleId indexed paged tables',
+        'instead of ordered maps.'
+    ],
+    'sharded_state_tables': [
+        'Generate a VulkanStateTable and VulkanStateHandleTable that store the handle wrappers in sharded',
+        'tables with a lock for each shard, which allows wrappers to be added and removed from multiple',
+        'threads at once. Takes precedence over paged state tables.'
+    ],
+    'paged_object_info_tables': [
+        'Generate a VulkanObjectInfoTableBase2 that stores the replay object info in dense tables with a paged',
+        'HandleId index instead of unordered maps, with template visitor functions.'
+    ],
+    'perfect_hash_func_table': [
+        'Generate the capture layer function table as a perfect hash table that is initialized at compile',
+        'time, instead of a std::unordered_map that is constructed when the layer is loaded.'
+    ],
+    'lazy_device_table': [
+        'Generate a LoadVulkanDeviceTable that fills the device table with functions that retrieve the',
+        'device functions on first use, instead of retrieving every device function when the table is',
+        'loaded.'
+    ]
+}
+
+
+def add_output_mode_args(parser, prefix):
+    """Add a store_true option for each output mode, named prefix followed by
+    the output mode with '-' in place of '_'.
+    """
+    for name, help_lines in output_mode_args.items():
+        parser.add_argument(
+            prefix + name.replace('_', '-'),
+            action='store_true',
+            dest=name,
+            default=False,
+            help='\n'.join(help_lines)
+        )
@@ -39,7 +39,11 @@ class VulkanApiCallEncodersBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Encode command buffer commands without the API call lock when the capture manager allows it.
+        lock_free_cmd_encoding=False,
+        # Defer writing command buffer commands to the capture file until the command buffer is ended.
+        deferred_cmd_encoding=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -53,6 +57,8 @@ class VulkanApiCallEncodersBodyGeneratorOptions(BaseGeneratorOptions):
             extraVulkanHeaders=extraVulkanHeaders
         )
         self.capture_overrides = capture_overrides
+        self.lock_free_cmd_encoding = lock_free_cmd_encoding
+        self.deferred_cmd_encoding = deferred_cmd_encoding
 
 
 class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
@@ -247,7 +253,12 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
             body += indent + '{\n'
             body += indent + '    exclusive_api_call_lock = VulkanCaptureManager::AcquireExclusiveApiCallLock();\n'
             body += indent + '}\n'
-            body += indent + 'else\n'
+            if self.genOpts.lock_free_cmd_encoding and self.is_cmd_buffer_command(
+                name, values
+            ):
+                body += indent + 'else if (!manager->GetLockFreeCommandEncoding())\n'
+            else:
+                body += indent + 'else\n'
             body += indent + '{\n'
             body += indent + '    shared_api_call_lock = VulkanCaptureManager::AcquireSharedApiCallLock();\n'
             body += indent + '}\n'
@@ -367,6 +378,12 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
 
         return body
 
+    def is_cmd_buffer_command(self, name, values):
+        """Determine if a command records to a command buffer."""
+        return name.startswith('vkCmd') and (
+            values[0].base_type == 'VkCommandBuffer'
+        )
+
     def make_parameter_encoding(
         self, name, values, return_type, indent, omit_output_param
     ):
@@ -594,15 +611,24 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
                 )
 
         elif values[0].base_type == 'VkCommandBuffer':
+            end_call = 'EndCommandApiCallCapture'
+            # Commands encoded without the API call lock are buffered by the command buffer, and are written to the
+            # capture file by an API call that holds the lock.
+            if (
+                self.genOpts.deferred_cmd_encoding
+                or self.genOpts.lock_free_cmd_encoding
+            ) and self.is_cmd_buffer_command(name, values):
+                end_call = 'EndDeferredCommandApiCallCapture'
+
             get_handles_expr = self.make_get_command_handles_expr(
                 name, values[1:]
             )
             if get_handles_expr:
-                decl += 'EndCommandApiCallCapture({}, {})'.format(
-                    values[0].name, get_handles_expr
+                decl += '{}({}, {})'.format(
+                    end_call, values[0].name, get_handles_expr
                 )
             else:
-                decl += 'EndCommandApiCallCapture({})'.format(values[0].name)
+                decl += '{}({})'.format(end_call, values[0].name)
         else:
             decl += 'EndApiCallCapture()'
 
@@ -84,6 +84,9 @@ class VulkanConsumerHeaderGenerator(BaseGenerator):
             diag_file=diag_file
         )
 
+        # Names of the commands with Process_ methods, for the override traits.
+        self.cmd_names = []
+
     def beginFile(self, gen_opts):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
@@ -136,6 +139,8 @@ class VulkanConsumerHeaderGenerator(BaseGenerator):
         """Method override."""
         write('};', file=self.outFile)
         self.newline()
+        if not self.genOpts.is_override:
+            self.write_override_traits()
         write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
         write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
 
@@ -172,4 +177,45 @@ class VulkanConsumerHeaderGenerator(BaseGenerator):
                 )
 
             write(cmddef, file=self.outFile)
+            self.cmd_names.append(cmd)
             first = False
+
+    def write_override_traits(self):
+        """Generate a function that checks which of the Process_ methods of the base consumer class are overridden
+        by a consumer class, which consumers can use to implement IsApiCallProcessed().
+        """
+        class_name = self.genOpts.class_name
+        write(
+            '// Returns true if T overrides the {} method that processes an API call.  API calls that do not'.
+            format(class_name),
+            file=self.outFile
+        )
+        write(
+            '// have a {} method are always treated as processed.'.format(class_name),
+            file=self.outFile
+        )
+        write('template <typename T>', file=self.outFile)
+        write(
+            'bool {}OverridesApiCall(format::ApiCallId call_id)'.format(
+                class_name
+            ),
+            file=self.outFile
+        )
+        write('{', file=self.outFile)
+        write('    switch (call_id)', file=self.outFile)
+        write('    {', file=self.outFile)
+        for cmd in self.cmd_names:
+            write(
+                '        case format::ApiCallId::ApiCall_{}:'.format(cmd),
+                file=self.outFile
+            )
+            write(
+                '            return !std::is_same<decltype(&T::Process_{0}), decltype(&{1}::Process_{0})>::value;'
+                .format(cmd, class_name),
+                file=self.outFile
+            )
+        write('        default:', file=self.outFile)
+        write('            return true;', file=self.outFile)
+        write('    }', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
@@ -293,15 +293,18 @@ def makeGen(statement, arguments=None, indent=4, **kwargs):
     return (' ' * indent) + statement.format(**arguments, **kwargs) + '\n'
 
 
-def makeCppOutputStream(streamName, indent=4):
+def makeCppOutputStream(streamName, indent=4, buffered=False):
     """
     Create a function call to write out contents of a stream into the resulting CPP file.
 
     :param streamName: the name of the std::stringstream to write its contents into the final CPP.
     :param indent: indentation size.
+    :param buffered: write the stream contents without printf style formatting.
 
     :returns:
     """
+    if buffered:
+        return (' ' * indent) + 'WriteFrameCode({streamName});\n'.format(streamName=streamName)
     return (' ' * indent) + 'fprintf(file, "%s", {streamName}.str().c_str());\n'.format(streamName=streamName)
 
 
@@ -534,7 +537,9 @@ class VulkanCppConsumerBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text=CPP_PREFIX_STRING,
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Write generated code to the frame file without printf style formatting.
+        buffered_output=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -547,6 +552,7 @@ class VulkanCppConsumerBodyGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.buffered_output = buffered_output
 
 
 class VulkanCppConsumerBodyGenerator(BaseGenerator):
@@ -555,6 +561,9 @@ class VulkanCppConsumerBodyGenerator(BaseGenerator):
     generating a textfile containing decoded Vulkan API call parameter data.
     """
 
+    # The array lengths and base types of parameters are modified while generating.
+    share_value_info = False
+
     def __init__(
         self, err_file=sys.stderr, warn_file=sys.stderr, diag_file=sys.stdout
      ):
@@ -684,12 +693,12 @@ class VulkanCppConsumerBodyGenerator(BaseGenerator):
                 cmddef += makeGen("FILE* file = GetFrameFile();", indent=4)
 
                 #if cmd.startswith('vkCreate'):
-                cmddef += '    fprintf(file, "\\t{\\n");\n'
+                cmddef += self.make_frame_code_write('\\t{\\n')
 
                 cmddef += self.makeConsumerFuncBody(return_type, cmd, values)
 
                 #if cmd.startswith('vkCreate'):
-                cmddef += '    fprintf(file, "\\t}\\n");\n'
+                cmddef += self.make_frame_code_write('\\t}\\n')
 
             cmddef += makeGenCall('Post_APICall'.format(cmd), ['format::ApiCallId::ApiCall_' + cmd], locals(), indent=4)
 
@@ -698,6 +707,12 @@ class VulkanCppConsumerBodyGenerator(BaseGenerator):
             write(cmddef, file=self.outFile)
             first = False
 
+    def make_frame_code_write(self, code, indent=4):
+        """Create a statement that writes a string literal of code into the resulting CPP file."""
+        if self.genOpts.buffered_output:
+            return (' ' * indent) + 'WriteFrameCode("{}");\n'.format(code)
+        return (' ' * indent) + 'fprintf(file, "{}");\n'.format(code)
+
     def buildInputArray(self, arg, valueSuffix='', indent=0):
         """
         Build an array of values collection in the CPP consumer for a given argument.
@@ -826,7 +841,7 @@ class VulkanCppConsumerBodyGenerator(BaseGenerator):
                                             '", "'], locals(), indent=4)
 
                     body += makeGenCond(f'{streamName}.str().length() > 0', [
-                                        makeCppOutputStream(streamName, indent=8),
+                                        makeCppOutputStream(streamName, indent=8, buffered=self.genOpts.buffered_output),
                                         makeGenConditions([
                                                 [f'{arg.array_length} == 1', [makeGen('{arrayVarName} = "&" + {arrayElementNames};', locals(), indent=12)]],
                                                 [f'{arg.array_length} > 1', [
@@ -847,7 +862,7 @@ class VulkanCppConsumerBodyGenerator(BaseGenerator):
                                             f'{arg.name}->GetMetaStructPointer()',
                                             '*this'],
                                            locals(), indent=4)
-                    body += makeCppOutputStream(streamName)
+                    body += makeCppOutputStream(streamName, buffered=self.genOpts.buffered_output)
 
                     callArgs.append(f'{structVarName}.c_str()')
                     callTempl.append('&%s')
@@ -903,7 +918,7 @@ class VulkanCppConsumerBodyGenerator(BaseGenerator):
                                             f'{arg.name}->GetMetaStructPointer()',
                                             '*this'],
                                            locals(), indent=4)
-                    body += makeCppOutputStream(streamName)
+                    body += makeCppOutputStream(streamName, buffered=self.genOpts.buffered_output)
                     callTempl.append('&%s')
                     callArgs.append(f'{varName}.c_str()')
                     continue
@@ -101,6 +101,9 @@ class VulkanCppStructGenerator(BaseGenerator):
     Generates vulkan struct generating functions.
     """
 
+    # The base types of struct members are modified while generating.
+    share_value_info = False
+
     def __init__(
         self, err_file=sys.stderr, warn_file=sys.stderr, diag_file=sys.stdout
      ):
@@ -38,7 +38,9 @@ class VulkanDecoderBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Reserve decode memory for the parameters of a command before decoding them.
+        reserve_decode_memory=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -51,6 +53,7 @@ class VulkanDecoderBodyGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.reserve_decode_memory = reserve_decode_memory
 
 
 class VulkanDecoderBodyGenerator(BaseDecoderBodyGenerator, BaseGenerator):
@@ -80,6 +83,10 @@ class VulkanDecoderBodyGenerator(BaseDecoderBodyGenerator, BaseGenerator):
         """Method override."""
         BaseGenerator.beginFile(self, gen_opts)
 
+        self.reserve_decode_memory = gen_opts.reserve_decode_memory
+
+        if self.reserve_decode_memory:
+            write('#include "decode/decode_allocator.h"', file=self.outFile)
         write('#include "decode/handle_pointer_decoder.h"', file=self.outFile)
         write('#include "decode/pnext_node.h"', file=self.outFile)
         write('#include "decode/pointer_decoder.h"', file=self.outFile)
@@ -37,7 +37,9 @@ class VulkanDispatchTableGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Load device table functions on first use instead of when the table is loaded.
+        lazy_device_table=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -50,6 +52,7 @@ class VulkanDispatchTableGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.lazy_device_table = lazy_device_table
 
 
 class VulkanDispatchTableGenerator(BaseGenerator):
@@ -85,6 +88,8 @@ class VulkanDispatchTableGenerator(BaseGenerator):
         )  # Map of API call names to no-op function declarations
         self.device_cmd_names = dict(
         )  # Map of API call names to no-op function declarations
+        self.device_cmd_lazy_decls = dict(
+        )  # Map of API call names to lazy load function declarations
 
     def beginFile(self, gen_opts):
         """Method override."""
@@ -97,6 +102,11 @@ class VulkanDispatchTableGenerator(BaseGenerator):
         write('#include "vulkan/vk_layer.h"', file=self.outFile)
         self.includeVulkanHeaders(gen_opts)
         self.newline()
+        if gen_opts.lazy_device_table:
+            write('#include <atomic>', file=self.outFile)
+            write('#include <mutex>', file=self.outFile)
+            write('#include <unordered_map>', file=self.outFile)
+            self.newline()
         write('#ifdef WIN32', file=self.outFile)
         write('#ifdef CreateEvent', file=self.outFile)
         write('#undef CreateEvent', file=self.outFile)
@@ -176,6 +186,9 @@ class VulkanDispatchTableGenerator(BaseGenerator):
         self.newline()
         self.generate_load_instance_table_func()
         self.newline()
+        if self.genOpts.lazy_device_table:
+            self.generate_lazy_device_table_funcs()
+            self.newline()
         self.generate_load_device_table_func()
         self.newline()
 
@@ -214,6 +227,7 @@ class VulkanDispatchTableGenerator(BaseGenerator):
                             self.instance_cmd_names[name] = self.make_cmd_decl(return_type, proto, values, name)
                         elif first_param.base_type not in ['VkInstance', 'VkPhysicalDevice']:
                             self.device_cmd_names[name] = self.make_cmd_decl(return_type, proto, values, name)
+                            self.device_cmd_lazy_decls[name] = self.make_lazy_cmd_decl(proto, values, name)
                         else:
                             self.instance_cmd_names[name] = self.make_cmd_decl(return_type, proto, values, name)
 
@@ -232,17 +246,49 @@ class VulkanDispatchTableGenerator(BaseGenerator):
 
     def generate_device_cmd_table(self):
         """Generate device dispatch table structure."""
+        if self.genOpts.lazy_device_table:
+            self.generate_lazy_device_table_entry()
+
         write('struct VulkanDeviceTable', file=self.outFile)
         write('{', file=self.outFile)
 
+        if self.genOpts.lazy_device_table:
+            decl_format = '    LazyDeviceTableEntry<PFN_{}> {}{{ noop::{} }};'
+        else:
+            decl_format = '    PFN_{} {}{{ noop::{} }};'
+
         for name in self.device_cmd_names:
-            decl = '    PFN_{} {}{{ noop::{} }};'.format(
-                name, name[2:], name[2:]
-            )
+            decl = decl_format.format(name, name[2:], name[2:])
             write(decl, file=self.outFile)
 
         write('};', file=self.outFile)
 
+    def generate_lazy_device_table_entry(self):
+        """Generate the device table entry type for the lazy device table."""
+        write('// A device table entry that the lazy load functions replace while other threads may call through it. The entry', file=self.outFile)
+        write('// is loaded and stored with relaxed memory ordering, so that calls through the table do not pay for a fence. The', file=self.outFile)
+        write('// functions that are stored in the entry do not depend on data written by the thread that stores them, and the', file=self.outFile)
+        write('// table itself is published to other threads with the device that it belongs to. Because the entries are atomic,', file=self.outFile)
+        write('// the device table cannot be copied.', file=self.outFile)
+        write('template <typename FuncP>', file=self.outFile)
+        write('class LazyDeviceTableEntry', file=self.outFile)
+        write('{', file=self.outFile)
+        write('  public:', file=self.outFile)
+        write('    LazyDeviceTableEntry(FuncP func) : func_(func) {}', file=self.outFile)
+        self.newline()
+        write('    LazyDeviceTableEntry& operator=(FuncP func)', file=self.outFile)
+        write('    {', file=self.outFile)
+        write('        func_.store(func, std::memory_order_relaxed);', file=self.outFile)
+        write('        return *this;', file=self.outFile)
+        write('    }', file=self.outFile)
+        self.newline()
+        write('    operator FuncP() const { return func_.load(std::memory_order_relaxed); }', file=self.outFile)
+        self.newline()
+        write('  private:', file=self.outFile)
+        write('    std::atomic<FuncP> func_;', file=self.outFile)
+        write('};', file=self.outFile)
+        self.newline()
+
     def generate_no_op_funcs(self):
         """Generate no-op function definitions."""
         write('GFXRECON_BEGIN_NAMESPACE(noop)', file=self.outFile)
@@ -290,9 +336,21 @@ class VulkanDispatchTableGenerator(BaseGenerator):
         write('    assert(table != nullptr);', file=self.outFile)
         self.newline()
 
+        if self.genOpts.lazy_device_table:
+            write(
+                '    lazy::RegisterDeviceTable(gpa, device, table);',
+                file=self.outFile
+            )
+            self.newline()
+
         for name in self.device_cmd_names:
             if name == 'vkGetDeviceProcAddr':
                 write('    table->GetDeviceProcAddr = gpa;', file=self.outFile)
+            elif self.genOpts.lazy_device_table:
+                write(
+                    '    table->{0} = lazy::{0};'.format(name[2:]),
+                    file=self.outFile
+                )
             else:
                 expr = '    LoadFunction(gpa, device, "{}", &table->{});'.format(
                     name, name[2:]
@@ -301,6 +359,102 @@ class VulkanDispatchTableGenerator(BaseGenerator):
 
         write('}', file=self.outFile)
 
+    def generate_lazy_device_table_funcs(self):
+        """Generate the functions that are placed in the device table by LoadVulkanDeviceTable when the table functions
+        are loaded on first use. Each function retrieves the device function with the device's getprocaddress routine,
+        replaces itself in the device table with the retrieved function, and then calls the retrieved function.
+        """
+        write('GFXRECON_BEGIN_NAMESPACE(lazy)', file=self.outFile)
+        self.newline()
+        write('struct DeviceTableLoader', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    PFN_vkGetDeviceProcAddr gpa{ nullptr };', file=self.outFile)
+        write('    VkDevice                device{ VK_NULL_HANDLE };', file=self.outFile)
+        write('    VulkanDeviceTable*      table{ nullptr };', file=self.outFile)
+        write('};', file=self.outFile)
+        self.newline()
+        write('struct DeviceTableLoaders', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    std::mutex                                         lock;', file=self.outFile)
+        write('    std::unordered_map<DispatchKey, DeviceTableLoader> loaders;', file=self.outFile)
+        write('};', file=self.outFile)
+        self.newline()
+        write('// The device tables with functions to load on first use, by the dispatch key of their device. The functions in', file=self.outFile)
+        write('// this namespace are static, so the device table functions are loaded from the list that their device table was', file=self.outFile)
+        write('// registered with.', file=self.outFile)
+        write('static DeviceTableLoaders& GetDeviceTableLoaders()', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    static DeviceTableLoaders loaders;', file=self.outFile)
+        write('    return loaders;', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
+        write('static void RegisterDeviceTable(PFN_vkGetDeviceProcAddr gpa, VkDevice device, VulkanDeviceTable* table)', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    auto&                       loaders = GetDeviceTableLoaders();', file=self.outFile)
+        write('    std::lock_guard<std::mutex> lock(loaders.lock);', file=self.outFile)
+        write('    loaders.loaders[GetDispatchKey(device)] = { gpa, device, table };', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
+        write('static bool UnregisterDeviceTable(VkDevice device, DeviceTableLoader* loader)', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    auto&                       loaders = GetDeviceTableLoaders();', file=self.outFile)
+        write('    std::lock_guard<std::mutex> lock(loaders.lock);', file=self.outFile)
+        write('    auto                        entry = loaders.loaders.find(GetDispatchKey(device));', file=self.outFile)
+        write('    if (entry == loaders.loaders.end())', file=self.outFile)
+        write('    {', file=self.outFile)
+        write('        return false;', file=self.outFile)
+        write('    }', file=self.outFile)
+        write('    *loader = entry->second;', file=self.outFile)
+        write('    loaders.loaders.erase(entry);', file=self.outFile)
+        write('    return true;', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
+        write('// Retrieves a device function for the device that handle belongs to, and replaces the function\'s lazy load function', file=self.outFile)
+        write('// in the device table with it. Threads that call the function at the same time store the same value.', file=self.outFile)
+        write('template <typename FuncP>', file=self.outFile)
+        write('static FuncP', file=self.outFile)
+        write('LoadDeviceFunction(const void* handle, const char* name, LazyDeviceTableEntry<FuncP> VulkanDeviceTable::*func, FuncP noop_func)', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    DeviceTableLoader loader;', file=self.outFile)
+        write('    {', file=self.outFile)
+        write('        auto&                       loaders = GetDeviceTableLoaders();', file=self.outFile)
+        write('        std::lock_guard<std::mutex> lock(loaders.lock);', file=self.outFile)
+        write('        auto                        entry = loaders.loaders.find(GetDispatchKey(handle));', file=self.outFile)
+        write('        if (entry == loaders.loaders.end())', file=self.outFile)
+        write('        {', file=self.outFile)
+        write('            GFXRECON_LOG_ERROR("Failed to load %s for an unknown device", name);', file=self.outFile)
+        write('            return noop_func;', file=self.outFile)
+        write('        }', file=self.outFile)
+        write('        loader = entry->second;', file=self.outFile)
+        write('    }', file=self.outFile)
+        self.newline()
+        write('    FuncP result = noop_func;', file=self.outFile)
+        write('    LoadFunction(loader.gpa, loader.device, name, &result);', file=self.outFile)
+        write('    loader.table->*func = result;', file=self.outFile)
+        write('    return result;', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
+        write('// The device table is unregistered when the device is destroyed, so DestroyDevice does not replace itself in the', file=self.outFile)
+        write('// device table.', file=self.outFile)
+        write('static VKAPI_ATTR void VKAPI_CALL DestroyDevice(VkDevice device, const VkAllocationCallbacks* pAllocator)', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    PFN_vkDestroyDevice destroy_device = noop::DestroyDevice;', file=self.outFile)
+        write('    DeviceTableLoader   loader;', file=self.outFile)
+        write('    if (UnregisterDeviceTable(device, &loader))', file=self.outFile)
+        write('    {', file=self.outFile)
+        write('        LoadFunction(loader.gpa, loader.device, "vkDestroyDevice", &destroy_device);', file=self.outFile)
+        write('    }', file=self.outFile)
+        write('    destroy_device(device, pAllocator);', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
+        write('// clang-format off', file=self.outFile)
+        for name in self.device_cmd_names:
+            if name not in ['vkGetDeviceProcAddr', 'vkDestroyDevice']:
+                write(self.device_cmd_lazy_decls[name], file=self.outFile)
+        write('// clang-format on', file=self.outFile)
+        self.newline()
+        write('GFXRECON_END_NAMESPACE(lazy)', file=self.outFile)
+
     def make_full_typename(self, value):
         """Generate the full typename for the NoOp function parameters; the array types need the [] moved from the parameter name to the parameter typename."""
         if value.is_array and not value.is_dynamic:
@@ -308,6 +462,21 @@ class VulkanDispatchTableGenerator(BaseGenerator):
         else:
             return value.full_type
 
+    def make_lazy_cmd_decl(self, proto, values, name):
+        """Generate a function definition for the lazy load functions, which loads the device function and forwards the
+        call to it.
+        """
+        params = []
+        for value in values:
+            if value.is_array and not value.is_dynamic:
+                params.append('{} {}[{}]'.format(value.full_type, value.name, value.array_capacity))
+            else:
+                params.append('{} {}'.format(value.full_type, value.name))
+        args = ', '.join([value.name for value in values])
+        return 'static {}({}) {{ return LoadDeviceFunction({}, "{}", &VulkanDeviceTable::{}, noop::{})({}); }}'.format(
+            proto, ', '.join(params), values[0].name, name, name[2:], name[2:], args
+        )
+
     def make_cmd_decl(self, return_type, proto, values, name):
         """Generate a function prototype for the NoOp functions, with a parameter list that only includes types."""
         params = ', '.join(
@@ -38,7 +38,9 @@ class VulkanEnumToJsonBodyGeneratorOptions(BaseGeneratorOptions):
         prefixText='',
         protectFile=False,
         protectFeature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Generate an interned enumerant name pool and sorted index tables instead of switch statements.
+        use_name_tables=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -51,6 +53,7 @@ class VulkanEnumToJsonBodyGeneratorOptions(BaseGeneratorOptions):
             protectFeature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.use_name_tables = use_name_tables
 
 
 # VulkanEnumToStringBodyGenerator - subclass of BaseGenerator.
@@ -82,10 +85,16 @@ class VulkanEnumToJsonBodyGenerator(BaseGenerator):
         self.flagsType = dict()
         self.flagEnumBitsType = dict()
 
+        # Map of enumerant names to their index in the interned name pool.  Index 0
+        #   is the empty name, used for flag bits without a name.
+        self.name_pool = {'': 0}
+        self.use_name_tables = False
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.use_name_tables = genOpts.use_name_tables
         body = format_cpp_code('''
             #include "generated_vulkan_enum_to_json.h"
             #include "util/to_string.h"
@@ -168,9 +177,15 @@ class VulkanEnumToJsonBodyGenerator(BaseGenerator):
     # Performs C++ code generation for the feature.
     # yapf: disable
     def make_decls(self):
+        bodies = []
         for enum in sorted(self.enum_names):
             if not enum in self.processedEnums and not enum in self.enumAliases and not enum in self.SKIP_ENUM and not enum in self.flagEnumBitsType:
                 self.processedEnums.add(enum)
+                if self.use_name_tables:
+                    body = self.make_enum_name_table_to_json(enum)
+                    if body:
+                        bodies.append(body)
+                        continue
                 bitwidth = 'VkFlags'
 
                 if enum in self.enumType and self.enumType[enum] == 'VkFlags64':
@@ -195,7 +210,7 @@ class VulkanEnumToJsonBodyGenerator(BaseGenerator):
 
                 body += '}}\n'
                 body = body.format(enum, bitwidth)
-                write(body, file=self.outFile)
+                bodies.append(body)
 
         for enum in sorted(self.flagsType):
             bittype = None
@@ -204,6 +219,11 @@ class VulkanEnumToJsonBodyGenerator(BaseGenerator):
             body = 'void FieldToJson({0}_t, nlohmann::ordered_json& jdata, const {1} flags, const JsonOptions& options)\n'
             body += '{{\n'
             if bittype is not None and bittype in self.enum_names and len(self.enumEnumerants[bittype]):
+                if self.use_name_tables:
+                    table_body = self.make_flags_name_table_to_json(enum, bittype)
+                    if table_body:
+                        bodies.append(table_body)
+                        continue
                 body += "    if (!options.expand_flags)\n"
                 body += "    {{\n"
                 body += "        jdata = to_hex_fixed_width(flags);\n"
@@ -225,6 +245,124 @@ class VulkanEnumToJsonBodyGenerator(BaseGenerator):
                 body += '    jdata = to_hex_fixed_width(flags);\n'
 
             body += '}}\n'
-            write(body.format(enum, self.flags_types[enum]), file=self.outFile)
+            bodies.append(body.format(enum, self.flags_types[enum]))
+
+        # The name pool is written after all of the tables that reference it have been generated, but must be
+        # declared before them.
+        if self.use_name_tables:
+            write(self.make_name_pool_decls(), file=self.outFile)
+        for body in bodies:
+            write(body, file=self.outFile)
+
+    def get_name_index(self, name):
+        """Returns the index of an enumerant name in the interned name pool, adding the name to the pool if needed."""
+        return self.name_pool.setdefault(name, len(self.name_pool))
+
+    def make_name_pool_decls(self):
+        """Generate the interned name pool and the helper functions used by the generated lookup tables."""
+        body = '// Enumerant and flag bit names referenced by the FieldToJson lookup tables.  Enumerant names\n'
+        body += '// are C identifiers, so they are written to JSON without escaping.\n'
+        body += 'static constexpr std::string_view kEnumNames[] = {\n'
+        for name in self.name_pool:
+            body += '    "' + name + '",\n'
+        body += '};\n'
+        body += '\n'
+        body += format_cpp_code('''
+            template <typename T, size_t N>
+            void EnumNameToJson(nlohmann::ordered_json& jdata, const T& value, const util::EnumNameEntry (&names)[N])
+            {
+                std::string_view name = util::FindEnumName(names, static_cast<int64_t>(value), std::string_view());
+                if (!name.empty())
+                {
+                    jdata = name;
+                }
+                else
+                {
+                    jdata = to_hex_fixed_width(value);
+                }
+            }
+
+            template <typename TFlags, size_t N>
+            void FlagNamesToJson(nlohmann::ordered_json& jdata, TFlags flags, const uint32_t (&bit_names)[N], const JsonOptions& options)
+            {
+                if (!options.expand_flags || (flags == 0))
+                {
+                    jdata = to_hex_fixed_width(flags);
+                    return;
+                }
+                std::string str;
+                uint32_t    bit_number = 0;
+                while (flags != 0)
+                {
+                    if (flags & 1)
+                    {
+                        if (!str.empty())
+                        {
+                            str.append("|");
+                        }
+                        if ((bit_number < N) && (bit_names[bit_number] != 0))
+                        {
+                            str.append(kEnumNames[bit_names[bit_number]]);
+                        }
+                        else
+                        {
+                            str.append(to_hex_fixed_width(static_cast<TFlags>(static_cast<TFlags>(1) << bit_number)));
+                        }
+                    }
+                    bit_number++;
+                    flags = flags >> 1;
+                }
+                jdata = std::move(str);
+            }
+        ''')
+        body += '\n'
+        return body
+
+    def make_enum_name_table_to_json(self, enum):
+        """Generate the FieldToJson function for an enum from a table of pooled names sorted by value.
+        Returns None if the enumerant values are not known, so the switch statement version must be used.
+        """
+        values = self.get_enumerant_values(enum)
+        if not values:
+            return None
+
+        body = 'static constexpr util::EnumNameEntry k{0}JsonNames[] = {{\n'
+        for value, name in values:
+            body += '    {{ ' + name + ', kEnumNames[' + str(self.get_name_index(name)) + '] }},\n'
+        body += '}};\n'
+        body += 'static_assert(util::IsSortedEnumNameTable(k{0}JsonNames), "k{0}JsonNames must be sorted by value");\n'
+        body += '\n'
+        if enum in self.enumType and self.enumType[enum] == 'VkFlags64':
+            body += 'void FieldToJson({0}_t, nlohmann::ordered_json& jdata, const {0}& value, const JsonOptions& options)\n'
+        else:
+            body += 'void FieldToJson(nlohmann::ordered_json& jdata, const {0}& value, const JsonOptions& options)\n'
+        body += '{{\n'
+        body += '    EnumNameToJson(jdata, value, k{0}JsonNames);\n'
+        body += '}}\n'
+        return body.format(enum)
+
+    def make_flags_name_table_to_json(self, flags, bittype):
+        """Generate the FieldToJson function for a flags type from a table of name pool indices indexed by bit
+        position.  Returns None if the flag bit values are not known, so the switch statement version must be used.
+        """
+        values = self.get_enumerant_values(bittype)
+        if values is None:
+            return None
+
+        bit_names = dict()
+        for value, name in values:
+            if (value > 0) and ((value & (value - 1)) == 0):
+                bit_names[value.bit_length() - 1] = self.get_name_index(name)
+        bit_count = max(bit_names.keys()) + 1 if bit_names else 1
+
+        body = 'static constexpr uint32_t k{0}JsonBitNames[] = {{ '
+        body += ', '.join(str(bit_names.get(bit, 0)) for bit in range(bit_count))
+        body += ' }};\n'
+        body += '\n'
+        body += 'void FieldToJson({0}_t, nlohmann::ordered_json& jdata, const {1} flags, const JsonOptions& options)\n'
+        body += '{{\n'
+        body += '    FlagNamesToJson(jdata, flags, k{0}JsonBitNames, options);\n'
+        body += '}}\n'
+        return body.format(flags, self.flags_types[flags])
 
     # yapf: enable
@@ -41,7 +41,9 @@ class VulkanEnumToStringBodyGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Generate sorted lookup tables instead of switch statements.
+        use_lookup_tables=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -54,6 +56,7 @@ class VulkanEnumToStringBodyGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.use_lookup_tables = use_lookup_tables
 
 
 # VulkanEnumToStringBodyGenerator - subclass of BaseGenerator.
@@ -82,10 +85,13 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
             'VkPipelineStageFlagBits2KHR',
         }
 
+        self.use_lookup_tables = False
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.use_lookup_tables = genOpts.use_lookup_tables
         body = inspect.cleandoc('''
             #include "generated_vulkan_enum_to_string.h"
 
@@ -123,6 +129,11 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
         for enum in sorted(self.enum_names):
             if not enum in self.processedEnums and not enum in self.enumAliases:
                 self.processedEnums.add(enum)
+                if self.use_lookup_tables:
+                    body = self.make_lookup_table_to_string(enum)
+                    if body:
+                        write(body, file=self.outFile)
+                        continue
                 if self.is_flags_enum_64bit(enum):
                     # print(enum)
                     # body = 'std::string {0}ToString(const {0}& value, ToStringFlags, uint32_t, uint32_t)\n'
@@ -183,4 +194,73 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
                 # if self.is_flags_enum_64bit(enum):
                 #    print(body.format(enum, BitsEnumToFlagsTypedef(enum)))
 
+    def make_lookup_table_to_string(self, enum):
+        """Generate the ToStringView and ToString functions for an enum from a table of enumerant names sorted by
+        value, and the bitmask ToString function from a table of flag bit names indexed by bit position.
+        Returns None if the enumerant values are not known, so the switch statement version must be used.
+        """
+        values = self.get_enumerant_values(enum)
+        if values is None:
+            return None
+
+        body = ''
+        if values:
+            body += 'static constexpr EnumNameEntry k{0}Names[] = {{\n'
+            for value, name in values:
+                body += '    {{ ' + name + ', "' + name + '" }},\n'
+            body += '}};\n'
+            body += 'static_assert(IsSortedEnumNameTable(k{0}Names), "k{0}Names must be sorted by value");\n'
+            body += '\n'
+            find_name = 'FindEnumName(k{0}Names, value, "Unhandled {0}")'
+        else:
+            find_name = '"Unhandled {0}"'
+
+        if self.is_flags_enum_64bit(enum):
+            body += 'std::string_view {0}ToStringView(const {0} value)\n'
+            body += '{{\n'
+            body += '    return ' + find_name + ';\n'
+            body += '}}\n'
+            body += '\n'
+            body += 'std::string {0}ToString(const {0} value)\n'
+            body += '{{\n'
+            body += '    return std::string({0}ToStringView(value));\n'
+            body += '}}\n'
+        else:
+            body += 'template <> std::string_view ToStringView<{0}>(const {0}& value)\n'
+            body += '{{\n'
+            body += '    return ' + find_name + ';\n'
+            body += '}}\n'
+            body += '\n'
+            body += 'template <> std::string ToString<{0}>(const {0}& value, ToStringFlags, uint32_t, uint32_t)\n'
+            body += '{{\n'
+            body += '    return std::string(ToStringView(value));\n'
+            body += '}}\n'
+
+        if 'Bits' in enum:
+            # Single bit enumerants, indexed by bit position.
+            bit_names = dict()
+            for value, name in values:
+                if (value > 0) and ((value & (value - 1)) == 0):
+                    bit_names[value.bit_length() - 1] = name
+            bit_count = max(bit_names.keys()) + 1 if bit_names else 1
+
+            body += '\n'
+            body += 'static constexpr std::string_view k{0}BitNames[] = {{\n'
+            for bit in range(bit_count):
+                body += '    "' + bit_names.get(bit, '') + '",\n'
+            body += '}};\n'
+            body += '\n'
+            if self.is_flags_enum_64bit(enum):
+                body += 'std::string {1}ToString(VkFlags64 vkFlags)\n'
+                body += '{{\n'
+                body += '    return BitNamesToString(k{0}BitNames, vkFlags, {0}ToStringView(0U), "Unhandled {0}");\n'
+                body += '}}\n'
+            else:
+                body += 'template <> std::string ToString<{0}>(VkFlags vkFlags, ToStringFlags, uint32_t, uint32_t)\n'
+                body += '{{\n'
+                body += '    return BitNamesToString(k{0}BitNames, vkFlags, ToStringView(static_cast<{0}>(0)), "Unhandled {0}");\n'
+                body += '}}\n'
+
+        return body.format(enum, BitsEnumToFlagsTypedef(enum))
+
     # yapf: enable
@@ -36,7 +36,8 @@ class VulkanEnumToStringHeaderGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        use_lookup_tables=False  # Declare the ToStringView functions generated with sorted lookup tables.
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,6 +50,7 @@ class VulkanEnumToStringHeaderGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.use_lookup_tables = use_lookup_tables
 
 
 # VulkanEnumToStringHeaderGenerator - subclass of BaseGenerator.
@@ -76,11 +78,13 @@ class VulkanEnumToStringHeaderGenerator(BaseGenerator):
             'VkAccessFlagBits2KHR',
             'VkPipelineStageFlagBits2KHR',
         }
+        self.use_lookup_tables = False
 
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
         BaseGenerator.beginFile(self, genOpts)
+        self.use_lookup_tables = genOpts.use_lookup_tables
         includes = inspect.cleandoc(
             '''
             #include "format/platform_types.h"
@@ -130,8 +134,12 @@ class VulkanEnumToStringHeaderGenerator(BaseGenerator):
                     if self.is_flags_enum_64bit(enum):
                         body = 'std::string {0}ToString(const {0} value);'
                         body += '\nstd::string {1}ToString(VkFlags64 vkFlags);'
+                        if self.use_lookup_tables:
+                            body += '\nstd::string_view {0}ToStringView(const {0} value);'
                     else:
                         body = 'template <> std::string ToString<{0}>(const {0}& value, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'
+                        if self.use_lookup_tables:
+                            body += '\ntemplate <> std::string_view ToStringView<{0}>(const {0}& value);'
                         if 'Bits' in enum:
                             body += '\ntemplate <> std::string ToString<{0}>(VkFlags vkFlags, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'
                     write(body.format(enum, BitsEnumToFlagsTypedef(enum)),
@@ -36,7 +36,9 @@ class VulkanObjectInfoTableBase2HeaderGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Store the object info in HandleId indexed dense tables instead of unordered maps.
+        paged_object_info_tables=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,6 +51,7 @@ class VulkanObjectInfoTableBase2HeaderGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.paged_object_info_tables = paged_object_info_tables
 
 
 # Generates declarations for functions for Vulkan object info table
@@ -103,11 +106,16 @@ class VulkanObjectInfoTableBase2HeaderGenerator(BaseGenerator):
             handle_info = handle_name + 'Info'
             handle_map = handle_name[0].lower() + handle_name[1:] + '_map_'
             add_code += '    void Add{0}({0}&& info) {{ AddObjectInfo(std::move(info), &{1}); }}\n'.format(handle_info, handle_map)
-            remove_code += '    void Remove{0}(format::HandleId id) {{ {1}.erase(id); }}\n'.format(handle_info, handle_map)
             const_get_code += '    const {0}* Get{0}(format::HandleId id) const {{ return GetObjectInfo<{0}>(id, &{1}); }}\n'.format(handle_info, handle_map)
             get_code += '    {0}* Get{0}(format::HandleId id) {{ return GetObjectInfo<{0}>(id, &{1}); }}\n'.format(handle_info, handle_map)
-            visit_code += '    void Visit{0}(std::function<void(const {0}*)> visitor) const {{  for (const auto& entry : {1}) {{ visitor(&entry.second); }}  }}\n'.format(handle_info, handle_map)
-            map_code += '     std::unordered_map<format::HandleId, {0}> {1};\n'.format(handle_info, handle_map)
+            if self.genOpts.paged_object_info_tables:
+                remove_code += '    void Remove{0}(format::HandleId id) {{ {1}.Remove(id); }}\n'.format(handle_info, handle_map)
+                visit_code += '    template <typename Visitor> void Visit{0}(Visitor visitor) const {{ {1}.Visit([&visitor](format::HandleId, const {0}& info) {{ visitor(&info); }}); }}\n'.format(handle_info, handle_map)
+                map_code += '     util::DenseHandleTable<{0}> {1};\n'.format(handle_info, handle_map)
+            else:
+                remove_code += '    void Remove{0}(format::HandleId id) {{ {1}.erase(id); }}\n'.format(handle_info, handle_map)
+                visit_code += '    void Visit{0}(std::function<void(const {0}*)> visitor) const {{  for (const auto& entry : {1}) {{ visitor(&entry.second); }}  }}\n'.format(handle_info, handle_map)
+                map_code += '     std::unordered_map<format::HandleId, {0}> {1};\n'.format(handle_info, handle_map)
 
         self.newline()
         code = 'class VulkanObjectInfoTableBase2 : VulkanObjectInfoTableBase\n'
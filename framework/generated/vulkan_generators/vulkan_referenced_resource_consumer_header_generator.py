@@ -108,9 +108,21 @@ class VulkanReferencedResourceHeaderGenerator(BaseGenerator):
         write('  public:', file=self.outFile)
         write('    {}() {{ }}\n'.format(class_name), file=self.outFile)
         write(
-            '    virtual ~{}() override {{ }}'.format(class_name),
+            '    virtual ~{}() override {{ }}\n'.format(class_name),
             file=self.outFile
         )
+        # Only decode the API calls with Process_ overrides, which are the calls that reference resources.
+        write(
+            '    virtual bool IsApiCallProcessed(format::ApiCallId call_id) const override',
+            file=self.outFile
+        )
+        write('    {', file=self.outFile)
+        write(
+            '        return VulkanConsumerOverridesApiCall<{}>(call_id);'.
+            format(class_name),
+            file=self.outFile
+        )
+        write('    }', file=self.outFile)
 
     def endFile(self):
         """Method override."""
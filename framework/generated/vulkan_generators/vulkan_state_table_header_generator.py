@@ -36,7 +36,11 @@ class VulkanStateTableHeaderGeneratorOptions(BaseGeneratorOptions):
         prefix_text='',
         protect_file=False,
         protect_feature=True,
-        extraVulkanHeaders=[]
+        extraVulkanHeaders=[],
+        # Store the wrappers in HandleId indexed paged tables instead of ordered maps.
+        paged_state_tables=False,
+        # Store the wrappers in tables that synchronize their own entries, with a lock for each shard of each table.
+        sharded_state_tables=False
     ):
         BaseGeneratorOptions.__init__(
             self,
@@ -49,6 +53,8 @@ class VulkanStateTableHeaderGeneratorOptions(BaseGeneratorOptions):
             protect_feature,
             extraVulkanHeaders=extraVulkanHeaders
         )
+        self.paged_state_tables = paged_state_tables
+        self.sharded_state_tables = sharded_state_tables
 
 
 # Generates declarations for functions for Vulkan state table
@@ -102,6 +108,12 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
         vk_get_code = ''
         vk_map_code = ''        
 
+        sharded = self.genOpts.sharded_state_tables
+        if sharded:
+            base_class = 'VulkanShardedStateTableBase'
+        else:
+            base_class = 'VulkanStateTableBase'
+
         for vkhandle_name in sorted(self.handle_names):
             if vkhandle_name in self.DUPLICATE_HANDLE_TYPES:
                 continue
@@ -112,10 +124,18 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
             handle_map = handle_name[0].lower() + handle_name[1:] + '_map_'
             insert_code += '    bool InsertWrapper(format::HandleId id, {0}* wrapper) {{ return InsertEntry(id, wrapper, {1}); }}\n'.format(handle_wrapper_type, handle_map)
             remove_code += '    bool RemoveWrapper(const {0}* wrapper) {{ return RemoveEntry(wrapper, {1}); }}\n'.format(handle_wrapper_type, handle_map)
-            visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ for (auto entry : {1}) {{ visitor(entry.second); }} }}\n'.format(handle_wrapper_type, handle_map)
+            if sharded or self.genOpts.paged_state_tables:
+                visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ {1}.Visit([&visitor](format::HandleId, {0}* wrapper) {{ visitor(wrapper); }}); }}\n'.format(handle_wrapper_type, handle_map)
+            else:
+                visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ for (auto entry : {1}) {{ visitor(entry.second); }} }}\n'.format(handle_wrapper_type, handle_map)
             get_code += '    {0}* Get{1}(format::HandleId id) {{ return GetWrapper<{0}>(id, {2}); }}\n'.format(handle_wrapper_type, handle_wrapper_func, handle_map)
             const_get_code += '    const {0}* Get{1}(format::HandleId id) const {{ return GetWrapper<{0}>(id, {2}); }}\n'.format(handle_wrapper_type, handle_wrapper_func, handle_map)
-            map_code += '    std::map<format::HandleId, {0}*> {1};\n'.format(handle_wrapper_type, handle_map)
+            if sharded:
+                map_code += '    util::ShardedHandleTable<format::HandleId, {0}> {1};\n'.format(handle_wrapper_type, handle_map)
+            elif self.genOpts.paged_state_tables:
+                map_code += '    util::PagedHandleTable<{0}*> {1};\n'.format(handle_wrapper_type, handle_map)
+            else:
+                map_code += '    std::map<format::HandleId, {0}*> {1};\n'.format(handle_wrapper_type, handle_map)
             vk_insert_code += '    bool InsertWrapper({0}* wrapper) {{ return InsertEntry(wrapper->handle, wrapper, {1}); }}\n'.format(handle_wrapper_type, handle_map)
             vk_remove_code += '    bool RemoveWrapper(const {}* wrapper) {{\n'.format(handle_wrapper_type)
             vk_remove_code += '         if (wrapper == nullptr) return false;\n'
@@ -123,10 +143,13 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
             vk_remove_code += '    }\n'
             vk_get_code += 'template<> inline {0}* VulkanStateHandleTable::GetWrapper<{0}>({1} handle) {{ return VulkanStateTableBase::GetWrapper(handle, {2}); }}\n'.format(handle_wrapper_type, vkhandle_name, handle_map)
             vk_const_get_code += 'template<> inline const {0}* VulkanStateHandleTable::GetWrapper<{0}>({1} handle) const {{ return VulkanStateTableBase::GetWrapper(handle, {2}); }}\n'.format(handle_wrapper_type, vkhandle_name, handle_map)
-            vk_map_code += '    std::unordered_map<{0}, {1}*> {2};\n'.format(vkhandle_name, handle_wrapper_type, handle_map)
+            if sharded:
+                vk_map_code += '    util::ShardedHandleTable<{0}, {1}> {2};\n'.format(vkhandle_name, handle_wrapper_type, handle_map)
+            else:
+                vk_map_code += '    std::unordered_map<{0}, {1}*> {2};\n'.format(vkhandle_name, handle_wrapper_type, handle_map)
 
         self.newline()
-        code = 'class VulkanStateTable : VulkanStateTableBase\n'
+        code = 'class VulkanStateTable : {}\n'.format(base_class)
         code += '{\n'
         code += '  public:\n'
         code += '    VulkanStateTable() {}\n'
@@ -146,7 +169,7 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
         code += map_code
         code += '};\n'
         code += '\n'
-        code += 'class VulkanStateHandleTable : VulkanStateTableBase\n'
+        code += 'class VulkanStateHandleTable : {}\n'.format(base_class)
         code += '{\n'
         code += '  public:\n'
         code += '    VulkanStateHandleTable() {}\n'
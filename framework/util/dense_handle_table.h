@@ -0,0 +1,222 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_UTIL_DENSE_HANDLE_TABLE_H
+#define GFXRECON_UTIL_DENSE_HANDLE_TABLE_H
+
+#include "format/format.h"
+#include "util/defines.h"
+#include "util/paged_handle_table.h"
+
+#include <bitset>
+#include <cstdint>
+#include <memory>
+#include <new>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+
+// A table of values indexed by format::HandleId, for large values such as the replay object info structures. The IDs
+// of one handle type are interleaved with the IDs of the other handle types, so a PagedHandleTable of the values would
+// leave most of each page unused. Instead, a PagedHandleTable maps each ID to a slot index, and the values are packed
+// into fixed size chunks of slots. A bitmap of the occupied slots in each chunk is used to reuse the slots of removed
+// values. Values are not moved while they are in the table, so pointers to them remain valid until they are removed.
+template <typename T, size_t kChunkSize = 64>
+class DenseHandleTable
+{
+  public:
+    DenseHandleTable() : first_free_chunk_(0) {}
+
+    ~DenseHandleTable() {}
+
+    DenseHandleTable(const DenseHandleTable&) = delete;
+
+    DenseHandleTable& operator=(const DenseHandleTable&) = delete;
+
+    size_t Size() const { return slots_.Size(); }
+
+    bool Empty() const { return slots_.Empty(); }
+
+    // Inserts a value for id, returning a pointer to the value for id and a bool that is false if the table already
+    // contained a value for id, which is left unchanged. The arguments are only moved from when a value is inserted.
+    template <typename... Args>
+    std::pair<T*, bool> Emplace(format::HandleId id, Args&&... args)
+    {
+        const uint32_t* existing = slots_.Find(id);
+        if (existing != nullptr)
+        {
+            return std::make_pair(GetValue(*existing), false);
+        }
+
+        uint32_t slot  = AcquireSlot();
+        auto&    chunk = chunks_[slot / kChunkSize];
+        size_t   index = slot % kChunkSize;
+        T*       value = new (&chunk->values[index]) T(std::forward<Args>(args)...);
+
+        chunk->occupied[index] = true;
+        ++chunk->count;
+        slots_.Insert(id, slot);
+        return std::make_pair(value, true);
+    }
+
+    bool Insert(format::HandleId id, const T& value) { return Emplace(id, value).second; }
+
+    bool Insert(format::HandleId id, T&& value) { return Emplace(id, std::move(value)).second; }
+
+    T* Find(format::HandleId id) { return const_cast<T*>(static_cast<const DenseHandleTable*>(this)->Find(id)); }
+
+    const T* Find(format::HandleId id) const
+    {
+        const uint32_t* slot = slots_.Find(id);
+        return (slot != nullptr) ? GetValue(*slot) : nullptr;
+    }
+
+    // Returns the first value, in ID order, for which predicate(const T&) returns true, or nullptr if there is no such
+    // value.
+    template <typename Predicate>
+    T* FindIf(Predicate predicate)
+    {
+        T* result = nullptr;
+        slots_.Visit([&](format::HandleId, uint32_t slot) {
+            if ((result == nullptr) && predicate(*static_cast<const T*>(GetValue(slot))))
+            {
+                result = GetValue(slot);
+            }
+        });
+        return result;
+    }
+
+    // Removes the value for id, returning false if the table does not contain a value for id.
+    bool Remove(format::HandleId id)
+    {
+        const uint32_t* slot = slots_.Find(id);
+        if (slot == nullptr)
+        {
+            return false;
+        }
+
+        size_t chunk_index = *slot / kChunkSize;
+        size_t index       = *slot % kChunkSize;
+        auto&  chunk       = chunks_[chunk_index];
+
+        chunk->Get(index)->~T();
+        chunk->occupied[index] = false;
+        --chunk->count;
+        if (chunk_index < first_free_chunk_)
+        {
+            first_free_chunk_ = chunk_index;
+        }
+
+        slots_.Remove(id);
+        return true;
+    }
+
+    void Clear()
+    {
+        slots_.Clear();
+        chunks_.clear();
+        first_free_chunk_ = 0;
+    }
+
+    // Calls visitor(format::HandleId, T&) for each value in the table, in ID order. The visitor must not insert or
+    // remove values.
+    template <typename Visitor>
+    void Visit(Visitor&& visitor)
+    {
+        slots_.Visit([&](format::HandleId id, uint32_t slot) { visitor(id, *GetValue(slot)); });
+    }
+
+    template <typename Visitor>
+    void Visit(Visitor&& visitor) const
+    {
+        slots_.Visit([&](format::HandleId id, uint32_t slot) { visitor(id, *GetValue(slot)); });
+    }
+
+  private:
+    struct Chunk
+    {
+        // Values are constructed on insert, so the value storage is left uninitialized.
+        Chunk() {}
+
+        ~Chunk()
+        {
+            if (!std::is_trivially_destructible<T>::value)
+            {
+                for (size_t i = 0; (i < kChunkSize) && (count > 0); ++i)
+                {
+                    if (occupied[i])
+                    {
+                        Get(i)->~T();
+                        --count;
+                    }
+                }
+            }
+        }
+
+        T* Get(size_t index) { return std::launder(reinterpret_cast<T*>(&values[index])); }
+
+        const T* Get(size_t index) const { return std::launder(reinterpret_cast<const T*>(&values[index])); }
+
+        typename std::aligned_storage<sizeof(T), alignof(T)>::type values[kChunkSize];
+        std::bitset<kChunkSize>                                    occupied;
+        size_t                                                     count{ 0 };
+    };
+
+    T* GetValue(uint32_t slot) { return chunks_[slot / kChunkSize]->Get(slot % kChunkSize); }
+
+    const T* GetValue(uint32_t slot) const { return chunks_[slot / kChunkSize]->Get(slot % kChunkSize); }
+
+    // Returns the lowest free slot, so that values are packed into the chunks at the start of the table.
+    uint32_t AcquireSlot()
+    {
+        while ((first_free_chunk_ < chunks_.size()) && (chunks_[first_free_chunk_]->count == kChunkSize))
+        {
+            ++first_free_chunk_;
+        }
+
+        if (first_free_chunk_ == chunks_.size())
+        {
+            chunks_.push_back(std::make_unique<Chunk>());
+        }
+
+        const auto& chunk = chunks_[first_free_chunk_];
+        size_t      index = 0;
+        while (chunk->occupied[index])
+        {
+            ++index;
+        }
+
+        return static_cast<uint32_t>((first_free_chunk_ * kChunkSize) + index);
+    }
+
+    PagedHandleTable<uint32_t>          slots_;
+    std::vector<std::unique_ptr<Chunk>> chunks_;
+    size_t                              first_free_chunk_;
+};
+
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_UTIL_DENSE_HANDLE_TABLE_H
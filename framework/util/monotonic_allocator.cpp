@@ -23,6 +23,8 @@
 
 #include "util/monotonic_allocator.h"
 
+#include <algorithm>
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
 
@@ -39,13 +41,60 @@ void MonotonicAllocator::Clear(bool free_system_memory)
     if (free_system_memory)
     {
         memory_blocks_.clear();
+        memory_block_sizes_.clear();
+    }
+    else
+    {
+        // Free the blocks created by Reserve that are after the last block used since the previous Clear
+        size_t block_count = memory_blocks_.size();
+        for (size_t i = block_count; i > used_block_count_; --i)
+        {
+            if (memory_block_sizes_[i - 1] != block_size_)
+            {
+                memory_blocks_.erase(memory_blocks_.begin() + (i - 1));
+                memory_block_sizes_.erase(memory_block_sizes_.begin() + (i - 1));
+            }
+        }
     }
 
     // Free oversized allocations
     oversized_allocations_.clear();
 
     current_block_            = 0;
-    current_block_free_bytes_ = block_size_;
+    current_block_free_bytes_ = memory_block_sizes_.empty() ? block_size_ : memory_block_sizes_[0];
+    used_block_count_         = 0;
+}
+
+size_t MonotonicAllocator::GetBlockMemorySize() const
+{
+    size_t size = 0;
+    for (size_t block_size : memory_block_sizes_)
+    {
+        size += block_size;
+    }
+    return size;
+}
+
+void MonotonicAllocator::Reserve(size_t object_bytes)
+{
+    // Find a block, starting with the current block, with enough free space
+    while (current_block_ < memory_blocks_.size())
+    {
+        if (current_block_free_bytes_ >= object_bytes)
+        {
+            used_block_count_ = std::max(used_block_count_, current_block_ + 1);
+            return;
+        }
+
+        // Move to next block
+        ++current_block_;
+        current_block_free_bytes_ =
+            (current_block_ < memory_block_sizes_.size()) ? memory_block_sizes_[current_block_] : block_size_;
+    }
+
+    AddBlock(std::max(object_bytes, block_size_));
+    current_block_free_bytes_ = memory_block_sizes_.back();
+    used_block_count_         = current_block_ + 1;
 }
 
 void* MonotonicAllocator::Allocate(size_t object_bytes, size_t alignment_bytes)
@@ -69,34 +118,51 @@ void* MonotonicAllocator::Allocate(size_t object_bytes, size_t alignment_bytes)
             {
                 // Move to next block
                 ++current_block_;
-                current_block_free_bytes_ = block_size_;
+                current_block_free_bytes_ =
+                    (current_block_ < memory_block_sizes_.size()) ? memory_block_sizes_[current_block_] : block_size_;
             }
         }
 
         if (result == nullptr)
         {
-            memory_blocks_.emplace_back(new unsigned char[block_size_]);
+            AddBlock(block_size_);
             result = AllocateToBlock(object_bytes, alignment_bytes);
         }
     }
     else
     {
-        // Custom allocation
-        oversized_allocations_.emplace_back(new unsigned char[object_bytes]);
-        result = oversized_allocations_.back().get();
+        // Try to allocate to the current block when it was sized by Reserve
+        if ((current_block_ < memory_blocks_.size()) && (memory_block_sizes_[current_block_] > block_size_))
+        {
+            result = AllocateToBlock(object_bytes, alignment_bytes);
+        }
+
+        if (result == nullptr)
+        {
+            // Custom allocation
+            oversized_allocations_.emplace_back(new unsigned char[object_bytes]);
+            result = oversized_allocations_.back().get();
+        }
     }
 
     return result;
 }
 
+void MonotonicAllocator::AddBlock(size_t block_size)
+{
+    memory_blocks_.emplace_back(new unsigned char[block_size]);
+    memory_block_sizes_.push_back(block_size);
+}
+
 void* MonotonicAllocator::AllocateToBlock(size_t object_bytes, size_t alignment_bytes)
 {
-    void* block_ptr =
-        reinterpret_cast<void*>(memory_blocks_[current_block_].get() + block_size_ - current_block_free_bytes_);
-    void* result = std::align(alignment_bytes, object_bytes, block_ptr, current_block_free_bytes_);
+    void* block_ptr = reinterpret_cast<void*>(memory_blocks_[current_block_].get() +
+                                              memory_block_sizes_[current_block_] - current_block_free_bytes_);
+    void* result    = std::align(alignment_bytes, object_bytes, block_ptr, current_block_free_bytes_);
     if (result != nullptr)
     {
         current_block_free_bytes_ -= object_bytes;
+        used_block_count_ = std::max(used_block_count_, current_block_ + 1);
     }
     return result;
 }
@@ -40,7 +40,7 @@ class MonotonicAllocator
     // fit requested allocations, and blocks are freed using an appropriate call to Clear or upon destruction of this
     // MonotonicAllocator
     MonotonicAllocator(size_t block_size) :
-        block_size_(block_size), current_block_(0), current_block_free_bytes_(block_size)
+        block_size_(block_size), current_block_(0), current_block_free_bytes_(block_size), used_block_count_(0)
     {}
 
     ~MonotonicAllocator() { Clear(true); }
@@ -69,14 +69,26 @@ class MonotonicAllocator
         return result;
     }
 
+    // Ensures that the next allocations, up to a total of object_bytes, can be made to a single memory block. If the
+    // current block does not have enough free space, allocation moves to the next block that does, or to a new block
+    // of at least object_bytes. Unlike oversized allocations, blocks larger than block_size created by Reserve are
+    // kept by Clear(false) while they are in use, so that large allocations that repeat do not allocate system memory
+    // each time.
+    void Reserve(size_t object_bytes);
+
     // "Frees" all previously allocated objects. Depending on free_system_memory, system memory blocks are either
     // reused for new calls to Allocate or freed and re-created as needed. Oversized allocations are freed from system
-    // memory
+    // memory. When system memory is not freed, blocks created by Reserve that were not allocated from since the
+    // previous call to Clear are still freed.
     void Clear(bool free_system_memory);
 
+    // Returns the total size of the system memory blocks held by the allocator, not including oversized allocations.
+    size_t GetBlockMemorySize() const;
+
   private:
     void* Allocate(size_t object_bytes, size_t alignment_bytes);
     void* AllocateToBlock(size_t object_bytes, size_t alignment_bytes);
+    void  AddBlock(size_t block_size);
 
   private:
     struct Destructor
@@ -87,11 +99,13 @@ class MonotonicAllocator
 
   private:
     std::vector<std::unique_ptr<unsigned char[]>> memory_blocks_;
+    std::vector<size_t>                           memory_block_sizes_;
     std::vector<std::unique_ptr<unsigned char[]>> oversized_allocations_;
     std::vector<Destructor>                       destructors_;
     const size_t                                  block_size_;
     size_t                                        current_block_;
     size_t                                        current_block_free_bytes_;
+    size_t                                        used_block_count_;
 };
 
 GFXRECON_END_NAMESPACE(util)
@@ -0,0 +1,256 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_UTIL_PAGED_HANDLE_TABLE_H
+#define GFXRECON_UTIL_PAGED_HANDLE_TABLE_H
+
+#include "format/format.h"
+#include "util/defines.h"
+
+#include <bitset>
+#include <map>
+#include <memory>
+#include <new>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+
+// A table of values indexed by format::HandleId, for use in place of std::map or std::unordered_map when the IDs are
+// assigned from an increasing counter. Values are stored in fixed size pages that are allocated when the first value
+// for the page is inserted, and freed when the last value for the page is removed, so that insert, find, and remove
+// are an index operation instead of a tree or hash table lookup. Values are visited in ID order, matching the
+// iteration order of std::map. IDs that are too large to index, such as the special IDs allocated from the top of
+// the ID range, are stored in an ordered map.
+template <typename T, size_t kPageSize = 256>
+class PagedHandleTable
+{
+    static_assert((kPageSize != 0) && ((kPageSize & (kPageSize - 1)) == 0), "Page size must be a power of two");
+
+  public:
+    PagedHandleTable() : size_(0) {}
+
+    ~PagedHandleTable() {}
+
+    PagedHandleTable(const PagedHandleTable&) = delete;
+
+    PagedHandleTable& operator=(const PagedHandleTable&) = delete;
+
+    size_t Size() const { return size_; }
+
+    bool Empty() const { return (size_ == 0); }
+
+    // Inserts a value for id, returning a pointer to the value for id and a bool that is false if the table already
+    // contained a value for id, which is left unchanged. The arguments are only moved from when a value is inserted.
+    template <typename... Args>
+    std::pair<T*, bool> Emplace(format::HandleId id, Args&&... args)
+    {
+        if ((id / kPageSize) >= kMaxPageCount)
+        {
+            // try_emplace does not move from args when the table already contains id.
+            auto inserted = overflow_.try_emplace(id, std::forward<Args>(args)...);
+            if (inserted.second)
+            {
+                ++size_;
+            }
+            return std::make_pair(&inserted.first->second, inserted.second);
+        }
+
+        size_t page_index = static_cast<size_t>(id / kPageSize);
+        if (page_index >= pages_.size())
+        {
+            pages_.resize(page_index + 1);
+        }
+
+        auto& page = pages_[page_index];
+        if (page == nullptr)
+        {
+            page = std::make_unique<Page>();
+        }
+
+        size_t index = static_cast<size_t>(id % kPageSize);
+        if (page->occupied[index])
+        {
+            return std::make_pair(page->Get(index), false);
+        }
+
+        T* value = new (&page->values[index]) T(std::forward<Args>(args)...);
+
+        page->occupied[index] = true;
+        ++page->count;
+        ++size_;
+        return std::make_pair(value, true);
+    }
+
+    bool Insert(format::HandleId id, const T& value) { return Emplace(id, value).second; }
+
+    bool Insert(format::HandleId id, T&& value) { return Emplace(id, std::move(value)).second; }
+
+    T* Find(format::HandleId id) { return const_cast<T*>(static_cast<const PagedHandleTable*>(this)->Find(id)); }
+
+    const T* Find(format::HandleId id) const
+    {
+        if ((id / kPageSize) >= kMaxPageCount)
+        {
+            auto entry = overflow_.find(id);
+            return (entry != overflow_.end()) ? &entry->second : nullptr;
+        }
+
+        size_t page_index = static_cast<size_t>(id / kPageSize);
+        if (page_index < pages_.size())
+        {
+            const auto& page  = pages_[page_index];
+            size_t      index = static_cast<size_t>(id % kPageSize);
+            if ((page != nullptr) && page->occupied[index])
+            {
+                return page->Get(index);
+            }
+        }
+        return nullptr;
+    }
+
+    // Removes the value for id, returning false if the table does not contain a value for id.
+    bool Remove(format::HandleId id)
+    {
+        if ((id / kPageSize) >= kMaxPageCount)
+        {
+            if (overflow_.erase(id) == 0)
+            {
+                return false;
+            }
+            --size_;
+            return true;
+        }
+
+        size_t page_index = static_cast<size_t>(id / kPageSize);
+        if (page_index >= pages_.size())
+        {
+            return false;
+        }
+
+        auto&  page  = pages_[page_index];
+        size_t index = static_cast<size_t>(id % kPageSize);
+        if ((page == nullptr) || !page->occupied[index])
+        {
+            return false;
+        }
+
+        page->Get(index)->~T();
+        page->occupied[index] = false;
+        --size_;
+        if (--page->count == 0)
+        {
+            page.reset();
+        }
+        return true;
+    }
+
+    void Clear()
+    {
+        pages_.clear();
+        overflow_.clear();
+        size_ = 0;
+    }
+
+    // Calls visitor(format::HandleId, T&) for each value in the table, in ID order. The visitor must not insert or
+    // remove values.
+    template <typename Visitor>
+    void Visit(Visitor&& visitor)
+    {
+        VisitValues(*this, visitor);
+    }
+
+    template <typename Visitor>
+    void Visit(Visitor&& visitor) const
+    {
+        VisitValues(*this, visitor);
+    }
+
+  private:
+    // Limit the size of the page index, so that a large ID does not allocate an index for all of the IDs below it.
+    static constexpr format::HandleId kMaxPageCount = format::HandleId{ 1 } << 20;
+
+    struct Page
+    {
+        // Values are constructed on insert, so the value storage is left uninitialized.
+        Page() {}
+
+        ~Page()
+        {
+            if (!std::is_trivially_destructible<T>::value)
+            {
+                for (size_t i = 0; (i < kPageSize) && (count > 0); ++i)
+                {
+                    if (occupied[i])
+                    {
+                        Get(i)->~T();
+                        --count;
+                    }
+                }
+            }
+        }
+
+        T* Get(size_t index) { return std::launder(reinterpret_cast<T*>(&values[index])); }
+
+        const T* Get(size_t index) const { return std::launder(reinterpret_cast<const T*>(&values[index])); }
+
+        typename std::aligned_storage<sizeof(T), alignof(T)>::type values[kPageSize];
+        std::bitset<kPageSize>                                     occupied;
+        size_t                                                     count{ 0 };
+    };
+
+    template <typename Table, typename Visitor>
+    static void VisitValues(Table& table, Visitor& visitor)
+    {
+        for (size_t page_index = 0; page_index < table.pages_.size(); ++page_index)
+        {
+            auto& page = table.pages_[page_index];
+            if (page != nullptr)
+            {
+                format::HandleId page_id = static_cast<format::HandleId>(page_index) * kPageSize;
+                for (size_t i = 0; i < kPageSize; ++i)
+                {
+                    if (page->occupied[i])
+                    {
+                        visitor(page_id + i, *page->Get(i));
+                    }
+                }
+            }
+        }
+
+        for (auto& entry : table.overflow_)
+        {
+            visitor(entry.first, entry.second);
+        }
+    }
+
+    std::vector<std::unique_ptr<Page>> pages_;
+    std::map<format::HandleId, T>      overflow_;
+    size_t                             size_;
+};
+
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_UTIL_PAGED_HANDLE_TABLE_H
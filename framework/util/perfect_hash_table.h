@@ -0,0 +1,103 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_UTIL_PERFECT_HASH_TABLE_H
+#define GFXRECON_UTIL_PERFECT_HASH_TABLE_H
+
+#include "util/defines.h"
+
+#include <cstddef>
+#include <cstdint>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+
+// A read only table of values indexed by string, which is initialized with an aggregate initializer and requires no
+// construction at program startup. The entries are placed in the table with a minimal perfect hash: the key is hashed
+// once to select a bucket, and the key hash is combined with the seed for the bucket to select the entry. The seeds
+// and the entry order are computed ahead of time by the code generator, which must use the same hash functions, so a
+// lookup computes one hash and performs one string comparison to check that the key is in the table.
+template <typename T, size_t kEntryCount, size_t kBucketCount>
+struct PerfectHashTable
+{
+    static_assert((kEntryCount != 0) && (kBucketCount != 0), "Table must have at least one entry and one bucket");
+
+    struct Entry
+    {
+        const char* key;
+        T           value;
+    };
+
+    // Returns a pointer to the value for key, or nullptr if the table does not contain key.
+    constexpr const T* Find(const char* key) const
+    {
+        if (key == nullptr)
+        {
+            return nullptr;
+        }
+
+        uint64_t     hash  = Hash(key);
+        const Entry& entry = entries[GetSlot(hash, seeds[GetBucket(hash)])];
+        return IsEqual(entry.key, key) ? &entry.value : nullptr;
+    }
+
+    // 64-bit FNV-1a hash of the key.
+    static constexpr uint64_t Hash(const char* key)
+    {
+        uint64_t hash = 14695981039346656037ull;
+        for (; *key != '\0'; ++key)
+        {
+            hash ^= static_cast<uint8_t>(*key);
+            hash *= 1099511628211ull;
+        }
+        return hash;
+    }
+
+    static constexpr size_t GetBucket(uint64_t hash) { return static_cast<size_t>((hash >> 32) % kBucketCount); }
+
+    static constexpr size_t GetSlot(uint64_t hash, uint32_t seed)
+    {
+        uint32_t value = static_cast<uint32_t>(hash) ^ seed;
+        value ^= value >> 16;
+        value *= 0x7feb352du;
+        value ^= value >> 15;
+        value *= 0x846ca68bu;
+        value ^= value >> 16;
+        return static_cast<size_t>(value % kEntryCount);
+    }
+
+    static constexpr bool IsEqual(const char* lhs, const char* rhs)
+    {
+        for (; (*lhs != '\0') && (*lhs == *rhs); ++lhs, ++rhs)
+        {
+        }
+        return (*lhs == *rhs);
+    }
+
+    uint32_t seeds[kBucketCount];
+    Entry    entries[kEntryCount];
+};
+
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_UTIL_PERFECT_HASH_TABLE_H
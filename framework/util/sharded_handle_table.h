@@ -0,0 +1,143 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_UTIL_SHARDED_HANDLE_TABLE_H
+#define GFXRECON_UTIL_SHARDED_HANDLE_TABLE_H
+
+#include "util/defines.h"
+
+#include <algorithm>
+#include <functional>
+#include <mutex>
+#include <shared_mutex>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+
+// A thread safe table of object pointers, for handle wrappers that are inserted, removed, and retrieved from multiple
+// threads. The entries are split between shards by a hash of their key, and each shard has its own lock, so that
+// threads that access different entries rarely wait for each other.
+template <typename Key, typename T, size_t kShardCount = 16>
+class ShardedHandleTable
+{
+    static_assert((kShardCount != 0) && ((kShardCount & (kShardCount - 1)) == 0), "Shard count must be a power of two");
+
+  public:
+    ShardedHandleTable() {}
+
+    ~ShardedHandleTable() {}
+
+    ShardedHandleTable(const ShardedHandleTable&) = delete;
+
+    ShardedHandleTable& operator=(const ShardedHandleTable&) = delete;
+
+    // Inserts value for key, returning false without replacing the current value if the table already contains key.
+    bool Insert(const Key& key, T* value)
+    {
+        auto&                               shard = GetShard(key);
+        std::unique_lock<std::shared_mutex> lock(shard.mutex);
+        return shard.entries.insert(std::make_pair(key, value)).second;
+    }
+
+    // Removes the entry for key, returning false if the table does not contain key.
+    bool Remove(const Key& key)
+    {
+        auto&                               shard = GetShard(key);
+        std::unique_lock<std::shared_mutex> lock(shard.mutex);
+        return (shard.entries.erase(key) != 0);
+    }
+
+    T* Find(const Key& key) const
+    {
+        const auto&                         shard = GetShard(key);
+        std::shared_lock<std::shared_mutex> lock(shard.mutex);
+        auto                                entry = shard.entries.find(key);
+        return (entry != shard.entries.end()) ? entry->second : nullptr;
+    }
+
+    size_t Size() const
+    {
+        size_t size = 0;
+        for (const auto& shard : shards_)
+        {
+            std::shared_lock<std::shared_mutex> lock(shard.mutex);
+            size += shard.entries.size();
+        }
+        return size;
+    }
+
+    // Calls visitor(const Key&, T*) for each entry in the table, in key order. The entries are copied from each shard
+    // before they are sorted and visited, so the visitor may modify the table. Entries that are inserted or removed
+    // by other threads while the table is being visited may or may not be visited.
+    template <typename Visitor>
+    void Visit(Visitor&& visitor) const
+    {
+        std::vector<std::pair<Key, T*>> entries;
+        for (const auto& shard : shards_)
+        {
+            std::shared_lock<std::shared_mutex> lock(shard.mutex);
+            entries.insert(entries.end(), shard.entries.begin(), shard.entries.end());
+        }
+
+        std::sort(entries.begin(), entries.end(), [](const std::pair<Key, T*>& lhs, const std::pair<Key, T*>& rhs) {
+            return lhs.first < rhs.first;
+        });
+
+        for (const auto& entry : entries)
+        {
+            visitor(entry.first, entry.second);
+        }
+    }
+
+  private:
+    // Each shard is placed on its own cache line, so that locking one shard does not slow down access to the others.
+    struct alignas(64) Shard
+    {
+        mutable std::shared_mutex   mutex;
+        std::unordered_map<Key, T*> entries;
+    };
+
+    // Handle values are often aligned addresses or sequential IDs, so the low bits of the key hash are mixed with the
+    // high bits before they are used to select a shard.
+    static size_t GetShardIndex(const Key& key)
+    {
+        size_t hash = std::hash<Key>{}(key);
+        hash ^= (hash >> 16);
+        hash *= 0x45d9f3b;
+        hash ^= (hash >> 16);
+        return hash & (kShardCount - 1);
+    }
+
+    Shard& GetShard(const Key& key) { return shards_[GetShardIndex(key)]; }
+
+    const Shard& GetShard(const Key& key) const { return shards_[GetShardIndex(key)]; }
+
+    Shard shards_[kShardCount];
+};
+
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_UTIL_SHARDED_HANDLE_TABLE_H
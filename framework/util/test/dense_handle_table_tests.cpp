@@ -0,0 +1,164 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "util/dense_handle_table.h"
+
+#include <catch2/catch.hpp>
+
+#include <chrono>
+#include <limits>
+#include <memory>
+#include <random>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+TEST_CASE("DenseHandleTable keeps values in place and reuses free slots", "[dense_handle_table]")
+{
+    DenseHandleTable<format::HandleId, 4> table;
+
+    // The IDs of one handle type are interleaved with the IDs of other handle types.
+    std::vector<format::HandleId*> values;
+    for (format::HandleId id = 1; id <= 40; id += 4)
+    {
+        values.push_back(table.Emplace(id, id).first);
+    }
+
+    // Removing values does not move the other values.
+    REQUIRE(table.Remove(5));
+    REQUIRE(table.Remove(21));
+    for (format::HandleId id = 1; id <= 40; id += 4)
+    {
+        if ((id != 5) && (id != 21))
+        {
+            REQUIRE(table.Find(id) == values[id / 4]);
+            REQUIRE(*table.Find(id) == id);
+        }
+    }
+
+    // New values are placed in the lowest free slots.
+    REQUIRE(table.Emplace(100, 100).first == values[5 / 4]);
+    REQUIRE(table.Emplace(200, 200).first == values[21 / 4]);
+    REQUIRE(table.Emplace(300, 300).first == values.back() + 1);
+}
+
+TEST_CASE("DenseHandleTable searches values in ID order", "[dense_handle_table]")
+{
+    DenseHandleTable<std::string, 4> table;
+
+    const std::vector<format::HandleId> ids = { std::numeric_limits<format::HandleId>::max(), 100, 5, 17, 16, 1 };
+    for (auto id : ids)
+    {
+        table.Insert(id, (id == 1) ? "other" : "match");
+    }
+    table.Remove(5);
+
+    REQUIRE(table.FindIf([](const std::string& value) { return value == "match"; }) == table.Find(16));
+    REQUIRE(table.FindIf([](const std::string& value) { return value == "none"; }) == nullptr);
+}
+
+TEST_CASE("DenseHandleTable destroys its values", "[dense_handle_table]")
+{
+    auto value = std::make_shared<int>(0);
+
+    {
+        DenseHandleTable<std::shared_ptr<int>> table;
+        table.Insert(1, value);
+        table.Insert(2, value);
+        table.Insert(3, value);
+        REQUIRE(value.use_count() == 4);
+
+        table.Remove(2);
+        REQUIRE(value.use_count() == 3);
+    }
+
+    REQUIRE(value.use_count() == 1);
+}
+
+// Replay object info structures are stored by value.
+struct TestObjectInfo
+{
+    format::HandleId capture_id{ format::kNullHandleId };
+    uint8_t          data[248]{};
+};
+
+// Times looking up random IDs from the IDs for one handle type of a capture that creates a million handles of four
+// handle types, returning the average time per lookup in nanoseconds. Run with:
+// gfxrecon_util_test [benchmark]
+template <typename InsertFunc, typename FindFunc>
+double MeasureLookupTime(InsertFunc insert, FindFunc find)
+{
+    const format::HandleId kHandleCount = 1000000;
+    const format::HandleId kTypeCount   = 4;
+    const size_t           kFindCount   = 4000000;
+
+    std::vector<format::HandleId> ids;
+    for (format::HandleId id = 1; id <= kHandleCount; id += kTypeCount)
+    {
+        insert(id);
+        ids.push_back(id);
+    }
+
+    std::mt19937_64               random(0);
+    std::vector<format::HandleId> find_ids(kFindCount);
+    for (auto& id : find_ids)
+    {
+        id = ids[random() % ids.size()];
+    }
+
+    auto start = std::chrono::steady_clock::now();
+
+    format::HandleId found = 0;
+    for (auto id : find_ids)
+    {
+        found += find(id);
+    }
+
+    auto end = std::chrono::steady_clock::now();
+
+    REQUIRE(found != 0);
+
+    return std::chrono::duration<double, std::nano>(end - start).count() / kFindCount;
+}
+
+TEST_CASE("DenseHandleTable is faster than std::unordered_map for object info lookup", "[.][benchmark]")
+{
+    std::unordered_map<format::HandleId, TestObjectInfo> unordered_map;
+    double                                               unordered_map_time =
+        MeasureLookupTime([&](format::HandleId id) { unordered_map.emplace(id, TestObjectInfo{ id }); },
+                          [&](format::HandleId id) { return unordered_map.find(id)->second.capture_id; });
+
+    DenseHandleTable<TestObjectInfo> dense_table;
+    double                           dense_table_time =
+        MeasureLookupTime([&](format::HandleId id) { dense_table.Emplace(id, TestObjectInfo{ id }); },
+                          [&](format::HandleId id) { return dense_table.Find(id)->capture_id; });
+
+    WARN("std::unordered_map: " << unordered_map_time << " ns/op, DenseHandleTable: " << dense_table_time << " ns/op");
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,166 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "util/dense_handle_table.h"
+#include "util/paged_handle_table.h"
+#include "util/sharded_handle_table.h"
+
+#include <catch2/catch.hpp>
+
+#include <limits>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+struct HandleTableTestWrapper
+{
+    format::HandleId handle_id;
+};
+
+using TestPagedHandleTable   = PagedHandleTable<HandleTableTestWrapper*, 16>;
+using TestDenseHandleTable   = DenseHandleTable<HandleTableTestWrapper*, 4>;
+using TestShardedHandleTable = ShardedHandleTable<format::HandleId, HandleTableTestWrapper>;
+
+// The sharded table stores wrapper pointers, and the other tables store values that are wrapper pointers in these
+// tests.
+HandleTableTestWrapper* FindWrapper(const TestShardedHandleTable& table, format::HandleId id)
+{
+    return table.Find(id);
+}
+
+template <typename Table>
+HandleTableTestWrapper* FindWrapper(const Table& table, format::HandleId id)
+{
+    auto value = table.Find(id);
+    return (value != nullptr) ? *value : nullptr;
+}
+
+const format::HandleId kMaxId = std::numeric_limits<format::HandleId>::max();
+
+TEMPLATE_TEST_CASE("Handle tables insert, find, and remove wrappers",
+                   "[handle_table]",
+                   TestPagedHandleTable,
+                   TestDenseHandleTable,
+                   TestShardedHandleTable)
+{
+    TestType table;
+
+    // IDs in the same page, in different pages, and the largest IDs.
+    std::vector<HandleTableTestWrapper> wrappers = { { 1 }, { 2 }, { 17 }, { 1000 }, { kMaxId - 1 }, { kMaxId } };
+    for (auto& wrapper : wrappers)
+    {
+        REQUIRE(table.Insert(wrapper.handle_id, &wrapper));
+    }
+
+    HandleTableTestWrapper duplicate{ 1 };
+    REQUIRE_FALSE(table.Insert(1, &duplicate));
+    REQUIRE_FALSE(table.Insert(kMaxId, &duplicate));
+    REQUIRE(table.Size() == wrappers.size());
+
+    for (auto& wrapper : wrappers)
+    {
+        REQUIRE(FindWrapper(table, wrapper.handle_id) == &wrapper);
+    }
+    REQUIRE(FindWrapper(table, 3) == nullptr);
+    REQUIRE(FindWrapper(table, 999) == nullptr);
+    REQUIRE(FindWrapper(table, kMaxId - 2) == nullptr);
+
+    REQUIRE(table.Remove(1));
+    REQUIRE(table.Remove(kMaxId));
+    REQUIRE_FALSE(table.Remove(1));
+    REQUIRE_FALSE(table.Remove(kMaxId));
+    REQUIRE_FALSE(table.Remove(3));
+    REQUIRE(FindWrapper(table, 1) == nullptr);
+    REQUIRE(FindWrapper(table, kMaxId) == nullptr);
+    REQUIRE(FindWrapper(table, 2) == &wrappers[1]);
+    REQUIRE(FindWrapper(table, kMaxId - 1) == &wrappers[4]);
+    REQUIRE(table.Size() == wrappers.size() - 2);
+
+    // Removed IDs can be inserted again.
+    REQUIRE(table.Insert(1, &duplicate));
+    REQUIRE(FindWrapper(table, 1) == &duplicate);
+}
+
+TEMPLATE_TEST_CASE("Handle tables visit wrappers in ID order",
+                   "[handle_table]",
+                   TestPagedHandleTable,
+                   TestDenseHandleTable,
+                   TestShardedHandleTable)
+{
+    TestType table;
+
+    std::vector<HandleTableTestWrapper> wrappers;
+    for (format::HandleId id = 1; id <= 1000; ++id)
+    {
+        wrappers.push_back({ id });
+    }
+    wrappers.push_back({ kMaxId });
+
+    // Insert in reverse order, so that the visit order does not follow the insert order.
+    for (auto wrapper = wrappers.rbegin(); wrapper != wrappers.rend(); ++wrapper)
+    {
+        table.Insert(wrapper->handle_id, &(*wrapper));
+    }
+    table.Remove(17);
+
+    std::vector<format::HandleId> visited;
+    table.Visit([&](format::HandleId id, HandleTableTestWrapper* wrapper) {
+        REQUIRE(wrapper->handle_id == id);
+        visited.push_back(id);
+    });
+
+    std::vector<format::HandleId> expected;
+    for (const auto& wrapper : wrappers)
+    {
+        if (wrapper.handle_id != 17)
+        {
+            expected.push_back(wrapper.handle_id);
+        }
+    }
+    REQUIRE(visited == expected);
+}
+
+TEMPLATE_TEST_CASE("Handle tables that store values can be cleared",
+                   "[handle_table]",
+                   TestPagedHandleTable,
+                   TestDenseHandleTable)
+{
+    TestType table;
+
+    HandleTableTestWrapper wrapper{ 1 };
+    REQUIRE(table.Empty());
+    REQUIRE(table.Insert(1, &wrapper));
+    REQUIRE(table.Insert(kMaxId, &wrapper));
+    REQUIRE_FALSE(table.Empty());
+
+    table.Clear();
+    REQUIRE(table.Empty());
+    REQUIRE(table.Size() == 0);
+    REQUIRE(FindWrapper(table, 1) == nullptr);
+    REQUIRE(FindWrapper(table, kMaxId) == nullptr);
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,159 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "util/monotonic_allocator.h"
+
+#include <catch2/catch.hpp>
+
+#include <cstdint>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+constexpr size_t kBlockSize    = 256;
+constexpr size_t kReserveBytes = 1024;
+
+TEST_CASE("MonotonicAllocator aligns allocations", "[monotonic_allocator]")
+{
+    MonotonicAllocator allocator(kBlockSize);
+
+    allocator.Allocate<uint8_t>(1);
+    auto value64 = allocator.Allocate<uint64_t>(1);
+    REQUIRE((reinterpret_cast<uintptr_t>(value64) % alignof(uint64_t)) == 0);
+
+    allocator.Allocate<uint8_t>(3);
+    auto value32 = allocator.Allocate<uint32_t>(1);
+    REQUIRE((reinterpret_cast<uintptr_t>(value32) % alignof(uint32_t)) == 0);
+}
+
+TEST_CASE("MonotonicAllocator reuses fixed size blocks after Clear", "[monotonic_allocator]")
+{
+    MonotonicAllocator allocator(kBlockSize);
+
+    auto first = allocator.Allocate<uint8_t>(kBlockSize);
+    allocator.Allocate<uint8_t>(kBlockSize);
+    REQUIRE(allocator.GetBlockMemorySize() == 2 * kBlockSize);
+
+    allocator.Clear(false);
+    REQUIRE(allocator.GetBlockMemorySize() == 2 * kBlockSize);
+    REQUIRE(allocator.Allocate<uint8_t>(kBlockSize) == first);
+
+    // Blocks of block_size are kept even when they were not used since the last Clear
+    allocator.Clear(false);
+    allocator.Clear(false);
+    REQUIRE(allocator.GetBlockMemorySize() == 2 * kBlockSize);
+
+    allocator.Clear(true);
+    REQUIRE(allocator.GetBlockMemorySize() == 0);
+}
+
+TEST_CASE("MonotonicAllocator performs oversized allocations on the heap", "[monotonic_allocator]")
+{
+    MonotonicAllocator allocator(kBlockSize);
+
+    allocator.Allocate<uint8_t>(1);
+    auto oversized = allocator.Allocate<uint8_t>(kReserveBytes);
+    REQUIRE(oversized != nullptr);
+    REQUIRE(allocator.GetBlockMemorySize() == kBlockSize);
+
+    // The block is still used for allocations that fit
+    auto block_start = allocator.Allocate<uint8_t>(1) - 1;
+    allocator.Clear(false);
+    REQUIRE(allocator.Allocate<uint8_t>(1) == block_start);
+    REQUIRE(allocator.GetBlockMemorySize() == kBlockSize);
+}
+
+TEST_CASE("MonotonicAllocator allocates reserved bytes from a single block", "[monotonic_allocator]")
+{
+    MonotonicAllocator allocator(kBlockSize);
+
+    allocator.Allocate<uint8_t>(kBlockSize / 2);
+    allocator.Reserve(kReserveBytes);
+    REQUIRE(allocator.GetBlockMemorySize() == kBlockSize + kReserveBytes);
+
+    // Both the oversized allocation and the allocations that follow it are made to the reserved block
+    auto oversized = allocator.Allocate<uint8_t>(kReserveBytes / 2);
+    auto next      = allocator.Allocate<uint8_t>(kReserveBytes / 4);
+    auto last      = allocator.Allocate<uint8_t>(kReserveBytes / 4);
+    REQUIRE(next == oversized + (kReserveBytes / 2));
+    REQUIRE(last == next + (kReserveBytes / 4));
+    REQUIRE(allocator.GetBlockMemorySize() == kBlockSize + kReserveBytes);
+
+    // Reserving space that the current block already has does not add a block
+    allocator.Clear(false);
+    allocator.Reserve(kBlockSize);
+    REQUIRE(allocator.GetBlockMemorySize() == kBlockSize + kReserveBytes);
+}
+
+TEST_CASE("MonotonicAllocator keeps reserved blocks while they are used", "[monotonic_allocator]")
+{
+    MonotonicAllocator allocator(kBlockSize);
+
+    allocator.Allocate<uint8_t>(kBlockSize);
+    allocator.Reserve(kReserveBytes);
+    auto reserved = allocator.Allocate<uint8_t>(kReserveBytes);
+
+    for (uint32_t i = 0; i < 3; ++i)
+    {
+        allocator.Clear(false);
+        REQUIRE(allocator.GetBlockMemorySize() == kBlockSize + kReserveBytes);
+
+        allocator.Allocate<uint8_t>(kBlockSize);
+        allocator.Reserve(kReserveBytes);
+        REQUIRE(allocator.Allocate<uint8_t>(kReserveBytes) == reserved);
+    }
+
+    // The reserved block is freed by the first Clear after a cycle that did not use it
+    allocator.Clear(false);
+    allocator.Allocate<uint8_t>(kBlockSize);
+    allocator.Clear(false);
+    REQUIRE(allocator.GetBlockMemorySize() == kBlockSize);
+
+    // Reserve creates a new block again when it is needed
+    allocator.Allocate<uint8_t>(kBlockSize);
+    allocator.Reserve(kReserveBytes);
+    REQUIRE(allocator.GetBlockMemorySize() == kBlockSize + kReserveBytes);
+
+    allocator.Clear(true);
+    REQUIRE(allocator.GetBlockMemorySize() == 0);
+}
+
+TEST_CASE("MonotonicAllocator reuses reserved blocks for regular allocations", "[monotonic_allocator]")
+{
+    MonotonicAllocator allocator(kBlockSize);
+
+    allocator.Reserve(kReserveBytes);
+    allocator.Allocate<uint8_t>(kReserveBytes);
+    allocator.Allocate<uint8_t>(kBlockSize);
+    REQUIRE(allocator.GetBlockMemorySize() == kReserveBytes + kBlockSize);
+
+    // The reserved block is the first block, so the allocations of the next cycle use it
+    allocator.Clear(false);
+    allocator.Allocate<uint8_t>(kBlockSize);
+    allocator.Clear(false);
+    REQUIRE(allocator.GetBlockMemorySize() == kReserveBytes + kBlockSize);
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
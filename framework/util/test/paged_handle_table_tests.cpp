@@ -0,0 +1,156 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "util/paged_handle_table.h"
+
+#include <catch2/catch.hpp>
+
+#include <chrono>
+#include <limits>
+#include <map>
+#include <memory>
+#include <string>
+#include <unordered_map>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+TEST_CASE("PagedHandleTable allocates a freed page again", "[paged_handle_table]")
+{
+    PagedHandleTable<std::string, 16> table;
+
+    REQUIRE(table.Insert(1, "one"));
+    REQUIRE(table.Insert(17, "seventeen"));
+
+    // The page that held ID 1 is freed, and is allocated again.
+    REQUIRE(table.Remove(1));
+    REQUIRE(table.Find(1) == nullptr);
+    REQUIRE(table.Insert(2, "two"));
+    REQUIRE(*table.Find(2) == "two");
+    REQUIRE(*table.Find(17) == "seventeen");
+    REQUIRE(table.Size() == 2);
+}
+
+TEST_CASE("PagedHandleTable does not move from a value that is not inserted", "[paged_handle_table]")
+{
+    PagedHandleTable<std::string> table;
+
+    for (auto id : { format::HandleId{ 1 }, std::numeric_limits<format::HandleId>::max() })
+    {
+        std::string first  = "first";
+        std::string second = "second";
+        REQUIRE(table.Emplace(id, std::move(first)).second);
+
+        auto result = table.Emplace(id, std::move(second));
+        REQUIRE_FALSE(result.second);
+        REQUIRE(*result.first == "first");
+        REQUIRE(second == "second");
+    }
+}
+
+TEST_CASE("PagedHandleTable destroys its values", "[paged_handle_table]")
+{
+    auto value = std::make_shared<int>(0);
+
+    {
+        PagedHandleTable<std::shared_ptr<int>> table;
+        table.Insert(1, value);
+        table.Insert(2, value);
+        table.Insert(3, value);
+        REQUIRE(value.use_count() == 4);
+
+        table.Remove(2);
+        REQUIRE(value.use_count() == 3);
+    }
+
+    REQUIRE(value.use_count() == 1);
+}
+
+// Times inserting, finding, and removing the IDs for one handle type of a capture that creates a million handles of
+// four handle types, returning the average time per operation in nanoseconds. Run with:
+// gfxrecon_util_test [benchmark]
+template <typename InsertFunc, typename FindFunc, typename RemoveFunc>
+double MeasureTableTime(InsertFunc insert, FindFunc find, RemoveFunc remove)
+{
+    const format::HandleId kHandleCount = 1000000;
+    const format::HandleId kTypeCount   = 4;
+
+    auto start = std::chrono::steady_clock::now();
+
+    for (format::HandleId id = 1; id <= kHandleCount; id += kTypeCount)
+    {
+        insert(id);
+    }
+
+    // Look up each handle several times, as state tracking does for each API call that uses a handle.
+    size_t found = 0;
+    for (uint32_t i = 0; i < 4; ++i)
+    {
+        for (format::HandleId id = 1; id <= kHandleCount; id += kTypeCount)
+        {
+            found += find(id) ? 1 : 0;
+        }
+    }
+    REQUIRE(found == (kHandleCount / kTypeCount) * 4);
+
+    for (format::HandleId id = 1; id <= kHandleCount; id += kTypeCount)
+    {
+        remove(id);
+    }
+
+    auto end = std::chrono::steady_clock::now();
+
+    return std::chrono::duration<double, std::nano>(end - start).count() / ((kHandleCount / kTypeCount) * 6);
+}
+
+TEST_CASE("PagedHandleTable is faster than std::map for HandleId lookup", "[.][benchmark]")
+{
+    int wrapper = 0;
+
+    std::map<format::HandleId, int*> ordered_map;
+    double map_time = MeasureTableTime([&](format::HandleId id) { ordered_map.insert(std::make_pair(id, &wrapper)); },
+                                       [&](format::HandleId id) { return ordered_map.find(id) != ordered_map.end(); },
+                                       [&](format::HandleId id) { ordered_map.erase(id); });
+
+    std::unordered_map<format::HandleId, int*> unordered_map;
+    double                                     unordered_map_time =
+        MeasureTableTime([&](format::HandleId id) { unordered_map.insert(std::make_pair(id, &wrapper)); },
+                         [&](format::HandleId id) { return unordered_map.find(id) != unordered_map.end(); },
+                         [&](format::HandleId id) { unordered_map.erase(id); });
+
+    PagedHandleTable<int*> paged_table;
+    double paged_table_time = MeasureTableTime([&](format::HandleId id) { paged_table.Insert(id, &wrapper); },
+                                               [&](format::HandleId id) { return paged_table.Find(id) != nullptr; },
+                                               [&](format::HandleId id) { paged_table.Remove(id); });
+
+    WARN("std::map: " << map_time << " ns/op, std::unordered_map: " << unordered_map_time
+                      << " ns/op, PagedHandleTable: " << paged_table_time << " ns/op");
+
+    REQUIRE(ordered_map.empty());
+    REQUIRE(unordered_map.empty());
+    REQUIRE(paged_table.Empty());
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
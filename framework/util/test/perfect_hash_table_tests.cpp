@@ -0,0 +1,77 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "util/perfect_hash_table.h"
+
+#include <catch2/catch.hpp>
+
+#include <string>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+// The seeds and entry order were computed with build_perfect_hash_table from
+// framework/generated/vulkan_generators/layer_func_table_generator.py.
+constexpr PerfectHashTable<int, 9, 3> kTestTable = { { 2, 36, 0 },
+                                                     { { "vkDestroyDevice", 4 },
+                                                       { "vkCreateDevice", 3 },
+                                                       { "vkCreateInstance", 1 },
+                                                       { "vkDestroyBuffer", 8 },
+                                                       { "vkCreateBuffer", 7 },
+                                                       { "vkQueueSubmit", 5 },
+                                                       { "vkCmdDraw", 9 },
+                                                       { "vkDestroyInstance", 2 },
+                                                       { "vkQueuePresentKHR", 6 } } };
+
+static_assert(*kTestTable.Find("vkCreateInstance") == 1, "Table lookup must be a constant expression");
+static_assert(kTestTable.Find("vkCreateInstanceKHR") == nullptr, "Table lookup must be a constant expression");
+
+TEST_CASE("PerfectHashTable finds the values for its keys", "[perfect_hash_table]")
+{
+    const char* keys[] = { "vkCreateInstance", "vkDestroyInstance", "vkCreateDevice",
+                           "vkDestroyDevice",  "vkQueueSubmit",     "vkQueuePresentKHR",
+                           "vkCreateBuffer",   "vkDestroyBuffer",   "vkCmdDraw" };
+
+    for (int i = 0; i < 9; ++i)
+    {
+        // Look up a copy of the key, so that the key is not compared by address.
+        std::string key   = keys[i];
+        const int*  value = kTestTable.Find(key.c_str());
+        REQUIRE(value != nullptr);
+        REQUIRE(*value == (i + 1));
+    }
+}
+
+TEST_CASE("PerfectHashTable does not find other keys", "[perfect_hash_table]")
+{
+    REQUIRE(kTestTable.Find(nullptr) == nullptr);
+    REQUIRE(kTestTable.Find("") == nullptr);
+    REQUIRE(kTestTable.Find("vk") == nullptr);
+    REQUIRE(kTestTable.Find("vkCmdDra") == nullptr);
+    REQUIRE(kTestTable.Find("vkCmdDrawIndexed") == nullptr);
+    REQUIRE(kTestTable.Find("vkcmddraw") == nullptr);
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,147 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "util/sharded_handle_table.h"
+
+#include <catch2/catch.hpp>
+
+#include <atomic>
+#include <cstdint>
+#include <thread>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+struct TestWrapper
+{
+    uint64_t handle_id;
+};
+
+TEST_CASE("ShardedHandleTable supports concurrent insert, remove, and find", "[sharded_handle_table]")
+{
+    const uint32_t kThreadCount       = 8;
+    const uint32_t kHandlesPerThread  = 4096;
+    const uint32_t kIterationCount    = 4;
+    const uint64_t kSharedHandleCount = 256;
+
+    ShardedHandleTable<uint64_t, TestWrapper> table;
+
+    // Entries that every thread reads while the other entries are inserted and removed.
+    std::vector<TestWrapper> shared_wrappers;
+    for (uint64_t id = 1; id <= kSharedHandleCount; ++id)
+    {
+        shared_wrappers.push_back({ id });
+    }
+    for (auto& wrapper : shared_wrappers)
+    {
+        REQUIRE(table.Insert(wrapper.handle_id, &wrapper));
+    }
+
+    // Each thread owns a range of IDs, which are interleaved with the IDs of the other threads, as the IDs for the
+    // wrappers created by different threads are.
+    std::vector<std::vector<TestWrapper>> thread_wrappers(kThreadCount);
+    for (uint32_t thread = 0; thread < kThreadCount; ++thread)
+    {
+        for (uint64_t i = 0; i < kHandlesPerThread; ++i)
+        {
+            thread_wrappers[thread].push_back({ kSharedHandleCount + 1 + (i * kThreadCount) + thread });
+        }
+    }
+
+    std::atomic<uint32_t> failure_count{ 0 };
+    std::atomic<bool>     start{ false };
+
+    std::vector<std::thread> threads;
+    for (uint32_t thread = 0; thread < kThreadCount; ++thread)
+    {
+        threads.emplace_back([&, thread]() {
+            auto& wrappers = thread_wrappers[thread];
+
+            while (!start)
+            {
+                std::this_thread::yield();
+            }
+
+            for (uint32_t iteration = 0; iteration < kIterationCount; ++iteration)
+            {
+                for (auto& wrapper : wrappers)
+                {
+                    if (!table.Insert(wrapper.handle_id, &wrapper))
+                    {
+                        ++failure_count;
+                    }
+
+                    uint64_t shared_id = (wrapper.handle_id % kSharedHandleCount) + 1;
+                    if (table.Find(shared_id) != &shared_wrappers[shared_id - 1])
+                    {
+                        ++failure_count;
+                    }
+                }
+
+                for (auto& wrapper : wrappers)
+                {
+                    if (table.Find(wrapper.handle_id) != &wrapper)
+                    {
+                        ++failure_count;
+                    }
+                }
+
+                // Keep the entries from the last iteration, and remove the others.
+                if (iteration + 1 < kIterationCount)
+                {
+                    for (auto& wrapper : wrappers)
+                    {
+                        if (!table.Remove(wrapper.handle_id) || (table.Find(wrapper.handle_id) != nullptr))
+                        {
+                            ++failure_count;
+                        }
+                    }
+                }
+            }
+        });
+    }
+
+    start = true;
+    for (auto& thread : threads)
+    {
+        thread.join();
+    }
+
+    REQUIRE(failure_count == 0);
+    REQUIRE(table.Size() == kSharedHandleCount + (kThreadCount * kHandlesPerThread));
+
+    uint64_t previous_id = 0;
+    size_t   count       = 0;
+    table.Visit([&](uint64_t id, TestWrapper* wrapper) {
+        REQUIRE(id > previous_id);
+        REQUIRE(wrapper->handle_id == id);
+        previous_id = id;
+        ++count;
+    });
+    REQUIRE(count == table.Size());
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,91 @@
+/*
+** Copyright (c) 2023 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "util/to_string.h"
+
+#include <catch2/catch.hpp>
+
+#include <cstdint>
+#include <string_view>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+constexpr std::string_view kUnhandled = "Unhandled";
+constexpr std::string_view kZero      = "0";
+
+constexpr EnumNameEntry kSortedTable[] = { { INT32_MIN, "MIN" }, { -1, "NEGATIVE" },
+                                           { 0, "ZERO" },        { 1, "ONE" },
+                                           { 7, "SEVEN" },       { 1000, "THOUSAND" },
+                                           { INT32_MAX, "MAX" }, { UINT32_MAX, "UINT32_MAX" } };
+
+constexpr EnumNameEntry kUnsortedTable[] = { { 0, "ZERO" }, { 2, "TWO" }, { 1, "ONE" } };
+
+constexpr EnumNameEntry kDuplicateTable[] = { { 0, "ZERO" }, { 1, "ONE" }, { 1, "ALSO_ONE" } };
+
+constexpr EnumNameEntry kSingleTable[] = { { 5, "FIVE" } };
+
+static_assert(IsSortedEnumNameTable(kSortedTable), "Sorted table must be accepted");
+static_assert(!IsSortedEnumNameTable(kUnsortedTable), "Unsorted table must be rejected");
+static_assert(!IsSortedEnumNameTable(kDuplicateTable), "Table with duplicate values must be rejected");
+static_assert(IsSortedEnumNameTable(kSingleTable), "Table with one entry must be accepted");
+static_assert(FindEnumName(kSortedTable, 7, kUnhandled) == "SEVEN", "Lookup must be a constant expression");
+
+TEST_CASE("FindEnumName finds every value in the table", "[to_string]")
+{
+    for (const auto& entry : kSortedTable)
+    {
+        REQUIRE(FindEnumName(kSortedTable, entry.value, kUnhandled) == entry.name);
+    }
+    REQUIRE(FindEnumName(kSingleTable, 5, kUnhandled) == "FIVE");
+}
+
+TEST_CASE("FindEnumName returns the unhandled name for values that are not in the table", "[to_string]")
+{
+    REQUIRE(FindEnumName(kSortedTable, INT64_MIN, kUnhandled) == kUnhandled);
+    REQUIRE(FindEnumName(kSortedTable, -2, kUnhandled) == kUnhandled);
+    REQUIRE(FindEnumName(kSortedTable, 2, kUnhandled) == kUnhandled);
+    REQUIRE(FindEnumName(kSortedTable, 999, kUnhandled) == kUnhandled);
+    REQUIRE(FindEnumName(kSortedTable, INT64_MAX, kUnhandled) == kUnhandled);
+    REQUIRE(FindEnumName(kSingleTable, 4, kUnhandled) == kUnhandled);
+    REQUIRE(FindEnumName(kSingleTable, 6, kUnhandled) == kUnhandled);
+}
+
+TEST_CASE("BitNamesToString converts flags to '|' separated bit names", "[to_string]")
+{
+    // Bit 2 has no name, and the table has no entry for bits 4 and above.
+    constexpr std::string_view kBitNames[] = { "BIT_0", "BIT_1", "", "BIT_3" };
+
+    REQUIRE(BitNamesToString(kBitNames, 0, kZero, kUnhandled) == "0");
+    REQUIRE(BitNamesToString(kBitNames, 0x1, kZero, kUnhandled) == "BIT_0");
+    REQUIRE(BitNamesToString(kBitNames, 0x8, kZero, kUnhandled) == "BIT_3");
+    REQUIRE(BitNamesToString(kBitNames, 0xb, kZero, kUnhandled) == "BIT_0|BIT_1|BIT_3");
+    REQUIRE(BitNamesToString(kBitNames, 0x4, kZero, kUnhandled) == "Unhandled");
+    REQUIRE(BitNamesToString(kBitNames, 0x5, kZero, kUnhandled) == "BIT_0|Unhandled");
+    REQUIRE(BitNamesToString(kBitNames, 0x10, kZero, kUnhandled) == "Unhandled");
+    REQUIRE(BitNamesToString(kBitNames, 0x8000000000000002ull, kZero, kUnhandled) == "BIT_1|Unhandled");
+}
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
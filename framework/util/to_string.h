@@ -32,6 +32,7 @@
 #include <iomanip>
 #include <sstream>
 #include <string>
+#include <string_view>
 #include <utility>
 #include <cmath>
 
@@ -195,6 +196,90 @@ inline std::string BitmaskToString(FlagsType flags)
     return str;
 }
 
+/// @brief Return a view of the name of an enumerant.
+/// Specializations are generated for Vulkan enums when the ToString functions
+/// are generated with lookup tables.
+template <typename T>
+std::string_view ToStringView(const T& value);
+
+/// @brief An enumerant value and name, for the enumerant name lookup tables
+/// generated for the Vulkan enum ToString functions.
+struct EnumNameEntry
+{
+    int64_t          value;
+    std::string_view name;
+};
+
+/// @brief Check that an enumerant name table is sorted by value, with no
+/// duplicate values, for use in a static_assert.
+template <size_t N>
+constexpr bool IsSortedEnumNameTable(const EnumNameEntry (&table)[N])
+{
+    for (size_t i = 1; i < N; ++i)
+    {
+        if (!(table[i - 1].value < table[i].value))
+        {
+            return false;
+        }
+    }
+    return true;
+}
+
+/// @brief Find the name of an enumerant with a binary search of a table that
+/// is sorted by value. Returns unhandled_name if the value is not found.
+template <size_t N>
+constexpr std::string_view FindEnumName(const EnumNameEntry (&table)[N], int64_t value, std::string_view unhandled_name)
+{
+    size_t first = 0;
+    size_t last  = N;
+    while (first < last)
+    {
+        size_t middle = first + ((last - first) / 2);
+        if (table[middle].value < value)
+        {
+            first = middle + 1;
+        }
+        else
+        {
+            last = middle;
+        }
+    }
+    return ((first < N) && (table[first].value == value)) ? table[first].name : unhandled_name;
+}
+
+/// @brief Convert flags to a string of '|' separated flag bit names, using a
+/// table of names indexed by bit position. Produces the same string as
+/// BitmaskToString: bits without a name are converted to unhandled_name, and
+/// flags with no bits set are converted to zero_name.
+template <size_t N>
+inline std::string BitNamesToString(const std::string_view (&bit_names)[N],
+                                    uint64_t         flags,
+                                    std::string_view zero_name,
+                                    std::string_view unhandled_name)
+{
+    std::string str;
+    size_t      index = 0;
+    while (flags)
+    {
+        if (flags & 1)
+        {
+            if (!str.empty())
+            {
+                str.append("|");
+            }
+            std::string_view name = (index < N) ? bit_names[index] : std::string_view();
+            str.append(name.empty() ? unhandled_name : name);
+        }
+        ++index;
+        flags >>= 1;
+    }
+    if (str.empty())
+    {
+        str.append(zero_name);
+    }
+    return str;
+}
+
 template <typename PtrType>
 inline std::string PtrToString(PtrType* ptr)
 {
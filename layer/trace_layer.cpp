@@ -30,6 +30,7 @@
 #include "encode/vulkan_handle_wrapper_util.h"
 #include "generated/generated_layer_func_table.h"
 #include "generated/generated_vulkan_api_call_encoders.h"
+#include "util/perfect_hash_table.h"
 #include "util/platform.h"
 
 #include "vulkan/vk_layer.h"
@@ -132,6 +133,24 @@ static const VkLayerDeviceCreateInfo* get_device_chain_info(const VkDeviceCreate
     return chain_info;
 }
 
+// The generated Vulkan function table is a std::unordered_map by default, or a util::PerfectHashTable when it is
+// generated with the -perfect-hash-func-table option.
+static PFN_vkVoidFunction find_layer_func(const std::unordered_map<std::string, PFN_vkVoidFunction>& func_table,
+                                          const char*                                                name)
+{
+    const auto entry = func_table.find(name);
+    return (entry != func_table.end()) ? entry->second : nullptr;
+}
+
+template <size_t kEntryCount, size_t kBucketCount>
+static PFN_vkVoidFunction
+find_layer_func(const util::PerfectHashTable<PFN_vkVoidFunction, kEntryCount, kBucketCount>& func_table,
+                const char*                                                                  name)
+{
+    const auto entry = func_table.Find(name);
+    return (entry != nullptr) ? *entry : nullptr;
+}
+
 static std::mutex                                  instance_handles_lock;
 static std::unordered_map<const void*, VkInstance> instance_handles;
 
@@ -304,23 +323,13 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance
     // the instance handle is null and we can't determine if it is available from the next level.
     if (has_implementation || (instance == VK_NULL_HANDLE))
     {
-        const auto entry = vulkan_func_table.find(pName);
-
-        if (entry != vulkan_func_table.end())
-        {
-            result = entry->second;
-        }
+        result = find_layer_func(vulkan_func_table, pName);
     }
 
     // Lastly check custom GFXR exposed functions
     if (result == nullptr)
     {
-        const auto entry = custom_func_table.find(pName);
-
-        if (entry != custom_func_table.end())
-        {
-            result = entry->second;
-        }
+        result = find_layer_func(custom_func_table, pName);
     }
 
     return result;
@@ -358,11 +367,7 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
         // Only intercept the requested function if there is an implementation available
         if (has_implementation)
         {
-            const auto entry = vulkan_func_table.find(pName);
-            if (entry != vulkan_func_table.end())
-            {
-                result = entry->second;
-            }
+            result = find_layer_func(vulkan_func_table, pName);
         }
     }
 
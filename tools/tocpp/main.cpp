@@ -93,6 +93,16 @@ CommandLineArgument g_command_limit_argument = {
     "Maximum number of API commands recorded per C++ file.  The intent is to"
     " adjust compilation load per file."
 };
+CommandLineArgument g_file_size_limit_argument = {
+    false,
+    true,
+    "-l",
+    "--file-size-limit",
+    "<kilobytes>\t\t",
+    " (Defaults to no limit)",
+    "Approximate amount of code, in kilobytes, recorded per C++ file.  Files are"
+    " split by size, as an estimate of compilation load, in addition to the command limit."
+};
 
 CommandLineArgument g_captured_swapchain_argument = {
     false,
@@ -388,6 +398,7 @@ int main(int argc, const char** argv)
     g_argument_list.push_back(g_max_window_dimensions_argument);
     g_argument_list.push_back(g_frame_limit_argument);
     g_argument_list.push_back(g_command_limit_argument);
+    g_argument_list.push_back(g_file_size_limit_argument);
     g_argument_list.push_back(g_captured_swapchain_argument);
 
     for (auto& argument : g_argument_list)
@@ -431,6 +442,15 @@ int main(int argc, const char** argv)
             ValidateAndConvertNumericArgument(command_limit_argument, "The given command limit is invalid!");
     }
 
+    // --file-size-limit
+    uint32_t    file_size_limit          = 0;
+    std::string file_size_limit_argument = arg_parser.GetArgumentValue(g_file_size_limit_argument.short_option);
+    if (file_size_limit_argument.size() != 0)
+    {
+        file_size_limit =
+            ValidateAndConvertNumericArgument(file_size_limit_argument, "The given file size limit is invalid!");
+    }
+
     // --frame-limit
     std::string frame_limit_argument = arg_parser.GetArgumentValue(g_frame_limit_argument.short_option);
 
@@ -521,6 +541,11 @@ int main(int argc, const char** argv)
         cpp_consumer.SetMaxCommandLimit(command_limit);
     }
 
+    if (file_size_limit > 0)
+    {
+        cpp_consumer.SetMaxFrameFileSize(static_cast<size_t>(file_size_limit) * 1024);
+    }
+
     int64_t process_start_time = gfxrecon::util::datetime::GetTimestamp();
     result = ProcessCapture(cpp_consumer, input_filename, output_filename, target_platform, frame_limit);
     int64_t  process_end_time           = gfxrecon::util::datetime::GetTimestamp();